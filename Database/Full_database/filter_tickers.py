@@ -12,6 +12,11 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
+import sys
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.core.excel_cache import ExcelCache
 
 # Thiết lập logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,7 +26,8 @@ def load_fiinx_data(file_path: str) -> pd.DataFrame:
     """Load dữ liệu từ file Excel data_fiinx.xlsx"""
     try:
         logger.info(f"Loading data from {file_path}")
-        df = pd.read_excel(file_path)
+        # Parquet sidecar, re-parsed only when the workbook changes
+        df = ExcelCache().read(file_path)
         logger.info(f"Loaded {len(df)} records with columns: {df.columns.tolist()}")
         return df
     except Exception as e:
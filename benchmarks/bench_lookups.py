@@ -0,0 +1,92 @@
+"""
+Micro-benchmark: DataManager index lookups vs full-column scans
+
+Usage:
+    python benchmarks/bench_lookups.py [--tickers 450] [--metrics 100] [--years 10]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.compact_frame import compact_frame, sort_by_ticker
+from src.core.indexes import FundamentalsIndex
+
+
+def make_long_frame(n_tickers: int, n_metrics: int, n_years: int) -> pd.DataFrame:
+    """Generate a synthetic long-format fundamentals frame"""
+    rng = np.random.default_rng(42)
+    tickers = np.array([f"T{i:03d}" for i in range(n_tickers)])
+    metrics = np.array([f"CIS_{i}" for i in range(n_metrics)])
+    industries = np.array([f"Industry {i}" for i in range(20)])
+    periods = n_years * 4
+
+    n = n_tickers * n_metrics * periods
+    ticker_idx = np.repeat(np.arange(n_tickers), n_metrics * periods)
+    return pd.DataFrame({
+        'SECURITY_CODE': tickers[ticker_idx],
+        'METRIC_CODE': np.tile(np.repeat(metrics, periods), n_tickers),
+        'METRIC_VALUE': rng.normal(size=n),
+        'FREQ_CODE': 'Q',
+        'YEAR': np.tile(2015 + np.arange(periods) // 4, n_tickers * n_metrics),
+        'QUARTER': np.tile(np.arange(periods) % 4 + 1, n_tickers * n_metrics),
+        'ICB_L2': industries[ticker_idx % len(industries)]
+    }).sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def timeit(func, repeat: int = 20) -> float:
+    """Median wall time of a callable in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataManager lookups")
+    parser.add_argument('--tickers', type=int, default=450)
+    parser.add_argument('--metrics', type=int, default=100)
+    parser.add_argument('--years', type=int, default=10)
+    args = parser.parse_args()
+
+    raw = make_long_frame(args.tickers, args.metrics, args.years)
+    print(f"Rows: {len(raw):,}")
+
+    start = time.perf_counter()
+    df = sort_by_ticker(compact_frame(raw))
+    index = FundamentalsIndex(df)
+    print(f"Compact + index build: {(time.perf_counter() - start) * 1000:.0f} ms (once per load)\n")
+
+    ticker, metric, industry = 'T123', 'CIS_42', 'Industry 7'
+
+    cases = [
+        ('ticker rows',
+         lambda: raw[raw['SECURITY_CODE'] == ticker],
+         lambda: df.iloc[index.ticker_rows(ticker)]),
+        ('(ticker, metric) values',
+         lambda: raw.loc[(raw['SECURITY_CODE'] == ticker) & (raw['METRIC_CODE'] == metric), 'METRIC_VALUE'],
+         lambda: df['METRIC_VALUE'].iloc[index.metric_rows(ticker, metric)]),
+        ('industry rows',
+         lambda: raw[raw['ICB_L2'] == industry],
+         lambda: df.iloc[index.industry_rows(industry)]),
+        ('available tickers',
+         lambda: sorted(raw['SECURITY_CODE'].unique().tolist()),
+         lambda: index.tickers),
+    ]
+
+    print(f"{'lookup':<26}{'full scan (ms)':>16}{'indexed (ms)':>16}{'speedup':>10}")
+    for name, scan, indexed in cases:
+        scan_ms, indexed_ms = timeit(scan), timeit(indexed)
+        print(f"{name:<26}{scan_ms:>16.3f}{indexed_ms:>16.3f}{scan_ms / max(indexed_ms, 1e-6):>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+Benchmark suite: dashboard hot paths on a synthetic market
+
+Builds a deterministic synthetic OHLCV cache and fundamentals frame in a
+temporary working directory, times each hot path and writes the results
+as JSON (one file per run) so regressions between commits are visible.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scale small|medium|large] [--years 5]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<baseline>.json
+    python benchmarks/run_benchmarks.py --log-level INFO   # cost of eager per-symbol logging
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic import SCALES, make_fundamentals, make_ohlcv_panel, write_ohlcv_cache
+from src.core.log_policy import LoggingConfig, configure_logging, load_logging_config, reset_logging
+from src.core.shared_data import SHARED_DIR_ENV
+
+RESULTS_DIR = Path(__file__).parent / "results"
+RESULTS_VERSION = 1
+# Relative slowdown reported as a regression by --compare
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class BenchmarkContext:
+    """Synthetic data shared by the benchmarks"""
+    workdir: Path
+    panel: pd.DataFrame
+    fundamentals: pd.DataFrame
+    symbols: List[str]
+    sample: List[str]
+    _cache: Dict[str, Any] = field(default_factory=dict)
+
+    def bars(self, symbol: str) -> pd.DataFrame:
+        """Daily bars of one symbol indexed by date"""
+        if 'bars' not in self._cache:
+            sample = self.panel[self.panel['symbol'].isin(self.sample)]
+            self._cache['bars'] = {s: df.drop(columns='symbol').set_index('date')
+                                   for s, df in sample.groupby('symbol', sort=False)}
+        return self._cache['bars'][symbol]
+
+
+# name -> setup(ctx) returning (timed callable, operations per call)
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], Tuple[Callable[[], Any], int]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark('ohlcv_save')
+def bench_ohlcv_save(ctx: BenchmarkContext):
+    """OHLCVCacheManager.save_ohlcv for the sample tickers into a fresh cache"""
+    from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+    cache = OHLCVCacheManager(cache_dir=str(ctx.workdir / "save_cache"))
+    frames = [(symbol, ctx.bars(symbol)) for symbol in ctx.sample]
+
+    def run():
+        for symbol, df in frames:
+            cache.save_ohlcv(symbol, df)
+    return run, len(frames)
+
+
+@benchmark('ohlcv_get')
+def bench_ohlcv_get(ctx: BenchmarkContext):
+    """OHLCVCacheManager.get_ohlcv for the sample tickers"""
+    from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+    cache = OHLCVCacheManager()
+
+    def run():
+        for symbol in ctx.sample:
+            cache.get_ohlcv(symbol)
+    return run, len(ctx.sample)
+
+
+@benchmark('breadth_history')
+def bench_breadth_history(ctx: BenchmarkContext):
+    """One-year breadth history over every cached symbol (calculate_market_breadth.py)"""
+    from calculate_market_breadth import calculate_market_breadth_history
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            calculate_market_breadth_history()
+    return run, len(ctx.symbols)
+
+
+@benchmark('market_breadth')
+def bench_market_breadth(ctx: BenchmarkContext):
+    """OHLCVVisualizer.analyze_market_breadth over every cached symbol"""
+    from src.data.connectors.update_ohlcv_data import OHLCVUpdater
+    from src.data.connectors.visualize_ohlcv import OHLCVVisualizer
+
+    visualizer = OHLCVVisualizer(updater=OHLCVUpdater())
+
+    def run():
+        visualizer.analyze_market_breadth(ctx.symbols)
+    return run, len(ctx.symbols)
+
+
+@benchmark('growth_analysis')
+def bench_growth_analysis(ctx: BenchmarkContext):
+    """GrowthAnalyzer.generate_growth_analysis for the sample tickers"""
+    from src.analysis.fundamental.growth_analyzer import GrowthAnalyzer
+
+    analyzer = GrowthAnalyzer(data=ctx.fundamentals)
+
+    def run():
+        for symbol in ctx.sample:
+            analyzer.generate_growth_analysis(symbol)
+    return run, len(ctx.sample)
+
+
+@benchmark('statement_tables')
+def bench_statement_tables(ctx: BenchmarkContext):
+    """Company Dashboard display tables (build_all_tables) for the sample tickers"""
+    from src.analysis.fundamental.growth_analyzer import GrowthAnalyzer
+    from src.analysis.fundamental.statement_tables import build_all_tables
+
+    analyzer = GrowthAnalyzer(data=ctx.fundamentals)
+    analyses = [analyzer.generate_growth_analysis(symbol) for symbol in ctx.sample]
+
+    def run():
+        for analysis in analyses:
+            build_all_tables(analysis)
+    return run, len(analyses)
+
+
+@benchmark('indicators')
+def bench_indicators(ctx: BenchmarkContext):
+    """TechnicalIndicatorAnalyzer.calculate_all_indicators for the sample tickers"""
+    from src.analysis.technical.indicator_analyzer import TechnicalIndicatorAnalyzer
+
+    analyzer = TechnicalIndicatorAnalyzer()
+    frames = [ctx.bars(symbol) for symbol in ctx.sample]
+
+    def run():
+        for df in frames:
+            analyzer.calculate_all_indicators(df)
+    return run, len(frames)
+
+
+@benchmark('backtest')
+def bench_backtest(ctx: BenchmarkContext):
+    """BacktestEngine EMA 9/21 crossover over every symbol"""
+    from src.analysis.technical.backtest import BacktestEngine
+
+    engine = BacktestEngine(ctx.panel)
+
+    def run():
+        engine.run_crossover(9, 21)
+    return run, len(ctx.symbols)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Time a callable
+
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+
+    Returns:
+        Dictionary with median/min/max wall time in milliseconds
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': float(np.median(times)),
+        'min_ms': float(np.min(times)),
+        'max_ms': float(np.max(times)),
+        'runs': repeat
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    """Current commit and whether the tree has local changes"""
+    def git(*args) -> str:
+        try:
+            return subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True,
+                                  text=True, timeout=30).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+    return {'commit': git('rev-parse', '--short', 'HEAD') or 'unknown',
+            'dirty': bool(git('status', '--porcelain', '--untracked-files=no'))}
+
+
+def run_suite(n_tickers: int, n_years: int = 5, seed: int = 42, sample_size: int = 50,
+              repeat: int = 3, names: Optional[List[str]] = None,
+              end_date: Optional[str] = None, log_level: str = "policy") -> Dict[str, Any]:
+    """
+    Generate the synthetic market and run the benchmarks
+
+    Args:
+        n_tickers: Number of tickers
+        n_years: Years of history
+        seed: Random seed
+        sample_size: Tickers used by the per-ticker benchmarks
+        repeat: Runs per benchmark
+        names: Benchmarks to run (default: all)
+        end_date: Last bar date (default: last business day)
+        log_level: 'policy' for the config.yaml levels, or one level for every logger
+
+    Returns:
+        Results document (meta + per-benchmark timings)
+    """
+    names = list(names or BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    # The benchmarks must read the synthetic cache, not a shared panel
+    os.environ.pop(SHARED_DIR_ENV, None)
+    original_cwd = Path.cwd()
+    setup_times = {}
+    results = {}
+
+    # Log records are formatted and written to a null stream so their cost is measured
+    log_config = (load_logging_config(PROJECT_ROOT / "config.yaml") if log_level == "policy"
+                  else LoggingConfig(level=log_level.upper()))
+    log_sink = open(os.devnull, 'w')
+    configure_logging(replace(log_config, file=None), stream=log_sink, force=True)
+
+    with log_sink, tempfile.TemporaryDirectory(prefix="stock_dashboard_bench_") as tmp:
+        # Modules resolve Database/... relative to the working directory
+        os.chdir(tmp)
+        try:
+            start = time.perf_counter()
+            panel = make_ohlcv_panel(n_tickers, n_years, seed, end_date)
+            fundamentals = make_fundamentals(n_tickers, n_years, seed)
+            setup_times['generate_s'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            write_ohlcv_cache(panel, "Database/cache").close()
+            setup_times['load_cache_s'] = time.perf_counter() - start
+
+            symbols = list(dict.fromkeys(panel['symbol']))
+            rng = np.random.default_rng(seed)
+            sample = sorted(rng.choice(symbols, size=min(sample_size, len(symbols)), replace=False).tolist())
+            ctx = BenchmarkContext(Path(tmp), panel, fundamentals, symbols, sample)
+
+            for name in names:
+                run, operations = BENCHMARKS[name](ctx)
+                timing = measure(run, repeat)
+                timing['operations'] = operations
+                timing['ms_per_op'] = timing['median_ms'] / max(operations, 1)
+                results[name] = timing
+                print(f"{name:<20}{timing['median_ms']:>12.1f} ms{timing['ms_per_op']:>12.3f} ms/op"
+                      f"  ({operations} ops)")
+        finally:
+            os.chdir(original_cwd)
+            reset_logging()
+
+    return {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            **git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'tickers': n_tickers,
+            'years': n_years,
+            'seed': seed,
+            'log_level': log_level,
+            'sample_size': len(sample),
+            'ohlcv_rows': len(panel),
+            'fundamental_rows': len(fundamentals),
+            **setup_times
+        },
+        'results': results
+    }
+
+
+def save_results(document: Dict[str, Any], output_dir: Path = RESULTS_DIR, label: str = "") -> Path:
+    """
+    Write a results document as JSON
+
+    Args:
+        document: Output of run_suite
+        output_dir: Results directory
+        label: Scale label used in the file name
+
+    Returns:
+        Path of the written file
+    """
+    meta = document['meta']
+    stamp = datetime.fromisoformat(meta['timestamp']).strftime('%Y%m%d-%H%M%S')
+    name = f"{stamp}_{meta['commit']}{'-dirty' if meta['dirty'] else ''}_{label or meta['tickers']}.json"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / name
+    path.write_text(json.dumps(document, indent=2))
+    return path
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare per-operation times against a baseline run
+
+    Args:
+        current: Results document of this run
+        baseline: Results document to compare with
+        threshold: Relative slowdown reported as a regression
+
+    Returns:
+        One row per benchmark present in both runs
+    """
+    rows = []
+    for name, timing in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        ratio = timing['ms_per_op'] / base['ms_per_op'] if base['ms_per_op'] > 0 else float('inf')
+        status = 'REGRESSION' if ratio > 1 + threshold else 'faster' if ratio < 1 - threshold else 'ok'
+        rows.append({'benchmark': name, 'baseline_ms_per_op': base['ms_per_op'],
+                     'ms_per_op': timing['ms_per_op'], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard hot paths on synthetic data")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small', help='Named ticker count')
+    parser.add_argument('--tickers', type=int, help='Ticker count (overrides --scale)')
+    parser.add_argument('--years', type=int, default=5, help='Years of history')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--sample', type=int, default=50, help='Tickers for per-ticker benchmarks')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per benchmark')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run')
+    parser.add_argument('--log-level', choices=['policy', 'DEBUG', 'INFO', 'WARNING'], default='policy',
+                        help='Logging levels during the run (policy: config.yaml)')
+    parser.add_argument('--end-date', help='Last bar date (default: last business day)')
+    parser.add_argument('--output', type=Path, default=RESULTS_DIR, help='Results directory')
+    parser.add_argument('--compare', type=Path, help='Baseline results JSON')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Relative slowdown reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 on any regression')
+    args = parser.parse_args()
+
+    n_tickers = args.tickers or SCALES[args.scale]
+    label = args.scale if args.tickers is None else f"{n_tickers}t"
+    if args.log_level != 'policy':
+        label += f"-log{args.log_level}"
+    print(f"Synthetic market: {n_tickers} tickers x {args.years} years (seed {args.seed})\n")
+
+    document = run_suite(n_tickers, args.years, args.seed, args.sample, args.repeat,
+                         args.only, args.end_date, args.log_level)
+    path = save_results(document, args.output, f"{label}-{args.years}y")
+    print(f"\nResults written to {path}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        keys = ('tickers', 'years', 'seed', 'sample_size', 'log_level')
+        if any(baseline['meta'].get(k) != document['meta'].get(k) for k in keys):
+            print("⚠️  Baseline was run with different parameters; per-op ratios are indicative only")
+
+        rows = compare_results(document, baseline, args.threshold)
+        print(f"\nvs {baseline['meta']['commit']} ({args.compare.name})")
+        print(f"{'benchmark':<20}{'baseline ms/op':>16}{'ms/op':>12}{'ratio':>8}  status")
+        for row in rows:
+            print(f"{row['benchmark']:<20}{row['baseline_ms_per_op']:>16.3f}{row['ms_per_op']:>12.3f}"
+                  f"{row['ratio']:>8.2f}  {row['status']}")
+
+        if args.fail_on_regression and any(row['status'] == 'REGRESSION' for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Synthetic market generator for benchmarks
+
+Deterministic (seeded) OHLCV panels and long-format fundamentals with the
+same schemas as the OHLCV SQLite cache and Buu_clean_ver2.parquet, so the
+hot paths can be timed without the real database or live APIs.
+"""
+
+import string
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analysis.fundamental.statement_tables import BALANCE_METRICS, CASHFLOW_METRICS, INCOME_METRICS
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+# Number of tickers per named scale
+SCALES = {'small': 100, 'medium': 1500, 'large': 5000}
+
+TRADING_DAYS_PER_YEAR = 250
+# Income statement costs are stored as negative values
+NEGATIVE_METRICS = {'CIS_11', 'CIS_22', 'CIS_25', 'CIS_26', 'CIS_32'}
+# Computed by the analysis, not stored
+DERIVED_METRICS = {'OPERATING_PROFIT', 'EBITDA'}
+
+
+def make_tickers(n_tickers: int) -> List[str]:
+    """
+    Generate distinct three-letter tickers (AAA, AAB, ...)
+
+    Args:
+        n_tickers: Number of tickers (at most 26**3)
+
+    Returns:
+        List of tickers
+    """
+    letters = string.ascii_uppercase
+    return [letters[i // 676] + letters[i // 26 % 26] + letters[i % 26] for i in range(n_tickers)]
+
+
+def fundamental_metrics() -> List[str]:
+    """Metric codes shown in the Company Dashboard statement tables"""
+    codes = [code for code, _ in INCOME_METRICS + BALANCE_METRICS + CASHFLOW_METRICS]
+    return [code for code in dict.fromkeys(codes) if code not in DERIVED_METRICS]
+
+
+def make_ohlcv_panel(n_tickers: int, n_years: int = 5, seed: int = 42,
+                     end_date: Optional[Union[str, pd.Timestamp]] = None,
+                     n_days: Optional[int] = None,
+                     betas: Optional[Sequence[float]] = None) -> pd.DataFrame:
+    """
+    Generate daily bars for many tickers as a geometric random walk
+
+    Values depend only on the seed and the shape; the business-day calendar
+    ends at end_date (default: the last business day), so date-relative
+    queries such as the one-year breadth history see a full year.
+
+    Args:
+        n_tickers: Number of tickers
+        n_years: Years of history
+        seed: Random seed
+        end_date: Last bar date
+        n_days: Sessions of history (overrides n_years)
+        betas: Per-ticker loadings on a common market return (default: none)
+
+    Returns:
+        Long frame with symbol, date, open, high, low, close, volume sorted by
+        symbol and date
+    """
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(end_date) if end_date is not None else pd.Timestamp.today().normalize()
+    dates = pd.bdate_range(end=end, periods=n_days or n_years * TRADING_DAYS_PER_YEAR)
+    n_days = len(dates)
+
+    base = np.round(rng.uniform(5_000, 100_000, size=(n_tickers, 1)), -1)
+    returns = rng.normal(0.0003, 0.02, size=(n_tickers, n_days))
+    if betas is not None:
+        # Drawn from its own stream so panels without betas are unchanged
+        market = np.random.default_rng([seed, 1]).normal(0.0005, 0.015, size=n_days)
+        returns = returns + np.asarray(betas, dtype='float64')[:, None] * market
+    close = np.round(base * np.exp(np.cumsum(returns, axis=1)), -1)
+    gap = rng.normal(0, 0.005, size=close.shape)
+    open_ = np.round(close * (1 - returns + gap), -1)
+    spread = np.abs(rng.normal(0, 0.01, size=close.shape))
+    high = np.round(np.maximum(open_, close) * (1 + spread), -1)
+    low = np.round(np.minimum(open_, close) * (1 - spread), -1)
+    # Median trading value around 10 billion VND
+    liquidity = rng.lognormal(np.log(10e9), 1.0, size=(n_tickers, 1))
+    volume = np.round(liquidity / close * rng.lognormal(0, 0.4, size=close.shape), -2)
+
+    return pd.DataFrame({
+        'symbol': np.repeat(make_tickers(n_tickers), n_days),
+        'date': np.tile(dates.values, n_tickers),
+        'open': open_.ravel(),
+        'high': high.ravel(),
+        'low': low.ravel(),
+        'close': close.ravel(),
+        'volume': volume.ravel().astype('int64')
+    })
+
+
+def make_fundamentals(n_tickers: int, n_years: int = 5, seed: int = 42,
+                      metrics: Optional[Sequence[str]] = None, last_year: int = 2024) -> pd.DataFrame:
+    """
+    Generate long-format quarterly and annual fundamentals
+
+    Annual rows (FREQ_CODE 'Y', QUARTER 0) are the sum of the year's quarters.
+
+    Args:
+        n_tickers: Number of tickers
+        n_years: Years of history
+        seed: Random seed
+        metrics: Metric codes (default: statement table metrics)
+        last_year: Last fiscal year
+
+    Returns:
+        Long frame with SECURITY_CODE, METRIC_CODE, FREQ_CODE, YEAR, QUARTER,
+        REPORT_DATE, METRIC_VALUE sorted by ticker
+    """
+    rng = np.random.default_rng(seed)
+    metrics = list(metrics or fundamental_metrics())
+    n_metrics = len(metrics)
+    years = np.arange(last_year - n_years + 1, last_year + 1)
+
+    # Company size (VND) and per-metric share of it, then quarterly noise
+    size = rng.lognormal(np.log(1e12), 1.0, size=(n_tickers, 1, 1, 1))
+    share = rng.uniform(0.02, 1.0, size=(n_tickers, n_metrics, 1, 1))
+    growth = (1 + rng.normal(0.08, 0.1, size=(n_tickers, 1, 1, 1))) ** (years - years[0])[:, None]
+    quarterly = size * share * growth * rng.uniform(0.15, 0.35, size=(n_tickers, n_metrics, n_years, 4))
+    sign = np.array([-1.0 if m in NEGATIVE_METRICS else 1.0 for m in metrics])[None, :, None, None]
+    quarterly = quarterly * sign
+    # Quarters 1-4 followed by the annual total (quarter 0)
+    values = np.concatenate([quarterly, quarterly.sum(axis=3, keepdims=True)], axis=3)
+
+    quarters = np.array([1, 2, 3, 4, 0])
+    year_grid = np.broadcast_to(years[:, None], (n_years, 5))
+    quarter_grid = np.broadcast_to(quarters, (n_years, 5))
+    month = np.where(quarter_grid == 0, 12, quarter_grid * 3)
+    report_dates = (pd.to_datetime({'year': year_grid.ravel(), 'month': month.ravel(), 'day': 1})
+                    + pd.offsets.MonthEnd(0)).to_numpy()
+
+    periods = n_years * 5
+    n_rows = n_tickers * n_metrics * periods
+    return pd.DataFrame({
+        'SECURITY_CODE': np.repeat(make_tickers(n_tickers), n_metrics * periods),
+        'METRIC_CODE': np.tile(np.repeat(metrics, periods), n_tickers),
+        'FREQ_CODE': np.tile(np.where(quarter_grid.ravel() == 0, 'Y', 'Q'), n_tickers * n_metrics),
+        'YEAR': np.tile(year_grid.ravel(), n_tickers * n_metrics).astype('int64'),
+        'QUARTER': np.tile(quarter_grid.ravel(), n_tickers * n_metrics).astype('int64'),
+        'REPORT_DATE': np.tile(report_dates, n_tickers * n_metrics),
+        'METRIC_VALUE': values.reshape(n_rows)
+    })
+
+
+def write_ohlcv_cache(panel: pd.DataFrame, cache_dir: Union[str, Path],
+                      resolution: str = '1D') -> OHLCVCacheManager:
+    """
+    Bulk-load a panel into an OHLCV cache database (benchmark setup)
+
+    Rows go straight into the cache tables with executemany, so large scales
+    can be prepared without timing save_ohlcv on every ticker.
+
+    Args:
+        panel: Long OHLCV panel from make_ohlcv_panel
+        cache_dir: Cache directory
+        resolution: Time resolution
+
+    Returns:
+        OHLCVCacheManager over the loaded database
+    """
+    cache = OHLCVCacheManager(cache_dir=str(cache_dir))
+    dates = pd.to_datetime(panel['date']).dt.strftime('%Y-%m-%d')
+    rows = zip(panel['symbol'], dates, panel['open'], panel['high'], panel['low'],
+               panel['close'], panel['volume'].astype(int).tolist(), [resolution] * len(panel))
+    cache.conn.executemany('''
+        INSERT OR REPLACE INTO ohlcv_data
+        (symbol, date, open, high, low, close, volume, resolution)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+
+    summary = (pd.DataFrame({'symbol': panel['symbol'], 'date': dates})
+               .groupby('symbol', sort=False)['date'].agg(['min', 'max', 'size']))
+    cache.conn.executemany('''
+        INSERT OR REPLACE INTO cache_metadata
+        (symbol, resolution, last_update, start_date, end_date, record_count)
+        VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?, ?)
+    ''', [(symbol, resolution, start, end, int(count))
+          for symbol, (start, end, count) in summary.iterrows()])
+    cache.conn.commit()
+    return cache
@@ -29,7 +29,7 @@ def calculate_market_breadth_history():
     # Get all symbols from cache
     conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
     cursor = conn.cursor()
-    cursor.execute('SELECT DISTINCT symbol FROM ohlcv_data ORDER BY symbol')
+    cursor.execute("SELECT DISTINCT symbol FROM ohlcv_data WHERE resolution = '1D' ORDER BY symbol")
     all_symbols = [row[0] for row in cursor.fetchall()]
     conn.close()
     
@@ -49,6 +49,7 @@ def calculate_market_breadth_history():
                 SELECT date, open, high, low, close, volume
                 FROM ohlcv_data 
                 WHERE symbol = '{symbol}'
+                AND resolution = '1D'
                 AND date >= date('now', '-365 days')
                 ORDER BY date
             """
@@ -16,10 +16,10 @@ def main():
     conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
     cursor = conn.cursor()
     
-    cursor.execute('SELECT COUNT(DISTINCT symbol) FROM ohlcv_data')
+    cursor.execute("SELECT COUNT(DISTINCT symbol) FROM ohlcv_data WHERE resolution = '1D'")
     cached_count = cursor.fetchone()[0]
     
-    cursor.execute('SELECT COUNT(*) FROM ohlcv_data')
+    cursor.execute("SELECT COUNT(*) FROM ohlcv_data WHERE resolution = '1D'")
     total_records = cursor.fetchone()[0]
     
     # Get file size
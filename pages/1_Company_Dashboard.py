@@ -6,7 +6,6 @@ Company Dashboard - Financial Analysis
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime
 import os
@@ -19,6 +18,11 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from src.analysis.fundamental.growth_analyzer import GrowthAnalyzer
+from src.analysis.fundamental.statement_tables import (
+    StatementTableStore, SUMMARY_METRICS, add_ebitda, summarize_statement
+)
+from src.core.instrumentation import use_session_recorder
+from src.core.log_policy import configure_logging
 
 # Page config
 st.set_page_config(
@@ -26,6 +30,8 @@ st.set_page_config(
     page_icon="📈",
     layout="wide"
 )
+configure_logging()
+use_session_recorder(st.session_state)
 
 # Title
 st.title("📈 Company Financial Dashboard")
@@ -66,16 +72,25 @@ period_type = st.sidebar.radio(
 )
 
 # Load and analyze data
+@st.cache_resource
+def get_growth_analyzer():
+    """Load parquet một lần cho mọi ticker"""
+    return GrowthAnalyzer("Database/Full_database/Buu_clean_ver2.parquet")
+
 @st.cache_data
 def analyze_ticker(ticker):
     """Phân tích dữ liệu cho ticker"""
     try:
-        analyzer = GrowthAnalyzer("Database/Full_database/Buu_clean_ver2.parquet")
-        return analyzer.generate_growth_analysis(ticker)
+        return get_growth_analyzer().generate_growth_analysis(ticker)
     except Exception as e:
         st.error(f"Lỗi khi phân tích {ticker}: {str(e)}")
         return None
 
+@st.cache_resource
+def get_statement_tables():
+    """Bảng báo cáo tài chính đã chuyển vị, dựng khi xem ticker lần đầu rồi dùng lại"""
+    return StatementTableStore(analyze_ticker)
+
 def calculate_ma4_growth(data, value_column):
     """
     Tính MA4 growth: (Sum của 4 quý gần nhất) / (Sum của 4 quý trước đó) - 1
@@ -224,145 +239,6 @@ def create_metric_chart(data, metric_code, metric_name, color='blue', is_quarter
     
     return fig
 
-def prepare_display_data(data, data_type, is_quarterly=True):
-    """
-    Chuẩn bị dữ liệu để hiển thị trong tab chi tiết với metrics làm hàng và thời gian làm cột
-    """
-    if data.empty:
-        return pd.DataFrame()
-    
-    # Define metric mappings with ordered lists to preserve sequence
-    income_metrics_ordered = [
-        ('CIS_10', 'Doanh thu thuần'),
-        ('CIS_11', 'Giá vốn hàng bán'),
-        ('CIS_20', 'Lợi nhuận gộp'),
-        ('CIS_25', 'Chi phí QLDN'),
-        ('CIS_26', 'Chi phí bán hàng'),
-        ('CIS_21', 'Thu nhập tài chính'),
-        ('CIS_22', 'Chi phí tài chính'),
-        ('CIS_31', 'Thu nhập khác'),
-        ('CIS_32', 'Chi phí khác'),
-        ('CIS_50', 'Lợi nhuận trước thuế'),
-        ('CIS_61', 'Lợi nhuận ròng'),
-        ('OPERATING_PROFIT', 'Lợi nhuận hoạt động'),
-        ('EBITDA', 'EBITDA')
-    ]
-    
-    balance_metrics_ordered = [
-        ('CBS_270', 'Tổng tài sản'),
-        ('CBS_100', 'Tài sản ngắn hạn'),
-        ('CBS_110', 'Tiền và tương đương'),
-        ('CBS_112', 'Đầu tư ngắn hạn'),
-        ('CBS_130', 'Phải thu'),
-        ('CBS_140', 'Hàng tồn kho'),
-        ('CBS_220', 'Tài sản cố định'),
-        ('CBS_300', 'Tổng nợ'),
-        ('CBS_320', 'Nợ ngắn hạn'),
-        ('CBS_338', 'Nợ dài hạn'),
-        ('CBS_400', 'Vốn chủ sở hữu')
-    ]
-    
-    cashflow_metrics_ordered = [
-        ('CFS_20', 'Dòng tiền HĐKD'),
-        ('CFS_30', 'Dòng tiền đầu tư'),
-        ('CFS_40', 'Dòng tiền tài chính'),
-        ('CFS_50', 'Lưu chuyển tiền thuần'),
-        ('CCFI_2', 'Khấu hao')
-    ]
-    
-    margin_columns_ordered = [
-        ('Gross_Margin', 'Gross Margin (%)'),
-        ('Operating_Margin', 'Operating Margin (%)'),
-        ('EBITDA_Margin', 'EBITDA Margin (%)'),
-        ('Net_Margin', 'Net Margin (%)')
-    ]
-    
-    display_df = data.copy()
-    
-    # Filter from 2018
-    if 'YEAR' in display_df.columns:
-        display_df = display_df[display_df['YEAR'] >= 2018]
-    
-    # Remove REPORT_DATE column if exists
-    if 'REPORT_DATE' in display_df.columns:
-        display_df = display_df.drop(columns=['REPORT_DATE'])
-    
-    # Create Period column and sort
-    if is_quarterly and 'YEAR' in display_df.columns and 'QUARTER' in display_df.columns:
-        display_df = display_df.sort_values(['YEAR', 'QUARTER'])
-        # Format: 1Q2018 instead of 2018-Q1
-        display_df['Period'] = display_df['QUARTER'].astype(str) + 'Q' + display_df['YEAR'].astype(str)
-        # Drop YEAR and QUARTER columns after creating Period
-        display_df = display_df.drop(columns=['YEAR', 'QUARTER'], errors='ignore')
-    elif 'YEAR' in display_df.columns:
-        display_df = display_df.sort_values('YEAR')
-        display_df['Period'] = display_df['YEAR'].astype(str)
-        display_df = display_df.drop(columns=['YEAR'], errors='ignore')
-    else:
-        # If no Period column can be created, return empty
-        return pd.DataFrame()
-    
-    # Select metrics based on data type
-    if data_type == "Financial Data":
-        metrics_ordered = income_metrics_ordered + balance_metrics_ordered + cashflow_metrics_ordered
-    elif data_type == "Income Statement":
-        metrics_ordered = income_metrics_ordered
-    elif data_type == "Balance Sheet":
-        metrics_ordered = balance_metrics_ordered
-    elif data_type == "Cash Flow":
-        metrics_ordered = cashflow_metrics_ordered
-    elif data_type == "Margins":
-        metrics_ordered = margin_columns_ordered
-    else:
-        return pd.DataFrame()
-    
-    # Create result dataframe
-    result_data = []
-    
-    # Process each metric in order
-    for metric_code, metric_name in metrics_ordered:
-        if metric_code in display_df.columns:
-            # Create a row for this metric
-            row_data = {'Chỉ tiêu': metric_name}
-            
-            # Add values for each period
-            for _, period_row in display_df.iterrows():
-                period = period_row['Period']
-                value = period_row.get(metric_code, np.nan)
-                row_data[period] = value
-            
-            result_data.append(row_data)
-    
-    if not result_data:
-        return pd.DataFrame()
-    
-    # Create final dataframe
-    transposed_df = pd.DataFrame(result_data)
-    
-    # Ensure Period columns are sorted properly
-    period_cols = [col for col in transposed_df.columns if col != 'Chỉ tiêu']
-    
-    # Sort periods correctly (extract year and quarter for proper sorting)
-    def sort_period_key(period_str):
-        try:
-            # Format: 1Q2018, 2Q2018, etc.
-            if 'Q' in period_str:
-                quarter, year = period_str.split('Q')
-                return (int(year), int(quarter))
-            else:
-                # Format: 2018, 2019, etc. (annual)
-                return (int(period_str), 0)
-        except:
-            return (9999, 0)  # Put any unparseable values at the end
-    
-    period_cols_sorted = sorted(period_cols, key=sort_period_key)
-    
-    # Reorder columns: 'Chỉ tiêu' first, then sorted periods
-    final_columns = ['Chỉ tiêu'] + period_cols_sorted
-    transposed_df = transposed_df[final_columns]
-    
-    return transposed_df
-
 def create_margin_chart(data, margin_columns, title, is_quarterly=True):
     """
     Tạo biểu đồ margins
@@ -441,25 +317,9 @@ ttm_growth = analysis_results.get('ttm_growth_data', pd.DataFrame())
 quarterly_margins = analysis_results.get('quarterly_margins', pd.DataFrame())
 annual_margins = analysis_results.get('annual_margins', pd.DataFrame())
 
-# Ensure EBITDA is calculated in quarterly_data
-if not quarterly_data.empty:
-    if 'EBITDA' not in quarterly_data.columns:
-        if 'OPERATING_PROFIT' in quarterly_data.columns and 'CCFI_2' in quarterly_data.columns:
-            quarterly_data['EBITDA'] = quarterly_data['OPERATING_PROFIT'] + quarterly_data['CCFI_2']
-        elif all(col in quarterly_data.columns for col in ['CIS_20', 'CIS_25', 'CIS_26', 'CCFI_2']):
-            # Calculate operating profit first, then EBITDA
-            quarterly_data['OPERATING_PROFIT'] = quarterly_data['CIS_20'] + quarterly_data['CIS_25'] + quarterly_data['CIS_26']
-            quarterly_data['EBITDA'] = quarterly_data['OPERATING_PROFIT'] + quarterly_data['CCFI_2']
-
-# Ensure EBITDA is calculated in annual_data
-if not annual_data.empty:
-    if 'EBITDA' not in annual_data.columns:
-        if 'OPERATING_PROFIT' in annual_data.columns and 'CCFI_2' in annual_data.columns:
-            annual_data['EBITDA'] = annual_data['OPERATING_PROFIT'] + annual_data['CCFI_2']
-        elif all(col in annual_data.columns for col in ['CIS_20', 'CIS_25', 'CIS_26', 'CCFI_2']):
-            # Calculate operating profit first, then EBITDA
-            annual_data['OPERATING_PROFIT'] = annual_data['CIS_20'] + annual_data['CIS_25'] + annual_data['CIS_26']
-            annual_data['EBITDA'] = annual_data['OPERATING_PROFIT'] + annual_data['CCFI_2']
+# Ensure EBITDA is calculated
+quarterly_data = add_ebitda(quarterly_data)
+annual_data = add_ebitda(annual_data)
 
 # Main dashboard layout with updated tabs
 tab1, tab2, tab3, tab4 = st.tabs([
@@ -811,131 +671,79 @@ with tab4:
                 ["Income Statement", "Balance Sheet", "Cash Flow", "Margins", "Financial Data"]
             )
     
-    # Prepare data based on selection
-    if data_type in ["Income Statement", "Balance Sheet", "Cash Flow", "Financial Data"]:
-        if is_quarterly:
-            base_data = quarterly_data
-        else:
-            base_data = annual_data
-    elif data_type == "Margins":
-        if is_quarterly:
-            base_data = quarterly_margins
-        else:
-            base_data = annual_margins
-    else:
-        base_data = pd.DataFrame()
-    
-    # Prepare display data
-    if not base_data.empty:
-        display_data = prepare_display_data(base_data, data_type, is_quarterly)
+    # Prepare display data (built once per ticker on first view, switching tabs/periods is a lookup)
+    display_data = get_statement_tables().get(selected_ticker, data_type, is_quarterly)
+    if not display_data.empty:
+        # Show data info
+        st.info(f"📊 Hiển thị: {data_type} - {'Theo Quý' if is_quarterly else 'Theo Năm'} (từ 2018)")
         
-        if not display_data.empty:
-            # Show data info
-            st.info(f"📊 Hiển thị: {data_type} - {'Theo Quý' if is_quarterly else 'Theo Năm'} (từ 2018)")
-            
-            # Create formatted dataframe for display
-            formatted_df = display_data.copy()
-            
-            # Get period columns (all columns except 'Chỉ tiêu')
-            period_columns = [col for col in formatted_df.columns if col != 'Chỉ tiêu']
-            
-            # Format based on data type
-            if data_type == "Margins":
-                # Format margin columns as percentages
-                for col in period_columns:
-                    formatted_df[col] = formatted_df[col].apply(
-                        lambda x: f'{x:.2f}%' if pd.notna(x) and isinstance(x, (int, float)) else ''
-                    )
-            else:
-                # Format financial data with thousand separators
-                for col in period_columns:
-                    formatted_df[col] = formatted_df[col].apply(
-                        lambda x: f'{x:,.0f}' if pd.notna(x) and isinstance(x, (int, float)) else ''
-                    )
-            
-            # Create column config for better display
-            column_config = {
-                'Chỉ tiêu': st.column_config.TextColumn(
-                    'Chỉ tiêu',
-                    width='medium',
-                    help='Tên chỉ tiêu tài chính'
+        # Create formatted dataframe for display
+        formatted_df = display_data.copy()
+        
+        # Get period columns (all columns except 'Chỉ tiêu')
+        period_columns = [col for col in formatted_df.columns if col != 'Chỉ tiêu']
+        
+        # Format based on data type
+        if data_type == "Margins":
+            # Format margin columns as percentages
+            for col in period_columns:
+                formatted_df[col] = formatted_df[col].apply(
+                    lambda x: f'{x:.2f}%' if pd.notna(x) and isinstance(x, (int, float)) else ''
                 )
-            }
-            
-            # Add config for period columns with smaller width
+        else:
+            # Format financial data with thousand separators
             for col in period_columns:
-                column_config[col] = st.column_config.TextColumn(
-                    col,
-                    width='small'
+                formatted_df[col] = formatted_df[col].apply(
+                    lambda x: f'{x:,.0f}' if pd.notna(x) and isinstance(x, (int, float)) else ''
                 )
-            
-            # Display dataframe with custom styling
-            st.dataframe(
-                formatted_df,
-                use_container_width=True,
-                hide_index=True,
-                height=500,
-                column_config=column_config
+        
+        # Create column config for better display
+        column_config = {
+            'Chỉ tiêu': st.column_config.TextColumn(
+                'Chỉ tiêu',
+                width='medium',
+                help='Tên chỉ tiêu tài chính'
+            )
+        }
+        
+        # Add config for period columns with smaller width
+        for col in period_columns:
+            column_config[col] = st.column_config.TextColumn(
+                col,
+                width='small'
             )
+        
+        # Display dataframe with custom styling
+        st.dataframe(
+            formatted_df,
+            use_container_width=True,
+            hide_index=True,
+            height=500,
+            column_config=column_config
+        )
+        
+        # Summary statistics
+        if data_type != "Margins":
+            st.subheader("📊 Thống kê tóm tắt")
             
-            # Summary statistics
-            if data_type != "Margins":
-                st.subheader("📊 Thống kê tóm tắt")
-                
-                # Select key metrics for summary
-                if data_type == "Income Statement" or data_type == "Financial Data":
-                    summary_metrics = ['Doanh thu thuần', 'Lợi nhuận gộp', 'EBITDA', 'Lợi nhuận ròng']
-                elif data_type == "Balance Sheet":
-                    summary_metrics = ['Tổng tài sản', 'Tổng nợ', 'Vốn chủ sở hữu']
-                elif data_type == "Cash Flow":
-                    summary_metrics = ['Dòng tiền HĐKD', 'Lưu chuyển tiền thuần']
-                else:
-                    summary_metrics = []
-                
-                # Filter to get only the metrics we want
-                summary_data = display_data[display_data['Chỉ tiêu'].isin(summary_metrics)]
+            stats_df = summarize_statement(display_data, SUMMARY_METRICS.get(data_type, []))
+            if not stats_df.empty:
+                # Format numbers
+                for col in ['Trung bình', 'Tối thiểu', 'Tối đa', 'Độ lệch chuẩn']:
+                    stats_df[col] = stats_df[col].apply(lambda x: f'{x:,.0f}')
                 
-                if not summary_data.empty:
-                    # Calculate statistics for each metric
-                    stats_list = []
-                    for _, row in summary_data.iterrows():
-                        metric_name = row['Chỉ tiêu']
-                        # Get numeric values from period columns
-                        values = []
-                        for col in period_columns:
-                            val = row[col]
-                            if pd.notna(val) and isinstance(val, (int, float)):
-                                values.append(val)
-                        
-                        if values:
-                            stats_list.append({
-                                'Chỉ tiêu': metric_name,
-                                'Trung bình': np.mean(values),
-                                'Tối thiểu': np.min(values),
-                                'Tối đa': np.max(values),
-                                'Độ lệch chuẩn': np.std(values)
-                            })
-                    
-                    if stats_list:
-                        stats_df = pd.DataFrame(stats_list)
-                        # Format numbers
-                        for col in ['Trung bình', 'Tối thiểu', 'Tối đa', 'Độ lệch chuẩn']:
-                            stats_df[col] = stats_df[col].apply(lambda x: f'{x:,.0f}')
-                        
-                        st.dataframe(stats_df, hide_index=True)
-            
-            # Download button
-            csv = display_data.to_csv(index=False)
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv,
-                file_name=f"{selected_ticker}_{data_type.lower().replace(' ', '_')}_{period_type.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
-        else:
-            st.warning(f"Không có dữ liệu {data_type} để hiển thị")
+                st.dataframe(stats_df, hide_index=True)
+        
+        # Download button
+        csv = display_data.to_csv(index=False)
+        st.download_button(
+            label="📥 Download CSV",
+            data=csv,
+            file_name=f"{selected_ticker}_{data_type.lower().replace(' ', '_')}_{period_type.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
     else:
-        st.info(f"Không có dữ liệu cho {selected_ticker}")
+        st.warning(f"Không có dữ liệu {data_type} để hiển thị")
 
 # Footer
 st.markdown("---")
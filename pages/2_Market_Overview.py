@@ -4,7 +4,9 @@ Market Overview Page with OHLCV Charts
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+import time
+from contextlib import contextmanager
+from datetime import datetime
 import plotly.graph_objects as go
 from typing import List, Dict, Any
 
@@ -14,34 +16,75 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Import OHLCV components
-from src.data.connectors import OHLCVVisualizer, OHLCVUpdater, MarketBreadthCache
+from src.analysis.technical.signal_engine import SignalStore
+from src.core.config import CalculationConfig, get_config
+from src.core.instrumentation import span, use_session_recorder
+from src.core.log_policy import configure_logging
+from src.data.connectors import OHLCVVisualizer
+from src.data.market_context import MarketDataContext
+from src.data.universe import get_universe
 from src.utils.formatters import format_number, format_percentage
-import csv
+
+SIGNAL_LABELS = {
+    'ema_cross': "EMA 9/21 Cross",
+    'breakout': "20D Breakout",
+    'rsi_oversold': "RSI Oversold",
+    'rsi_overbought': "RSI Overbought",
+    'macd_cross': "MACD Signal Cross",
+    'macd_zero': "MACD Zero Cross",
+}
 
 
 def load_tickers_from_csv():
-    """Load all tickers from filtered_tickers_summary.csv"""
-    csv_path = Path(__file__).parent.parent / "Database" / "Full_database" / "filtered_tickers_summary.csv"
-    tickers = []
-    ticker_info = {}
-    
+    """Load all tickers and their info from the ticker universe registry"""
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                ticker = row['ticker']
-                tickers.append(ticker)
-                ticker_info[ticker] = {
-                    'sector': row['sector'],
-                    'record_count': row['record_count'],
-                    'years': row['years'],
-                    'quarters': row['quarters']
-                }
+        universe = get_universe()
     except Exception as e:
-        st.error(f"Error loading tickers from CSV: {e}")
+        st.error(f"Error loading ticker universe: {e}")
         return [], {}
     
-    return tickers, ticker_info
+    ticker_info = {record['ticker']: record for record in universe.records()}
+    return list(universe.tickers), ticker_info
+
+
+@st.cache_resource
+def get_signal_store():
+    """Open the signal events table once per process"""
+    return SignalStore()
+
+
+@st.cache_resource
+def get_visualizer():
+    """Create the visualizer (and its updater/SQLite connection) once per process"""
+    return OHLCVVisualizer(signal_store=get_signal_store())
+
+
+@st.cache_resource(max_entries=1)
+def load_market_context(version: str) -> MarketDataContext:
+    """Load the OHLCV panel and refresh signal events once per data version"""
+    sectors = {record['ticker']: record.get('sector') for record in get_universe().records()}
+    panel = get_visualizer().updater.cache.get_panel()
+    get_signal_store().refresh(panel, version)
+    return MarketDataContext(panel, version, sectors=sectors)
+
+
+def get_calculation_config() -> CalculationConfig:
+    """Calculation settings from config.yaml (defaults if it cannot be loaded)"""
+    try:
+        return get_config().calculations
+    except Exception:
+        return CalculationConfig()
+
+
+@contextmanager
+def timed(timings: Dict[str, float], name: str):
+    """Record the wall time of a page section"""
+    start = time.perf_counter()
+    try:
+        with span(f"page.market_overview.{name.lower().replace(' ', '_')}"):
+            yield
+    finally:
+        timings[name] = time.perf_counter() - start
 
 
 def main():
@@ -53,10 +96,16 @@ def main():
     
     st.title("📊 Market Overview")
     st.caption("Real-time OHLCV data with technical indicators")
+    configure_logging()
+    use_session_recorder(st.session_state)
     
-    # Initialize components
-    viz = OHLCVVisualizer()
-    updater = OHLCVUpdater()
+    timings: Dict[str, float] = {}
+    
+    # Initialize components (cached across reruns)
+    with timed(timings, "Load"):
+        viz = get_visualizer()
+        updater = viz.updater
+        context = load_market_context(updater.cache.get_data_version())
     
     # Load all tickers from CSV
     all_tickers, ticker_info = load_tickers_from_csv()
@@ -101,14 +150,16 @@ def main():
                 st.success("Data updated successfully!")
     
     # Main content area
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "📊 Individual Charts", 
         "📈 Comparison", 
         "🌍 Market Breadth",
-        "🔝 Top Movers"
+        "🔝 Top Movers",
+        "🔔 Signals",
+        "⚠️ Risk"
     ])
     
-    with tab1:
+    with tab1, timed(timings, "Individual"):
         st.header("Individual Stock Charts")
         
         # Add search functionality
@@ -119,7 +170,7 @@ def main():
         with filter_col:
             selected_sector = "All"
             if ticker_info:
-                sectors = ["All"] + sorted(list(set(info['sector'] for info in ticker_info.values())))
+                sectors = ["All"] + sorted(list(set(info['sector'] for info in ticker_info.values() if info.get('sector'))))
                 selected_sector = st.selectbox("Filter by sector", sectors)
         
         # Filter tickers based on search and sector
@@ -171,7 +222,9 @@ def main():
                     st.plotly_chart(fig)
                     
                     # Display latest statistics
-                    df = updater.get_ticker_data(selected_ticker)
+                    df = context.history(selected_ticker)
+                    if df.empty:
+                        df = updater.get_ticker_data(selected_ticker)
                     if not df.empty:
                         latest = df.iloc[-1]
                         prev = df.iloc[-2] if len(df) > 1 else latest
@@ -213,21 +266,51 @@ def main():
                 else:
                     st.error(f"No data available for {selected_ticker}")
     
-    with tab2:
+    with tab2, timed(timings, "Comparison"):
         st.header("Stock Comparison")
         
+        calc_config = get_calculation_config()
+        max_compare = calc_config.comparison_max_companies + 1
+        comparison_tickers = all_tickers if all_tickers else updater.tickers
+        
+        # Peer suggestions from the precomputed correlation index
+        peer_index = context.peer_index
+        peer_col1, peer_col2 = st.columns([3, 1])
+        with peer_col1:
+            anchor = st.selectbox(
+                "Suggest peers for",
+                options=[t for t in comparison_tickers if t in peer_index] or comparison_tickers,
+                key="peer_anchor"
+            )
+        suggested = peer_index.suggest(
+            anchor,
+            min_companies=calc_config.comparison_min_companies,
+            max_companies=calc_config.comparison_max_companies,
+            candidates=comparison_tickers
+        )
+        with peer_col2:
+            st.write("")
+            if st.button("🤝 Use peers", disabled=not suggested):
+                st.session_state['compare_tickers'] = [anchor] + suggested
+                st.session_state['compare_stocks'] = True
+        if suggested:
+            scores = peer_index.peers_of(anchor).set_index('peer')['correlation']
+            st.caption(
+                f"Most correlated over the last {peer_index.window} sessions: " +
+                ", ".join(f"{peer} ({scores[peer]:.2f})" for peer in suggested)
+            )
+        
         # Multi-select for comparison
         col1, col2 = st.columns([3, 1])
         with col1:
-            # Use all tickers for comparison
-            comparison_tickers = all_tickers if all_tickers else updater.tickers
-            default_tickers = comparison_tickers[:3] if len(comparison_tickers) >= 3 else comparison_tickers
+            if 'compare_tickers' not in st.session_state:
+                st.session_state['compare_tickers'] = comparison_tickers[:3]
             
             compare_tickers = st.multiselect(
-                f"Select stocks to compare (max 5, {len(comparison_tickers)} available)",
+                f"Select stocks to compare (max {max_compare}, {len(comparison_tickers)} available)",
                 options=comparison_tickers,
-                default=default_tickers,
-                max_selections=5
+                key="compare_tickers",
+                max_selections=max_compare
             )
         
         with col2:
@@ -244,26 +327,15 @@ def main():
                     # Performance table
                     st.subheader("Performance Comparison")
                     
-                    perf_data = []
-                    for ticker in compare_tickers:
-                        df = updater.get_ticker_data(ticker)
-                        if not df.empty and len(df) > days:
-                            # Filter to requested days
-                            end_date = df.index.max()
-                            start_date = end_date - timedelta(days=days)
-                            df_period = df[df.index >= start_date]
-                            
-                            if not df_period.empty:
-                                start_price = df_period.iloc[0]['close']
-                                end_price = df_period.iloc[-1]['close']
-                                change = (end_price - start_price) / start_price * 100
-                                
-                                perf_data.append({
-                                    'Ticker': ticker,
-                                    'Start Price': f"{start_price:,.0f}",
-                                    'Current Price': f"{end_price:,.0f}",
-                                    'Change (%)': f"{change:.2f}%"
-                                })
+                    perf_data = [
+                        {
+                            'Ticker': ticker,
+                            'Start Price': f"{row.start_price:,.0f}",
+                            'Current Price': f"{row.end_price:,.0f}",
+                            'Change (%)': f"{row.change_pct:.2f}%"
+                        }
+                        for ticker, row in context.performance(compare_tickers, days).iterrows()
+                    ]
                     
                     if perf_data:
                         perf_df = pd.DataFrame(perf_data)
@@ -271,7 +343,7 @@ def main():
                 else:
                     st.error("Failed to create comparison chart")
     
-    with tab3:
+    with tab3, timed(timings, "Breadth"):
         st.header("Market Breadth Analysis")
         
         col1, col2 = st.columns([2, 1])
@@ -306,53 +378,12 @@ def main():
             available_for_analysis = all_tickers if all_tickers else updater.tickers
             if analyze_count == "All":
                 symbols = available_for_analysis
-                count_text = f"all {len(symbols)}"
             else:
                 symbols = available_for_analysis[:analyze_count]
-                count_text = f"top {analyze_count}"
             
-            # Check cache first
-            cache = MarketBreadthCache()
-            stats = None
-            
-            # Try to use cached data for "All" option
-            if analyze_count == "All":
-                with st.spinner("Checking cache..."):
-                    stats = cache.get_cached_stats(max_age_hours=1)
-                    if stats:
-                        st.success("Using cached data (updated within last hour)")
-            
-            # If no cache or not using "All", calculate fresh
-            if not stats:
-                # Use progress bar for all analysis
-                progress_bar = st.progress(0)
-                progress_text = st.empty()
-                
-                def update_progress(value):
-                    progress_bar.progress(value)
-                    progress_text.text(f"Analyzing {count_text} stocks... {int(value * 100)}%")
-                
-                # Use optimized parallel processing
-                progress_text.text(f"Starting analysis of {count_text} stocks...")
-                
-                # Get min trading value from session state
-                min_value = st.session_state.get('min_trading_value', 3) * 1_000_000_000
-                
-                # Increase batch size for larger datasets
-                batch_size = 20 if len(symbols) > 100 else 10
-                stats = viz.analyze_market_breadth(
-                    symbols, 
-                    progress_callback=update_progress if len(symbols) > 50 else None,
-                    batch_size=batch_size,
-                    min_trading_value=min_value
-                )
-                
-                # Cache the results if analyzing all stocks
-                if analyze_count == "All" and stats:
-                    cache.save_stats(stats)
-                
-                progress_bar.empty()
-                progress_text.empty()
+            # Breadth derives from the per-version snapshot - no per-ticker loads
+            min_value = st.session_state.get('min_trading_value', 3) * 1_000_000_000
+            stats = context.breadth(symbols, min_trading_value=min_value)
             
             if stats and stats['total'] > 0:
                 # Show detailed summary
@@ -552,47 +583,58 @@ def main():
             else:
                 st.warning("No data available for market breadth analysis")
     
-    with tab4:
+    with tab4, timed(timings, "Top Movers"):
         st.header("Top Movers")
         
+        engine = context.movers_engine
+        
+        # Filters
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            horizon = st.radio("Horizon", ["1D", "5D", "20D", "Gap"], horizontal=True)
+        with col2:
+            mover_sectors = st.multiselect("Sectors", engine.available_sectors)
+        with col3:
+            mover_min_value = st.select_slider(
+                "Min Trading Value (Billion VND)",
+                options=[0, 1, 3, 5, 10, 20],
+                value=0,
+                key="movers_min_value"
+            )
+        with col4:
+            top_k = st.number_input("Rows", min_value=5, max_value=50, value=10, step=5)
+        
+        metric = 'gap_pct' if horizon == "Gap" else f"ret_{horizon.lower()}"
+        movers_filters = dict(
+            symbols=all_tickers if all_tickers else None,
+            sectors=mover_sectors or None,
+            min_trading_value=mover_min_value * 1_000_000_000
+        )
+        
+        # Numbers stay numeric; formatting happens in the table renderer
+        movers_columns = {
+            'close': st.column_config.NumberColumn("Price", format="localized"),
+            metric: st.column_config.NumberColumn(f"Change {horizon}", format="%.2f%%"),
+            'volume': st.column_config.NumberColumn("Volume", format="compact"),
+            'volume_ratio': st.column_config.NumberColumn("Volume Ratio", format="%.1fx"),
+            'sector': st.column_config.TextColumn("Sector"),
+        }
+        
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("🚀 Top Gainers")
-            
-            # Calculate top gainers
-            gainers = []
-            # Use more tickers for comprehensive analysis
-            movers_tickers = all_tickers[:100] if all_tickers else updater.tickers[:50]
-            for ticker in movers_tickers:
-                df = updater.get_ticker_data(ticker)
-                if not df.empty and len(df) > 1:
-                    latest = df.iloc[-1]
-                    prev = df.iloc[-2]
-                    change = (latest['close'] - prev['close']) / prev['close'] * 100
-                    gainers.append({
-                        'Ticker': ticker,
-                        'Price': f"{latest['close']:,.0f}",
-                        'Change': f"{change:.2f}%",
-                        'Volume': format_number(latest['volume'])
-                    })
-            
-            # Sort and display top 5 gainers
-            gainers_sorted = sorted(gainers, key=lambda x: float(x['Change'].strip('%')), reverse=True)[:5]
-            if gainers_sorted:
-                gainers_df = pd.DataFrame(gainers_sorted)
-                st.dataframe(gainers_df, hide_index=True)
+            gainers = engine.top(metric, k=top_k, **movers_filters)
+            if not gainers.empty:
+                st.dataframe(gainers[list(movers_columns)], column_config=movers_columns)
             else:
                 st.info("No gainers data available")
         
         with col2:
             st.subheader("📉 Top Losers")
-            
-            # Sort and display top 5 losers
-            losers_sorted = sorted(gainers, key=lambda x: float(x['Change'].strip('%')))[:5]
-            if losers_sorted:
-                losers_df = pd.DataFrame(losers_sorted)
-                st.dataframe(losers_df, hide_index=True)
+            losers = engine.top(metric, k=top_k, ascending=True, **movers_filters)
+            if not losers.empty:
+                st.dataframe(losers[list(movers_columns)], column_config=movers_columns)
             else:
                 st.info("No losers data available")
         
@@ -600,30 +642,143 @@ def main():
         st.divider()
         st.subheader("📊 Volume Leaders")
         
-        volume_leaders = []
-        # Use same tickers as gainers/losers for consistency
-        for ticker in movers_tickers:
-            df = updater.get_ticker_data(ticker)
-            if not df.empty:
-                latest = df.iloc[-1]
-                avg_volume = df['volume'].rolling(20).mean().iloc[-1] if len(df) > 20 else df['volume'].mean()
-                volume_ratio = latest['volume'] / avg_volume if avg_volume > 0 else 0
-                
-                volume_leaders.append({
-                    'Ticker': ticker,
-                    'Price': f"{latest['close']:,.0f}",
-                    'Volume': format_number(latest['volume']),
-                    'Avg Volume': format_number(avg_volume),
-                    'Volume Ratio': f"{volume_ratio:.1f}x"
-                })
-        
-        # Sort by volume ratio
-        volume_sorted = sorted(volume_leaders, key=lambda x: float(x['Volume Ratio'].strip('x')), reverse=True)[:10]
-        if volume_sorted:
-            volume_df = pd.DataFrame(volume_sorted)
-            st.dataframe(volume_df, hide_index=True)
+        leaders = engine.top('volume_ratio', k=top_k, **movers_filters)
+        if not leaders.empty:
+            leader_columns = {
+                'close': st.column_config.NumberColumn("Price", format="localized"),
+                'volume': st.column_config.NumberColumn("Volume", format="compact"),
+                'avg_volume': st.column_config.NumberColumn(
+                    f"Avg Volume ({engine.volume_window}D)", format="compact"),
+                'volume_ratio': st.column_config.NumberColumn("Volume Ratio", format="%.1fx"),
+                'ret_1d': st.column_config.NumberColumn("Change 1D", format="%.2f%%"),
+            }
+            st.dataframe(leaders[list(leader_columns)], column_config=leader_columns)
         else:
             st.info("No volume data available")
+    
+    with tab5, timed(timings, "Signals"):
+        st.header("Today's Signals")
+        
+        store = get_signal_store()
+        latest = store.latest_date()
+        
+        if latest is not None:
+            # Filters
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                signal_date = st.date_input("Session", value=latest.date(), max_value=latest.date())
+            with col2:
+                signal_types = st.multiselect(
+                    "Signal Types",
+                    options=list(SIGNAL_LABELS),
+                    format_func=lambda name: SIGNAL_LABELS[name]
+                )
+            with col3:
+                signal_direction = st.radio("Direction", ["All", "Bullish", "Bearish"], horizontal=True)
+            
+            events = store.todays_signals(signal_date, signals=signal_types or None)
+            if all_tickers:
+                events = events[events['symbol'].isin(all_tickers)]
+            if signal_direction != "All":
+                events = events[events['direction'] == (1 if signal_direction == "Bullish" else -1)]
+            
+            # Counts per signal type
+            counts = events.groupby('signal')['direction'].value_counts().unstack(fill_value=0)
+            if not counts.empty:
+                metric_cols = st.columns(len(counts))
+                for col, (signal, row) in zip(metric_cols, counts.iterrows()):
+                    col.metric(SIGNAL_LABELS[signal], f"▲ {row.get(1, 0)} / ▼ {row.get(-1, 0)}")
+            
+            if not events.empty:
+                events = events.assign(
+                    signal=events['signal'].map(SIGNAL_LABELS),
+                    direction=events['direction'].map({1: "▲ Bullish", -1: "▼ Bearish"})
+                )
+                signal_columns = {
+                    'symbol': st.column_config.TextColumn("Symbol"),
+                    'signal': st.column_config.TextColumn("Signal"),
+                    'direction': st.column_config.TextColumn("Direction"),
+                    'close': st.column_config.NumberColumn("Price", format="localized"),
+                    'value': st.column_config.NumberColumn("Value", format="%.2f"),
+                }
+                st.dataframe(events[list(signal_columns)], column_config=signal_columns, hide_index=True)
+            else:
+                st.info("No signals for this session")
+        else:
+            st.info("No signal events available")
+    
+    with tab6, timed(timings, "Risk"):
+        st.header("Universe Risk")
+        
+        risk = context.risk_engine
+        risk_table = risk.table.join(context.movers_engine.table[['trading_value', 'sector']], how='left')
+        if all_tickers:
+            risk_table = risk_table[risk_table.index.isin(all_tickers)]
+        
+        # Filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            risk_sectors = st.multiselect("Sectors", context.movers_engine.available_sectors, key="risk_sectors")
+        with col2:
+            risk_min_value = st.select_slider(
+                "Min Trading Value (Billion VND)",
+                options=[0, 1, 3, 5, 10, 20],
+                value=3,
+                key="risk_min_value"
+            )
+        with col3:
+            risk_sort = st.selectbox("Sort by", ["volatility", "beta", "max_drawdown", "sharpe", "sortino"])
+        
+        risk_table = risk_table[risk_table['trading_value'].fillna(0) >= risk_min_value * 1_000_000_000]
+        if risk_sectors:
+            risk_table = risk_table[risk_table['sector'].isin(risk_sectors)]
+        
+        if not risk_table.empty:
+            market = "VNINDEX" if risk.benchmark in risk.returns.columns else "value-weighted universe (VNINDEX proxy)"
+            st.caption(f"{len(risk_table)} symbols · beta vs {market} · "
+                       f"risk-free rate {risk.risk_free_rate:.0%} · rolling window {risk.window} sessions")
+            risk_columns = {
+                'annual_return': st.column_config.NumberColumn("Return (ann.)", format="%.1f%%"),
+                'volatility': st.column_config.NumberColumn("Volatility", format="percent"),
+                'rolling_volatility': st.column_config.NumberColumn(
+                    f"Volatility {risk.window}D", format="percent"),
+                'beta': st.column_config.NumberColumn("Beta", format="%.2f"),
+                'market_correlation': st.column_config.NumberColumn("Corr. Market", format="%.2f"),
+                'max_drawdown': st.column_config.NumberColumn("Max Drawdown", format="%.1f%%"),
+                'sharpe': st.column_config.NumberColumn("Sharpe", format="%.2f"),
+                'sortino': st.column_config.NumberColumn("Sortino", format="%.2f"),
+                'sector': st.column_config.TextColumn("Sector"),
+            }
+            ascending = risk_sort in ("max_drawdown",)
+            st.dataframe(
+                risk_table.sort_values(risk_sort, ascending=ascending)[list(risk_columns)],
+                column_config=risk_columns
+            )
+            
+            # Correlation heatmap of the most traded symbols
+            st.subheader("Correlation")
+            default_symbols = list(risk_table.nlargest(15, 'trading_value').index)
+            corr_symbols = st.multiselect("Symbols", list(risk_table.index), default=default_symbols,
+                                          key="risk_corr_symbols")
+            if len(corr_symbols) >= 2:
+                corr = risk.correlation(corr_symbols)
+                fig = go.Figure(go.Heatmap(
+                    z=corr.to_numpy(), x=list(corr.columns), y=list(corr.index),
+                    zmin=-1, zmax=1, colorscale='RdBu', reversescale=True
+                ))
+                fig.update_layout(height=max(400, 28 * len(corr_symbols)), margin=dict(l=0, r=0, t=20, b=0))
+                st.plotly_chart(fig)
+            else:
+                st.info("Select at least two symbols")
+        else:
+            st.info("No symbols match the filters")
+    
+    # Debug footer with render timings
+    st.divider()
+    st.caption(
+        f"⏱ Data version {context.version} · " +
+        " · ".join(f"{name}: {seconds * 1000:.0f} ms" for name, seconds in timings.items())
+    )
 
 
 if __name__ == "__main__":
@@ -21,6 +21,8 @@ try:
     from analysis.technical.indicator_analyzer import TechnicalIndicatorAnalyzer
     from analysis.technical.market_breadth import MarketBreadthAnalyzer
     from visualization.technical_charts import TechnicalChartCreator
+    from src.core.instrumentation import use_session_recorder
+    from src.core.log_policy import configure_logging
     MODULES_AVAILABLE = True
 except ImportError as e:
     st.error(f"❌ Error importing modules: {str(e)}")
@@ -41,6 +43,9 @@ st.markdown("Interactive charts and technical indicators for stock analysis")
 if not MODULES_AVAILABLE:
     st.stop()
 
+configure_logging()
+use_session_recorder(st.session_state)
+
 # Initialize components
 @st.cache_resource
 def get_market_loader():
@@ -62,6 +67,29 @@ def get_chart_creator():
     """Get chart creator"""
     return TechnicalChartCreator()
 
+@st.cache_data(ttl=300, show_spinner=False)
+def load_indicator_data(symbol, start_date, end_date, ma_periods, ema_periods):
+    """Load OHLCV data with technical indicators and trend signals"""
+    data = get_market_loader().get_stock_ohlcv(symbol, start_date, end_date)
+    if data.empty:
+        return data, {}
+    
+    technical_analyzer = get_technical_analyzer()
+    
+    # Calculate MAs
+    if ma_periods:
+        data = technical_analyzer.calculate_moving_averages(data, list(ma_periods))
+    
+    # Calculate EMAs
+    if ema_periods:
+        data = technical_analyzer.calculate_exponential_moving_averages(data, list(ema_periods))
+    
+    # Calculate RSI and MACD
+    data = technical_analyzer.calculate_rsi(data)
+    data = technical_analyzer.calculate_macd(data)
+    
+    return data, technical_analyzer.get_ma_trend_signals(data)
+
 # Sidebar
 st.sidebar.header("⚙️ Settings")
 
@@ -113,39 +141,18 @@ ema_periods = st.sidebar.multiselect(
 # Main content
 if stock_symbol:
     try:
-        # Get market data
+        # Get market data and indicators (reused across reruns with the same inputs)
+        end_date = datetime.now().strftime("%Y-%m-%d")
+        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        
         with st.spinner(f"📊 Fetching data for {stock_symbol}..."):
-            market_loader = get_market_loader()
-            
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-            
-            data = market_loader.get_stock_ohlcv(stock_symbol, start_date, end_date)
+            data, trend_signals = load_indicator_data(
+                stock_symbol, start_date, end_date, tuple(ma_periods), tuple(ema_periods)
+            )
         
         if not data.empty:
             st.success(f"✅ Data loaded successfully for {stock_symbol}")
             
-            # Calculate technical indicators
-            with st.spinner("🔧 Calculating technical indicators..."):
-                technical_analyzer = get_technical_analyzer()
-                
-                # Calculate MAs
-                if ma_periods:
-                    data = technical_analyzer.calculate_moving_averages(data, ma_periods)
-                
-                # Calculate EMAs
-                if ema_periods:
-                    data = technical_analyzer.calculate_exponential_moving_averages(data, ema_periods)
-                
-                # Calculate RSI
-                data = technical_analyzer.calculate_rsi(data)
-                
-                # Calculate MACD
-                data = technical_analyzer.calculate_macd(data)
-                
-                # Get trend signals
-                trend_signals = technical_analyzer.get_ma_trend_signals(data)
-            
             # Display data summary
             col1, col2, col3, col4 = st.columns(4)
             
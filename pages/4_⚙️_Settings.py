@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Settings Page - Performance panel for hot-path instrumentation
+"""
+
+import streamlit as st
+import pandas as pd
+import time
+from datetime import datetime
+
+# Add parent directory to path for imports
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core import instrumentation
+from src.core.instrumentation import process_recorder, use_session_recorder
+
+# Stage name prefix -> group shown in the panel
+STAGE_GROUPS = {
+    'loader.': "Loaders",
+    'cache.': "Cache",
+    'api.': "API",
+    'indicators.': "Indicators",
+    'chart.': "Charts",
+    'analysis.': "Analysis",
+    'page.': "Pages",
+}
+
+
+def stage_group(stage: str) -> str:
+    """Group of a stage name"""
+    return next((group for prefix, group in STAGE_GROUPS.items() if stage.startswith(prefix)), "Other")
+
+
+def render_performance_panel():
+    """Render latency percentiles, cache hit rates and API call rates"""
+    st.header("⏱️ Performance")
+
+    enabled = st.toggle(
+        "Enable instrumentation",
+        value=instrumentation.is_enabled(),
+        help=f"Applies to the whole process; set {instrumentation.ENABLE_ENV}=1 to enable at startup"
+    )
+    instrumentation.enable(enabled)
+
+    session = use_session_recorder(st.session_state)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        scope = st.radio("Scope", ["This session", "All sessions"], horizontal=True,
+                         help="Background worker threads are only counted under All sessions")
+    recorder = session if scope == "This session" else process_recorder()
+    with col2:
+        if st.button("🔄 Reset", use_container_width=True):
+            recorder.reset()
+
+    if not enabled:
+        st.info("Instrumentation is off. Enable it, then use the other pages to collect timings.")
+
+    started = datetime.fromtimestamp(recorder.started_at)
+    elapsed_min = max((time.time() - recorder.started_at) / 60, 1e-9)
+    stages = pd.DataFrame(recorder.stage_stats())
+    caches = pd.DataFrame(recorder.cache_stats())
+    api_calls = pd.DataFrame(recorder.counter_stats('api.'))
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Recording since", started.strftime('%H:%M:%S'))
+    m2.metric("Timed calls", f"{int(stages['count'].sum()) if not stages.empty else 0:,}")
+    if not caches.empty:
+        lookups = caches['hits'].sum() + caches['misses'].sum()
+        m3.metric("Cache hit rate", f"{caches['hits'].sum() / lookups * 100:.1f}%" if lookups else "N/A")
+    else:
+        m3.metric("Cache hit rate", "N/A")
+    m4.metric("API calls / min",
+              f"{int(api_calls['per_minute'].sum()) if not api_calls.empty else 0}",
+              help="Calls in the last minute")
+
+    st.subheader("Latency per stage")
+    if stages.empty:
+        st.caption("No timings recorded yet")
+    else:
+        stages.insert(0, 'group', stages['stage'].map(stage_group))
+        groups = st.multiselect("Groups", sorted(stages['group'].unique()),
+                                default=sorted(stages['group'].unique()))
+        shown = stages[stages['group'].isin(groups)]
+        st.dataframe(
+            shown[['group', 'stage', 'count', 'p50_ms', 'p95_ms', 'max_ms', 'total_ms']],
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'count': st.column_config.NumberColumn("Calls", format="%d"),
+                'p50_ms': st.column_config.NumberColumn("p50 (ms)", format="%.2f"),
+                'p95_ms': st.column_config.NumberColumn("p95 (ms)", format="%.2f"),
+                'max_ms': st.column_config.NumberColumn("Max (ms)", format="%.2f"),
+                'total_ms': st.column_config.NumberColumn("Total (ms)", format="%.0f"),
+            }
+        )
+        st.bar_chart(shown.set_index('stage')[['p50_ms', 'p95_ms']].head(15), horizontal=True)
+
+    col_cache, col_api = st.columns(2)
+    with col_cache:
+        st.subheader("Cache hit rates")
+        if caches.empty:
+            st.caption("No cache lookups recorded yet")
+        else:
+            st.dataframe(
+                caches.assign(hit_rate=caches['hit_rate'] * 100),
+                hide_index=True,
+                use_container_width=True,
+                column_config={'hit_rate': st.column_config.ProgressColumn(
+                    "Hit rate", format="%.1f%%", min_value=0, max_value=100)}
+            )
+    with col_api:
+        st.subheader("API calls")
+        if api_calls.empty:
+            st.caption("No API calls recorded yet")
+        else:
+            api_calls['average_per_minute'] = api_calls['total'] / elapsed_min
+            st.dataframe(
+                api_calls,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    'per_minute': st.column_config.NumberColumn("Last minute", format="%d"),
+                    'average_per_minute': st.column_config.NumberColumn("Avg / min", format="%.1f"),
+                }
+            )
+
+
+def main():
+    st.set_page_config(
+        page_title="Settings",
+        page_icon="⚙️",
+        layout="wide"
+    )
+
+    st.title("⚙️ Settings")
+    render_performance_panel()
+
+
+if __name__ == "__main__":
+    main()
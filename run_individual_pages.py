@@ -3,12 +3,16 @@
 Script để chạy từng page Streamlit trên các port khác nhau
 """
 
+import argparse
 import subprocess
 import sys
 import time
 import signal
 import os
 
+from src.core.shared_data import SharedDataStore, SHARED_DIR_ENV
+from src.data.shared_publisher import SharedDataPublisher
+
 def kill_port(port):
     """Kill process running on specific port"""
     try:
@@ -16,13 +20,20 @@ def kill_port(port):
     except:
         pass
 
-def run_page(page_path, port, name):
+def run_page(page_path, port, name, env=None):
     """Run a single Streamlit page"""
     print(f"🚀 Starting {name} on http://localhost:{port}")
     cmd = f"streamlit run {page_path} --server.port {port} --server.headless true"
-    return subprocess.Popen(cmd, shell=True)
+    return subprocess.Popen(cmd, shell=True, env=env)
 
 def main():
+    parser = argparse.ArgumentParser(description="Run each Streamlit page on its own port")
+    parser.add_argument('--no-shared', action='store_true',
+                        help="Let every page load its own copy of the data")
+    parser.add_argument('--refresh-minutes', type=float, default=5,
+                        help="Re-publish shared data when sources change (0 = never)")
+    args = parser.parse_args()
+    
     pages = [
         ("pages/1_Company_Dashboard.py", 8503, "Company Dashboard 📈"),
         ("pages/2_Market_Overview.py", 8504, "Market Overview 📊"),
@@ -38,12 +49,23 @@ def main():
     
     time.sleep(2)
     
+    # Load data once and share it with all page processes
+    env = os.environ.copy()
+    publisher = None
+    if not args.no_shared:
+        store = SharedDataStore()
+        publisher = SharedDataPublisher(store)
+        print(f"📦 Publishing shared data to {store.root}...")
+        for dataset, version in publisher.publish_changed().items():
+            print(f"  {dataset}: v{version}")
+        env[SHARED_DIR_ENV] = str(store.root)
+    
     # Start all pages
     processes = []
     print("\n" + "="*50)
     for page_path, port, name in pages:
         if os.path.exists(page_path):
-            proc = run_page(page_path, port, name)
+            proc = run_page(page_path, port, name, env=env)
             processes.append(proc)
         else:
             print(f"⚠️ Warning: {page_path} not found")
@@ -68,10 +90,16 @@ def main():
     
     signal.signal(signal.SIGINT, signal_handler)
     
-    # Wait for all processes
+    # Wait for all processes, re-publishing changed sources (pages poll the manifest)
     try:
-        for proc in processes:
-            proc.wait()
+        last_refresh = time.monotonic()
+        while any(proc.poll() is None for proc in processes):
+            time.sleep(1)
+            if publisher and args.refresh_minutes > 0 and \
+                    time.monotonic() - last_refresh >= args.refresh_minutes * 60:
+                for dataset, version in publisher.publish_changed().items():
+                    print(f"📦 Published new {dataset} version v{version}")
+                last_refresh = time.monotonic()
     except KeyboardInterrupt:
         signal_handler(None, None)
 
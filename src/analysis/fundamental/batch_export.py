@@ -0,0 +1,259 @@
+"""
+Batch Growth Export - Growth analysis for every ticker in a process pool
+
+The long fundamentals frame is grouped by ticker once and sent to workers in
+chunks of tickers. Results are concatenated per result type in the parent
+and written as one Parquet dataset per type (partitioned by year), without
+per-ticker CSV files.
+
+Usage:
+    python -m src.analysis.fundamental.batch_export --output exports/growth --workers 8
+"""
+
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import logging
+
+from src.core.log_policy import configure_logging
+from .growth_analyzer import GrowthAnalyzer
+
+logger = logging.getLogger(__name__)
+
+RESULT_TYPES = ('quarterly_data', 'annual_data', 'ttm_growth_data',
+                'quarterly_margins', 'annual_margins')
+TICKER_COLUMN = 'SECURITY_CODE'
+# Year column per result type (TTM results use 'Year')
+PARTITION_COLUMNS = ('YEAR', 'Year')
+
+DEFAULT_DATA_PATH = "Database/Full_database/Buu_clean_ver2.parquet"
+DEFAULT_CHUNK_SIZE = 25
+
+
+@dataclass
+class BatchExportReport:
+    """Outcome of a batch export"""
+    tickers: int = 0
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    rows: Dict[str, int] = field(default_factory=dict)
+    paths: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def tickers_per_second(self) -> float:
+        """Throughput over the whole run (analysis and writing)"""
+        return self.tickers / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line summary"""
+        return (f"{self.tickers} tickers in {self.elapsed_seconds:.1f}s "
+                f"({self.tickers_per_second:.1f} tickers/s), "
+                f"{len(self.succeeded)} succeeded, {len(self.failed)} failed")
+
+
+def analyze_chunk(chunk: pd.DataFrame) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Optional[str]]]:
+    """
+    Run the growth analysis for every ticker in a chunk (worker entry point)
+
+    Args:
+        chunk: Long fundamentals rows of several tickers
+
+    Returns:
+        Tuple of (result type -> concatenated frame with a STOCK column,
+        ticker -> error message or None)
+    """
+    analyzer = GrowthAnalyzer(data=chunk)
+    parts: Dict[str, List[pd.DataFrame]] = {name: [] for name in RESULT_TYPES}
+    status: Dict[str, Optional[str]] = {}
+
+    for ticker, company_data in chunk.groupby(TICKER_COLUMN, observed=True, sort=False):
+        ticker = str(ticker)
+        try:
+            results = analyzer.analyze_company(company_data, ticker)
+        except Exception as e:
+            status[ticker] = str(e)
+            continue
+
+        produced = False
+        for name in RESULT_TYPES:
+            df = results.get(name)
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                parts[name].append(df.assign(STOCK=ticker))
+                produced = True
+        status[ticker] = None if produced else "no results"
+
+    combined = {name: pd.concat(frames, ignore_index=True)
+                for name, frames in parts.items() if frames}
+    return combined, status
+
+
+def iter_chunks(data: pd.DataFrame, chunk_size: int,
+                tickers: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Split the long frame into chunks of whole tickers
+
+    The frame is grouped once; each chunk is a take of its tickers' rows.
+
+    Args:
+        data: Long fundamentals frame
+        chunk_size: Tickers per chunk
+        tickers: Optional subset of tickers
+
+    Returns:
+        Iterator of chunk frames
+    """
+    groups = data.groupby(TICKER_COLUMN, observed=True, sort=True).indices
+    names = sorted(groups) if tickers is None else [t for t in tickers if t in groups]
+    for start in range(0, len(names), chunk_size):
+        yield data.take(np.concatenate([groups[name] for name in names[start:start + chunk_size]]))
+
+
+def write_dataset(df: pd.DataFrame, path: Path) -> str:
+    """
+    Write a result frame as a Parquet dataset partitioned by year
+
+    Args:
+        df: Result rows of every ticker
+        path: Dataset directory (replaced)
+
+    Returns:
+        Dataset path
+    """
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    partition = next((c for c in PARTITION_COLUMNS if c in df.columns), None)
+    df = df.copy()
+    df.columns = [str(c) for c in df.columns]
+    if 'REPORT_DATE' in df.columns:
+        df['REPORT_DATE'] = pd.to_datetime(df['REPORT_DATE'], errors='coerce')
+    if partition is not None:
+        df[partition] = df[partition].astype('int64')
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(table, str(path), partition_cols=[partition] if partition else None)
+    return str(path)
+
+
+class GrowthBatchExporter:
+    """Export growth analysis results for all tickers"""
+
+    def __init__(self, data: pd.DataFrame, output_dir: Union[str, Path],
+                 max_workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize exporter
+
+        Args:
+            data: Long fundamentals frame (SECURITY_CODE, METRIC_CODE, FREQ_CODE, ...)
+            output_dir: Directory for the per-type datasets
+            max_workers: Worker processes (None: CPU count, 0/1: run in-process)
+            chunk_size: Tickers per worker task
+        """
+        self.data = data
+        self.output_dir = Path(output_dir)
+        self.max_workers = os.cpu_count() if max_workers is None else max_workers
+        self.chunk_size = max(1, chunk_size)
+
+    @classmethod
+    def from_parquet(cls, data_path: Union[str, Path] = DEFAULT_DATA_PATH, **kwargs) -> 'GrowthBatchExporter':
+        """
+        Create from the fundamentals parquet file
+
+        Args:
+            data_path: Parquet path
+            **kwargs: GrowthBatchExporter arguments
+
+        Returns:
+            GrowthBatchExporter
+        """
+        return cls(pd.read_parquet(data_path), **kwargs)
+
+    def _results(self, tickers: Optional[Sequence[str]]) -> Iterator[Tuple[Dict[str, pd.DataFrame], Dict]]:
+        """Chunk results, in-process or from the pool as they complete"""
+        chunks = iter_chunks(self.data, self.chunk_size, tickers)
+        if self.max_workers <= 1:
+            for chunk in chunks:
+                yield analyze_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(analyze_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def run(self, tickers: Optional[Sequence[str]] = None) -> BatchExportReport:
+        """
+        Analyze all (or selected) tickers and write the datasets
+
+        Args:
+            tickers: Optional subset of tickers
+
+        Returns:
+            BatchExportReport with per-ticker status, row counts and throughput
+        """
+        start = time.perf_counter()
+        report = BatchExportReport()
+        parts: Dict[str, List[pd.DataFrame]] = {name: [] for name in RESULT_TYPES}
+
+        for combined, status in self._results(tickers):
+            for name, df in combined.items():
+                parts[name].append(df)
+            for ticker, error in status.items():
+                if error is None:
+                    report.succeeded.append(ticker)
+                else:
+                    report.failed[ticker] = error
+
+        for name, frames in parts.items():
+            if not frames:
+                continue
+            df = pd.concat(frames, ignore_index=True).sort_values('STOCK', kind='stable')
+            report.paths[name] = write_dataset(df, self.output_dir / name)
+            report.rows[name] = len(df)
+
+        report.succeeded.sort()
+        report.tickers = len(report.succeeded) + len(report.failed)
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info("Growth export: %s", report.summary())
+        return report
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description='Export growth analysis for all tickers')
+    parser.add_argument('--data', default=DEFAULT_DATA_PATH, help='Fundamentals parquet file')
+    parser.add_argument('--output', default='exports/growth_analysis', help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Tickers per task')
+    parser.add_argument('--tickers', nargs='+', help='Only export these tickers')
+    args = parser.parse_args()
+
+    exporter = GrowthBatchExporter.from_parquet(
+        args.data, output_dir=args.output, max_workers=args.workers, chunk_size=args.chunk_size
+    )
+    report = exporter.run(args.tickers)
+
+    print(f"\n✅ {report.summary()}")
+    for name, path in report.paths.items():
+        print(f"  {name}: {report.rows[name]:,} rows -> {path}")
+    if report.failed:
+        print(f"❌ Failed: {', '.join(sorted(report.failed)[:20])}")
+
+
+if __name__ == "__main__":
+    main()
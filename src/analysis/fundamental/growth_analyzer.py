@@ -8,6 +8,8 @@ import numpy as np
 from typing import Dict, Optional, Tuple
 import logging
 
+from src.core.instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
 class GrowthAnalyzer:
@@ -15,16 +17,20 @@ class GrowthAnalyzer:
     Phân tích tăng trưởng tài chính của công ty
     """
     
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: Optional[str] = None, data: Optional[pd.DataFrame] = None):
         """
         Khởi tạo Growth Analyzer
         
         Args:
             data_path: Đường dẫn đến file dữ liệu (parquet/csv)
+            data: DataFrame đã load sẵn (bỏ qua data_path)
         """
         self.data_path = data_path
         self.data = None
-        self._load_data()
+        if data is not None:
+            self.data = data
+        else:
+            self._load_data()
     
     def _load_data(self):
         """Load dữ liệu từ file"""
@@ -56,14 +62,27 @@ class GrowthAnalyzer:
             logger.warning("No data available for analysis")
             return self._empty_results()
         
-        try:
-            # Filter data cho security_code
-            company_data = self.data[
-                self.data['SECURITY_CODE'] == security_code.upper()
-            ].copy()
+        # Filter data cho security_code
+        company_data = self.data[
+            self.data['SECURITY_CODE'] == security_code.upper()
+        ]
+        return self.analyze_company(company_data, security_code)
+    
+    @timed('analysis.growth')
+    def analyze_company(self, company_data: pd.DataFrame, security_code: str = "") -> Dict[str, pd.DataFrame]:
+        """
+        Tạo phân tích tăng trưởng từ dữ liệu đã lọc của một mã
+        
+        Args:
+            company_data: Các dòng dữ liệu của một mã chứng khoán
+            security_code: Mã chứng khoán (để ghi log)
             
+        Returns:
+            Dictionary chứa các DataFrame phân tích
+        """
+        try:
             if company_data.empty:
-                logger.warning(f"No data found for {security_code}")
+                logger.warning("No data found for %s", security_code)
                 return self._empty_results()
             
             # Tạo các phân tích
@@ -75,7 +94,7 @@ class GrowthAnalyzer:
                 'annual_margins': self._calculate_annual_margins(company_data)
             }
             
-            logger.info(f"Growth analysis completed for {security_code}")
+            logger.debug("Growth analysis completed for %s", security_code)
             return results
             
         except Exception as e:
@@ -160,26 +179,29 @@ class GrowthAnalyzer:
                 ].sort_values(['YEAR', 'QUARTER'])
                 
                 if len(metric_data) >= 4:
-                    # Tính TTM (4 quý gần nhất)
-                    for i in range(3, len(metric_data)):
-                        current_ttm = metric_data.iloc[i-3:i+1]['METRIC_VALUE'].sum()
-                        previous_ttm = metric_data.iloc[i-4:i]['METRIC_VALUE'].sum()
-                        
-                        if previous_ttm > 0:
-                            growth_rate = ((current_ttm - previous_ttm) / previous_ttm) * 100
-                        else:
-                            growth_rate = 0
-                        
-                        ttm_data.append({
-                            'Year': metric_data.iloc[i]['YEAR'],
-                            'Quarter': metric_data.iloc[i]['QUARTER'],
-                            'Metric': metric,
-                            'TTM_Value': current_ttm,
-                            'TTM_Growth_Rate': growth_rate
-                        })
+                    # Tính TTM (4 quý gần nhất) bằng rolling sum thay cho vòng lặp iloc
+                    current_ttm = metric_data['METRIC_VALUE'].rolling(4, min_periods=0).sum().to_numpy()
+                    previous_ttm = np.concatenate(([0.0], current_ttm[:-1]))
+                    # Quý đầu tiên có đủ 4 quý chưa có TTM trước đó
+                    previous_ttm[3] = 0.0
+
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        growth_rate = np.where(
+                            previous_ttm > 0,
+                            (current_ttm - previous_ttm) / previous_ttm * 100,
+                            0
+                        )
+
+                    ttm_data.append(pd.DataFrame({
+                        'Year': metric_data['YEAR'].to_numpy()[3:],
+                        'Quarter': metric_data['QUARTER'].to_numpy()[3:],
+                        'Metric': metric,
+                        'TTM_Value': current_ttm[3:],
+                        'TTM_Growth_Rate': growth_rate[3:]
+                    }))
             
             if ttm_data:
-                ttm_df = pd.DataFrame(ttm_data)
+                ttm_df = pd.concat(ttm_data, ignore_index=True)
                 # Pivot để có cột riêng cho từng metric
                 ttm_pivot = ttm_df.pivot_table(
                     index=['Year', 'Quarter'],
@@ -0,0 +1,283 @@
+"""
+Statement Tables - Transposed income, balance sheet, cash flow and margin
+tables (metrics as rows, periods as columns) for the Company Dashboard
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+METRIC_COLUMN = 'Chỉ tiêu'
+
+INCOME_METRICS = [
+    ('CIS_10', 'Doanh thu thuần'),
+    ('CIS_11', 'Giá vốn hàng bán'),
+    ('CIS_20', 'Lợi nhuận gộp'),
+    ('CIS_25', 'Chi phí QLDN'),
+    ('CIS_26', 'Chi phí bán hàng'),
+    ('CIS_21', 'Thu nhập tài chính'),
+    ('CIS_22', 'Chi phí tài chính'),
+    ('CIS_31', 'Thu nhập khác'),
+    ('CIS_32', 'Chi phí khác'),
+    ('CIS_50', 'Lợi nhuận trước thuế'),
+    ('CIS_61', 'Lợi nhuận ròng'),
+    ('OPERATING_PROFIT', 'Lợi nhuận hoạt động'),
+    ('EBITDA', 'EBITDA')
+]
+
+BALANCE_METRICS = [
+    ('CBS_270', 'Tổng tài sản'),
+    ('CBS_100', 'Tài sản ngắn hạn'),
+    ('CBS_110', 'Tiền và tương đương'),
+    ('CBS_112', 'Đầu tư ngắn hạn'),
+    ('CBS_130', 'Phải thu'),
+    ('CBS_140', 'Hàng tồn kho'),
+    ('CBS_220', 'Tài sản cố định'),
+    ('CBS_300', 'Tổng nợ'),
+    ('CBS_320', 'Nợ ngắn hạn'),
+    ('CBS_338', 'Nợ dài hạn'),
+    ('CBS_400', 'Vốn chủ sở hữu')
+]
+
+CASHFLOW_METRICS = [
+    ('CFS_20', 'Dòng tiền HĐKD'),
+    ('CFS_30', 'Dòng tiền đầu tư'),
+    ('CFS_40', 'Dòng tiền tài chính'),
+    ('CFS_50', 'Lưu chuyển tiền thuần'),
+    ('CCFI_2', 'Khấu hao')
+]
+
+MARGIN_METRICS = [
+    ('Gross_Margin', 'Gross Margin (%)'),
+    ('Operating_Margin', 'Operating Margin (%)'),
+    ('EBITDA_Margin', 'EBITDA Margin (%)'),
+    ('Net_Margin', 'Net Margin (%)')
+]
+
+# Data type -> ordered (metric code, display name) rows
+STATEMENT_METRICS = {
+    "Income Statement": INCOME_METRICS,
+    "Balance Sheet": BALANCE_METRICS,
+    "Cash Flow": CASHFLOW_METRICS,
+    "Margins": MARGIN_METRICS,
+    "Financial Data": INCOME_METRICS + BALANCE_METRICS + CASHFLOW_METRICS,
+}
+
+# Key metrics shown in the summary statistics of each data type
+SUMMARY_METRICS = {
+    "Income Statement": ['Doanh thu thuần', 'Lợi nhuận gộp', 'EBITDA', 'Lợi nhuận ròng'],
+    "Financial Data": ['Doanh thu thuần', 'Lợi nhuận gộp', 'EBITDA', 'Lợi nhuận ròng'],
+    "Balance Sheet": ['Tổng tài sản', 'Tổng nợ', 'Vốn chủ sở hữu'],
+    "Cash Flow": ['Dòng tiền HĐKD', 'Lưu chuyển tiền thuần'],
+}
+
+MIN_YEAR = 2018
+
+
+def add_ebitda(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add OPERATING_PROFIT/EBITDA columns when the analysis did not produce them
+
+    Args:
+        data: Wide quarterly or annual data (metric codes as columns)
+
+    Returns:
+        DataFrame with EBITDA when it can be derived (input is not modified)
+    """
+    if data.empty or 'EBITDA' in data.columns:
+        return data
+
+    if 'OPERATING_PROFIT' in data.columns and 'CCFI_2' in data.columns:
+        return data.assign(EBITDA=data['OPERATING_PROFIT'] + data['CCFI_2'])
+    if all(col in data.columns for col in ['CIS_20', 'CIS_25', 'CIS_26', 'CCFI_2']):
+        operating_profit = data['CIS_20'] + data['CIS_25'] + data['CIS_26']
+        return data.assign(OPERATING_PROFIT=operating_profit,
+                           EBITDA=operating_profit + data['CCFI_2'])
+    return data
+
+
+def build_statement_table(data: pd.DataFrame, data_type: str,
+                          is_quarterly: bool = True,
+                          min_year: int = MIN_YEAR) -> pd.DataFrame:
+    """
+    Build a metrics x periods table with one reshape
+
+    Periods are ordered chronologically by (YEAR, QUARTER) and labelled
+    '1Q2018' (quarterly) or '2018' (annual). When a period appears twice
+    the last row wins.
+
+    Args:
+        data: Wide quarterly/annual data or margins with YEAR (and QUARTER)
+        data_type: One of STATEMENT_METRICS
+        is_quarterly: Quarterly periods instead of annual
+        min_year: First year shown
+
+    Returns:
+        DataFrame with the 'Chỉ tiêu' column followed by period columns
+        (empty if nothing can be shown)
+    """
+    metrics = STATEMENT_METRICS.get(data_type)
+    if metrics is None or data.empty or 'YEAR' not in data.columns:
+        return pd.DataFrame()
+
+    metrics = [(code, name) for code, name in metrics if code in data.columns]
+    if not metrics:
+        return pd.DataFrame()
+
+    quarterly = is_quarterly and 'QUARTER' in data.columns
+    sort_columns = ['YEAR', 'QUARTER'] if quarterly else ['YEAR']
+    df = data.loc[data['YEAR'] >= min_year]
+    df = df.sort_values(sort_columns, kind='stable')
+
+    if quarterly:
+        periods = df['QUARTER'].astype(str) + 'Q' + df['YEAR'].astype(str)
+    else:
+        periods = df['YEAR'].astype(str)
+
+    codes = [code for code, _ in metrics]
+    wide = df[codes].set_axis(periods.to_numpy(), axis=0)
+    wide = wide[~wide.index.duplicated(keep='last')]
+
+    table = wide.T
+    table.index = [name for _, name in metrics]
+    table.columns = list(table.columns)
+    return table.rename_axis(METRIC_COLUMN).reset_index()
+
+
+def summarize_statement(table: pd.DataFrame, metric_names: Iterable[str]) -> pd.DataFrame:
+    """
+    Compute mean/min/max/std of selected rows across all periods
+
+    Args:
+        table: Output of build_statement_table
+        metric_names: Display names of the rows to summarize
+
+    Returns:
+        DataFrame with 'Chỉ tiêu', 'Trung bình', 'Tối thiểu', 'Tối đa',
+        'Độ lệch chuẩn' (rows without numeric values are dropped)
+    """
+    columns = [METRIC_COLUMN, 'Trung bình', 'Tối thiểu', 'Tối đa', 'Độ lệch chuẩn']
+    if table.empty:
+        return pd.DataFrame(columns=columns)
+
+    rows = table[table[METRIC_COLUMN].isin(list(metric_names))].set_index(METRIC_COLUMN)
+    values = rows.apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+    counts = (~np.isnan(values)).sum(axis=1)
+    keep = counts > 0
+    if not keep.any():
+        return pd.DataFrame(columns=columns)
+    values = values[keep]
+
+    return pd.DataFrame({
+        METRIC_COLUMN: rows.index[keep],
+        'Trung bình': np.nanmean(values, axis=1),
+        'Tối thiểu': np.nanmin(values, axis=1),
+        'Tối đa': np.nanmax(values, axis=1),
+        'Độ lệch chuẩn': np.nanstd(values, axis=1),
+    })
+
+
+def build_all_tables(analysis: Dict[str, pd.DataFrame],
+                     min_year: int = MIN_YEAR) -> Dict[Tuple[str, bool], pd.DataFrame]:
+    """
+    Build every statement table of one ticker
+
+    Args:
+        analysis: Output of GrowthAnalyzer.generate_growth_analysis
+        min_year: First year shown
+
+    Returns:
+        (data_type, is_quarterly) -> table
+    """
+    sources = {
+        True: (add_ebitda(analysis.get('quarterly_data', pd.DataFrame())),
+               analysis.get('quarterly_margins', pd.DataFrame())),
+        False: (add_ebitda(analysis.get('annual_data', pd.DataFrame())),
+                analysis.get('annual_margins', pd.DataFrame())),
+    }
+
+    tables = {}
+    for is_quarterly, (data, margins) in sources.items():
+        for data_type in STATEMENT_METRICS:
+            base = margins if data_type == "Margins" else data
+            tables[(data_type, is_quarterly)] = build_statement_table(
+                base, data_type, is_quarterly, min_year
+            )
+    return tables
+
+
+class StatementTableStore:
+    """Lazy per-ticker cache of statement tables (all tables of a ticker built on its first view)"""
+
+    def __init__(self, analyze: Callable[[str], Optional[Dict[str, pd.DataFrame]]],
+                 min_year: int = MIN_YEAR):
+        """
+        Initialize store
+
+        Args:
+            analyze: Ticker -> growth analysis dict (e.g. GrowthAnalyzer.generate_growth_analysis)
+            min_year: First year shown
+        """
+        self.analyze = analyze
+        self.min_year = min_year
+        self._tables: Dict[str, Dict[Tuple[str, bool], pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    def tables(self, ticker: str) -> Dict[Tuple[str, bool], pd.DataFrame]:
+        """
+        Get all tables of a ticker, building them on first access
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            (data_type, is_quarterly) -> table
+        """
+        with self._lock:
+            cached = self._tables.get(ticker)
+        if cached is not None:
+            return cached
+
+        analysis = self.analyze(ticker) or {}
+        tables = build_all_tables(analysis, self.min_year)
+        with self._lock:
+            self._tables[ticker] = tables
+        return tables
+
+    def get(self, ticker: str, data_type: str, is_quarterly: bool = True) -> pd.DataFrame:
+        """
+        Get one statement table
+
+        Args:
+            ticker: Ticker symbol
+            data_type: One of STATEMENT_METRICS
+            is_quarterly: Quarterly periods instead of annual
+
+        Returns:
+            Statement table (empty if unavailable)
+        """
+        return self.tables(ticker).get((data_type, is_quarterly), pd.DataFrame())
+
+    def invalidate(self, ticker: Optional[str] = None):
+        """
+        Drop cached tables
+
+        Args:
+            ticker: Ticker to drop (None for all)
+        """
+        with self._lock:
+            if ticker is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(ticker, None)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
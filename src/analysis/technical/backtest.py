@@ -0,0 +1,408 @@
+"""
+Backtest Engine - Vectorized long-only backtests of MA/EMA crossover rules
+over a date x symbol panel, with VN tick sizes, fees and T+2 settlement
+
+Signals are taken at the close and filled at the next session's open.
+Every symbol is traded as its own sleeve with equal starting capital; the
+aggregate equity curve is the average of the sleeves.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import logging
+
+from src.core.instrumentation import timed
+from .movers import to_wide
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS = 252
+
+# (upper price bound in VND, tick size) per exchange; HNX/UPCoM use one tick
+TICK_SIZES = {
+    'HOSE': ((10_000, 10), (50_000, 50), (np.inf, 100)),
+    'HNX': ((np.inf, 100),),
+    'UPCOM': ((np.inf, 100),),
+}
+
+TRADE_COLUMNS = ['symbol', 'entry_date', 'exit_date', 'entry_price', 'exit_price', 'return_pct', 'sessions']
+
+
+@dataclass
+class CostModel:
+    """Transaction costs of a VN equity trade"""
+    commission: float = 0.0015    # Broker fee on each side
+    sell_tax: float = 0.001       # Personal income tax on sell proceeds
+    slippage_ticks: int = 0       # Ticks paid beyond the open on each fill
+    exchange: str = 'HOSE'
+
+
+def tick_size(prices: np.ndarray, exchange: str = 'HOSE') -> np.ndarray:
+    """
+    Tick size for each price
+
+    Args:
+        prices: Prices in VND
+        exchange: HOSE, HNX or UPCOM
+
+    Returns:
+        Tick sizes in VND
+    """
+    prices = np.asarray(prices, dtype='float64')
+    bands = TICK_SIZES[exchange.upper()]
+    return np.select([prices < bound for bound, _ in bands], [tick for _, tick in bands], default=bands[-1][1])
+
+
+def fill_price(prices: np.ndarray, side: int, costs: CostModel) -> np.ndarray:
+    """
+    Execution price on the tick grid (buys round up, sells round down)
+
+    Args:
+        prices: Reference prices (e.g. the open)
+        side: +1 buy, -1 sell
+        costs: Cost model (exchange and slippage)
+
+    Returns:
+        Fill prices
+    """
+    ticks = tick_size(prices, costs.exchange)
+    rounded = (np.ceil(prices / ticks) if side > 0 else np.floor(prices / ticks)) * ticks
+    return rounded + side * costs.slippage_ticks * ticks
+
+
+def moving_average(close: pd.DataFrame, period: int, kind: str = 'ema') -> pd.DataFrame:
+    """
+    Moving average of every column, skipping sessions a symbol did not trade
+
+    Args:
+        close: Close prices (date x symbol)
+        period: Window/span
+        kind: 'ema' (adjust=False, as in the charts) or 'sma'
+
+    Returns:
+        DataFrame aligned with close
+    """
+    if kind == 'ema':
+        return close.ewm(span=period, adjust=False, ignore_na=True).mean().where(close.notna())
+    if kind == 'sma':
+        return close.apply(lambda s: s.dropna().rolling(period).mean()).reindex(close.index)
+    raise ValueError(f"Unknown moving average '{kind}', expected 'ema' or 'sma'")
+
+
+def crossover_positions(close: pd.DataFrame, fast: int, slow: int, kind: str = 'ema') -> pd.DataFrame:
+    """
+    Long while the fast average is above the slow one
+
+    Args:
+        close: Close prices (date x symbol)
+        fast: Fast period
+        slow: Slow period
+        kind: 'ema' or 'sma'
+
+    Returns:
+        Boolean target positions (date x symbol)
+    """
+    fast_ma = moving_average(close, fast, kind)
+    slow_ma = moving_average(close, slow, kind)
+    return (fast_ma > slow_ma).fillna(False)
+
+
+def simulate(open_: np.ndarray, close: np.ndarray, target: np.ndarray, tradable: np.ndarray,
+             costs: CostModel, settlement_days: int = 2) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Simulate every symbol at once, stepping through sessions
+
+    The target of session t-1 is filled at the open of session t. A
+    position bought in session e can be sold from session e + settlement_days
+    (shares arrive T+2), and the proceeds of a sale can buy again from
+    settlement_days sessions after it (cash arrives T+2); earlier signals
+    wait until then. Settlement counts the symbol's own sessions, so halted
+    days do not bring it forward.
+
+    Args:
+        open_: (sessions, symbols) opens, NaN without a bar
+        close: (sessions, symbols) closes, NaN without a bar
+        target: (sessions, symbols) desired long position at each close
+        tradable: (sessions, symbols) sessions where fills are allowed
+        costs: Cost model
+        settlement_days: Sessions before bought shares or sale proceeds can be used
+
+    Returns:
+        (equity curves (sessions, symbols) starting at 1.0, trade arrays)
+    """
+    n_sessions, n_symbols = close.shape
+    equity = np.ones((n_sessions, n_symbols))
+    has_bar = ~np.isnan(open_) & ~np.isnan(close)
+    tradable = tradable & has_bar
+    # Sessions each symbol has traded up to each row
+    session = np.cumsum(has_bar, axis=0)
+
+    holding = np.zeros(n_symbols, dtype=bool)
+    entry_row = np.zeros(n_symbols, dtype=np.int64)
+    entry_session = np.zeros(n_symbols, dtype=np.int64)
+    exit_session = np.full(n_symbols, -settlement_days, dtype=np.int64)
+    entry_price = np.zeros(n_symbols)
+    entry_equity = np.ones(n_symbols)
+    last_close = np.where(np.isnan(close[0]), np.nan, close[0])
+    current = np.ones(n_symbols)
+    trades: Dict[str, List[np.ndarray]] = {key: [] for key in
+                                           ('symbol', 'entry', 'exit', 'entry_price', 'exit_price', 'return')}
+    keep = 1 - costs.commission
+    keep_sell = 1 - costs.commission - costs.sell_tax
+
+    for t in range(1, n_sessions):
+        bar = has_bar[t]
+        want = target[t - 1]
+        buy = ~holding & want & tradable[t] & (session[t] - exit_session >= settlement_days)
+        sell = holding & ~want & tradable[t] & (session[t] - entry_session >= settlement_days)
+        hold = holding & ~sell & bar
+
+        growth = np.ones(n_symbols)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth[hold] = close[t, hold] / last_close[hold]
+
+            if sell.any():
+                exit_price = fill_price(open_[t, sell], -1, costs)
+                growth[sell] = exit_price / last_close[sell] * keep_sell
+            if buy.any():
+                buy_price = fill_price(open_[t, buy], 1, costs)
+                growth[buy] = close[t, buy] / buy_price * keep
+
+        current *= growth
+        equity[t] = current
+
+        if sell.any():
+            exit_session[sell] = session[t, sell]
+            trades['symbol'].append(np.flatnonzero(sell))
+            trades['entry'].append(entry_row[sell])
+            trades['exit'].append(np.full(sell.sum(), t))
+            trades['entry_price'].append(entry_price[sell])
+            trades['exit_price'].append(exit_price)
+            trades['return'].append(current[sell] / entry_equity[sell] - 1)
+        if buy.any():
+            entry_row[buy] = t
+            entry_session[buy] = session[t, buy]
+            entry_price[buy] = buy_price
+            # Equity before the buy, so the trade return includes the entry fee
+            entry_equity[buy] = current[buy] / growth[buy]
+
+        holding = (holding & ~sell) | buy
+        last_close = np.where(bar, close[t], last_close)
+
+    # Positions still open at the end are marked to the last close
+    open_positions = np.flatnonzero(holding)
+    trades['symbol'].append(open_positions)
+    trades['entry'].append(entry_row[open_positions])
+    trades['exit'].append(np.full(len(open_positions), -1))
+    trades['entry_price'].append(entry_price[open_positions])
+    trades['exit_price'].append(np.full(len(open_positions), np.nan))
+    trades['return'].append(current[open_positions] / entry_equity[open_positions] - 1)
+
+    return equity, {key: np.concatenate(parts) for key, parts in trades.items()}
+
+
+def max_drawdown_pct(equity: np.ndarray) -> np.ndarray:
+    """Maximum drawdown in percent of each equity column"""
+    running_max = np.maximum.accumulate(equity, axis=0)
+    return (equity / running_max - 1).min(axis=0) * 100
+
+
+@dataclass
+class BacktestResult:
+    """Equity curves, trades and summaries of one backtest"""
+    equity: pd.DataFrame                 # Per-symbol equity (date x symbol), 1.0 at the start
+    trades: pd.DataFrame                 # One row per trade (open trades have no exit_date)
+    params: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def portfolio(self) -> pd.Series:
+        """Aggregate equity: equal starting capital in every symbol sleeve"""
+        return self.equity.mean(axis=1).rename('portfolio')
+
+    def symbol_summary(self) -> pd.DataFrame:
+        """
+        Per-symbol results
+
+        Returns:
+            DataFrame indexed by symbol with total return, trades, win rate,
+            max drawdown and exposure
+        """
+        trades = self.trades.groupby('symbol')['return_pct']
+        closed = self.trades[self.trades['exit_date'].notna()].groupby('symbol')['return_pct']
+        equity = self.equity.to_numpy()
+        summary = pd.DataFrame({
+            'total_return': (equity[-1] - 1) * 100 if len(equity) else np.nan,
+            'max_drawdown': max_drawdown_pct(equity) if len(equity) else np.nan,
+        }, index=pd.Index(self.equity.columns, name='symbol'))
+        summary['trades'] = trades.size().reindex(summary.index, fill_value=0)
+        summary['win_rate'] = (closed.apply(lambda r: (r > 0).mean() * 100)).reindex(summary.index)
+        held = self.trades['sessions'].groupby(self.trades['symbol']).sum()
+        summary['exposure'] = held.reindex(summary.index, fill_value=0) / max(len(equity), 1) * 100
+        return summary
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Aggregate results of the portfolio
+
+        Returns:
+            Total return, CAGR, Sharpe, max drawdown (percent), trades and win rate
+        """
+        portfolio = self.portfolio.to_numpy()
+        if len(portfolio) < 2:
+            return {'total_return': 0.0, 'cagr': 0.0, 'sharpe': np.nan, 'max_drawdown': 0.0,
+                    'trades': len(self.trades), 'win_rate': np.nan}
+        returns = np.diff(portfolio) / portfolio[:-1]
+        years = len(returns) / TRADING_DAYS
+        closed = self.trades.loc[self.trades['exit_date'].notna(), 'return_pct']
+        std = returns.std(ddof=1)
+        return {
+            'total_return': (portfolio[-1] - 1) * 100,
+            'cagr': (portfolio[-1] ** (1 / years) - 1) * 100 if portfolio[-1] > 0 else -100.0,
+            'sharpe': float(np.sqrt(TRADING_DAYS) * returns.mean() / std) if std > 0 else np.nan,
+            'max_drawdown': float(max_drawdown_pct(portfolio[:, None])[0]),
+            'trades': len(self.trades),
+            'win_rate': float((closed > 0).mean() * 100) if len(closed) else np.nan,
+        }
+
+
+# Panel arrays of the worker process (set once per worker by _init_worker)
+_WORKER: Dict[str, object] = {}
+
+
+def _init_worker(engine: 'BacktestEngine') -> None:
+    """Keep the engine in the worker so each task only sends parameters"""
+    _WORKER['engine'] = engine
+
+
+def _run_pairs(pairs: Sequence[Tuple[int, int]], kind: str) -> List[Dict[str, float]]:
+    """Run crossover backtests for parameter pairs in a worker"""
+    engine: BacktestEngine = _WORKER['engine']
+    return [{'fast': fast, 'slow': slow, **engine.run_crossover(fast, slow, kind).summary()}
+            for fast, slow in pairs]
+
+
+class BacktestEngine:
+    """Run signal rules over every symbol of an OHLCV panel at once"""
+
+    def __init__(self, panel: pd.DataFrame, costs: Optional[CostModel] = None,
+                 settlement_days: int = 2, mask: Optional[pd.DataFrame] = None):
+        """
+        Initialize engine
+
+        Args:
+            panel: Long OHLCV panel (symbol, date, open, close)
+            costs: Cost model (defaults to CostModel())
+            settlement_days: Sessions before bought shares or sale proceeds can be used (T+2)
+            mask: Optional boolean frame (date x symbol) of sessions where
+                  positions may be held, e.g. a liquidity filter; positions
+                  are closed when it turns False
+        """
+        self.costs = costs or CostModel()
+        self.settlement_days = settlement_days
+
+        wide = to_wide(panel, ['open', 'close'])
+        self.close = wide['close']
+        self.open = wide['open'].reindex_like(self.close)
+        self.mask = None if mask is None else \
+            mask.reindex_like(self.close).fillna(False).astype(bool)
+
+    @timed('analysis.backtest')
+    def run(self, target: pd.DataFrame, params: Optional[Dict[str, object]] = None) -> BacktestResult:
+        """
+        Backtest target positions
+
+        Args:
+            target: Boolean frame (date x symbol), True where a long position
+                    is wanted after that session's close
+            params: Parameters recorded in the result
+
+        Returns:
+            BacktestResult
+        """
+        target = target.reindex_like(self.close).fillna(False).to_numpy(dtype=bool)
+        if self.mask is not None:
+            target = target & self.mask.to_numpy()
+        # Any session with a bar can fill; the mask only limits the wanted positions
+        tradable = np.ones(target.shape, dtype=bool)
+
+        equity, trades = simulate(self.open.to_numpy(dtype='float64'), self.close.to_numpy(dtype='float64'),
+                                  target, tradable, self.costs, self.settlement_days)
+
+        dates = self.close.index
+        symbols = self.close.columns.astype(str)
+        exits = trades['exit']
+        last = len(dates) - 1
+        date_values = dates.to_numpy()
+        trade_frame = pd.DataFrame({
+            'symbol': np.asarray(symbols)[trades['symbol']],
+            'entry_date': date_values[trades['entry']],
+            'exit_date': np.where(exits >= 0, date_values[np.clip(exits, 0, None)],
+                                  np.datetime64('NaT')).astype(date_values.dtype),
+            'entry_price': trades['entry_price'],
+            'exit_price': trades['exit_price'],
+            'return_pct': trades['return'] * 100,
+            'sessions': np.where(exits >= 0, exits, last + 1) - trades['entry'],
+        }, columns=TRADE_COLUMNS)
+        trade_frame = trade_frame.sort_values(['entry_date', 'symbol'], kind='stable').reset_index(drop=True)
+
+        return BacktestResult(
+            equity=pd.DataFrame(equity, index=dates, columns=symbols),
+            trades=trade_frame,
+            params={'settlement_days': self.settlement_days, **(params or {})}
+        )
+
+    def run_crossover(self, fast: int = 9, slow: int = 21, kind: str = 'ema') -> BacktestResult:
+        """
+        Backtest a moving average crossover (long while fast > slow)
+
+        Args:
+            fast: Fast period
+            slow: Slow period
+            kind: 'ema' or 'sma'
+
+        Returns:
+            BacktestResult
+        """
+        target = crossover_positions(self.close, fast, slow, kind)
+        return self.run(target, {'rule': f"{kind}_cross", 'fast': fast, 'slow': slow})
+
+    def sweep(self, pairs: Iterable[Tuple[int, int]], kind: str = 'ema',
+              max_workers: Optional[int] = None, chunk_size: int = 4) -> pd.DataFrame:
+        """
+        Backtest many (fast, slow) combinations, in parallel across processes
+
+        The panel is sent to each worker once; tasks carry only parameters.
+
+        Args:
+            pairs: (fast, slow) periods; pairs with fast >= slow are skipped
+            kind: 'ema' or 'sma'
+            max_workers: Worker processes (None: CPU count, 0/1: run in-process)
+            chunk_size: Pairs per worker task
+
+        Returns:
+            DataFrame with one row of summary() results per pair, best total return first
+        """
+        pairs = [(int(fast), int(slow)) for fast, slow in pairs if fast < slow]
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), max(1, chunk_size))]
+        max_workers = os.cpu_count() if max_workers is None else max_workers
+
+        rows: List[Dict[str, float]] = []
+        if max_workers <= 1 or len(chunks) <= 1:
+            rows = [{'fast': fast, 'slow': slow, **self.run_crossover(fast, slow, kind).summary()}
+                    for fast, slow in pairs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                     initializer=_init_worker, initargs=(self,)) as pool:
+                for result in pool.map(_run_pairs, chunks, [kind] * len(chunks)):
+                    rows.extend(result)
+
+        logger.info("Swept %d %s crossover pairs", len(rows), kind.upper())
+        if not rows:
+            return pd.DataFrame(columns=['fast', 'slow', 'total_return', 'cagr', 'sharpe',
+                                         'max_drawdown', 'trades', 'win_rate'])
+        return pd.DataFrame(rows).sort_values('total_return', ascending=False, kind='stable').reset_index(drop=True)
@@ -8,6 +8,8 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from src.core.instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
 
@@ -329,6 +331,7 @@ class TechnicalIndicatorAnalyzer:
         
         return signals
     
+    @timed('indicators.all')
     def calculate_all_indicators(
         self, 
         data: pd.DataFrame,
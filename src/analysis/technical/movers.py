@@ -0,0 +1,194 @@
+"""
+Movers Engine - Vectorized returns, gaps and volume ratios over a date x symbol panel
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+# Return horizons in trading days
+HORIZONS = {'1D': 1, '5D': 5, '20D': 20}
+
+# Ranking metrics exposed by the engine
+RANK_METRICS = ('ret_1d', 'ret_5d', 'ret_20d', 'gap_pct', 'volume_ratio', 'trading_value')
+
+
+def to_wide(panel: pd.DataFrame, fields: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Pivot a long OHLCV panel into date x symbol frames
+
+    Args:
+        panel: Long frame with symbol, date and OHLCV columns
+        fields: Columns to pivot
+
+    Returns:
+        Field name -> DataFrame (index date, columns symbol)
+    """
+    panel = panel.assign(symbol=panel['symbol'].astype(str))
+    wide = panel.pivot_table(index='date', columns='symbol', values=list(fields),
+                             aggfunc='last', observed=True)
+    return {field: wide[field] for field in fields}
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs down each column"""
+    n_rows = values.shape[0]
+    idx = np.where(~np.isnan(values), np.arange(n_rows)[:, None], 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return np.take_along_axis(values, idx, axis=0)
+
+
+class MoversEngine:
+    """Compute mover metrics for every symbol of a panel at once"""
+
+    def __init__(self, panel: pd.DataFrame,
+                 volume_window: int = 20,
+                 sectors: Optional[Mapping[str, str]] = None):
+        """
+        Initialize engine
+
+        Args:
+            panel: Long OHLCV panel (symbol, date, open, high, low, close, volume)
+            volume_window: Number of prior sessions in the average volume
+            sectors: Optional symbol -> sector mapping for filtering
+        """
+        self.volume_window = volume_window
+        self.sectors = dict(sectors or {})
+        self.table = self._compute(panel)
+
+    def _compute(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build the per-symbol metrics table
+
+        Returns are measured from each symbol's latest bar, so halted symbols
+        are ranked on their own last session. Prices are forward-filled only to
+        look back across missing sessions.
+
+        Args:
+            panel: Long OHLCV panel
+
+        Returns:
+            DataFrame indexed by symbol
+        """
+        columns = ['date', 'close', 'ret_1d', 'ret_5d', 'ret_20d', 'gap_pct', 'volume',
+                   'avg_volume', 'volume_ratio', 'trading_value', 'sector']
+        if panel.empty:
+            return pd.DataFrame(columns=columns)
+
+        wide = to_wide(panel, ['open', 'close', 'volume'])
+        dates = wide['close'].index
+        symbols = wide['close'].columns
+        close = wide['close'].to_numpy(dtype='float64')
+        open_ = wide['open'].to_numpy(dtype='float64')
+        volume = wide['volume'].to_numpy(dtype='float64')
+
+        n_rows = close.shape[0]
+        valid = ~np.isnan(close)
+        has_data = valid.any(axis=0)
+        # Row of each symbol's latest bar
+        last = n_rows - 1 - np.argmax(valid[::-1], axis=0)
+        cols = np.arange(close.shape[1])
+
+        close_ff = _ffill(close)
+        last_close = close_ff[last, cols]
+
+        def lookback(k: int) -> np.ndarray:
+            rows = last - k
+            out = close_ff[np.clip(rows, 0, None), cols]
+            return np.where(rows >= 0, out, np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = {f'ret_{name.lower()}': (last_close / lookback(k) - 1) * 100
+                       for name, k in HORIZONS.items()}
+            gap_pct = (open_[last, cols] / lookback(1) - 1) * 100
+
+            # Average volume over the N sessions before the latest bar via cumulative sums
+            vol_filled = np.nan_to_num(volume)
+            vol_count = (~np.isnan(volume)).astype('float64')
+            cum_vol = np.vstack([np.zeros((1, volume.shape[1])), np.cumsum(vol_filled, axis=0)])
+            cum_cnt = np.vstack([np.zeros((1, volume.shape[1])), np.cumsum(vol_count, axis=0)])
+            start = np.clip(last - self.volume_window, 0, None)
+            window_sum = cum_vol[last, cols] - cum_vol[start, cols]
+            window_cnt = cum_cnt[last, cols] - cum_cnt[start, cols]
+            avg_volume = np.where(window_cnt > 0, window_sum / window_cnt, np.nan)
+
+            last_volume = volume[last, cols]
+            volume_ratio = np.where(avg_volume > 0, last_volume / avg_volume, np.nan)
+
+        table = pd.DataFrame({
+            'date': dates[last],
+            'close': last_close,
+            **returns,
+            'gap_pct': gap_pct,
+            'volume': last_volume,
+            'avg_volume': avg_volume,
+            'volume_ratio': volume_ratio,
+            'trading_value': last_close * last_volume,
+            'sector': [self.sectors.get(s) for s in symbols],
+        }, index=pd.Index(symbols, name='symbol'))
+
+        return table[has_data][columns]
+
+    def filter(self, symbols: Optional[Iterable[str]] = None,
+               sectors: Optional[Iterable[str]] = None,
+               min_trading_value: float = 0) -> np.ndarray:
+        """
+        Build a boolean row mask
+
+        Args:
+            symbols: Optional symbol subset
+            sectors: Optional sectors to keep
+            min_trading_value: Minimum latest trading value in VND
+
+        Returns:
+            Boolean mask over table rows
+        """
+        mask = self.table['trading_value'].to_numpy() >= min_trading_value
+        if symbols is not None:
+            mask &= self.table.index.isin(list(symbols))
+        if sectors:
+            mask &= self.table['sector'].isin(list(sectors)).to_numpy()
+        return mask
+
+    def top(self, metric: str = 'ret_1d', k: int = 10, ascending: bool = False,
+            symbols: Optional[Iterable[str]] = None,
+            sectors: Optional[Iterable[str]] = None,
+            min_trading_value: float = 0) -> pd.DataFrame:
+        """
+        Get the top-k symbols by a metric
+
+        Selection uses argpartition (O(n)), only the k winners are sorted.
+
+        Args:
+            metric: One of RANK_METRICS
+            k: Number of rows
+            ascending: True for the lowest values (e.g., top losers)
+            symbols: Optional symbol subset
+            sectors: Optional sectors to keep
+            min_trading_value: Minimum latest trading value in VND
+
+        Returns:
+            Table rows of the top-k symbols, best first
+        """
+        if metric not in RANK_METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {RANK_METRICS}")
+
+        mask = self.filter(symbols, sectors, min_trading_value)
+        values = self.table[metric].to_numpy(dtype='float64')
+        mask &= ~np.isnan(values)
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) == 0 or k <= 0:
+            return self.table.iloc[[]]
+
+        keys = values[candidates] if ascending else -values[candidates]
+        k = min(k, len(candidates))
+        chosen = np.argpartition(keys, k - 1)[:k]
+        chosen = chosen[np.argsort(keys[chosen], kind='stable')]
+        return self.table.iloc[candidates[chosen]]
+
+    @property
+    def available_sectors(self) -> List[str]:
+        """Sorted sectors present in the table"""
+        return sorted(s for s in self.table['sector'].dropna().unique())
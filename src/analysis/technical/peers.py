@@ -0,0 +1,246 @@
+"""
+Peer Index - Top-k most correlated peers per symbol, precomputed from
+blocked correlation products over a trailing window of daily returns
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+from src.core.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = Path("Database/cache/peer_index.npz")
+
+# Peers kept per symbol; suggestions never need more than comparison max_companies
+DEFAULT_TOP_K = 20
+# Trailing sessions in the correlation window
+DEFAULT_WINDOW = 120
+
+
+def _block_correlations(x: np.ndarray, w: np.ndarray, block: slice, min_periods: int) -> np.ndarray:
+    """
+    Pairwise-complete correlations of a block of columns against all columns
+
+    Args:
+        x: (sessions, symbols) returns with NaN replaced by 0
+        w: (sessions, symbols) 1.0 where the return exists
+        block: Column slice of the block
+        min_periods: Minimum common sessions (NaN below)
+
+    Returns:
+        (block symbols, all symbols) correlations
+    """
+    xb, wb = x[:, block], w[:, block]
+    n = wb.T @ w
+    # Sums of the block symbol / the other symbol over their common sessions
+    sum_b = xb.T @ w
+    sum_o = wb.T @ x
+    sq_b = (xb * xb).T @ w
+    sq_o = wb.T @ (x * x)
+    cross = xb.T @ x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = np.clip(n * sq_b - sum_b * sum_b, 0, None) * np.clip(n * sq_o - sum_o * sum_o, 0, None)
+        corr = (n * cross - sum_b * sum_o) / np.sqrt(var)
+    corr[n < min_periods] = np.nan
+    return corr
+
+
+class PeerIndex:
+    """Top-k correlated peers per symbol stored as compact arrays"""
+
+    def __init__(self, symbols: Iterable[str], peers: np.ndarray, scores: np.ndarray,
+                 version: str = "", window: int = DEFAULT_WINDOW):
+        """
+        Initialize index
+
+        Args:
+            symbols: Symbols in row order
+            peers: (symbols, k) int32 row numbers of peers, best first, -1 padded
+            scores: (symbols, k) float32 correlations, NaN padded
+            version: Data version the index was built from
+            window: Sessions in the correlation window
+        """
+        self.symbols = np.asarray(list(symbols), dtype=str)
+        self.peers = np.asarray(peers, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.float32)
+        self.version = version
+        self.window = window
+        self._rows = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def k(self) -> int:
+        """Peers stored per symbol"""
+        return self.peers.shape[1]
+
+    @classmethod
+    @timed('analysis.peer_index')
+    def build(cls, returns: pd.DataFrame, k: int = DEFAULT_TOP_K, window: int = DEFAULT_WINDOW,
+              min_periods: Optional[int] = None, block_size: int = 512,
+              version: str = "") -> 'PeerIndex':
+        """
+        Build the index from a date x symbol returns frame
+
+        Correlations are computed one block of symbols at a time, so memory
+        stays at block_size x symbols; only the top k per row are kept.
+
+        Args:
+            returns: Daily returns (date x symbol), NaN where a symbol did not trade
+            k: Peers kept per symbol
+            window: Trailing sessions used
+            min_periods: Minimum common sessions for a pair (default: half the window)
+            block_size: Symbols per block
+            version: Data version of the returns
+
+        Returns:
+            PeerIndex
+        """
+        min_periods = min_periods or max(window // 2, 2)
+        values = returns.tail(window).to_numpy(dtype='float64')
+        w = (~np.isnan(values)).astype('float64')
+        x = np.nan_to_num(values)
+        n_symbols = values.shape[1]
+        k = max(min(k, n_symbols - 1), 0)
+
+        peers = np.full((n_symbols, k), -1, dtype=np.int32)
+        scores = np.full((n_symbols, k), np.nan, dtype=np.float32)
+        for start in range(0, n_symbols, block_size):
+            block = slice(start, min(start + block_size, n_symbols))
+            corr = _block_correlations(x, w, block, min_periods)
+            rows = np.arange(corr.shape[0])
+            corr[rows, rows + start] = np.nan
+
+            if k == 0:
+                continue
+            keys = np.where(np.isnan(corr), np.inf, -corr)
+            top = np.argpartition(keys, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(keys, top, axis=1), axis=1, kind='stable')
+            top = np.take_along_axis(top, order, axis=1)
+            best = np.take_along_axis(corr, top, axis=1)
+            found = ~np.isnan(best)
+            peers[block] = np.where(found, top, -1)
+            scores[block] = best
+
+        logger.info("Built peer index for %d symbols (top %d, %d sessions)", n_symbols, k, len(values))
+        return cls(returns.columns.astype(str), peers, scores, version, window)
+
+    def peers_of(self, symbol: str, k: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the most correlated peers of a symbol
+
+        Args:
+            symbol: Stock symbol
+            k: Number of peers (default: all stored)
+
+        Returns:
+            DataFrame with peer and correlation, best first (empty if unknown)
+        """
+        peers, scores = self._lookup(symbol, k)
+        return pd.DataFrame({'peer': peers, 'correlation': scores.astype('float64')})
+
+    def _lookup(self, symbol: str, k: Optional[int] = None):
+        """Peer symbols and correlations of one row (empty if unknown)"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return self.symbols[:0], np.empty(0, dtype=np.float32)
+        peers = self.peers[row, :k]
+        found = peers >= 0
+        return self.symbols[peers[found]], self.scores[row, :k][found]
+
+    def suggest(self, symbol: str, min_companies: int = 3, max_companies: int = 10,
+                min_correlation: float = 0.3,
+                candidates: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Suggest comparison peers for a symbol
+
+        Takes peers above min_correlation up to max_companies, then tops up
+        with the next best peers until min_companies is reached.
+
+        Args:
+            symbol: Stock symbol
+            min_companies: Minimum suggestions (if enough peers are stored)
+            max_companies: Maximum suggestions
+            min_correlation: Correlation a peer needs beyond the minimum count
+            candidates: Optional allowed symbols
+
+        Returns:
+            Peer symbols, best first
+        """
+        peers, scores = self._lookup(symbol)
+        if candidates is not None:
+            allowed = candidates if isinstance(candidates, (set, frozenset)) else set(candidates)
+            keep = [peer in allowed for peer in peers]
+            peers, scores = peers[keep], scores[keep]
+        strong = int((scores >= min_correlation).sum())
+        count = min(max(strong, min_companies), max_companies)
+        return peers[:count].tolist()
+
+    def save(self, path: Union[str, Path] = DEFAULT_INDEX_PATH):
+        """
+        Write the index as a compressed .npz file
+
+        Args:
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, symbols=self.symbols, peers=self.peers, scores=self.scores,
+                                version=np.array(self.version), window=np.array(self.window))
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Optional['PeerIndex']:
+        """
+        Read an index written by save()
+
+        Args:
+            path: Index file
+
+        Returns:
+            PeerIndex or None if missing/unreadable
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls(data['symbols'], data['peers'], data['scores'],
+                           str(data['version']), int(data['window']))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Could not read peer index %s: %s", path, e)
+            return None
+
+    @classmethod
+    def load_or_build(cls, returns: pd.DataFrame, version: str,
+                      path: Union[str, Path] = DEFAULT_INDEX_PATH, **kwargs) -> 'PeerIndex':
+        """
+        Load the stored index if it matches the data version, otherwise rebuild and store it
+
+        Args:
+            returns: Daily returns (date x symbol)
+            version: Data version of the returns
+            path: Index file
+            **kwargs: Passed to build()
+
+        Returns:
+            PeerIndex
+        """
+        index = cls.load(path) if version else None
+        if index is not None and index.version == version \
+                and index.window == kwargs.get('window', DEFAULT_WINDOW) \
+                and index.k >= min(kwargs.get('k', DEFAULT_TOP_K), len(index.symbols) - 1):
+            return index
+
+        index = cls.build(returns, version=version, **kwargs)
+        if version:
+            index.save(path)
+        return index
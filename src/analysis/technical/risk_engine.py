@@ -0,0 +1,277 @@
+"""
+Risk Engine - Vectorized volatility, beta, drawdown, Sharpe/Sortino and
+correlation/covariance over a date x symbol panel
+
+Per-symbol definitions follow src/utils/calculations.py (annualized with
+252 sessions, Sharpe on daily excess returns, drawdown in percent); the
+engine computes them for the whole universe with masked NumPy sums.
+"""
+
+from functools import cached_property
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import logging
+
+from src.core.instrumentation import timed
+from .movers import _ffill, to_wide
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS = 252
+
+# Index symbol used as the market when it is part of the panel
+BENCHMARK_SYMBOL = 'VNINDEX'
+
+RISK_COLUMNS = ['date', 'bars', 'annual_return', 'volatility', 'rolling_volatility', 'beta',
+                'market_correlation', 'max_drawdown', 'sharpe', 'sortino']
+
+
+def _masked_moments(x: np.ndarray, y: np.ndarray, mask: np.ndarray):
+    """
+    Column-wise pairwise moments of x and y over rows where mask is set
+
+    Args:
+        x: (rows, cols) values, NaN-free where mask is set
+        y: (rows, cols) or (rows, 1) values
+        mask: (rows, cols) boolean
+
+    Returns:
+        (count, covariance, variance of x, variance of y), ddof=1
+    """
+    w = mask.astype('float64')
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    n = w.sum(axis=0)
+    sx, sy = x.sum(axis=0), y.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = ((x * y).sum(axis=0) - sx * sy / n) / (n - 1)
+        var_x = np.clip(((x * x).sum(axis=0) - sx * sx / n) / (n - 1), 0, None)
+        var_y = np.clip(((y * y).sum(axis=0) - sy * sy / n) / (n - 1), 0, None)
+    return n, cov, var_x, var_y
+
+
+class RiskEngine:
+    """Compute risk metrics for every symbol of a panel at once"""
+
+    def __init__(self, panel: pd.DataFrame, window: int = 60,
+                 risk_free_rate: float = 0.02,
+                 benchmark: str = BENCHMARK_SYMBOL,
+                 min_periods: int = 20):
+        """
+        Initialize engine
+
+        The market is the benchmark symbol when it is in the panel, otherwise
+        a VNINDEX proxy: the universe return weighted by each symbol's
+        previous-session trading value.
+
+        Args:
+            panel: Long OHLCV panel (symbol, date, close, volume)
+            window: Sessions in the rolling volatility
+            risk_free_rate: Annual risk-free rate for Sharpe/Sortino
+            benchmark: Index symbol used as the market if present
+            min_periods: Minimum returns for a metric (NaN below)
+        """
+        self.window = window
+        self.risk_free_rate = risk_free_rate
+        self.benchmark = benchmark
+        self.min_periods = min_periods
+
+        if panel.empty:
+            self.close = pd.DataFrame(dtype='float64')
+            self.volume = pd.DataFrame(dtype='float64')
+        else:
+            wide = to_wide(panel, ['close', 'volume'])
+            self.close, self.volume = wide['close'], wide['volume']
+
+    @cached_property
+    def returns(self) -> pd.DataFrame:
+        """
+        Simple returns per session (date x symbol)
+
+        A return is measured from the symbol's previous bar, so sessions a
+        symbol did not trade are skipped as in a per-symbol pct_change.
+        """
+        close = self.close.to_numpy(dtype='float64')
+        previous = np.full_like(close, np.nan)
+        if len(close) > 1:
+            previous[1:] = _ffill(close)[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = close / previous - 1
+        return pd.DataFrame(returns, index=self.close.index, columns=self.close.columns)
+
+    @cached_property
+    def market_returns(self) -> pd.Series:
+        """Market (benchmark or value-weighted proxy) return per session"""
+        if self.benchmark in self.returns.columns:
+            return self.returns[self.benchmark].rename('market')
+
+        returns = self.returns.to_numpy()
+        value = (self.close * self.volume).to_numpy(dtype='float64')
+        weights = np.full_like(value, np.nan)
+        if len(value) > 1:
+            weights[1:] = value[:-1]
+        usable = ~np.isnan(returns) & (np.nan_to_num(weights) > 0)
+        weights = np.where(usable, weights, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            market = (np.where(usable, returns, 0.0) * weights).sum(axis=1) / weights.sum(axis=1)
+        return pd.Series(market, index=self.returns.index, name='market')
+
+    def rolling_volatility(self, window: Optional[int] = None) -> pd.DataFrame:
+        """
+        Annualized rolling volatility for every symbol
+
+        Uses running sums of returns and squared returns, so the cost does
+        not grow with the window. Windows span sessions; a window needs a
+        return in each of its `window` sessions.
+
+        Args:
+            window: Sessions per window (default: engine window)
+
+        Returns:
+            DataFrame (date x symbol)
+        """
+        window = window or self.window
+        returns = self.returns.to_numpy()
+        valid = ~np.isnan(returns)
+        filled = np.where(valid, returns, 0.0)
+
+        def window_sum(values: np.ndarray) -> np.ndarray:
+            cum = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+            start = np.clip(np.arange(1, len(values) + 1) - window, 0, None)
+            return cum[1:] - cum[start]
+
+        n = window_sum(valid.astype('float64'))
+        s1 = window_sum(filled)
+        s2 = window_sum(filled * filled)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = np.clip((s2 - s1 * s1 / n) / (n - 1), 0, None)
+        volatility = np.where(n >= window, np.sqrt(variance) * np.sqrt(TRADING_DAYS), np.nan)
+        return pd.DataFrame(volatility, index=self.returns.index, columns=self.returns.columns)
+
+    def max_drawdown(self) -> pd.Series:
+        """Maximum drawdown in percent per symbol (negative)"""
+        close = self.close.to_numpy(dtype='float64')
+        running_max = np.fmax.accumulate(close, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdown = np.nanmin(np.where(np.isnan(close), np.inf, close / running_max - 1), axis=0)
+        drawdown = np.where(np.isfinite(drawdown), drawdown * 100, np.nan)
+        return pd.Series(drawdown, index=self.close.columns, name='max_drawdown')
+
+    @timed('analysis.risk')
+    def _compute_table(self) -> pd.DataFrame:
+        """
+        Build the per-symbol risk table
+
+        Returns:
+            DataFrame indexed by symbol with RISK_COLUMNS
+        """
+        if self.close.empty:
+            return pd.DataFrame(columns=RISK_COLUMNS)
+
+        returns = self.returns.to_numpy()
+        valid = ~np.isnan(returns)
+        n = valid.sum(axis=0)
+        enough = n >= self.min_periods
+        daily_rf = self.risk_free_rate / TRADING_DAYS
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(valid, returns, 0.0).sum(axis=0) / n
+            std = np.sqrt(np.clip(
+                np.where(valid, (returns - mean) ** 2, 0.0).sum(axis=0) / (n - 1), 0, None))
+            excess = mean - daily_rf
+            # Downside deviation of excess returns below zero over all sessions
+            downside = np.sqrt(np.where(valid, np.minimum(returns - daily_rf, 0) ** 2, 0.0).sum(axis=0) / n)
+            sharpe = np.sqrt(TRADING_DAYS) * excess / std
+            sortino = np.sqrt(TRADING_DAYS) * excess / downside
+
+            market = self.market_returns.to_numpy()[:, None]
+            paired = valid & ~np.isnan(market)
+            n_pairs, cov, var_x, var_m = _masked_moments(returns, market, paired)
+            beta = cov / var_m
+            correlation = cov / np.sqrt(var_x * var_m)
+        beta = np.where(n_pairs >= self.min_periods, beta, np.nan)
+        correlation = np.where(n_pairs >= self.min_periods, correlation, np.nan)
+
+        # Latest rolling volatility over each symbol's own last `window` returns,
+        # as calculate_volatility on the symbol's series
+        seen = np.cumsum(valid, axis=0)
+        recent = valid & (seen > n - self.window)
+        _, _, recent_var, _ = _masked_moments(returns, returns, recent)
+        rolling = np.where(n >= self.window, np.sqrt(recent_var) * np.sqrt(TRADING_DAYS), np.nan)
+
+        close = self.close.to_numpy(dtype='float64')
+        has_bar = ~np.isnan(close)
+        last = len(close) - 1 - np.argmax(has_bar[::-1], axis=0)
+
+        table = pd.DataFrame({
+            'date': self.close.index[last],
+            'bars': has_bar.sum(axis=0),
+            'annual_return': np.where(enough, mean * TRADING_DAYS * 100, np.nan),
+            'volatility': np.where(enough, std * np.sqrt(TRADING_DAYS), np.nan),
+            'rolling_volatility': rolling,
+            'beta': beta,
+            'market_correlation': correlation,
+            'max_drawdown': self.max_drawdown().to_numpy(),
+            'sharpe': np.where(enough & np.isfinite(sharpe), sharpe, np.nan),
+            'sortino': np.where(enough & np.isfinite(sortino), sortino, np.nan),
+        }, index=pd.Index(self.close.columns.astype(str), name='symbol'))
+
+        table = table[has_bar.any(axis=0)]
+        logger.debug("Computed risk metrics for %d symbols", len(table))
+        return table[RISK_COLUMNS]
+
+    @cached_property
+    def table(self) -> pd.DataFrame:
+        """Per-symbol risk table (computed on first use)"""
+        return self._compute_table()
+
+    def _pairwise(self, symbols: Optional[Iterable[str]]):
+        """Pairwise counts and sums of returns for a symbol subset"""
+        returns = self.returns if symbols is None else self.returns.reindex(columns=list(symbols))
+        values = returns.to_numpy(dtype='float64')
+        w = (~np.isnan(values)).astype('float64')
+        x = np.nan_to_num(values)
+        # Entry (i, j): sums of symbol i over the sessions where j also traded
+        n = w.T @ w
+        sx = x.T @ w
+        sxx = (x * x).T @ w
+        sxy = x.T @ x
+        return returns.columns, n, sx, sxx, sxy
+
+    def covariance(self, symbols: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Annualized covariance matrix of daily returns (pairwise complete sessions)
+
+        Args:
+            symbols: Optional symbol subset (default: all)
+
+        Returns:
+            DataFrame (symbol x symbol), NaN for pairs with fewer than min_periods sessions
+        """
+        columns, n, sx, _, sxy = self._pairwise(symbols)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = (sxy - sx * sx.T / n) / (n - 1)
+        cov = np.where(n >= self.min_periods, cov * TRADING_DAYS, np.nan)
+        return pd.DataFrame(cov, index=columns, columns=columns)
+
+    def correlation(self, symbols: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Correlation matrix of daily returns (pairwise complete sessions)
+
+        Matches DataFrame.corr(min_periods=min_periods) on the returns frame.
+
+        Args:
+            symbols: Optional symbol subset (default: all)
+
+        Returns:
+            DataFrame (symbol x symbol)
+        """
+        columns, n, sx, sxx, sxy = self._pairwise(symbols)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            numerator = n * sxy - sx * sx.T
+            var_i = np.clip(n * sxx - sx * sx, 0, None)
+            corr = numerator / np.sqrt(var_i * var_i.T)
+        corr = np.clip(np.where(n >= self.min_periods, corr, np.nan), -1, 1)
+        return pd.DataFrame(corr, index=columns, columns=columns)
@@ -0,0 +1,408 @@
+"""
+Signal Engine - Crossovers, breakouts, RSI and MACD events for every symbol
+of an OHLCV panel at once, stored in an indexed SQLite events table
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+from src.core.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+# Signal name -> description; direction +1 is bullish, -1 bearish
+SIGNAL_TYPES = {
+    'ema_cross': 'EMA fast crosses EMA slow (golden +1 / death -1)',
+    'breakout': 'Close crosses the prior N-day high (+1) or low (-1)',
+    'rsi_oversold': 'RSI crosses below the oversold level (+1)',
+    'rsi_overbought': 'RSI crosses above the overbought level (-1)',
+    'macd_cross': 'MACD crosses its signal line',
+    'macd_zero': 'MACD changes sign',
+}
+
+EVENT_COLUMNS = ['symbol', 'date', 'signal', 'direction', 'value', 'close']
+
+DEFAULT_DB_PATH = Path("Database/cache/signal_events.db")
+
+
+def group_starts(groups: np.ndarray) -> np.ndarray:
+    """
+    Mark the first row of each group in a group-sorted array
+
+    Args:
+        groups: Group labels/codes, contiguous per group
+
+    Returns:
+        Boolean mask of group starts
+    """
+    starts = np.ones(len(groups), dtype=bool)
+    if len(groups) > 1:
+        starts[1:] = groups[1:] != groups[:-1]
+    return starts
+
+
+def crossings(a, b, starts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Detect where series a crosses series b using sign differences
+
+    Rows where a equals b (or either is NaN) carry the previous side, so a
+    touch is not a cross and equal starting values (e.g. two EMAs seeded
+    with the same close) do not produce an event.
+
+    Args:
+        a: Values (array-like)
+        b: Values or scalar level
+        starts: Optional group-start mask; a row never crosses relative to
+                the previous group's rows
+
+    Returns:
+        int8 array: +1 where a crosses above b, -1 where it crosses below, else 0
+    """
+    with np.errstate(invalid='ignore'):
+        sign = np.sign(np.asarray(a, dtype='float64') - np.asarray(b, dtype='float64'))
+    sign[sign == 0] = np.nan
+
+    # Forward-fill the last known side within each group
+    positions = np.arange(len(sign))
+    known = ~np.isnan(sign)
+    if starts is not None:
+        known |= starts
+    else:
+        known[:1] = True
+    side = sign[np.maximum.accumulate(np.where(known, positions, 0))] if len(sign) else sign
+
+    prev = np.empty_like(side)
+    prev[:1] = np.nan
+    prev[1:] = side[:-1]
+    if starts is not None:
+        prev[starts] = np.nan
+
+    with np.errstate(invalid='ignore'):
+        up = (side > 0) & (prev < 0)
+        down = (side < 0) & (prev > 0)
+    return up.astype(np.int8) - down.astype(np.int8)
+
+
+class SignalEngine:
+    """Compute indicators and signal events over a long OHLCV panel"""
+
+    def __init__(self, ema_fast: int = 9, ema_slow: int = 21,
+                 breakout_window: int = 20,
+                 rsi_period: int = 14, rsi_oversold: float = 30, rsi_overbought: float = 70,
+                 macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9):
+        """
+        Initialize engine
+
+        Indicator definitions match the chart (EMA, adjust=False) and
+        TechnicalIndicatorAnalyzer (simple-average RSI, MACD).
+
+        Args:
+            ema_fast: Fast EMA span
+            ema_slow: Slow EMA span
+            breakout_window: Lookback of the prior high/low
+            rsi_period: RSI period
+            rsi_oversold: Oversold level
+            rsi_overbought: Overbought level
+            macd_fast: MACD fast EMA span
+            macd_slow: MACD slow EMA span
+            macd_signal: MACD signal line span
+        """
+        self.ema_fast = ema_fast
+        self.ema_slow = ema_slow
+        self.breakout_window = breakout_window
+        self.rsi_period = rsi_period
+        self.rsi_oversold = rsi_oversold
+        self.rsi_overbought = rsi_overbought
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal = macd_signal
+
+    @staticmethod
+    def _sorted(panel: pd.DataFrame) -> pd.DataFrame:
+        """Panel sorted by symbol then date with a fresh RangeIndex"""
+        return panel.sort_values(['symbol', 'date'], kind='stable').reset_index(drop=True)
+
+    @timed('indicators.signals')
+    def indicators(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add indicator columns to every row of the panel
+
+        Args:
+            panel: Long frame with symbol, date, high, low, close
+
+        Returns:
+            Sorted panel with ema_fast, ema_slow, prior_high, prior_low, rsi,
+            macd and macd_signal columns
+        """
+        df = self._sorted(panel)
+        symbols = df['symbol']
+
+        def grouped(series: pd.Series):
+            return series.groupby(symbols, observed=True, sort=False)
+
+        def per_row(result: pd.Series) -> np.ndarray:
+            # Grouped window results carry (symbol, row) index; realign to rows
+            return result.droplevel(0).reindex(df.index).to_numpy()
+
+        close = df['close']
+        df['ema_fast'] = per_row(grouped(close).ewm(span=self.ema_fast, adjust=False).mean())
+        df['ema_slow'] = per_row(grouped(close).ewm(span=self.ema_slow, adjust=False).mean())
+
+        window = self.breakout_window
+        high = per_row(grouped(df['high']).rolling(window, min_periods=window).max())
+        low = per_row(grouped(df['low']).rolling(window, min_periods=window).min())
+        df['prior_high'] = grouped(pd.Series(high, index=df.index)).shift(1)
+        df['prior_low'] = grouped(pd.Series(low, index=df.index)).shift(1)
+
+        delta = grouped(close).diff()
+        period = self.rsi_period
+        avg_gain = per_row(grouped(delta.clip(lower=0)).rolling(period, min_periods=period).mean())
+        avg_loss = per_row(grouped(-delta.clip(upper=0)).rolling(period, min_periods=period).mean())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['rsi'] = 100 - 100 / (1 + avg_gain / avg_loss)
+
+        fast = per_row(grouped(close).ewm(span=self.macd_fast).mean())
+        slow = per_row(grouped(close).ewm(span=self.macd_slow).mean())
+        df['macd'] = fast - slow
+        df['macd_signal'] = per_row(grouped(df['macd']).ewm(span=self.macd_signal).mean())
+        return df
+
+    def detect(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Detect all signal events in a panel
+
+        Args:
+            panel: Long frame with symbol, date, high, low, close
+
+        Returns:
+            DataFrame with EVENT_COLUMNS sorted by date and symbol
+        """
+        if panel.empty:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+
+        df = self.indicators(panel)
+        codes, symbols = pd.factorize(df['symbol'])
+        starts = group_starts(codes)
+
+        ema = crossings(df['ema_fast'], df['ema_slow'], starts)
+        breakout_up = crossings(df['close'], df['prior_high'], starts) == 1
+        breakout_down = crossings(df['close'], df['prior_low'], starts) == -1
+        rsi_down = crossings(df['rsi'], self.rsi_oversold, starts) == -1
+        rsi_up = crossings(df['rsi'], self.rsi_overbought, starts) == 1
+        macd = crossings(df['macd'], df['macd_signal'], starts)
+        macd_zero = crossings(df['macd'], 0, starts)
+
+        breakout = breakout_up.astype(np.int8) - breakout_down.astype(np.int8)
+        # (signal, direction per row, value column)
+        detected = [
+            ('ema_cross', ema, df['ema_fast'] - df['ema_slow']),
+            ('breakout', breakout, df['close']),
+            ('rsi_oversold', rsi_down.astype(np.int8), df['rsi']),
+            ('rsi_overbought', -rsi_up.astype(np.int8), df['rsi']),
+            ('macd_cross', macd, df['macd'] - df['macd_signal']),
+            ('macd_zero', macd_zero, df['macd']),
+        ]
+
+        rows, names, directions, values = [], [], [], []
+        for name, direction, value in detected:
+            hit = np.flatnonzero(direction)
+            rows.append(hit)
+            names.append(np.full(len(hit), name, dtype=object))
+            directions.append(direction[hit])
+            values.append(np.asarray(value, dtype='float64')[hit])
+        rows = np.concatenate(rows)
+
+        events = pd.DataFrame({
+            'symbol': np.asarray(symbols.astype(str), dtype=object)[codes[rows]],
+            'date': df['date'].to_numpy()[rows],
+            'signal': np.concatenate(names),
+            'direction': np.concatenate(directions),
+            'value': np.concatenate(values),
+            'close': df['close'].to_numpy(dtype='float64')[rows],
+        })
+        return events.sort_values(['date', 'symbol', 'signal'], kind='stable').reset_index(drop=True)
+
+
+class SignalStore:
+    """SQLite events table indexed by symbol/date and date/signal"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH):
+        """
+        Initialize store
+
+        Args:
+            db_path: SQLite file path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self):
+        """Create tables and indexes"""
+        with self._lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS signal_events (
+                    symbol TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    signal TEXT NOT NULL,
+                    direction INTEGER NOT NULL,
+                    value REAL,
+                    close REAL,
+                    PRIMARY KEY (symbol, date, signal)
+                ) WITHOUT ROWID
+            ''')
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_signal_events_date
+                ON signal_events(date, signal)
+            ''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS signal_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+
+    @property
+    def version(self) -> Optional[str]:
+        """Data version the stored events were computed from"""
+        row = self.conn.execute(
+            "SELECT value FROM signal_meta WHERE key = 'version'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def replace(self, events: pd.DataFrame, version: str = ""):
+        """
+        Replace all events
+
+        Args:
+            events: Output of SignalEngine.detect
+            version: Data version the events were computed from
+        """
+        dates = pd.to_datetime(events['date']).to_numpy().astype('datetime64[D]')
+        records = zip(
+            events['symbol'].astype(str).tolist(),
+            np.datetime_as_string(dates).tolist(),
+            events['signal'].astype(str).tolist(),
+            events['direction'].astype(int).tolist(),
+            events['value'].astype(float).tolist(),
+            events['close'].astype(float).tolist(),
+        )
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM signal_events')
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO signal_events VALUES (?, ?, ?, ?, ?, ?)', records
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO signal_meta VALUES ('version', ?)", (version,)
+            )
+        logger.info(f"Stored {len(events)} signal events (version {version})")
+
+    def refresh(self, panel: pd.DataFrame, version: str,
+                engine: Optional[SignalEngine] = None) -> bool:
+        """
+        Recompute events if the panel's data version changed
+
+        Args:
+            panel: Long OHLCV panel
+            version: Data version of the panel
+            engine: Signal engine (defaults to SignalEngine())
+
+        Returns:
+            True if events were recomputed
+        """
+        if version and self.version == version:
+            return False
+        self.replace((engine or SignalEngine()).detect(panel), version)
+        return True
+
+    def query(self, symbol: Optional[str] = None,
+              signals: Optional[Iterable[str]] = None,
+              start: Optional[str] = None, end: Optional[str] = None,
+              direction: Optional[int] = None) -> pd.DataFrame:
+        """
+        Query events
+
+        Args:
+            symbol: Optional symbol
+            signals: Optional signal names
+            start: Optional first date (inclusive)
+            end: Optional last date (inclusive)
+            direction: Optional +1/-1
+
+        Returns:
+            DataFrame with EVENT_COLUMNS sorted by date
+        """
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append('symbol = ?')
+            params.append(symbol)
+        if signals is not None:
+            signals = list(signals)
+            clauses.append(f"signal IN ({', '.join('?' * len(signals))})")
+            params.extend(signals)
+        if start is not None:
+            clauses.append('date >= ?')
+            params.append(pd.Timestamp(start).strftime('%Y-%m-%d'))
+        if end is not None:
+            clauses.append('date <= ?')
+            params.append(pd.Timestamp(end).strftime('%Y-%m-%d'))
+        if direction is not None:
+            clauses.append('direction = ?')
+            params.append(int(direction))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return pd.read_sql_query(
+            f'SELECT {", ".join(EVENT_COLUMNS)} FROM signal_events {where} ORDER BY date, symbol, signal',
+            self.conn, params=params, parse_dates=['date']
+        )
+
+    def latest_date(self) -> Optional[pd.Timestamp]:
+        """Most recent event date"""
+        row = self.conn.execute('SELECT MAX(date) FROM signal_events').fetchone()
+        return pd.Timestamp(row[0]) if row and row[0] else None
+
+    def todays_signals(self, date: Optional[str] = None,
+                       signals: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Get the events of one session (the latest by default)
+
+        Args:
+            date: Session date (defaults to the latest event date)
+            signals: Optional signal names
+
+        Returns:
+            DataFrame with EVENT_COLUMNS
+        """
+        date = date or self.latest_date()
+        if date is None:
+            return pd.DataFrame(columns=EVENT_COLUMNS)
+        return self.query(signals=signals, start=date, end=date)
+
+    def counts(self, date: Optional[str] = None) -> Dict[str, Dict[int, int]]:
+        """
+        Count events per signal and direction for one session
+
+        Args:
+            date: Session date (defaults to the latest event date)
+
+        Returns:
+            Signal -> {direction: count}
+        """
+        events = self.todays_signals(date)
+        counts: Dict[str, Dict[int, int]] = {}
+        for (signal, direction), n in events.groupby(['signal', 'direction']).size().items():
+            counts.setdefault(signal, {})[int(direction)] = int(n)
+        return counts
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -1,9 +1,44 @@
 """
 Core business logic and configuration management
+
+Classes are imported on first access, so `from src.core.config import
+get_config` does not load pandas through DataManager.
 """
 
-from .config import AppConfig, get_config
-from .data_manager import DataManager
-from .exceptions import DataLoadError, APIConnectionError, ValidationError
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import AppConfig, get_config
+    from .data_manager import DataManager
+    from .exceptions import DataLoadError, APIConnectionError, ValidationError
+    from .memory_cache import MemoryCache
+    from .disk_cache import DiskCache, get_disk_cache
+
+# Exported name -> submodule
+_LAZY_EXPORTS = {
+    "AppConfig": ".config",
+    "get_config": ".config",
+    "DataManager": ".data_manager",
+    "MemoryCache": ".memory_cache",
+    "DiskCache": ".disk_cache",
+    "get_disk_cache": ".disk_cache",
+    "DataLoadError": ".exceptions",
+    "APIConnectionError": ".exceptions",
+    "ValidationError": ".exceptions",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name on first access"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["AppConfig", "get_config", "DataManager", "DataLoadError", "APIConnectionError", "ValidationError"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
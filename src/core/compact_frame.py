@@ -0,0 +1,214 @@
+"""
+Compact Frame - Memory-optimized representation of the long-format fundamentals frame
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Low-cardinality string columns stored as categoricals
+CATEGORICAL_COLUMNS = ('SECURITY_CODE', 'METRIC_CODE', 'FREQ_CODE', 'ICB_L2',
+                       'ticker', 'symbol', 'industry', 'sector')
+# Small integer columns downcast to int16
+SMALL_INT_COLUMNS = ('YEAR', 'QUARTER')
+# Value columns optionally downcast to float32
+VALUE_COLUMNS = ('METRIC_VALUE',)
+# Ticker columns in order of preference
+TICKER_COLUMNS = ('ticker', 'symbol', 'SECURITY_CODE')
+
+
+def find_ticker_column(df: pd.DataFrame) -> Optional[str]:
+    """
+    Find the ticker column of a frame
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        Column name or None if no ticker column exists
+    """
+    for column in TICKER_COLUMNS:
+        if column in df.columns:
+            return column
+    return None
+
+
+def read_compact_parquet(path: Union[str, Path],
+                         float32_values: bool = False) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Read a parquet file into a compact, ticker-sorted frame
+
+    String columns are read dictionary-encoded so they never materialize as
+    per-row Python strings.
+
+    Args:
+        path: Parquet file path
+        float32_values: Downcast value columns to float32
+
+    Returns:
+        Tuple of (compact DataFrame, memory report)
+    """
+    schema_names = set(pq.read_schema(path).names)
+    dictionary_columns = [c for c in CATEGORICAL_COLUMNS if c in schema_names]
+
+    df = pd.read_parquet(path, read_dictionary=dictionary_columns or None)
+    baseline_bytes = estimate_default_memory(df)
+
+    df = sort_by_ticker(compact_frame(df, float32_values=float32_values))
+    return df, memory_report(baseline_bytes, frame_memory(df))
+
+
+def compact_frame(df: pd.DataFrame, float32_values: bool = False) -> pd.DataFrame:
+    """
+    Convert columns of a fundamentals frame to compact dtypes
+
+    Args:
+        df: Input DataFrame
+        float32_values: Downcast value columns to float32
+
+    Returns:
+        DataFrame with categorical strings and narrow numeric dtypes
+    """
+    df = df.copy(deep=False)
+
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            series = df[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype('category')
+            # Sorted categories make code order match lexical order
+            categories = series.cat.remove_unused_categories().cat.categories
+            df[column] = series.cat.set_categories(categories.sort_values())
+
+    for column in SMALL_INT_COLUMNS:
+        if column in df.columns:
+            values = pd.to_numeric(df[column], errors='coerce')
+            df[column] = values.astype('Int16' if values.isna().any() else 'int16')
+
+    if float32_values:
+        for column in VALUE_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('float32')
+
+    return df
+
+
+def sort_by_ticker(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort a frame by ticker (then year/quarter) so tickers occupy contiguous rows
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        Sorted DataFrame with a fresh RangeIndex
+    """
+    ticker_col = find_ticker_column(df)
+    if ticker_col is None:
+        return df
+
+    sort_cols = [ticker_col] + [c for c in SMALL_INT_COLUMNS if c in df.columns]
+    return df.sort_values(sort_cols, kind='stable').reset_index(drop=True)
+
+
+def ticker_slice(df: pd.DataFrame, column: str, ticker: str) -> slice:
+    """
+    Locate the contiguous row range of a ticker with binary search
+
+    The frame must be sorted by ``column`` (see sort_by_ticker).
+
+    Args:
+        df: Ticker-sorted DataFrame
+        column: Ticker column name
+        ticker: Ticker symbol
+
+    Returns:
+        Positional slice (empty if the ticker is absent)
+    """
+    series = df[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        code = series.cat.categories.get_indexer([ticker])[0]
+        if code < 0:
+            return slice(0, 0)
+        values = series.cat.codes.to_numpy()
+        key = code
+    else:
+        values = series.to_numpy()
+        key = ticker
+
+    start = int(np.searchsorted(values, key, side='left'))
+    stop = int(np.searchsorted(values, key, side='right'))
+    return slice(start, stop)
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """
+    Get the deep memory usage of a frame in bytes
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        Size in bytes
+    """
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def _string_bytes(value: str, default_dtype) -> int:
+    """Bytes one string takes in a column of pandas' default string dtype"""
+    if default_dtype == object:
+        # Pointer plus the Python string object
+        return 8 + sys.getsizeof(value)
+    # Arrow large_string: 64-bit offset plus the UTF-8 bytes
+    return 8 + len(value.encode('utf-8'))
+
+
+def estimate_default_memory(df: pd.DataFrame) -> int:
+    """
+    Estimate the memory a frame would use as plain pd.read_parquet returns it
+
+    Categorical columns are counted in pandas' default string dtype (object
+    strings, or Arrow-backed strings under pandas 3) and numeric columns as
+    64-bit, without materializing the default-dtype frame.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        Estimated size in bytes
+    """
+    default_string = pd.Series(['']).dtype
+    total = int(df.index.memory_usage(deep=True))
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            counts = series.value_counts(sort=False)
+            total += int(sum(_string_bytes(str(cat), default_string) * int(n) for cat, n in counts.items()))
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            total += 8 * len(series)
+        else:
+            total += int(series.memory_usage(deep=True, index=False))
+    return total
+
+
+def memory_report(baseline_bytes: int, compact_bytes: int) -> Dict[str, Any]:
+    """
+    Build a memory reduction report
+
+    Args:
+        baseline_bytes: Size with default dtypes
+        compact_bytes: Size with compact dtypes
+
+    Returns:
+        Dictionary with sizes in MB and the reduction percentage
+    """
+    reduction = 1 - compact_bytes / baseline_bytes if baseline_bytes else 0.0
+    return {
+        'baseline_mb': baseline_bytes / (1024 * 1024),
+        'compact_mb': compact_bytes / (1024 * 1024),
+        'reduction_pct': reduction * 100
+    }
@@ -11,8 +11,8 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+from .log_policy import LoggingConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +44,10 @@ class DataConfig:
     default_lookback_years: int = 5
     default_frequency: str = "Y"
     batch_size: int = 100
+    memory_cache_mb: int = 512
+    disk_cache_mb: int = 1024
+    compact_main_data: bool = True
+    float32_values: bool = False
 
 
 @dataclass
@@ -84,6 +88,16 @@ class CalculationConfig:
     good_roa: float = 0.10
     high_debt_equity: float = 1.0
     good_current_ratio: float = 1.5
+    comparison_min_companies: int = 3
+    comparison_max_companies: int = 10
+
+
+@dataclass
+class ChartConfig:
+    """Chart rendering limits"""
+    max_points: int = 2000
+    max_candles: int = 600
+    webgl_threshold: int = 5000
 
 
 @dataclass
@@ -99,6 +113,8 @@ class AppConfig:
     data: DataConfig
     metrics: MetricsMapping
     calculations: CalculationConfig
+    charts: ChartConfig = field(default_factory=ChartConfig)
+    logging_config: LoggingConfig = field(default_factory=LoggingConfig)
     
     # Metadata
     loaded_at: datetime = field(default_factory=datetime.now)
@@ -138,7 +154,11 @@ class AppConfig:
             cache_ttl=config_dict['data']['cache_ttl'],
             default_lookback_years=config_dict['data']['default_lookback_years'],
             default_frequency=config_dict['data']['default_frequency'],
-            batch_size=config_dict['data'].get('batch_size', 100)
+            batch_size=config_dict['data'].get('batch_size', 100),
+            memory_cache_mb=config_dict['data'].get('memory_cache_mb', 512),
+            disk_cache_mb=config_dict['data'].get('disk_cache_mb', 1024),
+            compact_main_data=config_dict['data'].get('compact_main_data', True),
+            float32_values=config_dict['data'].get('float32_values', False)
         )
         
         # Parse metrics mapping
@@ -156,7 +176,17 @@ class AppConfig:
             good_roe=calc_config['thresholds']['good_roe'],
             good_roa=calc_config['thresholds']['good_roa'],
             high_debt_equity=calc_config['thresholds']['high_debt_equity'],
-            good_current_ratio=calc_config['thresholds']['good_current_ratio']
+            good_current_ratio=calc_config['thresholds']['good_current_ratio'],
+            comparison_min_companies=calc_config.get('comparison', {}).get('min_companies', 3),
+            comparison_max_companies=calc_config.get('comparison', {}).get('max_companies', 10)
+        )
+        
+        # Parse chart config (optional section)
+        chart_config = config_dict.get('charts', {})
+        charts = ChartConfig(
+            max_points=chart_config.get('max_points', 2000),
+            max_candles=chart_config.get('max_candles', 600),
+            webgl_threshold=chart_config.get('webgl_threshold', 5000)
         )
         
         # Create config instance
@@ -168,6 +198,8 @@ class AppConfig:
             data=data_config,
             metrics=metrics,
             calculations=calculations,
+            charts=charts,
+            logging_config=LoggingConfig.from_dict(config_dict.get('logging')),
             config_file=str(config_path)
         )
         
@@ -4,13 +4,26 @@ Data Manager - Central orchestration for data loading and caching
 
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import pickle
-from datetime import datetime, timedelta
-import os
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
+import re
+import time
+import logging
 
 from .config import get_config
 from .exceptions import DataLoadError, ConfigurationError
+from .memory_cache import MemoryCache, readonly_view
+from .disk_cache import get_disk_cache
+from .excel_cache import ExcelCache, build_index
+from .compact_frame import read_compact_parquet
+from .indexes import FundamentalsIndex
+from .instrumentation import timed
+from .shared_data import SharedDataClient, FUNDAMENTALS_DATASET, METADATA_DATASET
+
+logger = logging.getLogger(__name__)
+
+# Metadata columns holding the metric code, in order of preference
+METADATA_KEY_COLUMNS = ('code', 'COLUMN_NAME')
 
 
 class DataManager:
@@ -24,8 +37,6 @@ class DataManager:
             config: Configuration object
         """
         self.config = config or get_config()
-        self._cache = {}
-        self._cache_timestamps = {}
         
         # Get paths from config
         self.parquet_path = self.config.paths.parquet_path
@@ -38,9 +49,39 @@ class DataManager:
         # Cache TTL from config
         self.cache_ttl = self.config.data.cache_ttl
         
+        # Bounded in-memory cache shared with loaders
+        memory_cache_mb = getattr(self.config.data, 'memory_cache_mb', 512)
+        self._cache = MemoryCache(
+            max_bytes=memory_cache_mb * 1024 * 1024,
+            ttl=self.cache_ttl,
+            name="data_manager"
+        )
+        
+        # Single-file disk cache (write-behind, size bounded), shared per file
+        disk_cache_mb = getattr(self.config.data, 'disk_cache_mb', 1024)
+        self._disk_cache = get_disk_cache(
+            self.cache_dir / "data_cache.db",
+            ttl=self.cache_ttl,
+            max_bytes=disk_cache_mb * 1024 * 1024
+        )
+        
+        # Compact load mode (categorical/int16 dtypes, ticker-sorted)
+        self.compact_main_data = getattr(self.config.data, 'compact_main_data', True)
+        self.float32_values = getattr(self.config.data, 'float32_values', False)
+        
+        # Excel workbooks are read through Parquet sidecars
+        self._excel_cache = ExcelCache(self.cache_dir / "excel")
+        
         # Load main data
         self._main_data = None
         self._metadata = None
+        self._metadata_index: Optional[Tuple[pd.DataFrame, Dict[str, int]]] = None
+        self._index: Optional[FundamentalsIndex] = None
+        self.memory_report: Dict[str, Any] = {}
+        
+        # Attach to data published by the page launcher instead of loading a private copy
+        self._shared = SharedDataClient() if SharedDataClient.is_enabled() else None
+        self._main_version: Optional[int] = None
     
     def get_main_data(self) -> pd.DataFrame:
         """
@@ -49,15 +90,25 @@ class DataManager:
         Returns:
             DataFrame with financial data
         """
+        if self._shared is not None:
+            attached = self._shared.get(FUNDAMENTALS_DATASET)
+            if attached is not None:
+                df, version = attached
+                if version != self._main_version:
+                    # New version published - rebuild indexes over the shared frame
+                    self._set_main_data(df)
+                    self._main_version = version
+                return self._main_data
+        
         if self._main_data is None:
             try:
                 if self.parquet_path and Path(self.parquet_path).exists():
-                    self._main_data = pd.read_parquet(self.parquet_path)
+                    self._set_main_data(self._read_parquet(self.parquet_path))
                 else:
                     # Try relative path
                     relative_path = Path("Database/Full_database/Buu_clean_ver2.parquet")
                     if relative_path.exists():
-                        self._main_data = pd.read_parquet(relative_path)
+                        self._set_main_data(self._read_parquet(relative_path))
                     else:
                         raise DataLoadError(f"Data file not found: {self.parquet_path}")
             except Exception as e:
@@ -65,6 +116,55 @@ class DataManager:
         
         return self._main_data
     
+    @timed('loader.fundamentals')
+    def _read_parquet(self, path: Path) -> pd.DataFrame:
+        """
+        Read the main parquet file, compacted if enabled
+        
+        Args:
+            path: Parquet file path
+            
+        Returns:
+            Loaded DataFrame
+        """
+        if not self.compact_main_data:
+            return pd.read_parquet(path)
+        
+        df, self.memory_report = read_compact_parquet(path, float32_values=self.float32_values)
+        logger.info(
+            "Main data loaded in compact mode: %.1f MB -> %.1f MB (%.0f%% reduction)",
+            self.memory_report['baseline_mb'],
+            self.memory_report['compact_mb'],
+            self.memory_report['reduction_pct']
+        )
+        return df
+    
+    def _set_main_data(self, df: pd.DataFrame) -> None:
+        """
+        Install a main data frame and build its lookup indexes
+        
+        Args:
+            df: Main data frame
+        """
+        self._main_data = df
+        self._index = FundamentalsIndex(df)
+    
+    @property
+    def index(self) -> FundamentalsIndex:
+        """Ticker/metric/industry indexes over the main data (loads data if needed)"""
+        self.get_main_data()
+        return self._index
+    
+    def get_memory_report(self) -> Dict[str, Any]:
+        """
+        Get the memory reduction report of the compact load
+        
+        Returns:
+            Dictionary with baseline_mb, compact_mb and reduction_pct
+            (empty when compact mode is disabled or data is not loaded)
+        """
+        return dict(self.memory_report)
+    
     def get_metadata(self) -> pd.DataFrame:
         """
         Get metadata from Excel file
@@ -72,24 +172,57 @@ class DataManager:
         Returns:
             DataFrame with metadata
         """
+        if self._shared is not None:
+            attached = self._shared.get(METADATA_DATASET)
+            if attached is not None:
+                return attached[0]
+        
         if self._metadata is None:
             try:
-                if self.metadata_path and Path(self.metadata_path).exists():
-                    self._metadata = pd.read_excel(self.metadata_path)
+                metadata_file = self._metadata_file()
+                if metadata_file is not None:
+                    # Parquet sidecar, re-parsed only when the workbook changes
+                    self._metadata = self._excel_cache.read(metadata_file)
                 else:
-                    # Try relative path
-                    relative_path = Path("Database/Full_database/CSDL.xlsx")
-                    if relative_path.exists():
-                        self._metadata = pd.read_excel(relative_path)
-                    else:
-                        # Return empty metadata if not found
-                        self._metadata = pd.DataFrame()
+                    # Return empty metadata if not found
+                    self._metadata = pd.DataFrame()
             except Exception as e:
                 print(f"Warning: Could not load metadata: {str(e)}")
                 self._metadata = pd.DataFrame()
         
         return self._metadata
     
+    def _metadata_file(self) -> Optional[Path]:
+        """Metadata workbook path (configured, then the default relative path)"""
+        if self.metadata_path and Path(self.metadata_path).exists():
+            return Path(self.metadata_path)
+        relative_path = Path("Database/Full_database/CSDL.xlsx")
+        return relative_path if relative_path.exists() else None
+    
+    def get_metadata_index(self) -> Dict[str, int]:
+        """
+        Get the metric code -> metadata row position index
+        
+        Returns:
+            Dictionary of metric code -> row position in get_metadata()
+        """
+        metadata = self.get_metadata()
+        if self._metadata_index is not None and self._metadata_index[0] is metadata:
+            return self._metadata_index[1]
+        
+        key_column = next((c for c in METADATA_KEY_COLUMNS if c in metadata.columns), None)
+        if key_column is None:
+            index = {}
+        elif metadata is self._metadata and self._metadata_file() is not None:
+            index = self._excel_cache.index(self._metadata_file(), key_column)
+        else:
+            # Shared (published) metadata: index the attached frame
+            index = build_index(metadata, key_column)
+        
+        self._metadata_index = (metadata, index)
+        return index
+    
+    @timed('loader.ticker_data')
     def get_ticker_data(self, ticker: str, 
                        start_date: Optional[datetime] = None,
                        end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -106,16 +239,13 @@ class DataManager:
         """
         df = self.get_main_data()
         
-        # Filter by ticker
-        if 'ticker' in df.columns:
-            ticker_data = df[df['ticker'] == ticker.upper()].copy()
-        elif 'symbol' in df.columns:
-            ticker_data = df[df['symbol'] == ticker.upper()].copy()
-        elif 'SECURITY_CODE' in df.columns:
-            ticker_data = df[df['SECURITY_CODE'] == ticker.upper()].copy()
-        else:
+        # Filter by ticker via the index (no full-column scan)
+        if self._index.ticker_column is None:
             raise DataLoadError("No ticker/symbol/SECURITY_CODE column found in data")
         
+        rows = self._index.ticker_rows(ticker.upper())
+        ticker_data = df.iloc[rows if rows is not None else slice(0, 0)].copy()
+        
         # Filter by date if provided
         if 'date' in ticker_data.columns:
             ticker_data['date'] = pd.to_datetime(ticker_data['date'])
@@ -143,14 +273,7 @@ class DataManager:
         Returns:
             List of ticker symbols
         """
-        df = self.get_main_data()
-        
-        if 'ticker' in df.columns:
-            return sorted(df['ticker'].unique().tolist())
-        elif 'symbol' in df.columns:
-            return sorted(df['symbol'].unique().tolist())
-        else:
-            return []
+        return self.index.tickers
     
     def get_metric_value(self, ticker: str, metric_code: str, 
                         period: Optional[str] = None) -> Optional[float]:
@@ -160,11 +283,14 @@ class DataManager:
         Args:
             ticker: Stock ticker
             metric_code: Metric code (e.g., 'CIS_20' for revenue)
-            period: Optional period filter
+            period: Optional period filter ('2023' for annual, '2023Q4' for quarterly)
             
         Returns:
             Metric value or None if not found
         """
+        if self.index.is_long_format:
+            return self._get_long_metric_value(ticker.upper(), metric_code, period)
+        
         ticker_data = self.get_ticker_data(ticker)
         
         if metric_code in ticker_data.columns:
@@ -177,6 +303,57 @@ class DataManager:
         
         return None
     
+    def _get_long_metric_value(self, ticker: str, metric_code: str,
+                               period: Optional[str]) -> Optional[float]:
+        """
+        Get a metric value from long-format data via the (ticker, metric) index
+        
+        Args:
+            ticker: Upper-case ticker
+            metric_code: Metric code
+            period: Optional period filter
+            
+        Returns:
+            Latest matching value or None
+        """
+        rows = self._index.metric_rows(ticker, metric_code)
+        if rows is None:
+            return None
+        
+        metric_data = self._main_data.iloc[rows]
+        has_freq = 'FREQ_CODE' in metric_data.columns
+        
+        if period:
+            match = re.fullmatch(r'(\d{4})(?:\s*Q([1-4]))?', str(period).strip().upper())
+            if not match or 'YEAR' not in metric_data.columns:
+                return None
+            mask = metric_data['YEAR'] == int(match.group(1))
+            if match.group(2):
+                mask &= metric_data['QUARTER'] == int(match.group(2))
+                if has_freq:
+                    mask &= metric_data['FREQ_CODE'] == 'Q'
+            elif has_freq:
+                mask &= metric_data['FREQ_CODE'] == 'Y'
+            metric_data = metric_data[mask]
+        elif has_freq:
+            default_freq = getattr(self.config.data, 'default_frequency', 'Y')
+            preferred = metric_data[metric_data['FREQ_CODE'] == default_freq]
+            if not preferred.empty:
+                metric_data = preferred
+        
+        if metric_data.empty:
+            return None
+        # Rows are only period-ordered when compact_main_data sorted the frame
+        period_columns = [col for col in ('YEAR', 'QUARTER') if col in metric_data.columns]
+        if period_columns:
+            metric_data = metric_data.sort_values(period_columns, kind='stable')
+        return float(metric_data['METRIC_VALUE'].iloc[-1])
+    
+    @property
+    def memory_cache(self) -> MemoryCache:
+        """In-memory cache shared by loaders using this data manager"""
+        return self._cache
+    
     def cache_data(self, key: str, data: Any) -> None:
         """
         Cache data with TTL
@@ -185,14 +362,11 @@ class DataManager:
             key: Cache key
             data: Data to cache
         """
-        self._cache[key] = data
-        self._cache_timestamps[key] = datetime.now()
+        self._cache.set(key, data)
         
-        # Also save to disk cache
-        cache_file = self.cache_dir / f"{key}.pkl"
+        # Queued for the disk cache; unchanged payloads are not rewritten
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            self._disk_cache.set(key, data)
         except Exception as e:
             print(f"Warning: Could not save cache to disk: {e}")
     
@@ -206,51 +380,59 @@ class DataManager:
         Returns:
             Cached data or None if expired/not found
         """
-        # Check memory cache first
-        if key in self._cache:
-            timestamp = self._cache_timestamps.get(key)
-            if timestamp and (datetime.now() - timestamp).seconds < self.cache_ttl:
-                return self._cache[key]
+        # Check memory cache first (TTL handled by the cache)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
         
         # Try disk cache
-        cache_file = self.cache_dir / f"{key}.pkl"
-        if cache_file.exists():
-            try:
-                # Check file modification time
-                file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if file_age.seconds < self.cache_ttl:
-                    with open(cache_file, 'rb') as f:
-                        data = pickle.load(f)
-                        # Update memory cache
-                        self._cache[key] = data
-                        self._cache_timestamps[key] = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                        return data
-            except Exception as e:
-                print(f"Warning: Could not load cache from disk: {e}")
+        try:
+            entry = self._disk_cache.get_with_expiry(key)
+        except Exception as e:
+            print(f"Warning: Could not load cache from disk: {e}")
+            return None
         
-        return None
+        if entry is None:
+            return None
+        
+        data, expires_at = entry
+        # Update memory cache with the remaining TTL
+        remaining = expires_at - time.time() if expires_at is not None else None
+        self._cache.set(key, data, ttl=remaining)
+        return readonly_view(data)
+    
+    def flush_cache(self) -> None:
+        """Write pending disk cache entries"""
+        self._disk_cache.flush()
     
     def clear_cache(self, key: Optional[str] = None) -> None:
         """
         Clear cache
         
+        Only entries owned by this data manager's cache file are removed;
+        other files in the cache directory are left untouched.
+        
         Args:
             key: Optional specific key to clear, otherwise clear all
         """
         if key:
-            self._cache.pop(key, None)
-            self._cache_timestamps.pop(key, None)
-            
-            cache_file = self.cache_dir / f"{key}.pkl"
-            if cache_file.exists():
-                cache_file.unlink()
+            self._cache.delete(key)
+            self._disk_cache.delete(key)
         else:
             self._cache.clear()
-            self._cache_timestamps.clear()
-            
-            # Clear disk cache
-            for cache_file in self.cache_dir.glob("*.pkl"):
-                cache_file.unlink()
+            self._disk_cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with in-memory entries, size and hit/miss/eviction
+            counters, plus disk cache statistics under 'disk'
+        """
+        stats = self._cache.get_stats()
+        stats['disk'] = self._disk_cache.get_stats()
+        return stats
     
     def get_industry_data(self, industry: str) -> pd.DataFrame:
         """
@@ -264,9 +446,7 @@ class DataManager:
         """
         df = self.get_main_data()
         
-        if 'industry' in df.columns:
-            return df[df['industry'] == industry].copy()
-        elif 'sector' in df.columns:
-            return df[df['sector'] == industry].copy()
-        else:
-            return pd.DataFrame()
\ No newline at end of file
+        if self._index.industry_column is None:
+            return pd.DataFrame()
+        
+        return df.iloc[self._index.industry_rows(industry)].copy()
\ No newline at end of file
@@ -0,0 +1,374 @@
+"""
+Disk Cache - Single-file SQLite store for cached objects
+DataFrames are stored as Parquet bytes, other objects are pickled
+"""
+
+import atexit
+import hashlib
+import io
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+import logging
+
+from .exceptions import CacheError
+from .instrumentation import record_cache, timed
+
+logger = logging.getLogger(__name__)
+
+FORMAT_PARQUET = 'parquet'
+FORMAT_PICKLE = 'pickle'
+
+
+def serialize(value: Any) -> Tuple[str, bytes]:
+    """
+    Serialize a value for storage
+
+    Args:
+        value: Object to serialize
+
+    Returns:
+        Tuple of (format, payload bytes)
+    """
+    if isinstance(value, pd.DataFrame):
+        try:
+            buffer = io.BytesIO()
+            value.to_parquet(buffer, index=True)
+            return FORMAT_PARQUET, buffer.getvalue()
+        except Exception:
+            # Non-string column names or mixed object columns - fall back to pickle
+            pass
+    return FORMAT_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize(fmt: str, payload: bytes) -> Any:
+    """
+    Deserialize a stored payload
+
+    Args:
+        fmt: Storage format
+        payload: Serialized bytes
+
+    Returns:
+        Original object
+    """
+    if fmt == FORMAT_PARQUET:
+        return pd.read_parquet(io.BytesIO(payload))
+    return pickle.loads(payload)
+
+
+_shared_caches: Dict[Path, 'DiskCache'] = {}
+_shared_lock = threading.Lock()
+
+
+def get_disk_cache(db_path: Path, **kwargs) -> 'DiskCache':
+    """
+    Get the shared disk cache of a file, opening it on first use
+
+    Instances on the same file would each hold a connection and flush
+    their own stale buffers over each other's writes, so every caller
+    in the process shares one.
+
+    Args:
+        db_path: Path to the SQLite file
+        **kwargs: DiskCache options (used when the cache is opened)
+
+    Returns:
+        Open DiskCache for db_path
+    """
+    key = Path(db_path).resolve()
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None or cache._closed:
+            cache = DiskCache(key, **kwargs)
+            _shared_caches[key] = cache
+        return cache
+
+
+class DiskCache:
+    """SQLite-backed cache with TTL, write-behind and size-bounded eviction"""
+
+    def __init__(self, db_path: Path,
+                 ttl: Optional[float] = 3600,
+                 max_bytes: int = 1024 * 1024 * 1024,
+                 flush_threshold: int = 32,
+                 flush_interval: float = 5.0):
+        """
+        Initialize disk cache
+
+        Args:
+            db_path: Path to the SQLite file
+            ttl: Default time-to-live in seconds (None = never expire)
+            max_bytes: Maximum total payload size before eviction
+            flush_threshold: Number of pending writes that triggers a flush
+            flush_interval: Age in seconds after which the next set() flushes
+                (there is no timer - idle pending writes wait for flush/close)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = int(max_bytes)
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._touched: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._closed = False
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._init_database()
+        # Unregistered again in close() so closed caches are not kept alive
+        atexit.register(self.close)
+
+    def _init_database(self):
+        """Initialize cache table"""
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                format TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                digest TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_cache_last_access
+            ON cache_entries(last_access)
+        ''')
+        self.conn.commit()
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Queue a value for writing (written on the next flush)
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._pending[key] = (value, expires_at)
+            should_flush = (
+                len(self._pending) >= self.flush_threshold or
+                time.monotonic() - self._last_flush >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value if present and not expired
+
+        Args:
+            key: Cache key
+            default: Value returned on miss
+
+        Returns:
+            Cached value or default
+        """
+        entry = self.get_with_expiry(key)
+        return entry[0] if entry is not None else default
+
+    @timed('cache.disk.read')
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Get a cached value together with its expiry timestamp
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, expires_at epoch seconds) or None if missing/expired
+        """
+        entry = self._lookup(key)
+        record_cache('disk', entry is not None)
+        return entry
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        Read a pending or stored entry, dropping it if expired
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, expires_at epoch seconds) or None if missing/expired
+        """
+        now = time.time()
+
+        with self._lock:
+            if key in self._pending:
+                value, expires_at = self._pending[key]
+                if expires_at is None or expires_at > now:
+                    return value, expires_at
+                return None
+
+            row = self.conn.execute(
+                'SELECT format, payload, expires_at FROM cache_entries WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            fmt, payload, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self.conn.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+                self.conn.commit()
+                return None
+
+            self._touched[key] = now
+
+        try:
+            return deserialize(fmt, payload), expires_at
+        except Exception as e:
+            logger.warning(f"Could not deserialize cache entry '{key}': {e}")
+            return None
+
+    @timed('cache.disk.write')
+    def flush(self) -> None:
+        """Write pending entries, skipping payloads that did not change"""
+        with self._lock:
+            if self._closed:
+                return
+
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+            self._last_flush = time.monotonic()
+
+            if not pending and not touched:
+                return
+
+            now = time.time()
+            try:
+                for key, (value, expires_at) in pending.items():
+                    fmt, payload = serialize(value)
+                    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+                    row = self.conn.execute(
+                        'SELECT digest FROM cache_entries WHERE key = ?', (key,)
+                    ).fetchone()
+
+                    if row is not None and row[0] == digest:
+                        # Unchanged payload - only refresh expiry
+                        self.conn.execute(
+                            'UPDATE cache_entries SET expires_at = ?, last_access = ? WHERE key = ?',
+                            (expires_at, now, key)
+                        )
+                        continue
+
+                    self.conn.execute('''
+                        INSERT OR REPLACE INTO cache_entries
+                        (key, format, payload, digest, size_bytes, created_at, expires_at, last_access)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (key, fmt, payload, digest, len(payload), now, expires_at, now))
+
+                self.conn.executemany(
+                    'UPDATE cache_entries SET last_access = ? WHERE key = ?',
+                    [(ts, key) for key, ts in touched.items() if key not in pending]
+                )
+
+                self._evict_to_budget()
+                self.conn.commit()
+
+            except Exception as e:
+                self.conn.rollback()
+                raise CacheError(str(e), operation='flush')
+
+    def _evict_to_budget(self) -> None:
+        """Delete expired entries, then least recently used ones over budget (lock held)"""
+        self.conn.execute(
+            'DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?',
+            (time.time(),)
+        )
+
+        total = self.conn.execute(
+            'SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries'
+        ).fetchone()[0]
+
+        if total <= self.max_bytes:
+            return
+
+        rows = self.conn.execute(
+            'SELECT key, size_bytes FROM cache_entries ORDER BY last_access'
+        ).fetchall()
+
+        evict = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evict.append((key,))
+            total -= size
+
+        self.conn.executemany('DELETE FROM cache_entries WHERE key = ?', evict)
+        logger.debug(f"Evicted {len(evict)} disk cache entries")
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a single entry
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._pending.pop(key, None)
+            self._touched.pop(key, None)
+            self.conn.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+            self.conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from this cache file only"""
+        with self._lock:
+            self._pending.clear()
+            self._touched.clear()
+            self.conn.execute('DELETE FROM cache_entries')
+            self.conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics"""
+        with self._lock:
+            count, total = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries'
+            ).fetchone()
+            return {
+                'entries': count,
+                'pending_writes': len(self._pending),
+                'size_mb': total / (1024 * 1024),
+                'max_size_mb': self.max_bytes / (1024 * 1024),
+                'db_path': str(self.db_path)
+            }
+
+    def close(self) -> None:
+        """Flush pending writes and close the database"""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(f"Could not flush disk cache: {e}")
+        with self._lock:
+            self._closed = True
+            self.conn.close()
+        atexit.unregister(self.close)
+
+    def __del__(self):
+        """Cleanup on deletion"""
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,220 @@
+"""
+Excel Cache - Compile Excel sheets into Parquet sidecars
+
+A sheet is parsed with pd.read_excel once and stored as Parquet, next to a
+JSON manifest holding the workbook signature (mtime, size, SHA-256) and
+key-column indexes (code -> row position). Later reads load the Parquet
+file; the workbook is parsed again only when its content hash changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import pandas as pd
+import logging
+
+from .instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("Database/cache/excel")
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """
+    Hash a file's contents
+
+    Args:
+        path: File path
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert mixed-type object columns (common in Excel sheets) to strings"""
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].astype(str).where(df[column].notna())
+    df.columns = [str(c) for c in df.columns]
+    return df
+
+
+def build_index(df: pd.DataFrame, key_column: str) -> Dict[str, int]:
+    """
+    Map each key to the position of its first row
+
+    Args:
+        df: Frame to index
+        key_column: Column holding the keys
+
+    Returns:
+        Dictionary of str(key) -> row position (missing keys skipped)
+    """
+    index: Dict[str, int] = {}
+    for position, key in enumerate(df[key_column].tolist()):
+        if pd.notna(key):
+            index.setdefault(str(key), position)
+    return index
+
+
+class ExcelCache:
+    """Parquet sidecars and key indexes for Excel sheets"""
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        """
+        Initialize Excel cache
+
+        Args:
+            cache_dir: Directory for the sidecar and manifest files
+        """
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+
+    def _paths(self, path: Path, sheet_name: Union[str, int]) -> Tuple[Path, Path]:
+        """Sidecar and manifest paths of one sheet"""
+        source_id = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:8]
+        stem = f"{path.stem}-{source_id}.{sheet_name}"
+        return self.cache_dir / f"{stem}.parquet", self.cache_dir / f"{stem}.json"
+
+    @staticmethod
+    def _read_manifest(manifest_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a manifest (None if missing or unreadable)"""
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get('version') == MANIFEST_VERSION else None
+
+    @staticmethod
+    def _write_manifest(manifest_path: Path, manifest: Dict[str, Any]):
+        """Write a manifest atomically"""
+        tmp_path = manifest_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, manifest_path)
+
+    def _fresh_manifest(self, path: Path, sheet_name: Union[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        Get the manifest if the sidecar matches the workbook
+
+        An mtime/size match is trusted; otherwise the content hash decides
+        (a touched but unchanged workbook only refreshes the signature).
+        """
+        parquet_path, manifest_path = self._paths(path, sheet_name)
+        manifest = self._read_manifest(manifest_path)
+        if manifest is None or not parquet_path.exists():
+            return None
+
+        stat = path.stat()
+        if manifest['mtime_ns'] == stat.st_mtime_ns and manifest['size'] == stat.st_size:
+            return manifest
+        if manifest['sha256'] != file_sha256(path):
+            return None
+
+        manifest.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._write_manifest(manifest_path, manifest)
+        return manifest
+
+    def compile(self, path: Union[str, Path], sheet_name: Union[str, int] = 0) -> pd.DataFrame:
+        """
+        Parse a sheet and (re)write its sidecar
+
+        Args:
+            path: Workbook path
+            sheet_name: Sheet name or position
+
+        Returns:
+            Parsed sheet
+        """
+        path = Path(path)
+        stat = path.stat()
+        df = arrow_safe(pd.read_excel(path, sheet_name=sheet_name))
+
+        parquet_path, manifest_path = self._paths(path, sheet_name)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = parquet_path.with_suffix('.parquet.tmp')
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+        self._write_manifest(manifest_path, {
+            'version': MANIFEST_VERSION,
+            'source': str(path),
+            'sheet_name': sheet_name,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': file_sha256(path),
+            'indexes': {},
+        })
+        logger.info(f"Compiled {path.name} [{sheet_name}] to {parquet_path.name} ({len(df)} rows)")
+        return df
+
+    @timed('loader.excel')
+    def read(self, path: Union[str, Path], sheet_name: Union[str, int] = 0) -> pd.DataFrame:
+        """
+        Read a sheet from its sidecar, compiling it when stale
+
+        Args:
+            path: Workbook path
+            sheet_name: Sheet name or position
+
+        Returns:
+            Sheet as a DataFrame
+        """
+        path = Path(path)
+        with self._lock:
+            if self._fresh_manifest(path, sheet_name) is not None:
+                return pd.read_parquet(self._paths(path, sheet_name)[0])
+            return self.compile(path, sheet_name)
+
+    def index(self, path: Union[str, Path], key_column: str,
+              sheet_name: Union[str, int] = 0) -> Dict[str, int]:
+        """
+        Get the key -> row position index of a sheet
+
+        Indexes are stored in the manifest and rebuilt with the sidecar.
+
+        Args:
+            path: Workbook path
+            key_column: Column holding the keys
+            sheet_name: Sheet name or position
+
+        Returns:
+            Dictionary of str(key) -> row position in read()'s result
+        """
+        path = Path(path)
+        df = self.read(path, sheet_name)
+        _, manifest_path = self._paths(path, sheet_name)
+        with self._lock:
+            manifest = self._read_manifest(manifest_path)
+            if manifest is not None and key_column in manifest['indexes']:
+                return manifest['indexes'][key_column]
+
+            index = build_index(df, key_column) if key_column in df.columns else {}
+            if manifest is not None:
+                manifest['indexes'][key_column] = index
+                self._write_manifest(manifest_path, manifest)
+            return index
+
+    def invalidate(self, path: Union[str, Path], sheet_name: Union[str, int] = 0):
+        """
+        Remove a sheet's sidecar and manifest
+
+        Args:
+            path: Workbook path
+            sheet_name: Sheet name or position
+        """
+        for cached in self._paths(Path(path), sheet_name):
+            cached.unlink(missing_ok=True)
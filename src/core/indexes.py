@@ -0,0 +1,138 @@
+"""
+Indexes - Secondary lookup indexes over the main fundamentals frame
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .compact_frame import find_ticker_column
+
+# Industry columns in order of preference
+INDUSTRY_COLUMNS = ('ICB_L2', 'industry', 'sector')
+METRIC_COLUMN = 'METRIC_CODE'
+
+Rows = Union[slice, np.ndarray]
+
+
+def _group_positions(df: pd.DataFrame, columns: List[str]) -> Dict:
+    """Map group keys to integer row positions"""
+    grouped = df.groupby(columns, observed=True, sort=False)
+    return {
+        (tuple(str(k) for k in key) if isinstance(key, tuple) else str(key)): positions
+        for key, positions in grouped.indices.items()
+    }
+
+
+def _as_rows(positions: np.ndarray) -> Rows:
+    """Collapse contiguous positions into a slice"""
+    if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
+class FundamentalsIndex:
+    """Ticker, (ticker, metric) and industry indexes built once per load"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build indexes for a frame
+
+        Args:
+            df: Main data frame (long or wide format)
+        """
+        self.ticker_column = find_ticker_column(df)
+        self.industry_column = next((c for c in INDUSTRY_COLUMNS if c in df.columns), None)
+        self.is_long_format = METRIC_COLUMN in df.columns
+
+        self._ticker_rows: Dict[str, Rows] = {}
+        self._metric_rows: Dict[Tuple[str, str], Rows] = {}
+        self._industry_tickers: Dict[str, List[str]] = {}
+
+        if self.ticker_column is None:
+            return
+
+        self._ticker_rows = {
+            ticker: _as_rows(positions)
+            for ticker, positions in _group_positions(df, [self.ticker_column]).items()
+        }
+
+        if self.is_long_format:
+            self._metric_rows = {
+                key: _as_rows(positions)
+                for key, positions in _group_positions(df, [self.ticker_column, METRIC_COLUMN]).items()
+            }
+
+        if self.industry_column is not None:
+            pairs = df[[self.industry_column, self.ticker_column]].drop_duplicates()
+            for industry, ticker in pairs.itertuples(index=False):
+                if pd.notna(industry):
+                    self._industry_tickers.setdefault(str(industry), []).append(str(ticker))
+            for tickers in self._industry_tickers.values():
+                tickers.sort()
+
+    @property
+    def tickers(self) -> List[str]:
+        """Sorted list of indexed tickers"""
+        return sorted(self._ticker_rows)
+
+    @property
+    def industries(self) -> List[str]:
+        """Sorted list of indexed industries"""
+        return sorted(self._industry_tickers)
+
+    def ticker_rows(self, ticker: str) -> Optional[Rows]:
+        """
+        Get the row positions of a ticker
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            Slice or position array, None if absent
+        """
+        return self._ticker_rows.get(ticker)
+
+    def metric_rows(self, ticker: str, metric_code: str) -> Optional[Rows]:
+        """
+        Get the row positions of one metric for a ticker
+
+        Args:
+            ticker: Ticker symbol
+            metric_code: Metric code (e.g., 'CIS_10')
+
+        Returns:
+            Slice or position array, None if absent
+        """
+        return self._metric_rows.get((ticker, metric_code))
+
+    def industry_tickers(self, industry: str) -> List[str]:
+        """
+        Get tickers belonging to an industry
+
+        Args:
+            industry: Industry name
+
+        Returns:
+            Sorted list of tickers
+        """
+        return list(self._industry_tickers.get(industry, []))
+
+    def industry_rows(self, industry: str) -> np.ndarray:
+        """
+        Get the row positions of all tickers in an industry
+
+        Args:
+            industry: Industry name
+
+        Returns:
+            Sorted position array
+        """
+        parts = []
+        for ticker in self._industry_tickers.get(industry, []):
+            rows = self._ticker_rows[ticker]
+            parts.append(np.arange(rows.start, rows.stop) if isinstance(rows, slice) else rows)
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(parts))
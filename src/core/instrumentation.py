@@ -0,0 +1,337 @@
+"""
+Instrumentation - Lightweight spans and counters for hot paths
+
+Spans record wall time per stage into log-bucketed histograms; counters
+track events such as cache hits and API calls. Events go to the active
+Recorder (one per Streamlit session) and to the process-wide recorder.
+When instrumentation is disabled, spans and counters reduce to a flag check.
+
+Usage:
+    from src.core.instrumentation import span, timed, count
+
+    @timed('indicators.all')
+    def calculate_all_indicators(...): ...
+
+    with span('cache.ohlcv.read'):
+        ...
+    count('api.tcbs')
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, MutableMapping, Optional
+
+# Set to 1 to enable instrumentation at startup
+ENABLE_ENV = "STOCK_DASHBOARD_PERF"
+SESSION_KEY = "_perf_recorder"
+
+# Histogram bucket upper bounds in ms: 4 per doubling from 10 µs to ~3 hours
+BUCKET_BOUNDS_MS = tuple(0.01 * 2 ** (i / 4) for i in range(4 * 30 + 1))
+# Window for per-minute rates and the number of event times kept per counter
+RATE_WINDOW_S = 60.0
+MAX_RATE_EVENTS = 10_000
+
+_enabled = os.environ.get(ENABLE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def enable(on: bool = True) -> None:
+    """Turn instrumentation on or off for the whole process"""
+    global _enabled
+    _enabled = bool(on)
+
+
+def is_enabled() -> bool:
+    """Check whether spans and counters are being recorded"""
+    return _enabled
+
+
+class Histogram:
+    """Latency histogram with logarithmic buckets"""
+    __slots__ = ('counts', 'count', 'total_ms', 'min_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float('inf')
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        """Record one duration in milliseconds"""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile by interpolating inside its bucket
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Duration in milliseconds (0 if empty)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKET_BOUNDS_MS[i - 1] if i > 0 else 0.0
+                upper = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                value = lower + (upper - lower) * max(rank - seen, 0) / n
+                return min(max(value, self.min_ms), self.max_ms)
+            seen += n
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Count, total, mean and p50/p95/max in milliseconds"""
+        return {
+            'count': self.count,
+            'total_ms': self.total_ms,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'max_ms': self.max_ms
+        }
+
+
+class EventCounter:
+    """Event total plus recent event times for per-minute rates"""
+    __slots__ = ('total', 'times')
+
+    def __init__(self):
+        self.total = 0
+        self.times = deque(maxlen=MAX_RATE_EVENTS)
+
+    def add(self, n: int, now: float) -> None:
+        """Record n events"""
+        self.total += n
+        self.times.extend([now] * min(n, MAX_RATE_EVENTS))
+
+    def per_minute(self, now: float) -> int:
+        """Events in the last minute"""
+        cutoff = now - RATE_WINDOW_S
+        return len(self.times) - bisect.bisect_right(self.times, cutoff)
+
+
+class Recorder:
+    """Thread-safe store of span histograms and counters"""
+
+    def __init__(self, name: str = "session"):
+        """
+        Initialize recorder
+
+        Args:
+            name: Recorder name shown in the performance panel
+        """
+        self.name = name
+        self.started_at = time.time()
+        self._spans: Dict[str, Histogram] = {}
+        self._counters: Dict[str, EventCounter] = {}
+        self._lock = threading.Lock()
+
+    def record_span(self, stage: str, ms: float) -> None:
+        """Record a stage duration in milliseconds"""
+        with self._lock:
+            histogram = self._spans.get(stage)
+            if histogram is None:
+                histogram = self._spans[stage] = Histogram()
+            histogram.add(ms)
+
+    def increment(self, name: str, n: int = 1) -> None:
+        """Increment a counter"""
+        now = time.monotonic()
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = EventCounter()
+            counter.add(n, now)
+
+    def stage_stats(self) -> List[Dict[str, Any]]:
+        """Latency summary per stage, slowest total first"""
+        with self._lock:
+            rows = [{'stage': stage, **histogram.summary()} for stage, histogram in self._spans.items()]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def counter_stats(self, prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        Totals and last-minute rates of counters
+
+        Args:
+            prefix: Only counters starting with this prefix
+
+        Returns:
+            One row per counter
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [{'counter': name, 'total': counter.total, 'per_minute': counter.per_minute(now)}
+                    for name, counter in sorted(self._counters.items()) if name.startswith(prefix)]
+
+    def cache_stats(self) -> List[Dict[str, Any]]:
+        """Hits, misses and hit rate per cache (from cache.<name>.hit/miss counters)"""
+        caches: Dict[str, Dict[str, int]] = {}
+        for row in self.counter_stats('cache.'):
+            cache, _, outcome = row['counter'][len('cache.'):].rpartition('.')
+            if outcome in ('hit', 'miss'):
+                caches.setdefault(cache, {'hit': 0, 'miss': 0})[outcome] = row['total']
+
+        rows = []
+        for cache, counts in sorted(caches.items()):
+            lookups = counts['hit'] + counts['miss']
+            rows.append({'cache': cache, 'hits': counts['hit'], 'misses': counts['miss'],
+                         'hit_rate': counts['hit'] / lookups if lookups else 0.0})
+        return rows
+
+    def reset(self) -> None:
+        """Drop all recorded spans and counters"""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+
+_process_recorder = Recorder("process")
+_current: ContextVar[Optional[Recorder]] = ContextVar('perf_recorder', default=None)
+
+
+def process_recorder() -> Recorder:
+    """Recorder aggregating events from every session and thread"""
+    return _process_recorder
+
+
+def get_recorder() -> Recorder:
+    """Recorder of the current session (the process recorder if none is active)"""
+    return _current.get() or _process_recorder
+
+
+def set_recorder(recorder: Optional[Recorder]) -> None:
+    """Make a recorder active for the current thread/context"""
+    _current.set(recorder)
+
+
+def use_session_recorder(session_state: MutableMapping) -> Recorder:
+    """
+    Activate the recorder stored in a Streamlit session (created on first use)
+
+    Worker threads started by the page do not inherit it; their events are
+    only recorded in the process recorder.
+
+    Args:
+        session_state: st.session_state
+
+    Returns:
+        Session recorder
+    """
+    recorder = session_state.get(SESSION_KEY)
+    if recorder is None:
+        recorder = session_state[SESSION_KEY] = Recorder("session")
+    set_recorder(recorder)
+    return recorder
+
+
+def _record_span(stage: str, ms: float) -> None:
+    """Record a duration in the session and process recorders"""
+    recorder = _current.get()
+    if recorder is not None and recorder is not _process_recorder:
+        recorder.record_span(stage, ms)
+    _process_recorder.record_span(stage, ms)
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Increment a counter (API calls, cache hits, ...)
+
+    Args:
+        name: Counter name, e.g. 'api.tcbs' or 'cache.figures.hit'
+        n: Number of events
+    """
+    if not _enabled:
+        return
+    recorder = _current.get()
+    if recorder is not None and recorder is not _process_recorder:
+        recorder.increment(name, n)
+    _process_recorder.increment(name, n)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup as cache.<cache>.hit or cache.<cache>.miss"""
+    if _enabled:
+        count(f"cache.{cache}.{'hit' if hit else 'miss'}")
+
+
+class _Span:
+    """Context manager timing one stage"""
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _record_span(self.stage, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NullSpan:
+    """Shared no-op span used while disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(stage: str):
+    """
+    Time a block of code
+
+    Args:
+        stage: Stage name, e.g. 'cache.ohlcv.read'
+
+    Returns:
+        Context manager
+    """
+    return _Span(stage) if _enabled else _NULL_SPAN
+
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator timing every call of a function as a stage
+
+    Args:
+        stage: Stage name, e.g. 'indicators.all'
+
+    Returns:
+        Decorator
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record_span(stage, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorate
@@ -0,0 +1,220 @@
+"""
+Logging Policy - Per-subsystem levels and per-batch summaries
+
+Levels come from the `logging` section of config.yaml. Per-symbol code
+paths log at DEBUG with lazy %-style arguments; loops over many symbols
+report one summary line per batch through BatchLog.
+
+Usage:
+    configure_logging()  # once, in an entry point
+
+    with BatchLog(logger, "OHLCV update") as batch:
+        for symbol in symbols:
+            batch.add(symbol, update(symbol))
+"""
+
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+import yaml
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Marks handlers installed by configure_logging so reconfiguring replaces only them
+_HANDLER_FLAG = '_log_policy'
+_configured = False
+_subsystem_loggers: List[str] = []
+_configure_lock = threading.Lock()
+
+
+@dataclass
+class LoggingConfig:
+    """Logging configuration"""
+    level: str = "INFO"
+    format: str = DEFAULT_FORMAT
+    file: Optional[str] = None
+    max_bytes: int = 10 * 1024 * 1024
+    backup_count: int = 5
+    # Logger name prefix -> level
+    subsystems: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, section: Optional[Dict[str, Any]]) -> 'LoggingConfig':
+        """
+        Create from the `logging` section of config.yaml
+
+        Args:
+            section: Parsed section (missing keys use defaults)
+
+        Returns:
+            LoggingConfig
+        """
+        section = section or {}
+        return cls(
+            level=str(section.get('level', 'INFO')).upper(),
+            format=section.get('format', DEFAULT_FORMAT),
+            file=section.get('file') or None,
+            max_bytes=int(section.get('max_bytes', 10 * 1024 * 1024)),
+            backup_count=int(section.get('backup_count', 5)),
+            subsystems={name: str(level).upper() for name, level in (section.get('subsystems') or {}).items()}
+        )
+
+
+def load_logging_config(config_path: Union[str, Path] = "config.yaml") -> LoggingConfig:
+    """
+    Read the logging section without loading (and validating) the full config
+
+    Args:
+        config_path: Path to config.yaml
+
+    Returns:
+        LoggingConfig (defaults if the file is missing)
+    """
+    path = Path(config_path)
+    if not path.exists():
+        return LoggingConfig()
+    with open(path, 'r', encoding='utf-8') as f:
+        return LoggingConfig.from_dict((yaml.safe_load(f) or {}).get('logging'))
+
+
+def configure_logging(config: Optional[LoggingConfig] = None,
+                      config_path: Union[str, Path] = "config.yaml",
+                      stream: Optional[TextIO] = None,
+                      force: bool = False) -> LoggingConfig:
+    """
+    Install the root handlers and per-subsystem levels (once per process)
+
+    Handlers of other libraries (e.g. Streamlit's own logger) are left alone.
+
+    Args:
+        config: Logging configuration (read from config_path if omitted)
+        config_path: Path to config.yaml
+        stream: Console stream (default: stderr)
+        force: Reconfigure even if already configured
+
+    Returns:
+        Applied configuration
+    """
+    global _configured
+
+    with _configure_lock:
+        if config is None:
+            config = load_logging_config(config_path)
+        if _configured and not force:
+            return config
+
+        root = logging.getLogger()
+        for handler in [h for h in root.handlers if getattr(h, _HANDLER_FLAG, False)]:
+            root.removeHandler(handler)
+            handler.close()
+
+        formatter = logging.Formatter(config.format, datefmt='%Y-%m-%d %H:%M:%S')
+        handlers: List[logging.Handler] = [logging.StreamHandler(stream or sys.stderr)]
+        if config.file:
+            log_path = Path(config.file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=config.max_bytes, backupCount=config.backup_count, encoding='utf-8'
+            ))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            setattr(handler, _HANDLER_FLAG, True)
+            root.addHandler(handler)
+
+        root.setLevel(config.level)
+        for name in _subsystem_loggers:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        _subsystem_loggers[:] = config.subsystems
+        for name, level in config.subsystems.items():
+            logging.getLogger(name).setLevel(level)
+
+        _configured = True
+        return config
+
+
+def reset_logging() -> None:
+    """Remove the handlers and subsystem levels installed by configure_logging"""
+    global _configured
+
+    with _configure_lock:
+        root = logging.getLogger()
+        for handler in [h for h in root.handlers if getattr(h, _HANDLER_FLAG, False)]:
+            root.removeHandler(handler)
+            handler.close()
+        root.setLevel(logging.WARNING)
+        for name in _subsystem_loggers:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        _subsystem_loggers.clear()
+        _configured = False
+
+
+class BatchLog:
+    """Collect per-symbol outcomes of a loop and log one summary line"""
+
+    def __init__(self, logger: logging.Logger, label: str,
+                 level: int = logging.INFO, max_listed: int = 10):
+        """
+        Initialize batch log
+
+        Args:
+            logger: Logger of the calling module
+            label: Batch description used in the summary
+            level: Level of the summary line
+            max_listed: Failed symbols listed in the summary
+        """
+        self.logger = logger
+        self.label = label
+        self.level = level
+        self.max_listed = max_listed
+        self.succeeded = 0
+        self.failed: Dict[str, Optional[str]] = {}
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, symbol: str, ok: bool = True, detail: Optional[str] = None) -> None:
+        """
+        Record the outcome of one symbol (details are logged at DEBUG)
+
+        Args:
+            symbol: Symbol processed
+            ok: Whether it succeeded
+            detail: Optional reason for a failure
+        """
+        with self._lock:
+            if ok:
+                self.succeeded += 1
+            else:
+                self.failed[symbol] = detail
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s: %s %s%s", self.label, symbol, "ok" if ok else "failed",
+                              f" ({detail})" if detail else "")
+
+    @property
+    def total(self) -> int:
+        """Symbols recorded so far"""
+        return self.succeeded + len(self.failed)
+
+    def log_summary(self) -> None:
+        """Log the summary line and the failed symbols"""
+        self.elapsed = time.perf_counter() - self.start
+        self.logger.log(self.level, "%s: %d symbols in %.1fs (%d ok, %d failed)",
+                        self.label, self.total, self.elapsed, self.succeeded, len(self.failed))
+        if self.failed:
+            listed = list(self.failed)[:self.max_listed]
+            self.logger.warning("%s failed for: %s%s", self.label, ", ".join(listed),
+                                "..." if len(self.failed) > len(listed) else "")
+
+    def __enter__(self) -> 'BatchLog':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.log_summary()
+        return False
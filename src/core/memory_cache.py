@@ -0,0 +1,247 @@
+"""
+Memory Cache - Bounded LRU cache with byte-size accounting
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import record_cache
+
+
+def _copy_on_write_enabled() -> bool:
+    """Check whether pandas copy-on-write semantics are active"""
+    try:
+        if int(pd.__version__.split('.')[0]) >= 3:
+            return True
+        return pd.options.mode.copy_on_write is True
+    except Exception:
+        return False
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the in-memory size of a cached value in bytes
+
+    Args:
+        value: Object to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def readonly_view(value: Any) -> Any:
+    """
+    Return a view of a cached value that cannot modify the cached original
+
+    DataFrames/Series are returned as shallow copies when pandas copy-on-write
+    is active (writes to the view trigger a private copy), otherwise as deep
+    copies. NumPy arrays are returned as non-writeable views. Other objects
+    are returned as-is.
+
+    Args:
+        value: Cached value
+
+    Returns:
+        Safe view of the value
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not _copy_on_write_enabled())
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    return value
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss/eviction counters for a cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejected: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    """Single cache entry"""
+    __slots__ = ('value', 'size', 'expires_at')
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class MemoryCache:
+    """Thread-safe LRU cache bounded by total byte size with optional TTL"""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024,
+                 ttl: Optional[float] = None,
+                 name: str = "cache"):
+        """
+        Initialize memory cache
+
+        Args:
+            max_bytes: Total size budget in bytes
+            ttl: Default time-to-live in seconds (None = never expire)
+            name: Cache name used in statistics
+        """
+        self.max_bytes = int(max_bytes)
+        self.ttl = ttl
+        self.name = name
+        self.stats = CacheStats()
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a read-only view of a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on miss
+
+        Returns:
+            Cached value view or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                record_cache(self.name, False)
+                return default
+
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                record_cache(self.name, False)
+                return default
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            record_cache(self.name, True)
+            value = entry.value
+
+        return readonly_view(value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        Store a value, evicting least recently used entries to fit the budget
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+
+        Returns:
+            True if stored, False if the value alone exceeds the budget
+        """
+        size = estimate_size(value)
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                self.stats.rejected += 1
+                return False
+
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.stats.evictions += 1
+
+            self._entries[key] = _Entry(value, size, expires_at)
+            self.current_bytes += size
+
+        return True
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove a key from the cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def keys(self) -> List[Hashable]:
+        """Get cached keys from least to most recently used"""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'size_mb': self.current_bytes / (1024 * 1024),
+                'max_size_mb': self.max_bytes / (1024 * 1024),
+                'hits': self.stats.hits,
+                'misses': self.stats.misses,
+                'evictions': self.stats.evictions,
+                'expirations': self.stats.expirations,
+                'rejected': self.stats.rejected,
+                'hit_rate': self.stats.hit_rate
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and release its accounted size (lock held)"""
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            return entry.expires_at is None or entry.expires_at > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
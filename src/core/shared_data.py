@@ -0,0 +1,235 @@
+"""
+Shared Data - Arrow IPC segments shared between Streamlit processes
+
+A publisher writes each dataset once as an Arrow IPC file (in /dev/shm when
+available) and records its version in a manifest. Page processes memory-map
+the file, so numeric columns are zero-copy views over the shared pages, and
+poll the manifest to pick up newly published versions.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Environment variable pointing page processes at a published store
+SHARED_DIR_ENV = "STOCK_DASHBOARD_SHARED_DIR"
+MANIFEST_NAME = "manifest.json"
+
+# Dataset names
+FUNDAMENTALS_DATASET = "fundamentals"
+METADATA_DATASET = "metadata"
+OHLCV_DATASET = "ohlcv"
+
+
+def default_shared_dir() -> Path:
+    """Get the default store directory (RAM-backed /dev/shm when available)"""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / "stock_dashboard"
+    return Path("Database/cache/shared")
+
+
+class SharedDataStore:
+    """Publish and attach versioned Arrow IPC datasets"""
+
+    def __init__(self, root: Optional[Path] = None, keep_versions: int = 2):
+        """
+        Initialize shared store
+
+        Args:
+            root: Store directory (defaults to $STOCK_DASHBOARD_SHARED_DIR or /dev/shm)
+            keep_versions: Number of versions kept per dataset
+        """
+        env_root = os.environ.get(SHARED_DIR_ENV)
+        self.root = Path(root or env_root or default_shared_dir())
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.keep_versions = max(1, keep_versions)
+        self.manifest_path = self.root / MANIFEST_NAME
+
+    def read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Read the dataset manifest (empty if nothing was published)"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def manifest_stamp(self) -> int:
+        """Cheap change marker for polling (manifest mtime in ns, 0 if missing)"""
+        try:
+            return self.manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def publish(self, name: str, df: pd.DataFrame) -> int:
+        """
+        Publish a DataFrame as a new version of a dataset
+
+        Args:
+            name: Dataset name (e.g., 'fundamentals', 'ohlcv')
+            df: Data to publish
+
+        Returns:
+            Published version number
+        """
+        version = time.time_ns()
+        path = self.root / f"{name}.{version}.arrow"
+        tmp_path = path.with_suffix('.tmp')
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+        manifest = self.read_manifest()
+        previous = manifest.get(name, {}).get('history', [])
+        history = ([path.name] + previous)[:self.keep_versions]
+        manifest[name] = {
+            'version': version,
+            'file': path.name,
+            'rows': table.num_rows,
+            'size_mb': path.stat().st_size / (1024 * 1024),
+            'published_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'history': history
+        }
+        self._write_manifest(manifest)
+
+        # Older files can be unlinked safely - attached readers keep their mapping
+        for stale in set(previous) - set(history):
+            try:
+                (self.root / stale).unlink()
+            except FileNotFoundError:
+                pass
+
+        logger.info(f"Published shared dataset '{name}' v{version} ({table.num_rows:,} rows)")
+        return version
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Atomically replace the manifest"""
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def version(self, name: str) -> Optional[int]:
+        """
+        Get the current version of a dataset
+
+        Args:
+            name: Dataset name
+
+        Returns:
+            Version number or None if not published
+        """
+        return self.read_manifest().get(name, {}).get('version')
+
+    def attach_table(self, name: str) -> Optional[Tuple[pa.Table, int]]:
+        """
+        Memory-map the current version of a dataset
+
+        Args:
+            name: Dataset name
+
+        Returns:
+            Tuple of (zero-copy Arrow table, version) or None if not published
+        """
+        entry = self.read_manifest().get(name)
+        if not entry:
+            return None
+
+        source = pa.memory_map(str(self.root / entry['file']), 'r')
+        return pa.ipc.open_file(source).read_all(), entry['version']
+
+    def attach(self, name: str) -> Optional[Tuple[pd.DataFrame, int]]:
+        """
+        Attach the current version of a dataset as a DataFrame
+
+        Numeric columns without nulls stay zero-copy (read-only) views over the
+        memory-mapped file; dictionary columns become categoricals.
+
+        Args:
+            name: Dataset name
+
+        Returns:
+            Tuple of (DataFrame, version) or None if not published
+        """
+        attached = self.attach_table(name)
+        if attached is None:
+            return None
+        table, version = attached
+        return table.to_pandas(split_blocks=True), version
+
+
+class SharedDataClient:
+    """Per-process view of a shared store that re-attaches on new versions"""
+
+    def __init__(self, store: Optional[SharedDataStore] = None):
+        """
+        Initialize client
+
+        Args:
+            store: Shared store (defaults to the environment-configured store)
+        """
+        self.store = store or SharedDataStore()
+        self._attached: Dict[str, Tuple[pd.DataFrame, int]] = {}
+        self._stamps: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Check whether this process was launched against a shared store"""
+        return bool(os.environ.get(SHARED_DIR_ENV))
+
+    def get(self, name: str) -> Optional[Tuple[pd.DataFrame, int]]:
+        """
+        Get the latest version of a dataset, re-attaching only when it changed
+
+        Args:
+            name: Dataset name
+
+        Returns:
+            Tuple of (DataFrame, version) or None if not published
+        """
+        with self._lock:
+            stamp = self.store.manifest_stamp()
+            if stamp == self._stamps.get(name) and name in self._attached:
+                return self._attached[name]
+
+            version = self.store.version(name)
+            if version is None:
+                return None
+
+            cached = self._attached.get(name)
+            if cached is None or cached[1] != version:
+                attached = self.store.attach(name)
+                if attached is None:
+                    return None
+                self._attached[name] = attached
+                logger.info(f"Attached shared dataset '{name}' v{version}")
+
+            self._stamps[name] = stamp
+            return self._attached[name]
+
+    def has_new_version(self, name: str) -> bool:
+        """
+        Check whether a newer version than the attached one was published
+
+        Args:
+            name: Dataset name
+
+        Returns:
+            True if a different version is available
+        """
+        cached = self._attached.get(name)
+        version = self.store.version(name)
+        return version is not None and (cached is None or cached[1] != version)
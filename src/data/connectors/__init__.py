@@ -1,28 +1,50 @@
 """
 Data Connectors Module
 Provides TCBS data source for OHLCV data
+
+Classes are imported on first access so that, for example, importing
+OHLCVCacheManager does not load plotly, requests or the TCBS config.
 """
 
-# Import main connectors
-from .tcbs_connector import TCBSConnector
-from .ohlcv_connector import OHLCVConnector, HybridOHLCVConnector
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# Import utilities
-from .ohlcv_cache import OHLCVCacheManager
-from .update_ohlcv_data import OHLCVUpdater
-from .visualize_ohlcv import OHLCVVisualizer
-from .market_breadth_cache import MarketBreadthCache
+if TYPE_CHECKING:
+    from .tcbs_connector import TCBSConnector
+    from .ohlcv_connector import OHLCVConnector, HybridOHLCVConnector
+    from .ohlcv_cache import OHLCVCacheManager
+    from .update_ohlcv_data import OHLCVUpdater
+    from .visualize_ohlcv import OHLCVVisualizer
+    from .market_breadth_cache import MarketBreadthCache
+    from .intraday_store import IntradayStore
 
-# Export all classes
-__all__ = [
+# Exported name -> submodule
+_LAZY_EXPORTS = {
     # Connectors
-    "TCBSConnector",
-    "OHLCVConnector",
-    "HybridOHLCVConnector",  # Alias for compatibility
-    
+    "TCBSConnector": ".tcbs_connector",
+    "OHLCVConnector": ".ohlcv_connector",
+    "HybridOHLCVConnector": ".ohlcv_connector",  # Alias for compatibility
+
     # Utilities
-    "OHLCVCacheManager",
-    "OHLCVUpdater",
-    "OHLCVVisualizer",
-    "MarketBreadthCache"
-]
\ No newline at end of file
+    "OHLCVCacheManager": ".ohlcv_cache",
+    "OHLCVUpdater": ".update_ohlcv_data",
+    "OHLCVVisualizer": ".visualize_ohlcv",
+    "MarketBreadthCache": ".market_breadth_cache",
+    "IntradayStore": ".intraday_store",
+}
+
+# Export all classes
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported class on first access"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
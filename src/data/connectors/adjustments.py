@@ -0,0 +1,247 @@
+"""
+Price Adjustments - Corporate-action factors applied to cached daily bars
+
+When a provider back-adjusts its history after a split or stock dividend,
+the bars it returns for dates already in the cache come back on a new
+price scale. The ratio between the fetched and cached closes over that
+overlap is stored as an event; bars older than the event are multiplied
+by the cumulative factor of all later events when they are read, so the
+cached rows themselves are never rewritten.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+# Overlap ratio deviation treated as a new price scale (daily revisions stay well below)
+DEFAULT_TOLERANCE = 0.02
+# Overlapping sessions needed before a ratio is trusted
+DEFAULT_MIN_OVERLAP = 3
+
+
+def detect_adjustment(cached_close: pd.Series, new_close: pd.Series,
+                      tolerance: float = DEFAULT_TOLERANCE,
+                      min_overlap: int = DEFAULT_MIN_OVERLAP) -> Optional[float]:
+    """
+    Detect a price-scale change between cached and newly fetched closes
+
+    Args:
+        cached_close: Cached closes indexed by date
+        new_close: Fetched closes indexed by date
+        tolerance: Relative deviation from 1 (and between sessions) allowed
+        min_overlap: Minimum overlapping sessions
+
+    Returns:
+        Ratio new / cached, or None when both are on the same scale
+    """
+    overlap = cached_close.index.intersection(new_close.index)
+    if len(overlap) < min_overlap:
+        return None
+
+    ratios = (new_close.loc[overlap] / cached_close.loc[overlap]).to_numpy(dtype='float64')
+    ratios = ratios[np.isfinite(ratios) & (ratios > 0)]
+    if len(ratios) < min_overlap:
+        return None
+
+    ratio = float(np.median(ratios))
+    if abs(ratio - 1) <= tolerance:
+        return None
+    # A corporate action moves every overlapping session by the same ratio
+    if (np.abs(ratios / ratio - 1) <= tolerance).mean() < 0.8:
+        logger.warning("Inconsistent overlap ratios (median %.4f), not recorded as an adjustment", ratio)
+        return None
+    return round(ratio, 6)
+
+
+def factors_for_dates(dates: np.ndarray, event_dates: np.ndarray, factors: np.ndarray) -> np.ndarray:
+    """
+    Look up the cumulative factor of each bar
+
+    Args:
+        dates: Bar dates (datetime64)
+        event_dates: Sorted event dates (datetime64)
+        factors: Cumulative factor of the bars before each event
+
+    Returns:
+        Factor per bar (1.0 on or after the last event)
+    """
+    position = np.searchsorted(event_dates, dates, side='right')
+    return np.append(factors, 1.0)[position]
+
+
+class AdjustmentStore:
+    """Adjustment events and cumulative factors kept next to the OHLCV cache"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Initialize store
+
+        Args:
+            conn: Connection of the OHLCV cache database
+        """
+        self.conn = conn
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS adjustment_factors (
+                symbol TEXT NOT NULL,
+                date TEXT NOT NULL,
+                ratio REAL NOT NULL,
+                factor REAL NOT NULL,
+                detected_at TIMESTAMP,
+                PRIMARY KEY (symbol, date)
+            )
+        ''')
+        self.conn.commit()
+
+    def record(self, symbol: str, start: str, end: str, ratio: Optional[float] = None) -> bool:
+        """
+        Update a symbol's events after its bars from start to end were re-fetched
+
+        The re-fetched bars are on the provider's current scale, so events
+        inside the window move to start, combined with a newly detected
+        ratio. Runs inside the caller's transaction.
+
+        Args:
+            symbol: Stock symbol
+            start: First re-fetched date (YYYY-MM-DD)
+            end: Last re-fetched date (YYYY-MM-DD)
+            ratio: Detected new / cached ratio (None if unchanged)
+
+        Returns:
+            True if the symbol's factors changed
+        """
+        rows = self.conn.execute('''
+            SELECT date, ratio, detected_at FROM adjustment_factors WHERE symbol = ? ORDER BY date
+        ''', (symbol,)).fetchall()
+        inside = [row for row in rows if start <= row[0] <= end]
+        if ratio is None and not inside:
+            return False
+
+        merged = np.prod([row[1] for row in inside]) * (ratio or 1.0)
+        kept = [row for row in rows if not start <= row[0] <= end]
+        if abs(merged - 1) > 1e-9:
+            detected_at = datetime.now() if ratio is not None else inside[-1][2]
+            kept = sorted(kept + [(start, float(merged), detected_at)])
+        cumulative = np.cumprod([row[1] for row in kept][::-1])[::-1]
+
+        self.conn.execute('DELETE FROM adjustment_factors WHERE symbol = ?', (symbol,))
+        self.conn.executemany('''
+            INSERT INTO adjustment_factors (symbol, date, ratio, factor, detected_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(symbol, date, ratio_, float(factor), detected_at)
+              for (date, ratio_, detected_at), factor in zip(kept, cumulative)])
+        if ratio is not None:
+            logger.info("Price adjustment detected for %s from %s (ratio %.4f)", symbol, start, ratio)
+        return True
+
+    def clear(self, symbol: Optional[str] = None):
+        """
+        Drop the events of a symbol (or all), e.g. after a full refetch
+
+        Args:
+            symbol: Stock symbol, or None for all
+        """
+        if symbol is None:
+            self.conn.execute('DELETE FROM adjustment_factors')
+        else:
+            self.conn.execute('DELETE FROM adjustment_factors WHERE symbol = ?', (symbol,))
+
+    def events(self, symbol: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get stored events
+
+        Args:
+            symbol: Stock symbol, or None for all
+
+        Returns:
+            DataFrame with symbol, date, ratio, factor and detected_at
+        """
+        query = 'SELECT symbol, date, ratio, factor, detected_at FROM adjustment_factors'
+        params = ()
+        if symbol is not None:
+            query += ' WHERE symbol = ?'
+            params = (symbol,)
+        return pd.read_sql_query(query + ' ORDER BY symbol, date', self.conn,
+                                 params=params, parse_dates=['date'])
+
+    def symbols(self) -> List[str]:
+        """Symbols with adjustment events (candidates for a full refetch)"""
+        rows = self.conn.execute('SELECT DISTINCT symbol FROM adjustment_factors ORDER BY symbol')
+        return [row[0] for row in rows.fetchall()]
+
+    def _factor_arrays(self) -> Dict[str, tuple]:
+        """Symbol -> (event dates, cumulative factors)"""
+        events = self.events()
+        return {
+            symbol: (group['date'].to_numpy(dtype='datetime64[ns]'), group['factor'].to_numpy())
+            for symbol, group in events.groupby('symbol', sort=False)
+        }
+
+    def _factor_arrays_for(self, symbol: str) -> Optional[tuple]:
+        """(event dates, cumulative factors) of one symbol, None without events"""
+        rows = self.conn.execute('''
+            SELECT date, factor FROM adjustment_factors WHERE symbol = ? ORDER BY date
+        ''', (symbol,)).fetchall()
+        if not rows:
+            return None
+        return (np.array([date for date, _ in rows], dtype='datetime64[ns]'),
+                np.array([factor for _, factor in rows], dtype='float64'))
+
+    def apply(self, symbol: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adjust one symbol's bars indexed by date
+
+        Args:
+            symbol: Stock symbol
+            df: Bars indexed by date with OHLC(V) columns
+
+        Returns:
+            Adjusted copy, or df itself when the symbol has no events
+        """
+        arrays = self._factor_arrays_for(symbol)
+        if arrays is None or df.empty:
+            return df
+        factor = factors_for_dates(df.index.to_numpy(dtype='datetime64[ns]'), *arrays)
+        return _scale(df, factor)
+
+    def apply_panel(self, panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adjust a long panel (symbol, date, OHLCV) of many symbols
+
+        Args:
+            panel: Long frame with symbol and date columns
+
+        Returns:
+            Adjusted copy, or panel itself when no symbol has events
+        """
+        arrays = self._factor_arrays()
+        if not arrays or panel.empty:
+            return panel
+
+        factor = np.ones(len(panel))
+        symbols = panel['symbol'].astype(str).to_numpy()
+        dates = panel['date'].to_numpy(dtype='datetime64[ns]')
+        for symbol, (event_dates, factors) in arrays.items():
+            rows = np.flatnonzero(symbols == symbol)
+            if len(rows):
+                factor[rows] = factors_for_dates(dates[rows], event_dates, factors)
+        return _scale(panel, factor)
+
+
+def _scale(df: pd.DataFrame, factor: np.ndarray) -> pd.DataFrame:
+    """Multiply prices by factor and divide volumes by it"""
+    df = df.copy()
+    for col in PRICE_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].to_numpy(dtype='float64') * factor
+    if 'volume' in df.columns:
+        volume = np.round(df['volume'].to_numpy(dtype='float64') / factor)
+        df['volume'] = volume.astype('int64') if np.isfinite(volume).all() else volume
+    return df
@@ -0,0 +1,393 @@
+"""
+Intraday Store - Day-partitioned Parquet files for minute bars
+
+Bars are kept per resolution and trading day:
+
+    <root>/<resolution>m/<YYYY-MM-DD>/bars.parquet       compacted, sorted by symbol and time
+    <root>/<resolution>m/<YYYY-MM-DD>/part-<n>.parquet   appended during the session
+
+Timestamps are integer epoch seconds (UTC), prices float32 and volumes
+int32. Naive times - the connector's bars and read windows - are exchange
+local time (Asia/Ho_Chi_Minh, UTC+7), and day partitions and returned dates
+are local too. Reads only open the day directories of the requested window
+and filter symbols and times with Parquet row-group statistics.
+"""
+
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import logging
+
+from src.core.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTRADAY_DIR = Path("Database/intraday")
+
+# Resolutions in minutes, as accepted by TCBSConnector.fetch_intraday_price
+INTRADAY_RESOLUTIONS = ('1', '5', '15', '30', '60')
+
+# Exchange time zone of naive timestamps (TCBS bars, read windows)
+MARKET_TZ = 'Asia/Ho_Chi_Minh'
+# Fixed offset of MARKET_TZ for day partitions; Vietnam has no daylight saving time
+MARKET_UTC_OFFSET = 7 * 3600
+
+SCHEMA = pa.schema([
+    ('symbol', pa.string()),
+    ('ts', pa.int64()),
+    ('open', pa.float32()),
+    ('high', pa.float32()),
+    ('low', pa.float32()),
+    ('close', pa.float32()),
+    ('volume', pa.int32()),
+])
+
+COMPACTED_FILE = "bars.parquet"
+# Rows per row group of compacted files; small groups let symbol filters skip most of a day
+ROW_GROUP_SIZE = 16_384
+
+INT32_MAX = np.iinfo(np.int32).max
+
+
+@dataclass
+class IntradayPolicy:
+    """Retention and compaction policy of the intraday store"""
+    # Days of bars kept per resolution (older day partitions are deleted)
+    retention_days: Dict[str, int] = field(default_factory=lambda: {
+        '1': 30, '5': 180, '15': 365, '30': 730, '60': 730
+    })
+    # Part files a day may collect before the writer compacts it
+    max_parts: int = 32
+
+
+def _epoch_seconds(value) -> int:
+    """Epoch seconds (UTC) of a timestamp, naive values taken as exchange time"""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(MARKET_TZ)
+    return int(ts.value // 1_000_000_000)
+
+
+def _day_numbers(ts: np.ndarray) -> np.ndarray:
+    """Days since 1970-01-01 of epoch seconds, in exchange time"""
+    return (ts + MARKET_UTC_OFFSET) // 86_400
+
+
+def bars_to_table(symbol: str, df: pd.DataFrame) -> pa.Table:
+    """
+    Convert connector bars to the store's columnar schema
+
+    Args:
+        symbol: Stock symbol
+        df: Bars indexed by date (or with a date column) and OHLCV columns
+
+    Returns:
+        Arrow table with symbol, ts and OHLCV columns
+    """
+    dates = df['date'] if 'date' in df.columns else df.index.to_series()
+    dates = pd.to_datetime(dates)
+    if dates.dt.tz is None:
+        dates = dates.dt.tz_localize(MARKET_TZ)
+    ts = dates.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy(dtype='datetime64[s]').astype(np.int64)
+
+    volume = df['volume'].to_numpy(dtype='float64') if 'volume' in df.columns else np.zeros(len(df))
+    columns = {
+        'symbol': pa.array([symbol] * len(df), pa.string()),
+        'ts': pa.array(ts, pa.int64()),
+        **{col: pa.array(df[col].to_numpy(dtype='float32'), pa.float32())
+           for col in ('open', 'high', 'low', 'close')},
+        'volume': pa.array(np.clip(np.nan_to_num(volume), 0, INT32_MAX).astype(np.int32), pa.int32()),
+    }
+    return pa.table(columns, schema=SCHEMA)
+
+
+class IntradayStore:
+    """Day-partitioned columnar store of intraday bars"""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_INTRADAY_DIR,
+                 policy: Optional[IntradayPolicy] = None):
+        """
+        Initialize store
+
+        Args:
+            root: Root directory of the partitions
+            policy: Retention and compaction policy
+        """
+        self.root = Path(root)
+        self.policy = policy or IntradayPolicy()
+
+    def _resolution_dir(self, resolution: str) -> Path:
+        """Directory holding the day partitions of a resolution"""
+        if str(resolution) not in INTRADAY_RESOLUTIONS:
+            raise ValueError(f"Unsupported intraday resolution: {resolution}")
+        return self.root / f"{resolution}m"
+
+    def _day_files(self, day_dir: Path) -> List[Path]:
+        """Compacted file first, then parts in write order (later rows win)"""
+        files = sorted(day_dir.glob("part-*.parquet"))
+        compacted = day_dir / COMPACTED_FILE
+        return ([compacted] if compacted.exists() else []) + files
+
+    def days(self, resolution: str) -> List[date]:
+        """
+        Get the stored trading days of a resolution
+
+        Args:
+            resolution: Resolution in minutes
+
+        Returns:
+            Sorted list of days
+        """
+        res_dir = self._resolution_dir(resolution)
+        if not res_dir.exists():
+            return []
+        return sorted(date.fromisoformat(p.name) for p in res_dir.iterdir() if p.is_dir())
+
+    @timed('cache.intraday.write')
+    def write(self, table: pa.Table, resolution: str) -> int:
+        """
+        Append bars as new part files, one per trading day
+
+        Args:
+            table: Arrow table in the store schema
+            resolution: Resolution in minutes
+
+        Returns:
+            Number of part files written
+        """
+        if table.num_rows == 0:
+            return 0
+        table = table.cast(SCHEMA)
+        res_dir = self._resolution_dir(resolution)
+        day_numbers = _day_numbers(table.column('ts').to_numpy())
+
+        written = 0
+        for day_number in np.unique(day_numbers):
+            day_dir = res_dir / (date(1970, 1, 1) + timedelta(days=int(day_number))).isoformat()
+            day_dir.mkdir(parents=True, exist_ok=True)
+            part = table.filter(pa.array(day_numbers == day_number))
+            # Nanosecond time and pid keep part names unique and in write order
+            path = day_dir / f"part-{time.time_ns():020d}-{os.getpid()}.parquet"
+            pq.write_table(part, path)
+            written += 1
+        logger.debug("Wrote %d intraday rows (%sm) in %d parts", table.num_rows, resolution, written)
+        return written
+
+    def append(self, symbol: str, df: pd.DataFrame, resolution: str) -> int:
+        """
+        Append one symbol's bars (e.g. from OHLCVConnector.get_intraday)
+
+        Args:
+            symbol: Stock symbol
+            df: Bars indexed by date
+            resolution: Resolution in minutes
+
+        Returns:
+            Number of part files written
+        """
+        if df is None or df.empty:
+            return 0
+        return self.write(bars_to_table(symbol, df), resolution)
+
+    def writer(self, resolution: str, flush_rows: int = 100_000) -> 'IntradayWriter':
+        """
+        Get a buffered writer for session ingestion
+
+        Args:
+            resolution: Resolution in minutes
+            flush_rows: Buffered rows that trigger a flush
+
+        Returns:
+            IntradayWriter
+        """
+        return IntradayWriter(self, resolution, flush_rows)
+
+    @timed('cache.intraday.read')
+    def read(self, symbols: Union[str, Iterable[str]], start, end=None,
+             resolution: str = '5') -> pd.DataFrame:
+        """
+        Read bars of one or more symbols in a time window
+
+        Args:
+            symbols: Symbol or symbols
+            start: First timestamp or day (inclusive)
+            end: Last timestamp (inclusive); a plain day covers the whole day.
+                 Defaults to the end of the start day
+            resolution: Resolution in minutes
+
+        Returns:
+            DataFrame with symbol, date (exchange time) and OHLCV columns sorted by symbol and date
+        """
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        start_ts = pd.Timestamp(start)
+        end_ts = pd.Timestamp(end) if end is not None else start_ts.normalize()
+        if end_ts == end_ts.normalize():
+            end_ts = end_ts + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        lo, hi = _epoch_seconds(start_ts), _epoch_seconds(end_ts)
+
+        res_dir = self._resolution_dir(resolution)
+        filters = [('symbol', 'in', symbols), ('ts', '>=', lo), ('ts', '<=', hi)]
+        tables = []
+        for day_number in range(int(_day_numbers(lo)), int(_day_numbers(hi)) + 1):
+            day_dir = res_dir / (date(1970, 1, 1) + timedelta(days=day_number)).isoformat()
+            if not day_dir.is_dir():
+                continue
+            for path in self._day_files(day_dir):
+                try:
+                    tables.append(pq.read_table(path, filters=filters, schema=SCHEMA))
+                except FileNotFoundError:
+                    # Part removed by a concurrent compaction; its rows are in bars.parquet
+                    continue
+
+        table = pa.concat_tables(tables) if tables else SCHEMA.empty_table()
+        return self._to_frame(table)
+
+    @staticmethod
+    def _to_frame(table: pa.Table) -> pd.DataFrame:
+        """Deduplicate (later rows win), sort and convert epoch seconds to exchange-time dates"""
+        df = table.to_pandas()
+        df = df.drop_duplicates(['symbol', 'ts'], keep='last').sort_values(['symbol', 'ts'])
+        df.insert(1, 'date', pd.to_datetime(df.pop('ts').to_numpy() + MARKET_UTC_OFFSET, unit='s'))
+        return df.reset_index(drop=True)
+
+    def compact(self, resolution: str, day: date) -> bool:
+        """
+        Merge a day's parts into one sorted, deduplicated file
+
+        Args:
+            resolution: Resolution in minutes
+            day: Trading day
+
+        Returns:
+            True if the day had parts to merge
+        """
+        day_dir = self._resolution_dir(resolution) / day.isoformat()
+        files = self._day_files(day_dir) if day_dir.is_dir() else []
+        parts = [path for path in files if path.name != COMPACTED_FILE]
+        if not parts:
+            return False
+
+        table = pa.concat_tables([pq.read_table(path, schema=SCHEMA) for path in files])
+        df = table.to_pandas().drop_duplicates(['symbol', 'ts'], keep='last')
+        table = pa.Table.from_pandas(df.sort_values(['symbol', 'ts']), schema=SCHEMA, preserve_index=False)
+
+        tmp = day_dir / f"{COMPACTED_FILE}.tmp"
+        pq.write_table(table, tmp, row_group_size=ROW_GROUP_SIZE)
+        os.replace(tmp, day_dir / COMPACTED_FILE)
+        for path in parts:
+            path.unlink(missing_ok=True)
+        logger.debug("Compacted %d parts of %s (%sm) into %d rows",
+                     len(parts), day.isoformat(), resolution, table.num_rows)
+        return True
+
+    def apply_retention(self, resolution: str, today: Optional[date] = None) -> int:
+        """
+        Delete day partitions older than the policy's retention
+
+        Args:
+            resolution: Resolution in minutes
+            today: Reference day (default: today)
+
+        Returns:
+            Number of days deleted
+        """
+        keep_days = self.policy.retention_days.get(str(resolution))
+        if not keep_days:
+            return 0
+        cutoff = (today or date.today()) - timedelta(days=keep_days)
+        expired = [day for day in self.days(resolution) if day < cutoff]
+        for day in expired:
+            shutil.rmtree(self._resolution_dir(resolution) / day.isoformat(), ignore_errors=True)
+        return len(expired)
+
+    def maintain(self, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Compact closed days and apply retention for every resolution
+
+        Args:
+            today: Reference day (default: today); only earlier days are compacted
+
+        Returns:
+            Dictionary with compacted and deleted day counts
+        """
+        today = today or date.today()
+        compacted = deleted = 0
+        for resolution in INTRADAY_RESOLUTIONS:
+            deleted += self.apply_retention(resolution, today)
+            compacted += sum(self.compact(resolution, day)
+                             for day in self.days(resolution) if day < today)
+        if compacted or deleted:
+            logger.info("Intraday store: compacted %d days, deleted %d expired days", compacted, deleted)
+        return {'compacted': compacted, 'deleted': deleted}
+
+
+class IntradayWriter:
+    """Buffer bars during a session and write them as part files"""
+
+    def __init__(self, store: IntradayStore, resolution: str, flush_rows: int = 100_000):
+        """
+        Initialize writer
+
+        Args:
+            store: Target store
+            resolution: Resolution in minutes
+            flush_rows: Buffered rows that trigger a flush
+        """
+        self.store = store
+        self.resolution = str(resolution)
+        self.flush_rows = flush_rows
+        self._tables: List[pa.Table] = []
+        self._rows = 0
+
+    def add(self, symbol: str, df: pd.DataFrame):
+        """
+        Buffer one symbol's bars
+
+        Args:
+            symbol: Stock symbol
+            df: Bars indexed by date
+        """
+        if df is None or df.empty:
+            return
+        table = bars_to_table(symbol, df)
+        self._tables.append(table)
+        self._rows += table.num_rows
+        if self._rows >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered bars; days that collected too many parts are compacted
+
+        Returns:
+            Number of rows written
+        """
+        if not self._tables:
+            return 0
+        table = pa.concat_tables(self._tables)
+        rows = self._rows
+        self._tables, self._rows = [], 0
+        self.store.write(table, self.resolution)
+
+        res_dir = self.store._resolution_dir(self.resolution)
+        for day_number in np.unique(_day_numbers(table.column('ts').to_numpy())):
+            day = date(1970, 1, 1) + timedelta(days=int(day_number))
+            if len(list((res_dir / day.isoformat()).glob("part-*.parquet"))) > self.store.policy.max_parts:
+                self.store.compact(self.resolution, day)
+        return rows
+
+    def __enter__(self) -> 'IntradayWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
@@ -10,6 +10,8 @@ import logging
 from typing import Dict, List, Optional
 import concurrent.futures
 
+from src.core.log_policy import BatchLog
+
 logger = logging.getLogger(__name__)
 
 class MarketBreadthCache:
@@ -89,7 +91,7 @@ class MarketBreadthCache:
         Returns:
             Market breadth statistics
         """
-        logger.info(f"Pre-calculating market breadth for {len(symbols)} symbols")
+        logger.info("Pre-calculating market breadth for %d symbols", len(symbols))
         
         stats = {
             'above_ma20': 0,
@@ -129,7 +131,8 @@ class MarketBreadthCache:
                 return {'symbol': symbol, 'error': str(e)}
         
         # Process in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+        with BatchLog(logger, "Market breadth") as batch, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
             futures = [executor.submit(analyze_symbol, symbol) for symbol in symbols]
             
             for future in concurrent.futures.as_completed(futures):
@@ -142,8 +145,10 @@ class MarketBreadthCache:
                         stats['ema9_above_ema21'] += result['ema9_above_ema21']
                         stats['total'] += 1
                         stats['analyzed'].append(result['symbol'])
+                        batch.add(result['symbol'])
                     elif result:
                         stats['failed'].append(result['symbol'])
+                        batch.add(result['symbol'], False, result['error'])
                 except Exception:
                     pass
         
@@ -10,8 +10,17 @@ from pathlib import Path
 import logging
 import json
 
+from src.core.compact_frame import ticker_slice
+from src.core.instrumentation import record_cache, timed
+from src.core.shared_data import SharedDataClient, OHLCV_DATASET
+
+from .adjustments import AdjustmentStore, detect_adjustment
+
 logger = logging.getLogger(__name__)
 
+# Resolutions materialized from daily bars: resolution -> pandas period frequency
+ROLLUP_RESOLUTIONS = {'1W': 'W-FRI', '1M': 'M'}
+
 class OHLCVCacheManager:
     """Manage OHLCV data caching using SQLite"""
     
@@ -30,6 +39,11 @@ class OHLCVCacheManager:
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         
         self._init_database()
+        # Corporate-action factors applied to daily bars at read time
+        self.adjustments = AdjustmentStore(self.conn)
+        
+        # Zero-copy daily panel published by the page launcher, if any
+        self._shared = SharedDataClient() if SharedDataClient.is_enabled() else None
         logger.info(f"OHLCVCacheManager initialized at {self.db_path}")
     
     def _init_database(self):
@@ -74,6 +88,7 @@ class OHLCVCacheManager:
         
         self.conn.commit()
     
+    @timed('cache.ohlcv.write')
     def save_ohlcv(self, symbol: str, df: pd.DataFrame, resolution: str = '1D'):
         """
         Save OHLCV data to cache
@@ -84,7 +99,7 @@ class OHLCVCacheManager:
             resolution: Time resolution
         """
         if df.empty:
-            logger.warning(f"Empty DataFrame for {symbol}, skipping save")
+            logger.warning("Empty DataFrame for %s, skipping save", symbol)
             return
         
         cursor = self.conn.cursor()
@@ -101,6 +116,11 @@ class OHLCVCacheManager:
             
             df_copy['date'] = pd.to_datetime(df_copy['date']).dt.strftime('%Y-%m-%d')
             
+            # Compare with the cached bars before they are replaced
+            rollup_start = None
+            if resolution == '1D':
+                rollup_start = self._record_adjustment(symbol, df_copy)
+            
             # Insert or replace data
             for _, row in df_copy.iterrows():
                 cursor.execute('''
@@ -136,13 +156,138 @@ class OHLCVCacheManager:
                 record_count
             ))
             
+            # Weekly/monthly bars of the touched periods follow the daily bars
+            if resolution == '1D':
+                self._update_rollups(cursor, symbol, rollup_start or start_date, end_date)
+            
             self.conn.commit()
-            logger.info(f"Saved {record_count} records for {symbol} ({resolution})")
+            logger.debug("Saved %d records for %s (%s)", record_count, symbol, resolution)
             
         except Exception as e:
-            logger.error(f"Error saving data for {symbol}: {e}")
+            logger.error("Error saving data for %s: %s", symbol, e)
             self.conn.rollback()
     
+    def _record_adjustment(self, symbol: str, df: pd.DataFrame) -> Optional[str]:
+        """
+        Detect a price-scale change between the cached and fetched overlap
+        
+        Cached closes are compared after their existing factors, so only a new
+        scale change is recorded. A fetch that covers the whole cached history
+        drops the symbol's events.
+        
+        Args:
+            symbol: Stock symbol
+            df: Bars about to be saved (date as YYYY-MM-DD strings)
+            
+        Returns:
+            First cached date when the factors changed (rollups are then
+            rebuilt from it), otherwise None
+        """
+        start, end = df['date'].min(), df['date'].max()
+        first_cached = self.get_first_date(symbol)
+        if first_cached is None:
+            return None
+        if start <= first_cached:
+            had_events = bool(self.adjustments.events(symbol).shape[0])
+            self.adjustments.clear(symbol)
+            return first_cached if had_events else None
+        
+        cached = pd.read_sql_query('''
+            SELECT date, close FROM ohlcv_data
+            WHERE symbol = ? AND resolution = '1D' AND date >= ? AND date <= ?
+        ''', self.conn, params=[symbol, start, end], index_col='date')
+        cached.index = pd.to_datetime(cached.index)
+        cached = self.adjustments.apply(symbol, cached)['close']
+        fresh = pd.Series(df['close'].to_numpy(dtype='float64'), index=pd.to_datetime(df['date']))
+        
+        ratio = detect_adjustment(cached, fresh)
+        return first_cached if self.adjustments.record(symbol, start, end, ratio) else None
+    
+    def _update_rollups(self, cursor: sqlite3.Cursor, symbol: str, start_date: str, end_date: str):
+        """
+        Re-aggregate the weekly/monthly bars of the periods a daily save touched
+        
+        Rollups are built from adjusted daily bars. Each rollup bar is stamped
+        with its last daily session, so the bars of a period always lie within
+        the period's own date range.
+        
+        Args:
+            cursor: Cursor of the open transaction
+            symbol: Stock symbol
+            start_date: First saved daily date (YYYY-MM-DD)
+            end_date: Last saved daily date (YYYY-MM-DD)
+        """
+        # The aggregation lives with the chart helpers, which pull in plotly
+        from src.visualization.downsampling import resample_ohlc
+        
+        for resolution, freq in ROLLUP_RESOLUTIONS.items():
+            first = pd.Period(start_date, freq).start_time.strftime('%Y-%m-%d')
+            last = pd.Period(end_date, freq).end_time.strftime('%Y-%m-%d')
+            
+            daily = pd.read_sql_query('''
+                SELECT date, open, high, low, close, volume
+                FROM ohlcv_data
+                WHERE symbol = ? AND resolution = '1D' AND date >= ? AND date <= ?
+                ORDER BY date
+            ''', self.conn, params=[symbol, first, last], parse_dates=['date'], index_col='date')
+            bars = resample_ohlc(self.adjustments.apply(symbol, daily), freq)
+            
+            cursor.execute('''
+                DELETE FROM ohlcv_data
+                WHERE symbol = ? AND resolution = ? AND date >= ? AND date <= ?
+            ''', (symbol, resolution, first, last))
+            cursor.executemany('''
+                INSERT INTO ohlcv_data
+                (symbol, date, open, high, low, close, volume, resolution)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (symbol, date.strftime('%Y-%m-%d'), o, h, l, c, int(v), resolution)
+                for date, o, h, l, c, v in zip(bars.index, bars['open'], bars['high'],
+                                               bars['low'], bars['close'], bars['volume'].fillna(0))
+            ])
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO cache_metadata
+                (symbol, resolution, last_update, start_date, end_date, record_count)
+                SELECT ?, ?, ?, MIN(date), MAX(date), COUNT(*)
+                FROM ohlcv_data WHERE symbol = ? AND resolution = ?
+            ''', (symbol, resolution, datetime.now(), symbol, resolution))
+    
+    def rebuild_rollups(self, symbols: Optional[List[str]] = None) -> int:
+        """
+        Rebuild weekly/monthly bars from all cached daily bars
+        
+        Daily saves keep the rollups current; this backfills caches written
+        before rollups existed.
+        
+        Args:
+            symbols: Symbols to rebuild (None for all cached daily symbols)
+            
+        Returns:
+            Number of symbols rebuilt
+        """
+        rows = self.conn.execute('''
+            SELECT symbol, MIN(date), MAX(date) FROM ohlcv_data
+            WHERE resolution = '1D' GROUP BY symbol
+        ''').fetchall()
+        if symbols is not None:
+            wanted = set(symbols)
+            rows = [row for row in rows if row[0] in wanted]
+        
+        cursor = self.conn.cursor()
+        try:
+            for symbol, start_date, end_date in rows:
+                self._update_rollups(cursor, symbol, start_date, end_date)
+            self.conn.commit()
+        except Exception as e:
+            logger.error("Error rebuilding rollups: %s", e)
+            self.conn.rollback()
+            return 0
+        
+        logger.info("Rebuilt %s rollups for %d symbols", '/'.join(ROLLUP_RESOLUTIONS), len(rows))
+        return len(rows)
+    
+    @timed('cache.ohlcv.read')
     def get_ohlcv(self, 
                   symbol: str,
                   start_date: Optional[str] = None,
@@ -151,15 +296,25 @@ class OHLCVCacheManager:
         """
         Get OHLCV data from cache
         
+        Daily bars are returned adjusted for recorded corporate actions.
+        Weekly ('1W') and monthly ('1M') bars are read pre-aggregated (from
+        adjusted daily bars), each stamped with its last trading session.
+        
         Args:
             symbol: Stock symbol
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
-            resolution: Time resolution
+            resolution: Time resolution ('1D', '1W' or '1M')
             
         Returns:
             DataFrame with OHLCV data or None if not cached
         """
+        if self._shared is not None and resolution == '1D':
+            shared = self._get_shared_ohlcv(symbol, start_date, end_date)
+            if shared is not None:
+                record_cache('ohlcv', True)
+                return shared
+        
         cursor = self.conn.cursor()
         
         # Build query
@@ -184,17 +339,132 @@ class OHLCVCacheManager:
         try:
             df = pd.read_sql_query(query, self.conn, params=params, parse_dates=['date'])
             
+            record_cache('ohlcv', not df.empty)
             if not df.empty:
                 df.set_index('date', inplace=True)
-                logger.info(f"Retrieved {len(df)} cached records for {symbol}")
-                return df
+                logger.debug("Retrieved %d cached records for %s", len(df), symbol)
+                return self.adjustments.apply(symbol, df) if resolution == '1D' else df
             else:
-                logger.info(f"No cached data found for {symbol}")
+                logger.debug("No cached data found for %s", symbol)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error retrieving cached data for {symbol}: {e}")
+            logger.error("Error retrieving cached data for %s: %s", symbol, e)
+            return None
+    
+    def _get_shared_ohlcv(self, symbol: str,
+                          start_date: Optional[str],
+                          end_date: Optional[str]) -> Optional[pd.DataFrame]:
+        """
+        Slice a symbol from the shared daily panel if it is at least as fresh as SQLite
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            
+        Returns:
+            DataFrame indexed by date, or None to fall back to SQLite
+        """
+        attached = self._shared.get(OHLCV_DATASET)
+        if attached is None:
+            return None
+        
+        panel, _ = attached
+        df = panel.iloc[ticker_slice(panel, 'symbol', symbol)]
+        if df.empty:
+            return None
+        
+        # Rows saved after the panel was published are only in SQLite
+        row = self.conn.execute('''
+            SELECT end_date FROM cache_metadata WHERE symbol = ? AND resolution = '1D'
+        ''', (symbol,)).fetchone()
+        if row and row[0] and pd.Timestamp(row[0]) > df['date'].iloc[-1]:
             return None
+        
+        df = df.drop(columns='symbol').set_index('date')
+        if start_date:
+            df = df[df.index >= pd.Timestamp(start_date)]
+        if end_date:
+            df = df[df.index <= pd.Timestamp(end_date)]
+        return df if not df.empty else None
+    
+    def load_panel(self, resolution: str = '1D') -> pd.DataFrame:
+        """
+        Load all cached bars as one long frame sorted by symbol and date
+        (daily bars adjusted for recorded corporate actions)
+        
+        Args:
+            resolution: Time resolution
+            
+        Returns:
+            DataFrame with symbol (categorical), date and OHLCV columns
+        """
+        df = pd.read_sql_query('''
+            SELECT symbol, date, open, high, low, close, volume
+            FROM ohlcv_data
+            WHERE resolution = ?
+            ORDER BY symbol, date
+        ''', self.conn, params=[resolution], parse_dates=['date'])
+        
+        symbols = df['symbol'].astype('category')
+        df['symbol'] = symbols.cat.set_categories(symbols.cat.categories.sort_values())
+        return self.adjustments.apply_panel(df) if resolution == '1D' else df
+    
+    def get_panel(self, resolution: str = '1D') -> pd.DataFrame:
+        """
+        Get all bars as one long frame, from the shared panel when it is current
+        
+        Args:
+            resolution: Time resolution
+            
+        Returns:
+            DataFrame with symbol (categorical), date and OHLCV columns
+        """
+        if self._shared is not None and resolution == '1D':
+            attached = self._shared.get(OHLCV_DATASET)
+            if attached is not None:
+                panel = attached[0]
+                row = self.conn.execute('''
+                    SELECT MAX(end_date) FROM cache_metadata WHERE resolution = ?
+                ''', (resolution,)).fetchone()
+                if not panel.empty and (not row[0] or pd.Timestamp(row[0]) <= panel['date'].max()):
+                    return panel
+        
+        return self.load_panel(resolution)
+    
+    def get_data_version(self, resolution: str = '1D', symbol: Optional[str] = None) -> str:
+        """
+        Get a cheap version marker that changes whenever cached bars change
+        
+        Args:
+            resolution: Time resolution
+            symbol: Limit the version to one symbol (None for all)
+            
+        Returns:
+            Version string (symbol count, record count, last update and end date)
+        """
+        query = '''
+            SELECT COUNT(*), COALESCE(SUM(record_count), 0), MAX(last_update), MAX(end_date)
+            FROM cache_metadata WHERE resolution = ?
+        '''
+        params = (resolution,)
+        if symbol is not None:
+            query += ' AND symbol = ?'
+            params += (symbol,)
+        count, records, last_update, end_date = self.conn.execute(query, params).fetchone()
+        version = f"{resolution}:{count}:{records}:{last_update}"
+        
+        # Adjustment factors change daily bars without touching cache_metadata
+        query = 'SELECT COUNT(*), MAX(detected_at) FROM adjustment_factors'
+        params = ()
+        if symbol is not None:
+            query += ' WHERE symbol = ?'
+            params = (symbol,)
+        events, detected_at = self.conn.execute(query, params).fetchone()
+        if events:
+            version += f":adj{events}:{detected_at}"
+        return f"{version}:{symbol}:{end_date}" if symbol is not None else version
     
     def is_cache_valid(self, symbol: str, resolution: str = '1D', max_age_hours: int = 24) -> bool:
         """
@@ -222,12 +492,29 @@ class OHLCVCacheManager:
             age = datetime.now() - last_update
             
             is_valid = age.total_seconds() < (max_age_hours * 3600)
-            logger.debug(f"Cache for {symbol} is {'valid' if is_valid else 'expired'} (age: {age})")
+            logger.debug("Cache for %s is %s (age: %s)", symbol, 'valid' if is_valid else 'expired', age)
             
             return is_valid
         
         return False
     
+    def get_first_date(self, symbol: str, resolution: str = '1D') -> Optional[str]:
+        """
+        Get the date of a symbol's oldest cached bar
+        
+        cache_metadata only describes the latest save, so the bars are queried.
+        
+        Args:
+            symbol: Stock symbol
+            resolution: Time resolution
+            
+        Returns:
+            Date as YYYY-MM-DD, or None if the symbol is not cached
+        """
+        return self.conn.execute('''
+            SELECT MIN(date) FROM ohlcv_data WHERE symbol = ? AND resolution = ?
+        ''', (symbol, resolution)).fetchone()[0]
+    
     def get_cached_symbols(self, resolution: str = '1D') -> List[str]:
         """Get list of symbols in cache"""
         cursor = self.conn.cursor()
@@ -252,10 +539,12 @@ class OHLCVCacheManager:
         if symbol:
             cursor.execute('DELETE FROM ohlcv_data WHERE symbol = ?', (symbol,))
             cursor.execute('DELETE FROM cache_metadata WHERE symbol = ?', (symbol,))
+            self.adjustments.clear(symbol)
             logger.info(f"Cleared cache for {symbol}")
         else:
             cursor.execute('DELETE FROM ohlcv_data')
             cursor.execute('DELETE FROM cache_metadata')
+            self.adjustments.clear()
             logger.info("Cleared all cache")
         
         self.conn.commit()
@@ -268,7 +557,8 @@ class OHLCVCacheManager:
         cursor.execute('SELECT COUNT(DISTINCT symbol) FROM cache_metadata')
         symbol_count = cursor.fetchone()[0]
         
-        cursor.execute('SELECT COUNT(*) FROM ohlcv_data')
+        # Daily bars only; 1W/1M rollups share the table
+        cursor.execute("SELECT COUNT(*) FROM ohlcv_data WHERE resolution = '1D'")
         total_records = cursor.fetchone()[0]
         
         # Get per-symbol stats
@@ -3,21 +3,30 @@ OHLCV Data Connector - Using TCBS API only
 """
 
 import pandas as pd
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, TYPE_CHECKING
 from datetime import datetime, timedelta
 import logging
 
 # Import TCBS connector only
 from .tcbs_connector import TCBSConnector
 
+if TYPE_CHECKING:
+    from .intraday_store import IntradayStore
+
 logger = logging.getLogger(__name__)
 
 class OHLCVConnector:
     """Main OHLCV data connector using TCBS API"""
     
-    def __init__(self):
-        """Initialize TCBS connector"""
+    def __init__(self, intraday_store: Optional['IntradayStore'] = None):
+        """
+        Initialize TCBS connector
+        
+        Args:
+            intraday_store: Store that fetched intraday bars are appended to (optional)
+        """
         self.connector = TCBSConnector()
+        self.intraday_store = intraday_store
         logger.info("OHLCVConnector initialized with TCBS API")
     
     def get_ohlcv(self, 
@@ -95,7 +104,7 @@ class OHLCVConnector:
     
     def get_intraday(self, symbol: str, resolution: str = '5') -> pd.DataFrame:
         """
-        Get intraday data for a symbol
+        Get intraday data for a symbol (persisted when an intraday store is set)
         
         Args:
             symbol: Stock symbol
@@ -105,7 +114,10 @@ class OHLCVConnector:
             DataFrame with intraday data
         """
         try:
-            return self.connector.fetch_intraday_price(symbol, resolution)
+            df = self.connector.fetch_intraday_price(symbol, resolution)
+            if self.intraday_store is not None and not df.empty:
+                self.intraday_store.append(symbol, df, resolution)
+            return df
         except Exception as e:
             logger.error(f"Error fetching intraday data for {symbol}: {e}")
             return pd.DataFrame()
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 # Import config - using relative import
 from src.core.config import get_config
+from src.core.instrumentation import count, record_cache, span, timed
+from src.core.log_policy import BatchLog
 
 
 class TCBSConnector:
@@ -75,6 +77,12 @@ class TCBSConnector:
         
         self._last_request_time = time.time()
     
+    def _get(self, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Send a GET request, counted as an API call and timed per endpoint"""
+        count('api.tcbs')
+        with span(f'api.tcbs.{endpoint}'):
+            return self.session.get(url, timeout=10, **kwargs)
+    
     def fetch_historical_price(
         self, 
         ticker: str, 
@@ -110,8 +118,10 @@ class TCBSConnector:
         
         # Check cache
         cache_key = f"{ticker}_{from_timestamp}_{to_timestamp}_{resolution}"
+        if use_cache:
+            record_cache('tcbs', cache_key in self._cache)
         if use_cache and cache_key in self._cache:
-            logger.info(f"Using cached data for {ticker}")
+            logger.debug("Using cached data for %s", ticker)
             return self._cache[cache_key]
         
         # Rate limiting
@@ -131,8 +141,8 @@ class TCBSConnector:
         }
         
         try:
-            logger.info(f"Fetching historical data for {ticker} ({days} days)")
-            response = self.session.get(url, params=params, timeout=10)
+            logger.debug("Fetching historical data for %s (%d days)", ticker, days)
+            response = self._get('historical', url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -147,17 +157,17 @@ class TCBSConnector:
                 if use_cache and not df.empty:
                     self._cache[cache_key] = df
                 
-                logger.info(f"✓ Fetched {len(df)} records for {ticker}")
+                logger.debug("Fetched %d records for %s", len(df), ticker)
                 return df
             else:
-                logger.warning(f"No data returned for {ticker}")
+                logger.warning("No data returned for %s", ticker)
                 return pd.DataFrame()
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching data from TCBS: {e}")
+            logger.error("Error fetching %s from TCBS: %s", ticker, e)
             return pd.DataFrame()
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error fetching %s: %s", ticker, e)
             return pd.DataFrame()
     
     def _process_price_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -262,14 +272,14 @@ class TCBSConnector:
         }
         
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get('intraday', url, params=params)
             response.raise_for_status()
             data = response.json()
             
             if 'data' in data:
                 df = pd.DataFrame(data['data'])
                 df = self._process_price_data(df)
-                logger.info(f"✓ Fetched intraday data for {ticker}")
+                logger.debug("Fetched intraday data for %s", ticker)
                 return df
             else:
                 return pd.DataFrame()
@@ -291,7 +301,7 @@ class TCBSConnector:
         url = f"{self.BASE_URL}/stock-insight/v1/market/overview"
         
         try:
-            response = self.session.get(url, timeout=10)
+            response = self._get('market_overview', url)
             response.raise_for_status()
             data = response.json()
             
@@ -302,6 +312,7 @@ class TCBSConnector:
             logger.error(f"Failed to fetch market overview: {e}")
             return {}
     
+    @timed('indicators.tcbs')
     def calculate_technical_indicators(
         self,
         df: pd.DataFrame,
@@ -362,7 +373,7 @@ class TCBSConnector:
         if 'volume' in df.columns:
             df['volume_SMA'] = df['volume'].rolling(window=20).mean()
         
-        logger.info(f"✓ Calculated {len(indicators)} technical indicators")
+        logger.debug("Calculated %d technical indicators", len(indicators))
         
         return df
     
@@ -398,28 +409,27 @@ class TCBSConnector:
         """
         result = {}
         
-        for ticker in tickers:
-            try:
-                if start_date and end_date:
-                    df = self.fetch_historical_price(
-                        ticker, 
-                        start_date=start_date, 
-                        end_date=end_date
-                    )
-                else:
-                    df = self.fetch_historical_price(ticker, days=days)
-                    
-                if not df.empty:
-                    result[ticker] = df
-                    logger.info(f"✓ Fetched data for {ticker}")
-                else:
-                    logger.warning(f"No data for {ticker}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to fetch {ticker}: {e}")
-                continue
-        
-        logger.info(f"✓ Fetched data for {len(result)}/{len(tickers)} tickers")
+        with BatchLog(logger, "TCBS fetch") as batch:
+            for ticker in tickers:
+                try:
+                    if start_date and end_date:
+                        df = self.fetch_historical_price(
+                            ticker, 
+                            start_date=start_date, 
+                            end_date=end_date
+                        )
+                    else:
+                        df = self.fetch_historical_price(ticker, days=days)
+                        
+                    if not df.empty:
+                        result[ticker] = df
+                        batch.add(ticker)
+                    else:
+                        batch.add(ticker, False, "no data")
+                        
+                except Exception as e:
+                    batch.add(ticker, False, str(e))
+                    continue
         
         return result
     
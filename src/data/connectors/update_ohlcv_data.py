@@ -7,19 +7,16 @@ import pandas as pd
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 import logging
-from tqdm import tqdm
 import time
 
 # Import from same directory
 from .ohlcv_connector import OHLCVConnector
 from .ohlcv_cache import OHLCVCacheManager
+from src.data.universe import get_universe
+from src.core.log_policy import BatchLog, configure_logging
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class OHLCVUpdater:
@@ -38,14 +35,12 @@ class OHLCVUpdater:
         
         # Load ticker list
         self.tickers = self._load_tickers()
-        logger.info(f"Loaded {len(self.tickers)} tickers from database")
+        logger.info("Loaded %d tickers from database", len(self.tickers))
     
     def _load_tickers(self) -> list:
-        """Load unique tickers from parquet file"""
+        """Load tickers from the cached universe registry"""
         try:
-            df = pd.read_parquet(self.parquet_path)
-            tickers = df['SECURITY_CODE'].unique().tolist()
-            return sorted(tickers)
+            return list(get_universe({'parquet': Path(self.parquet_path)}).tickers)
         except Exception as e:
             logger.error(f"Failed to load tickers: {e}")
             return []
@@ -53,7 +48,8 @@ class OHLCVUpdater:
     def update_ticker(self, 
                      symbol: str, 
                      days_back: int = 365,
-                     force_update: bool = False) -> bool:
+                     force_update: bool = False,
+                     start_date: Optional[str] = None) -> bool:
         """
         Update OHLCV data for a single ticker
         
@@ -61,6 +57,7 @@ class OHLCVUpdater:
             symbol: Stock symbol
             days_back: Number of days to fetch
             force_update: Force update even if cache is valid
+            start_date: First date to fetch (YYYY-MM-DD), overrides days_back
             
         Returns:
             True if successful, False otherwise
@@ -68,15 +65,15 @@ class OHLCVUpdater:
         try:
             # Check cache validity
             if not force_update and self.cache.is_cache_valid(symbol, max_age_hours=24):
-                logger.debug(f"Cache is valid for {symbol}, skipping update")
+                logger.debug("Cache is valid for %s, skipping update", symbol)
                 return True
             
             # Calculate date range
             end_date = datetime.now().strftime('%Y-%m-%d')
-            start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            start_date = start_date or (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
             
             # Fetch new data
-            logger.info(f"Fetching data for {symbol} from {start_date} to {end_date}")
+            logger.debug("Fetching data for %s from %s to %s", symbol, start_date, end_date)
             df = self.connector.get_ohlcv(symbol, start_date, end_date, '1D')
             
             if not df.empty:
@@ -84,11 +81,11 @@ class OHLCVUpdater:
                 self.cache.save_ohlcv(symbol, df, '1D')
                 return True
             else:
-                logger.warning(f"No data received for {symbol}")
+                logger.debug("No data received for %s", symbol)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error updating {symbol}: {e}")
+            logger.error("Error updating %s: %s", symbol, e)
             return False
     
     def update_all(self, 
@@ -103,38 +100,23 @@ class OHLCVUpdater:
             delay: Delay between batches (seconds)
             force_update: Force update all tickers
         """
-        logger.info(f"Starting update for {len(self.tickers)} tickers")
+        from tqdm import tqdm  # Only bulk updates need the progress bar
         
-        success_count = 0
-        failed_tickers = []
+        logger.info("Starting update for %d tickers", len(self.tickers))
         
-        # Process tickers with progress bar
-        for i, ticker in enumerate(tqdm(self.tickers, desc="Updating OHLCV")):
-            if self.update_ticker(ticker, force_update=force_update):
-                success_count += 1
-            else:
-                failed_tickers.append(ticker)
-            
-            # Add delay after batch
-            if (i + 1) % batch_size == 0:
-                time.sleep(delay)
-        
-        # Print summary
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Update Summary:")
-        logger.info(f"  Total tickers: {len(self.tickers)}")
-        logger.info(f"  Successful: {success_count}")
-        logger.info(f"  Failed: {len(failed_tickers)}")
-        
-        if failed_tickers:
-            logger.warning(f"  Failed tickers: {failed_tickers[:10]}...")
+        # Process tickers with progress bar; one summary line at the end
+        with BatchLog(logger, "OHLCV update") as batch:
+            for i, ticker in enumerate(tqdm(self.tickers, desc="Updating OHLCV")):
+                batch.add(ticker, self.update_ticker(ticker, force_update=force_update))
+                
+                # Add delay after batch
+                if (i + 1) % batch_size == 0:
+                    time.sleep(delay)
         
         # Show cache stats
         stats = self.cache.get_cache_stats()
-        logger.info(f"\nCache Statistics:")
-        logger.info(f"  Cached symbols: {stats['symbol_count']}")
-        logger.info(f"  Total records: {stats['total_records']:,}")
-        logger.info(f"  Database size: {stats['db_size_mb']:.2f} MB")
+        logger.info("Cache: %d symbols, %d records, %.2f MB",
+                    stats['symbol_count'], stats['total_records'], stats['db_size_mb'])
     
     def update_selected(self, symbols: list, force_update: bool = False):
         """
@@ -144,10 +126,55 @@ class OHLCVUpdater:
             symbols: List of symbols to update
             force_update: Force update even if cache is valid
         """
-        logger.info(f"Updating {len(symbols)} selected tickers")
+        from tqdm import tqdm  # Only bulk updates need the progress bar
+        
+        with BatchLog(logger, "OHLCV update (selected)") as batch:
+            for symbol in tqdm(symbols, desc="Updating"):
+                batch.add(symbol, self.update_ticker(symbol, force_update=force_update))
+    
+    def refetch_adjusted(self):
+        """
+        Re-fetch the full history of tickers with recorded price adjustments
+        
+        Each ticker is fetched from its oldest cached bar, so the new bars
+        replace the mixed ones and its adjustment factors are dropped. Tickers
+        whose provider history starts later keep their factors.
+        """
+        symbols = self.cache.adjustments.symbols()
+        logger.info("Re-fetching %d adjusted tickers", len(symbols))
+        with BatchLog(logger, "OHLCV refetch (adjusted)") as batch:
+            for symbol in symbols:
+                start_date = self.cache.get_first_date(symbol)
+                batch.add(symbol, self.update_ticker(symbol, force_update=True, start_date=start_date))
         
-        for symbol in tqdm(symbols, desc="Updating"):
-            self.update_ticker(symbol, force_update=force_update)
+        remaining = self.cache.adjustments.symbols()
+        if remaining:
+            logger.warning("%d tickers still have adjustment factors (history not re-fetched "
+                           "back to the first cached bar): %s", len(remaining), ', '.join(remaining))
+    
+    def update_intraday(self, symbols: list, resolution: str = '5', store=None):
+        """
+        Fetch intraday bars and append them to the intraday store
+        
+        Meant to run repeatedly during the session; closed days are compacted
+        and expired days deleted once the symbols are written.
+        
+        Args:
+            symbols: List of symbols to fetch
+            resolution: Time resolution in minutes ('1', '5', '15', '30', '60')
+            store: IntradayStore (default location if omitted)
+        """
+        # pyarrow is only needed by intraday ingestion
+        from .intraday_store import IntradayStore
+        
+        store = store or IntradayStore()
+        with BatchLog(logger, f"Intraday update ({resolution}m)") as batch, \
+                store.writer(resolution) as writer:
+            for symbol in symbols:
+                df = self.connector.get_intraday(symbol, resolution)
+                writer.add(symbol, df)
+                batch.add(symbol, not df.empty)
+        store.maintain()
     
     def get_ticker_data(self, symbol: str) -> pd.DataFrame:
         """
@@ -164,7 +191,7 @@ class OHLCVUpdater:
         
         if df is None or df.empty:
             # Fetch new data
-            logger.info(f"No cached data for {symbol}, fetching...")
+            logger.debug("No cached data for %s, fetching...", symbol)
             self.update_ticker(symbol)
             df = self.cache.get_ohlcv(symbol)
         
@@ -175,19 +202,36 @@ def main():
     """Main function"""
     import argparse
     
+    configure_logging()
+    
     parser = argparse.ArgumentParser(description='Update OHLCV data')
     parser.add_argument('--tickers', nargs='+', help='Specific tickers to update')
     parser.add_argument('--all', action='store_true', help='Update all tickers')
     parser.add_argument('--force', action='store_true', help='Force update even if cache is valid')
     parser.add_argument('--days', type=int, default=365, help='Number of days to fetch')
     parser.add_argument('--batch-size', type=int, default=10, help='Batch size for API calls')
+    parser.add_argument('--rebuild-rollups', action='store_true',
+                        help='Rebuild weekly/monthly bars from the cached daily bars')
+    parser.add_argument('--refetch-adjusted', action='store_true',
+                        help='Re-fetch tickers with detected price adjustments from their first cached bar')
+    parser.add_argument('--intraday', choices=['1', '5', '15', '30', '60'],
+                        help='Append intraday bars of this resolution (minutes) to the intraday store')
     
     args = parser.parse_args()
     
     # Initialize updater
     updater = OHLCVUpdater()
     
-    if args.tickers:
+    if args.intraday:
+        # Intraday session ingest for the given tickers (all tickers otherwise)
+        updater.update_intraday(args.tickers or updater.tickers, args.intraday)
+    elif args.refetch_adjusted:
+        # Only tickers whose cached history mixes price scales
+        updater.refetch_adjusted()
+    elif args.rebuild_rollups:
+        # Backfill 1W/1M bars (daily saves keep them current afterwards)
+        updater.cache.rebuild_rollups(args.tickers)
+    elif args.tickers:
         # Update specific tickers
         updater.update_selected(args.tickers, force_update=args.force)
     elif args.all:
@@ -201,6 +245,9 @@ def main():
         print("  python update_ohlcv_data.py --tickers VNM HPG VIC")
         print("  python update_ohlcv_data.py --all")
         print("  python update_ohlcv_data.py --all --force")
+        print("  python update_ohlcv_data.py --rebuild-rollups")
+        print("  python update_ohlcv_data.py --refetch-adjusted")
+        print("  python update_ohlcv_data.py --intraday 5 --tickers VNM HPG")
         print("\nUpdating top 10 tickers as demo...")
         
         top_tickers = updater.tickers[:10]
@@ -10,16 +10,71 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
+from typing import TYPE_CHECKING, Optional
 
 # Import from same directory
-from .update_ohlcv_data import OHLCVUpdater
+from src.analysis.technical.signal_engine import SignalStore, crossings
+from src.core.instrumentation import timed
+from src.visualization.chart_cache import FigureCache
+from src.visualization.downsampling import ChartDownsampler
+
+if TYPE_CHECKING:
+    from .update_ohlcv_data import OHLCVUpdater
 
 class OHLCVVisualizer:
     """Create interactive OHLCV charts with technical indicators"""
     
-    def __init__(self):
-        """Initialize visualizer"""
-        self.updater = OHLCVUpdater()
+    def __init__(self, updater: Optional['OHLCVUpdater'] = None,
+                 downsampler: Optional[ChartDownsampler] = None,
+                 figure_cache: Optional[FigureCache] = None,
+                 signal_store: Optional[SignalStore] = None):
+        """
+        Initialize visualizer
+        
+        Args:
+            updater: Shared updater (a new one is created if omitted)
+            downsampler: Point budget for candles and line traces
+            figure_cache: Cache of built figures
+            signal_store: Signal events used for crossover markers
+                          (computed per chart if omitted)
+        """
+        if updater is None:
+            # The updater pulls in the TCBS connector; import it only when needed
+            from .update_ohlcv_data import OHLCVUpdater
+            updater = OHLCVUpdater()
+        self.updater = updater
+        self.downsampler = downsampler or ChartDownsampler()
+        self.figure_cache = figure_cache or FigureCache()
+        self.signal_store = signal_store
+    
+    def _cached_figure(self, kind: str, symbols, days: int, options: dict, build):
+        """
+        Get a figure from the cache or build it
+        
+        Figures are only cached when every symbol already has cached bars, so
+        the version reflects the data the figure is built from.
+        
+        Args:
+            kind: Chart kind
+            symbols: Symbol or list of symbols
+            days: Number of days displayed
+            options: Indicator/display options
+            build: Figure builder
+            
+        Returns:
+            Plotly figure object (or None)
+        """
+        cache = self.updater.cache
+        names = [symbols] if isinstance(symbols, str) else list(symbols)
+        if not set(names).issubset(cache.get_cached_symbols('1D')):
+            return build()
+        versions = [cache.get_data_version('1D', s) for s in names]
+        
+        options = {**options, 'downsampler': (self.downsampler.max_points,
+                                              self.downsampler.max_candles,
+                                              self.downsampler.webgl_threshold)}
+        key = self.figure_cache.make_key(kind, symbols, days, options, '|'.join(versions))
+        return self.figure_cache.get_or_build(key, build)
         
     def calculate_ema(self, prices: pd.Series, period: int) -> pd.Series:
         """
@@ -56,19 +111,13 @@ class OHLCVVisualizer:
             ema_long: Long period EMA
             
         Returns:
-            Tuple of (golden_crosses, death_crosses) as DataFrames
+            Tuple of (golden_crosses, death_crosses) as boolean Series
         """
-        # Calculate the difference
-        diff = ema_short - ema_long
-        
-        # Find sign changes
-        sign_change = np.sign(diff).diff()
-        
-        # Golden cross (short crosses above long)
-        golden_crosses = sign_change > 0
+        direction = crossings(ema_short, ema_long)
         
-        # Death cross (short crosses below long)
-        death_crosses = sign_change < 0
+        # Golden cross (short crosses above long), death cross (short crosses below long)
+        golden_crosses = pd.Series(direction > 0, index=ema_short.index)
+        death_crosses = pd.Series(direction < 0, index=ema_short.index)
         
         return golden_crosses, death_crosses
     
@@ -79,7 +128,37 @@ class OHLCVVisualizer:
                                 show_sma: bool = False,
                                 show_volume: bool = True) -> go.Figure:
         """
-        Create interactive candlestick chart with indicators
+        Create interactive candlestick chart with indicators (cached per data version)
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days to display
+            show_ema: Show EMA 9 and EMA 21
+            show_sma: Show SMA 50 and SMA 200
+            show_volume: Show volume chart
+            
+        Returns:
+            Plotly figure object
+        """
+        options = {'show_ema': show_ema, 'show_sma': show_sma, 'show_volume': show_volume}
+        return self._cached_figure(
+            'candlestick', symbol, days, options,
+            lambda: self._build_candlestick_chart(symbol, days, show_ema, show_sma, show_volume)
+        )
+    
+    @timed('chart.ohlcv_candlestick')
+    def _build_candlestick_chart(self, 
+                                 symbol: str,
+                                 days: int = 180,
+                                 show_ema: bool = True,
+                                 show_sma: bool = False,
+                                 show_volume: bool = True) -> go.Figure:
+        """
+        Build the candlestick chart
+        
+        Indicators are computed on daily bars; long ranges are then drawn as
+        weekly/monthly candles (read from the cache's rollup bars) with
+        LTTB-downsampled lines.
         
         Args:
             symbol: Stock symbol
@@ -98,19 +177,36 @@ class OHLCVVisualizer:
             print(f"No data available for {symbol}")
             return None
         
+        # Calculate indicators over the full history so long windows are warmed up
+        df = df.assign(
+            EMA9=self.calculate_ema(df['close'], 9),
+            EMA21=self.calculate_ema(df['close'], 21),
+            SMA50=self.calculate_sma(df['close'], 50),
+            SMA200=self.calculate_sma(df['close'], 200)
+        )
+        
         # Filter to requested days
         end_date = df.index.max()
         start_date = end_date - timedelta(days=days)
         df = df[df.index >= start_date]
         
-        # Calculate indicators
-        df['EMA9'] = self.calculate_ema(df['close'], 9)
-        df['EMA21'] = self.calculate_ema(df['close'], 21)
-        df['SMA50'] = self.calculate_sma(df['close'], 50)
-        df['SMA200'] = self.calculate_sma(df['close'], 200)
+        # Find crossovers (from the signal events table when available)
+        if self.signal_store is not None:
+            events = self.signal_store.query(symbol, ['ema_cross'], start=start_date, end=end_date)
+            golden_crosses = df.index.isin(events.loc[events['direction'] > 0, 'date'])
+            death_crosses = df.index.isin(events.loc[events['direction'] < 0, 'date'])
+        else:
+            golden_crosses, death_crosses = self.find_ema_crossovers(df['EMA9'], df['EMA21'])
         
-        # Find crossovers
-        golden_crosses, death_crosses = self.find_ema_crossovers(df['EMA9'], df['EMA21'])
+        # Candles and lines within the point budget
+        bars, resolution = self.downsampler.prepare_ohlc(
+            df[['open', 'high', 'low', 'close', 'volume']],
+            lambda label, start, end: self.updater.cache.get_ohlcv(symbol, start, end, resolution=f'1{label}')
+        )
+        line_columns = (['EMA9', 'EMA21'] if show_ema else []) + (['SMA50', 'SMA200'] if show_sma else [])
+        lines = {col: self.downsampler.line(df.index, df[col]) for col in line_columns}
+        scatter = self.downsampler.scatter_class(sum(len(x) for x, _ in lines.values()))
+        chart_title = f'{symbol} - Candlestick Chart' + (f' ({resolution})' if resolution != 'D' else '')
         
         # Create subplots
         if show_volume:
@@ -118,23 +214,23 @@ class OHLCVVisualizer:
                 rows=2, cols=1,
                 shared_xaxes=True,
                 vertical_spacing=0.03,
-                subplot_titles=(f'{symbol} - Candlestick Chart', 'Volume'),
+                subplot_titles=(chart_title, 'Volume'),
                 row_heights=[0.7, 0.3]
             )
         else:
             fig = make_subplots(
                 rows=1, cols=1,
-                subplot_titles=(f'{symbol} - Candlestick Chart',)
+                subplot_titles=(chart_title,)
             )
         
         # Add candlestick chart
         fig.add_trace(
             go.Candlestick(
-                x=df.index,
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
+                x=bars.index,
+                open=bars['open'],
+                high=bars['high'],
+                low=bars['low'],
+                close=bars['close'],
                 name='OHLC',
                 increasing_line_color='green',
                 decreasing_line_color='red'
@@ -145,9 +241,9 @@ class OHLCVVisualizer:
         # Add EMA lines
         if show_ema:
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['EMA9'],
+                scatter(
+                    x=lines['EMA9'][0],
+                    y=lines['EMA9'][1],
                     name='EMA 9',
                     line=dict(color='blue', width=1),
                     opacity=0.8
@@ -156,9 +252,9 @@ class OHLCVVisualizer:
             )
             
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['EMA21'],
+                scatter(
+                    x=lines['EMA21'][0],
+                    y=lines['EMA21'][1],
                     name='EMA 21',
                     line=dict(color='orange', width=1),
                     opacity=0.8
@@ -204,9 +300,9 @@ class OHLCVVisualizer:
         # Add SMA lines
         if show_sma:
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['SMA50'],
+                scatter(
+                    x=lines['SMA50'][0],
+                    y=lines['SMA50'][1],
                     name='SMA 50',
                     line=dict(color='purple', width=1, dash='dash'),
                     opacity=0.6
@@ -215,9 +311,9 @@ class OHLCVVisualizer:
             )
             
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['SMA200'],
+                scatter(
+                    x=lines['SMA200'][0],
+                    y=lines['SMA200'][1],
                     name='SMA 200',
                     line=dict(color='gray', width=1, dash='dash'),
                     opacity=0.6
@@ -227,13 +323,12 @@ class OHLCVVisualizer:
         
         # Add volume chart
         if show_volume:
-            colors = ['red' if row['close'] < row['open'] else 'green' 
-                     for _, row in df.iterrows()]
+            colors = np.where(bars['close'] < bars['open'], 'red', 'green')
             
             fig.add_trace(
                 go.Bar(
-                    x=df.index,
-                    y=df['volume'],
+                    x=bars.index,
+                    y=bars['volume'],
                     name='Volume',
                     marker_color=colors,
                     opacity=0.5
@@ -274,7 +369,24 @@ class OHLCVVisualizer:
     
     def create_multi_ticker_chart(self, symbols: list, days: int = 90) -> go.Figure:
         """
-        Create comparison chart for multiple tickers
+        Create comparison chart for multiple tickers (cached per data version)
+        
+        Args:
+            symbols: List of stock symbols
+            days: Number of days to display
+            
+        Returns:
+            Plotly figure object
+        """
+        return self._cached_figure(
+            'comparison', list(symbols), days, {},
+            lambda: self._build_multi_ticker_chart(symbols, days)
+        )
+    
+    @timed('chart.multi_ticker')
+    def _build_multi_ticker_chart(self, symbols: list, days: int = 90) -> go.Figure:
+        """
+        Build the comparison chart
         
         Args:
             symbols: List of stock symbols
@@ -285,6 +397,7 @@ class OHLCVVisualizer:
         """
         fig = go.Figure()
         
+        series = {}
         for symbol in symbols:
             df = self.updater.get_ticker_data(symbol)
             
@@ -299,11 +412,14 @@ class OHLCVVisualizer:
             
             # Normalize prices (percentage change from first day)
             normalized = (df['close'] / df['close'].iloc[0] - 1) * 100
-            
+            series[symbol] = self.downsampler.line(df.index, normalized)
+        
+        scatter = self.downsampler.scatter_class(sum(len(x) for x, _ in series.values()))
+        for symbol, (x, y) in series.items():
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=normalized,
+                scatter(
+                    x=x,
+                    y=y,
                     name=symbol,
                     mode='lines'
                 )
@@ -320,6 +436,7 @@ class OHLCVVisualizer:
         
         return fig
     
+    @timed('analysis.market_breadth')
     def analyze_market_breadth(self, symbols: list = None, progress_callback=None, batch_size: int = 10, min_trading_value: float = 3_000_000_000) -> dict:
         """
         Analyze market breadth based on MA positions (optimized version)
@@ -3,13 +3,13 @@ Data loaders for various data sources
 """
 
 from .base_loader import BaseLoader
-from .financial_loader import FinancialLoader
-from .market_loader import MarketLoader
+from .financial_loader import FinancialDataLoader
+from .market_loader import MarketDataLoader
 from .metadata_loader import MetadataLoader
 
 __all__ = [
     'BaseLoader',
-    'FinancialLoader',
-    'MarketLoader',
+    'FinancialDataLoader',
+    'MarketDataLoader',
     'MetadataLoader'
 ]
\ No newline at end of file
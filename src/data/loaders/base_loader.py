@@ -7,7 +7,7 @@ from typing import Any, Optional, Dict, List
 import pandas as pd
 from pathlib import Path
 
-from src.core.config import AppConfig
+from src.core.config import AppConfig, get_config
 from src.core.data_manager import DataManager
 from src.core.exceptions import DataLoadError
 
@@ -24,9 +24,11 @@ class BaseLoader(ABC):
             config: Configuration object
             data_manager: Data manager instance
         """
-        self.config = config or AppConfig()
+        self.config = config or get_config()
         self.data_manager = data_manager or DataManager(self.config)
-        self._cache = {}
+        
+        # Share the data manager's bounded memory cache
+        self._cache = self.data_manager.memory_cache
     
     @abstractmethod
     def load(self, *args, **kwargs) -> Any:
@@ -61,14 +63,8 @@ class BaseLoader(ABC):
         Returns:
             Cached data or None
         """
-        # Try data manager cache first
-        if self.data_manager:
-            cached = self.data_manager.get_cached_data(key)
-            if cached is not None:
-                return cached
-        
-        # Try local cache
-        return self._cache.get(key)
+        # Data manager checks its memory cache, then disk
+        return self.data_manager.get_cached_data(key)
     
     def save_to_cache(self, key: str, data: Any) -> None:
         """
@@ -78,12 +74,8 @@ class BaseLoader(ABC):
             key: Cache key
             data: Data to cache
         """
-        # Save to data manager cache
-        if self.data_manager:
-            self.data_manager.cache_data(key, data)
-        
-        # Save to local cache
-        self._cache[key] = data
+        # Save to data manager cache (memory + disk)
+        self.data_manager.cache_data(key, data)
     
     def load_parquet(self, file_path: str) -> pd.DataFrame:
         """
@@ -5,11 +5,13 @@ Handles OHLCV data loading, caching, and real-time updates
 
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Dict, Tuple
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import logging
 from functools import lru_cache
-import time
+
+from src.core.instrumentation import timed
+from src.core.memory_cache import MemoryCache, readonly_view
 
 try:
     from vnstock_data import get_stock_data
@@ -24,20 +26,25 @@ logger = logging.getLogger(__name__)
 class MarketDataLoader:
     """Market data loader for OHLCV data using vnstock_data"""
     
-    def __init__(self, cache_ttl: int = 300):
+    def __init__(self, cache_ttl: int = 300, max_cache_mb: int = 256):
         """
         Initialize market data loader
         
         Args:
             cache_ttl: Cache time-to-live in seconds (default: 5 minutes)
+            max_cache_mb: Memory budget for cached OHLCV frames in MB
         """
         self.cache_ttl = cache_ttl
-        self._cache = {}
-        self._cache_timestamps = {}
+        self._cache = MemoryCache(
+            max_bytes=max_cache_mb * 1024 * 1024,
+            ttl=cache_ttl,
+            name="market_data"
+        )
         
         if not VNSTOCK_AVAILABLE:
             raise ImportError("vnstock_data is required. Install with: pip install vnstock_data")
     
+    @timed('loader.market_ohlcv')
     def get_stock_ohlcv(
         self, 
         symbol: str, 
@@ -60,9 +67,10 @@ class MarketDataLoader:
         try:
             # Check cache first
             cache_key = f"{symbol}_{start_date}_{end_date}_{period}"
-            if self._is_cache_valid(cache_key):
-                logger.info(f"Using cached data for {symbol}")
-                return self._cache[cache_key].copy()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached data for {symbol}")
+                return cached
             
             # Get fresh data
             logger.info(f"Fetching fresh data for {symbol}")
@@ -80,10 +88,10 @@ class MarketDataLoader:
             # Standardize column names
             data = self._standardize_columns(data)
             
-            # Cache the data
-            self._cache_data(cache_key, data)
+            # Cache the data and hand out a read-only view
+            self._cache.set(cache_key, data)
             
-            return data.copy()
+            return readonly_view(data)
             
         except Exception as e:
             logger.error(f"Error fetching data for {symbol}: {str(e)}")
@@ -195,31 +203,17 @@ class MarketDataLoader:
         
         return data
     
-    def _cache_data(self, key: str, data: pd.DataFrame):
-        """Cache data with timestamp"""
-        self._cache[key] = data.copy()
-        self._cache_timestamps[key] = time.time()
-    
-    def _is_cache_valid(self, key: str) -> bool:
-        """Check if cached data is still valid"""
-        if key not in self._cache or key not in self._cache_timestamps:
-            return False
-        
-        cache_age = time.time() - self._cache_timestamps[key]
-        return cache_age < self.cache_ttl
-    
     def clear_cache(self):
         """Clear all cached data"""
         self._cache.clear()
-        self._cache_timestamps.clear()
         logger.info("Cache cleared")
     
-    def get_cache_info(self) -> Dict[str, int]:
+    def get_cache_info(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return {
-            'cached_items': len(self._cache),
-            'cache_size_mb': sum(df.memory_usage(deep=True).sum() for df in self._cache.values()) / 1024 / 1024
-        }
+        stats = self._cache.get_stats()
+        stats['cached_items'] = stats['entries']
+        stats['cache_size_mb'] = stats['size_mb']
+        return stats
 
 
 # Utility functions
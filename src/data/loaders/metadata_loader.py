@@ -48,10 +48,8 @@ class MetadataLoader(BaseLoader):
         if metadata.empty:
             return None
         
-        # Look for metric in metadata
-        if 'code' in metadata.columns:
-            metric_row = metadata[metadata['code'] == metric_code]
-            if not metric_row.empty:
-                return metric_row.iloc[0].to_dict()
-        
-        return None
\ No newline at end of file
+        # O(1) lookup through the metric code index
+        position = self.data_manager.get_metadata_index().get(str(metric_code))
+        if position is None:
+            return None
+        return metadata.iloc[position].to_dict()
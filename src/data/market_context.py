@@ -0,0 +1,198 @@
+"""
+Market Data Context - OHLCV panel loaded once per data version with
+vectorized per-symbol snapshots for movers, volume leaders, breadth, risk
+and correlated peers
+"""
+
+from datetime import timedelta
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.technical.movers import MoversEngine
+from src.analysis.technical.peers import PeerIndex
+from src.analysis.technical.risk_engine import RiskEngine
+
+
+class MarketDataContext:
+    """Daily OHLCV panel plus a latest-bar snapshot for every symbol"""
+
+    def __init__(self, panel: pd.DataFrame, version: str = "",
+                 sectors: Optional[Mapping[str, str]] = None):
+        """
+        Initialize context
+
+        Args:
+            panel: Long frame with symbol, date, open, high, low, close, volume
+                   sorted by symbol and date
+            version: Data version the panel was loaded at
+            sectors: Optional symbol -> sector mapping
+        """
+        self.panel = panel
+        self.version = version
+        self.sectors = dict(sectors or {})
+        self.snapshot = self._build_snapshot(panel)
+
+    @cached_property
+    def movers_engine(self) -> MoversEngine:
+        """Movers engine over the panel (built on first use)"""
+        return MoversEngine(self.panel, sectors=self.sectors)
+
+    @cached_property
+    def risk_engine(self) -> RiskEngine:
+        """Risk engine over the panel (built on first use)"""
+        return RiskEngine(self.panel)
+
+    @cached_property
+    def peer_index(self) -> PeerIndex:
+        """Correlated-peer index, stored on disk per data version (built on first use)"""
+        return PeerIndex.load_or_build(self.risk_engine.returns, self.version)
+
+    @staticmethod
+    def _build_snapshot(panel: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute latest values and indicators for all symbols at once
+
+        Args:
+            panel: Long OHLCV panel
+
+        Returns:
+            DataFrame indexed by symbol
+        """
+        columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'prev_close',
+                   'change_pct', 'avg_volume_20', 'volume_ratio', 'trading_value',
+                   'ma20', 'ma50', 'ma200', 'ema9', 'ema21', 'bars']
+        if panel.empty:
+            return pd.DataFrame(columns=columns)
+
+        grouped = panel.groupby('symbol', observed=True, sort=False)
+        # Position of each row counted from the symbol's latest bar (0 = latest)
+        from_end = grouped.cumcount(ascending=False)
+
+        def per_symbol(series: pd.Series) -> pd.Series:
+            series.index = series.index.astype(str)
+            return series
+
+        snapshot = per_symbol(grouped[['date', 'open', 'high', 'low', 'close', 'volume']].last())
+        snapshot['bars'] = per_symbol(grouped.size())
+        snapshot['prev_close'] = per_symbol(panel.loc[from_end == 1].set_index('symbol')['close'])
+        snapshot['change_pct'] = (snapshot['close'] / snapshot['prev_close'] - 1) * 100
+
+        # Same windows as the per-symbol breadth analysis, computed per group in C
+        for window in (20, 50, 200):
+            tail = panel.loc[from_end < window].groupby('symbol', observed=True)
+            snapshot[f'ma{window}'] = per_symbol(tail['close'].mean()).where(snapshot['bars'] >= window)
+
+        recent_volume = per_symbol(
+            panel.loc[from_end < 20].groupby('symbol', observed=True)['volume'].mean()
+        )
+        all_volume = per_symbol(grouped['volume'].mean())
+        snapshot['avg_volume_20'] = recent_volume.where(snapshot['bars'] > 20, all_volume)
+        snapshot['volume_ratio'] = np.where(
+            snapshot['avg_volume_20'] > 0, snapshot['volume'] / snapshot['avg_volume_20'], 0.0
+        )
+
+        for span in (9, 21):
+            ema = grouped['close'].ewm(span=span, adjust=False).mean()
+            last_ema = per_symbol(ema.groupby(level=0, observed=True).last())
+            snapshot[f'ema{span}'] = last_ema.where(snapshot['bars'] >= span)
+
+        snapshot['trading_value'] = snapshot['close'] * snapshot['volume']
+        return snapshot[columns]
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols present in the panel"""
+        return list(self.snapshot.index)
+
+    def history(self, symbol: str, days: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the bars of one symbol
+
+        Args:
+            symbol: Stock symbol
+            days: Optional calendar-day lookback from the symbol's last bar
+
+        Returns:
+            DataFrame indexed by date
+        """
+        symbols = self.panel['symbol']
+        if isinstance(symbols.dtype, pd.CategoricalDtype):
+            code = symbols.cat.categories.get_indexer([symbol])[0]
+            codes = symbols.cat.codes.to_numpy()
+            start = int(np.searchsorted(codes, code, side='left')) if code >= 0 else 0
+            stop = int(np.searchsorted(codes, code, side='right')) if code >= 0 else 0
+            df = self.panel.iloc[start:stop]
+        else:
+            df = self.panel[symbols == symbol]
+
+        df = df.drop(columns='symbol').set_index('date')
+        if days is not None and not df.empty:
+            df = df[df.index >= df.index.max() - timedelta(days=days)]
+        return df
+
+    def performance(self, symbols: List[str], days: int) -> pd.DataFrame:
+        """
+        Get price change over a calendar-day window for each symbol
+
+        Args:
+            symbols: Symbols to compare
+            days: Lookback in calendar days
+
+        Returns:
+            DataFrame with start_price, end_price and change_pct per symbol
+        """
+        panel = self.panel[self.panel['symbol'].isin(symbols)]
+        if panel.empty:
+            return pd.DataFrame(columns=['start_price', 'end_price', 'change_pct'])
+
+        last_date = panel.groupby('symbol', observed=True)['date'].transform('max')
+        window = panel[panel['date'] >= last_date - pd.Timedelta(days=days)]
+        grouped = window.groupby('symbol', observed=True)['close']
+        result = pd.DataFrame({'start_price': grouped.first(), 'end_price': grouped.last()})
+        result['change_pct'] = (result['end_price'] / result['start_price'] - 1) * 100
+        result.index = result.index.astype(str)
+        return result.reindex([s for s in symbols if s in result.index])
+
+    def breadth(self, symbols: Optional[List[str]] = None,
+                min_trading_value: float = 3_000_000_000) -> Dict[str, Any]:
+        """
+        Compute market breadth statistics
+
+        Returns the same structure as OHLCVVisualizer.analyze_market_breadth.
+
+        Args:
+            symbols: Symbols to analyze (None for all)
+            min_trading_value: Minimum latest trading value in VND
+
+        Returns:
+            Dictionary with market breadth statistics
+        """
+        requested = list(symbols) if symbols is not None else self.symbols
+        snapshot = self.snapshot.reindex(requested)
+
+        loaded = snapshot['bars'].fillna(0) >= 20
+        low_value = loaded & (snapshot['trading_value'] < min_trading_value)
+        analyzed = snapshot[loaded & ~low_value]
+
+        stats = {
+            'above_ma20': int((analyzed['close'] > analyzed['ma20']).sum()),
+            'above_ma50': int((analyzed['close'] > analyzed['ma50']).sum()),
+            'above_ma200': int((analyzed['close'] > analyzed['ma200']).sum()),
+            'ema9_above_ema21': int((analyzed['ema9'] > analyzed['ema21']).sum()),
+            'total': len(analyzed),
+            'analyzed': list(analyzed.index),
+            'failed': [],
+            'filtered_out': int(low_value.sum()),
+            'low_value_stocks': list(snapshot.index[low_value])
+        }
+
+        if stats['total'] > 0:
+            stats['pct_above_ma20'] = stats['above_ma20'] / stats['total'] * 100
+            stats['pct_above_ma50'] = stats['above_ma50'] / stats['total'] * 100
+            stats['pct_above_ma200'] = stats['above_ma200'] / stats['total'] * 100
+            stats['pct_ema_bullish'] = stats['ema9_above_ema21'] / stats['total'] * 100
+
+        return stats
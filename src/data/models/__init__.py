@@ -5,6 +5,7 @@ Data models for the VN Finance Dashboard
 from .company import Company, CompanyInfo
 from .financial import FinancialStatement, FinancialRatio, FinancialMetric
 from .market import MarketData, PriceData, VolumeData
+from .columnar import PriceSeries, MetricPanel
 
 __all__ = [
     'Company',
@@ -14,5 +15,7 @@ __all__ = [
     'FinancialMetric',
     'MarketData',
     'PriceData',
-    'VolumeData'
+    'VolumeData',
+    'PriceSeries',
+    'MetricPanel'
 ]
\ No newline at end of file
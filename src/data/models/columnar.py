@@ -0,0 +1,408 @@
+"""
+Columnar data models
+
+PriceSeries and MetricPanel hold whole batches of bars or fundamentals as
+NumPy arrays. The schema is validated once per batch (not once per row),
+and conversion to pandas reuses the arrays without copying.
+"""
+
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.exceptions import ValidationError
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+OPTIONAL_PRICE_FIELDS = ('volume', 'adjusted_close')
+
+# Long fundamentals columns: (ticker, metric, year, quarter, value)
+METRIC_PANEL_COLUMNS = ('SECURITY_CODE', 'METRIC_CODE', 'YEAR', 'QUARTER', 'METRIC_VALUE')
+
+
+def _float_array(values: Any, field: str) -> np.ndarray:
+    """View values as a float64 array (no copy for float64 input)"""
+    try:
+        return np.asarray(values, dtype='float64')
+    except (TypeError, ValueError) as e:
+        raise ValidationError(f"values must be numeric ({e})", field=field)
+
+
+def _date_array(values: Any) -> np.ndarray:
+    """View values as a datetime64 array (keeping the input's resolution)"""
+    values = np.asarray(values)
+    if values.dtype.kind != 'M':
+        values = pd.to_datetime(values).to_numpy()
+    return values
+
+
+def _last_valid(values: np.ndarray) -> Optional[float]:
+    """Last non-NaN value of an array"""
+    valid = np.flatnonzero(~np.isnan(values))
+    return float(values[valid[-1]]) if len(valid) else None
+
+
+class PriceSeries:
+    """Daily bars of one ticker as parallel arrays"""
+
+    __slots__ = ('ticker', 'dates', 'open', 'high', 'low', 'close', 'volume', 'adjusted_close')
+
+    def __init__(self, ticker: str, dates: Any, open: Any, high: Any, low: Any, close: Any,
+                 volume: Any = None, adjusted_close: Any = None, validate: bool = True):
+        """
+        Initialize price series
+
+        Args:
+            ticker: Stock ticker
+            dates: Trading dates (ascending)
+            open: Opening prices
+            high: High prices
+            low: Low prices
+            close: Closing prices
+            volume: Optional trading volumes
+            adjusted_close: Optional adjusted closing prices
+            validate: Check the batch schema
+        """
+        self.ticker = str(ticker).strip()
+        self.dates = _date_array(dates)
+        self.open = _float_array(open, 'open')
+        self.high = _float_array(high, 'high')
+        self.low = _float_array(low, 'low')
+        self.close = _float_array(close, 'close')
+        self.volume = _float_array(volume, 'volume') if volume is not None else None
+        self.adjusted_close = (_float_array(adjusted_close, 'adjusted_close')
+                               if adjusted_close is not None else None)
+        if validate:
+            self.validate()
+
+    def validate(self):
+        """
+        Validate the batch: equal lengths, ascending dates, sane prices
+
+        Raises:
+            ValidationError: If the schema is violated
+        """
+        n = len(self.dates)
+        for field in PRICE_FIELDS + OPTIONAL_PRICE_FIELDS:
+            values = getattr(self, field)
+            if values is not None and (values.ndim != 1 or len(values) != n):
+                raise ValidationError(f"expected {n} values, got {values.shape}", field=field)
+
+        if n > 1 and not (self.dates[1:] > self.dates[:-1]).all():
+            raise ValidationError("dates must be strictly ascending", field='dates')
+
+        with np.errstate(invalid='ignore'):
+            if (self.low > self.high).any():
+                raise ValidationError("low above high", field='low')
+            if (self.close < 0).any():
+                raise ValidationError("negative close", field='close')
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, ticker: Optional[str] = None,
+                   validate: bool = True) -> 'PriceSeries':
+        """
+        Create from an OHLCV frame
+
+        Args:
+            df: Frame indexed by date (or with a date/time column) and
+                open/high/low/close[/volume/adjusted_close] columns
+            ticker: Stock ticker (defaults to a ticker/symbol column)
+            validate: Check the batch schema
+
+        Returns:
+            PriceSeries sharing the frame's float64 arrays
+        """
+        missing = [c for c in PRICE_FIELDS if c not in df.columns]
+        if missing:
+            raise ValidationError(f"missing columns {missing}", field='columns')
+
+        date_column = next((c for c in ('date', 'time') if c in df.columns), None)
+        dates = df[date_column] if date_column else df.index
+        if ticker is None:
+            ticker_column = next((c for c in ('ticker', 'symbol') if c in df.columns), None)
+            ticker = str(df[ticker_column].iloc[0]) if ticker_column and len(df) else ''
+
+        return cls(
+            ticker, dates,
+            *(df[c].to_numpy() for c in PRICE_FIELDS),
+            **{c: df[c].to_numpy() for c in OPTIONAL_PRICE_FIELDS if c in df.columns},
+            validate=validate
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]], ticker: str = '',
+                     validate: bool = True) -> 'PriceSeries':
+        """
+        Create from row dictionaries (e.g. API responses)
+
+        Args:
+            records: Rows with date and price fields
+            ticker: Stock ticker
+            validate: Check the batch schema
+
+        Returns:
+            PriceSeries
+        """
+        return cls.from_frame(pd.DataFrame.from_records(list(records)), ticker or None, validate)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a DataFrame indexed by date without copying the arrays
+
+        Returns:
+            DataFrame with the price (and optional) columns
+        """
+        columns = {field: getattr(self, field) for field in PRICE_FIELDS + OPTIONAL_PRICE_FIELDS
+                   if getattr(self, field) is not None}
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(self.dates, name='date'), copy=False)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f"PriceSeries({self.ticker!r}, {len(self)} bars)"
+
+    def slice(self, start: Any = None, end: Any = None) -> 'PriceSeries':
+        """
+        Get the bars between two dates (inclusive) as array views
+
+        Args:
+            start: First date
+            end: Last date
+
+        Returns:
+            PriceSeries sharing this series' memory
+        """
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start)), 'left')
+        hi = len(self) if end is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end)), 'right')
+
+        def view(values):
+            return values[lo:hi] if values is not None else None
+
+        return PriceSeries(self.ticker, self.dates[lo:hi], view(self.open), view(self.high),
+                           view(self.low), view(self.close), view(self.volume),
+                           view(self.adjusted_close), validate=False)
+
+    def latest(self, field: str = 'close') -> Optional[float]:
+        """
+        Get the most recent non-missing value of a field
+
+        Args:
+            field: Price field
+
+        Returns:
+            Value or None
+        """
+        values = getattr(self, field)
+        return _last_valid(values) if values is not None else None
+
+    def returns(self, periods: int = 1) -> np.ndarray:
+        """
+        Close-to-close returns in percent
+
+        Args:
+            periods: Return horizon in bars
+
+        Returns:
+            Array aligned to dates (NaN for the first periods bars)
+        """
+        result = np.full(len(self), np.nan)
+        if len(self) > periods:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result[periods:] = (self.close[periods:] / self.close[:-periods] - 1) * 100
+        return result
+
+    def daily_return(self) -> np.ndarray:
+        """Open-to-close return in percent per bar (0 where open is not positive)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.open > 0, (self.close - self.open) / self.open * 100, 0.0)
+
+    def intraday_range(self) -> np.ndarray:
+        """High minus low per bar"""
+        return self.high - self.low
+
+    def intraday_volatility(self) -> np.ndarray:
+        """High-low range in percent of low per bar (0 where low is not positive)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.low > 0, (self.high - self.low) / self.low * 100, 0.0)
+
+
+class MetricPanel:
+    """Long-format fundamentals as coded arrays sorted by ticker, metric and period"""
+
+    __slots__ = ('tickers', 'metrics', 'ticker_codes', 'metric_codes',
+                 'years', 'quarters', 'values', '_offsets')
+
+    def __init__(self, tickers: Any, metrics: Any, ticker_codes: Any, metric_codes: Any,
+                 years: Any, quarters: Any, values: Any, validate: bool = True):
+        """
+        Initialize metric panel
+
+        Rows are sorted by (ticker, metric, year, quarter) once here, so
+        lookups are binary searches over the arrays.
+
+        Args:
+            tickers: Ticker categories
+            metrics: Metric code categories
+            ticker_codes: Per-row index into tickers
+            metric_codes: Per-row index into metrics
+            years: Per-row fiscal year
+            quarters: Per-row quarter (0 for annual rows)
+            values: Per-row metric value
+            validate: Check the batch schema
+        """
+        self.tickers = pd.Index(tickers)
+        self.metrics = pd.Index(metrics)
+        ticker_codes = np.asarray(ticker_codes, dtype='int32')
+        metric_codes = np.asarray(metric_codes, dtype='int32')
+        years = np.asarray(years, dtype='int16')
+        quarters = np.asarray(quarters, dtype='int8')
+        values = _float_array(values, 'values')
+
+        if validate:
+            n = len(values)
+            for field, array in (('ticker_codes', ticker_codes), ('metric_codes', metric_codes),
+                                 ('years', years), ('quarters', quarters)):
+                if len(array) != n:
+                    raise ValidationError(f"expected {n} values, got {len(array)}", field=field)
+            if n and (ticker_codes.min() < 0 or ticker_codes.max() >= len(self.tickers)):
+                raise ValidationError("ticker code out of range", field='ticker_codes')
+            if n and (metric_codes.min() < 0 or metric_codes.max() >= len(self.metrics)):
+                raise ValidationError("metric code out of range", field='metric_codes')
+
+        order = np.lexsort((quarters, years, metric_codes, ticker_codes))
+        if not (order[1:] > order[:-1]).all():
+            ticker_codes, metric_codes = ticker_codes[order], metric_codes[order]
+            years, quarters, values = years[order], quarters[order], values[order]
+
+        self.ticker_codes = ticker_codes
+        self.metric_codes = metric_codes
+        self.years = years
+        self.quarters = quarters
+        self.values = values
+        # Combined (ticker, metric) key per row for binary search
+        self._offsets = ticker_codes.astype('int64') * max(len(self.metrics), 1) + metric_codes
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, validate: bool = True) -> 'MetricPanel':
+        """
+        Create from the long fundamentals frame
+
+        Categorical ticker/metric columns (compact load mode) are used
+        through their codes without materializing strings. When FREQ_CODE
+        is present it decides which rows are annual (quarter 0), as in the
+        other fundamentals readers.
+
+        Args:
+            df: Frame with SECURITY_CODE, METRIC_CODE, YEAR, QUARTER, METRIC_VALUE
+                (and optionally FREQ_CODE)
+            validate: Check the batch schema
+
+        Returns:
+            MetricPanel
+        """
+        missing = [c for c in METRIC_PANEL_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValidationError(f"missing columns {missing}", field='columns')
+
+        def codes(column: str) -> Tuple[np.ndarray, pd.Index]:
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                return series.cat.codes.to_numpy(), series.cat.categories
+            codes, uniques = pd.factorize(series)
+            return codes, pd.Index(uniques)
+
+        ticker_codes, tickers = codes('SECURITY_CODE')
+        metric_codes, metrics = codes('METRIC_CODE')
+        if validate and ((ticker_codes < 0).any() or (metric_codes < 0).any()):
+            raise ValidationError("missing ticker or metric code", field='codes')
+
+        quarters = df['QUARTER'].fillna(0).to_numpy()
+        if 'FREQ_CODE' in df.columns:
+            quarters = np.where((df['FREQ_CODE'] == 'Y').to_numpy(), 0, quarters)
+
+        return cls(tickers, metrics, ticker_codes, metric_codes,
+                   df['YEAR'].to_numpy(), quarters,
+                   df['METRIC_VALUE'].to_numpy(), validate=validate)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Convert to a long DataFrame with categorical ticker/metric columns
+
+        Returns:
+            DataFrame with METRIC_PANEL_COLUMNS
+        """
+        return pd.DataFrame({
+            'SECURITY_CODE': pd.Categorical.from_codes(self.ticker_codes, self.tickers),
+            'METRIC_CODE': pd.Categorical.from_codes(self.metric_codes, self.metrics),
+            'YEAR': self.years,
+            'QUARTER': self.quarters,
+            'METRIC_VALUE': self.values,
+        }, copy=False)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"MetricPanel({len(self.tickers)} tickers, {len(self.metrics)} metrics, {len(self)} rows)"
+
+    def _rows(self, ticker: str, metric: str) -> slice:
+        """Row range of one (ticker, metric) pair"""
+        if ticker not in self.tickers or metric not in self.metrics:
+            return slice(0, 0)
+        key = self.tickers.get_loc(ticker) * max(len(self.metrics), 1) + self.metrics.get_loc(metric)
+        return slice(np.searchsorted(self._offsets, key, 'left'),
+                     np.searchsorted(self._offsets, key, 'right'))
+
+    def series(self, ticker: str, metric: str,
+               quarterly: Optional[bool] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get one metric's history for a ticker
+
+        Args:
+            ticker: Stock ticker
+            metric: Metric code
+            quarterly: True for quarterly rows, False for annual rows, None for both
+
+        Returns:
+            Tuple of (years, quarters, values) array views in period order
+        """
+        rows = self._rows(ticker, metric)
+        years, quarters, values = self.years[rows], self.quarters[rows], self.values[rows]
+        if quarterly is not None:
+            mask = (quarters > 0) if quarterly else (quarters == 0)
+            years, quarters, values = years[mask], quarters[mask], values[mask]
+        return years, quarters, values
+
+    def latest(self, ticker: str, metric: str, quarterly: Optional[bool] = None) -> Optional[float]:
+        """
+        Get the most recent non-missing value of a metric
+
+        Args:
+            ticker: Stock ticker
+            metric: Metric code
+            quarterly: Restrict to quarterly or annual rows
+
+        Returns:
+            Value or None
+        """
+        return _last_valid(self.series(ticker, metric, quarterly)[2])
+
+    def cross_section(self, metric: str, year: int, quarter: int = 0) -> pd.Series:
+        """
+        Get one metric for every ticker in a period
+
+        Args:
+            metric: Metric code
+            year: Fiscal year
+            quarter: Quarter (0 for annual)
+
+        Returns:
+            Series of values indexed by ticker
+        """
+        if metric not in self.metrics:
+            return pd.Series(dtype='float64')
+        mask = ((self.metric_codes == self.metrics.get_loc(metric))
+                & (self.years == year) & (self.quarters == quarter))
+        return pd.Series(self.values[mask], index=self.tickers[self.ticker_codes[mask]],
+                         name=metric)
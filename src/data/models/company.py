@@ -2,9 +2,12 @@
 Company data models
 """
 
-from typing import Optional, List
+from typing import Any, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+import pandas as pd
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from .columnar import MetricPanel, PriceSeries
 
 
 class CompanyInfo(BaseModel):
@@ -32,26 +35,59 @@ class CompanyInfo(BaseModel):
 
 class Company(BaseModel):
     """Complete company model with all data"""
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, arbitrary_types_allowed=True)
     
     # Basic info
     info: CompanyInfo
     
     # Related data (will be populated by loaders)
     financial_statements: Optional[List[dict]] = Field(default_factory=list)
-    market_data: Optional[List[dict]] = Field(default_factory=list)
+    market_data: Optional[PriceSeries] = Field(None, description="Daily bars (columnar)")
+    fundamentals: Optional[MetricPanel] = Field(None, description="Long-format metrics (columnar)")
     ratios: Optional[dict] = Field(default_factory=dict)
     
     # Metadata
     last_updated: Optional[datetime] = Field(default_factory=datetime.now)
     data_source: Optional[str] = Field(None, description="Data source identifier")
     
+    @field_validator('market_data', mode='before')
+    @classmethod
+    def _to_price_series(cls, value: Any) -> Optional[PriceSeries]:
+        """Accept bars as a PriceSeries, an OHLCV DataFrame or a list of row dicts"""
+        if value is None or isinstance(value, PriceSeries):
+            return value
+        if isinstance(value, pd.DataFrame):
+            return PriceSeries.from_frame(value)
+        if isinstance(value, list):
+            return PriceSeries.from_records(value) if value else None
+        raise ValueError(f"Unsupported market_data type: {type(value).__name__}")
+    
+    @field_validator('fundamentals', mode='before')
+    @classmethod
+    def _to_metric_panel(cls, value: Any) -> Optional[MetricPanel]:
+        """Accept fundamentals as a MetricPanel or a long DataFrame"""
+        if isinstance(value, pd.DataFrame):
+            return MetricPanel.from_frame(value)
+        return value
+    
     def get_latest_price(self) -> Optional[float]:
         """Get latest stock price"""
-        if self.market_data and len(self.market_data) > 0:
-            return self.market_data[-1].get('close')
+        if self.market_data is not None and len(self.market_data) > 0:
+            return self.market_data.latest('close')
         return None
     
+    def get_price_history(self, start=None, end=None) -> pd.DataFrame:
+        """Get daily bars between two dates as a DataFrame (no copy)"""
+        if self.market_data is None:
+            return pd.DataFrame()
+        return self.market_data.slice(start, end).to_frame()
+    
+    def get_latest_metric(self, metric_code: str, quarterly: Optional[bool] = None) -> Optional[float]:
+        """Get the most recent value of a fundamental metric"""
+        if self.fundamentals is None:
+            return None
+        return self.fundamentals.latest(self.info.ticker, metric_code, quarterly)
+    
     def get_market_cap(self) -> Optional[float]:
         """Calculate market capitalization"""
         latest_price = self.get_latest_price()
@@ -0,0 +1,107 @@
+"""
+Shared Data Publisher - Load datasets once and publish them for page processes
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import logging
+
+from src.core.compact_frame import read_compact_parquet
+from src.core.excel_cache import ExcelCache
+from src.core.shared_data import (
+    SharedDataStore, FUNDAMENTALS_DATASET, METADATA_DATASET, OHLCV_DATASET
+)
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARQUET_PATH = Path("Database/Full_database/Buu_clean_ver2.parquet")
+DEFAULT_METADATA_PATH = Path("Database/Full_database/CSDL.xlsx")
+DEFAULT_OHLCV_DB = Path("Database/cache/ohlcv_cache.db")
+
+
+def _signature(*paths: Path) -> Optional[Tuple]:
+    """Source signature from file mtimes and sizes (None if the first file is missing)"""
+    if not paths[0].exists():
+        return None
+    return tuple(
+        (p.stat().st_mtime_ns, p.stat().st_size) if p.exists() else None
+        for p in paths
+    )
+
+
+class SharedDataPublisher:
+    """Publish fundamentals, metadata and the daily OHLCV panel to a shared store"""
+
+    def __init__(self, store: Optional[SharedDataStore] = None,
+                 parquet_path: Path = DEFAULT_PARQUET_PATH,
+                 metadata_path: Path = DEFAULT_METADATA_PATH,
+                 ohlcv_db_path: Path = DEFAULT_OHLCV_DB,
+                 excel_cache: Optional[ExcelCache] = None):
+        """
+        Initialize publisher
+
+        Args:
+            store: Target shared store
+            parquet_path: Fundamentals parquet file
+            metadata_path: Metadata Excel file
+            ohlcv_db_path: OHLCV SQLite cache
+            excel_cache: Parquet sidecars for the metadata workbook
+        """
+        self.store = store or SharedDataStore()
+        self.parquet_path = Path(parquet_path)
+        self.metadata_path = Path(metadata_path)
+        self.ohlcv_db_path = Path(ohlcv_db_path)
+        self.excel_cache = excel_cache or ExcelCache(self.ohlcv_db_path.parent / "excel")
+        self._published: Dict[str, Tuple] = {}
+
+    def _sources(self) -> Dict[str, Tuple[Optional[Tuple], Callable[[], pd.DataFrame]]]:
+        """Dataset name -> (source signature, loader)"""
+        wal_path = self.ohlcv_db_path.with_name(self.ohlcv_db_path.name + '-wal')
+        return {
+            FUNDAMENTALS_DATASET: (_signature(self.parquet_path), self._load_fundamentals),
+            METADATA_DATASET: (_signature(self.metadata_path), self._load_metadata),
+            OHLCV_DATASET: (_signature(self.ohlcv_db_path, wal_path), self._load_ohlcv),
+        }
+
+    def _load_fundamentals(self) -> pd.DataFrame:
+        """Load the compact, ticker-sorted fundamentals frame"""
+        df, report = read_compact_parquet(self.parquet_path)
+        logger.info(f"Fundamentals compacted to {report['compact_mb']:.1f} MB")
+        return df
+
+    def _load_metadata(self) -> pd.DataFrame:
+        """Load the metadata sheet (through its Parquet sidecar)"""
+        return self.excel_cache.read(self.metadata_path)
+
+    def _load_ohlcv(self) -> pd.DataFrame:
+        """Load the daily OHLCV panel from the SQLite cache"""
+        cache = OHLCVCacheManager(cache_dir=str(self.ohlcv_db_path.parent),
+                                  db_name=self.ohlcv_db_path.name)
+        try:
+            return cache.load_panel('1D')
+        finally:
+            cache.close()
+
+    def publish_changed(self) -> Dict[str, int]:
+        """
+        Publish every dataset whose source changed since the last publish
+
+        Returns:
+            Dictionary of dataset name -> new version
+        """
+        versions = {}
+        for name, (signature, loader) in self._sources().items():
+            if signature is None:
+                logger.warning(f"Source for shared dataset '{name}' not found, skipping")
+                continue
+            if self._published.get(name) == signature:
+                continue
+            try:
+                versions[name] = self.store.publish(name, loader())
+                self._published[name] = signature
+            except Exception as e:
+                logger.error(f"Could not publish shared dataset '{name}': {e}")
+        return versions
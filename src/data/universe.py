@@ -0,0 +1,268 @@
+"""
+Ticker Universe - Small cached registry of tickers, sectors and exchanges
+
+Built from the fundamentals parquet (ticker/industry columns only), the
+filtered tickers summary and the industry classification CSVs, and stored in
+a JSON sidecar keyed by the sources' mtime/size signature.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCES = {
+    'parquet': Path("Database/Full_database/Buu_clean_ver2.parquet"),
+    'summary': Path("Database/Full_database/filtered_tickers_summary.csv"),
+    'standard': Path("Database/Non_Finance Data/standard_tickers_with_industry.csv"),
+    'financial': Path("Database/Finance Data/special_tickers_with_industry.csv"),
+}
+DEFAULT_SIDECAR = Path("Database/cache/ticker_universe.json")
+
+# Parquet columns read when building (never the full frame)
+PARQUET_TICKER_COLUMN = 'SECURITY_CODE'
+PARQUET_SECTOR_COLUMN = 'ICB_L2'
+PARQUET_EXCHANGE_COLUMNS = ('EXCHANGE', 'exchange', 'FLOOR_CODE')
+
+# Minimum seconds between source signature checks on the singleton
+CHECK_INTERVAL = 30.0
+
+
+def source_signature(sources: Dict[str, Path]) -> Dict[str, Optional[List[int]]]:
+    """
+    Build a change signature from source file mtimes and sizes
+
+    Args:
+        sources: Source name -> path
+
+    Returns:
+        Source name -> [mtime_ns, size] (None for missing files)
+    """
+    signature = {}
+    for name, path in sources.items():
+        try:
+            stat = os.stat(path)
+            signature[name] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature[name] = None
+    return signature
+
+
+class TickerUniverse:
+    """Ticker registry with sector, exchange and summary attributes"""
+
+    def __init__(self, records: List[Dict[str, Any]],
+                 signature: Optional[Dict[str, Any]] = None):
+        """
+        Initialize universe
+
+        Args:
+            records: One dict per ticker (ticker, sector, exchange, financial, ...)
+            signature: Source signature the records were built from
+        """
+        self.signature = signature or {}
+        self._records = {r['ticker']: r for r in records}
+        self.tickers: List[str] = sorted(self._records)
+
+        self._sector_tickers: Dict[str, List[str]] = {}
+        for ticker in self.tickers:
+            sector = self._records[ticker].get('sector')
+            if sector:
+                self._sector_tickers.setdefault(sector, []).append(ticker)
+
+    @classmethod
+    def build(cls, sources: Dict[str, Path] = None) -> 'TickerUniverse':
+        """
+        Build a universe from the source files
+
+        Args:
+            sources: Source name -> path (defaults to DEFAULT_SOURCES)
+
+        Returns:
+            New TickerUniverse
+        """
+        sources = {**DEFAULT_SOURCES, **(sources or {})}
+        records: Dict[str, Dict[str, Any]] = {}
+
+        def record(ticker) -> Dict[str, Any]:
+            ticker = str(ticker).strip().upper()
+            return records.setdefault(ticker, {
+                'ticker': ticker, 'sector': None, 'exchange': None, 'financial': False
+            })
+
+        # Parquet: read only the ticker/sector/exchange columns
+        parquet_path = sources['parquet']
+        if parquet_path.exists():
+            names = set(pq.read_schema(parquet_path).names)
+            if PARQUET_TICKER_COLUMN in names:
+                columns = [PARQUET_TICKER_COLUMN]
+                columns += [c for c in (PARQUET_SECTOR_COLUMN,) + PARQUET_EXCHANGE_COLUMNS if c in names]
+                table = pq.read_table(parquet_path, columns=columns,
+                                      read_dictionary=columns)
+                df = table.to_pandas().drop_duplicates(subset=[PARQUET_TICKER_COLUMN])
+                exchange_col = next((c for c in PARQUET_EXCHANGE_COLUMNS if c in df.columns), None)
+                for row in df.itertuples(index=False):
+                    rec = record(getattr(row, PARQUET_TICKER_COLUMN))
+                    if PARQUET_SECTOR_COLUMN in df.columns and pd.notna(getattr(row, PARQUET_SECTOR_COLUMN)):
+                        rec['sector'] = str(getattr(row, PARQUET_SECTOR_COLUMN))
+                    if exchange_col and pd.notna(getattr(row, exchange_col)):
+                        rec['exchange'] = str(getattr(row, exchange_col))
+
+        # Summary CSV: sector and data coverage
+        if sources['summary'].exists():
+            summary = pd.read_csv(sources['summary'], dtype=str)
+            for row in summary.itertuples(index=False):
+                rec = record(row.ticker)
+                rec['sector'] = rec['sector'] or row.sector
+                rec['record_count'] = int(row.record_count)
+                rec['years'] = row.years
+                rec['quarters'] = row.quarters
+
+        # Industry classification CSVs take precedence for sector
+        for name, financial in (('standard', False), ('financial', True)):
+            if sources[name].exists():
+                industries = pd.read_csv(sources[name], dtype=str)
+                for row in industries.itertuples(index=False):
+                    rec = record(row.Ticker)
+                    rec['sector'] = row.Industry_ICB_L2 or rec['sector']
+                    rec['financial'] = rec['financial'] or financial
+
+        return cls(list(records.values()), source_signature(sources))
+
+    @classmethod
+    def load_or_build(cls, sources: Dict[str, Path] = None,
+                      sidecar: Path = DEFAULT_SIDECAR) -> 'TickerUniverse':
+        """
+        Load the sidecar if it matches the sources, otherwise rebuild and save it
+
+        Args:
+            sources: Source name -> path
+            sidecar: Sidecar JSON path
+
+        Returns:
+            TickerUniverse
+        """
+        sources = {**DEFAULT_SOURCES, **(sources or {})}
+        signature = source_signature(sources)
+        sidecar = Path(sidecar)
+
+        try:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('signature') == signature:
+                return cls(payload['records'], signature)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+        universe = cls.build(sources)
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = sidecar.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'signature': universe.signature,
+                           'records': universe.records()}, f, ensure_ascii=False)
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            logger.warning(f"Could not write ticker universe sidecar: {e}")
+
+        logger.info(f"Built ticker universe with {len(universe)} tickers")
+        return universe
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Get all ticker records sorted by ticker"""
+        return [self._records[t] for t in self.tickers]
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the record of a ticker
+
+        Args:
+            ticker: Ticker symbol
+
+        Returns:
+            Record dict or None
+        """
+        return self._records.get(ticker.upper())
+
+    def get_sector(self, ticker: str) -> Optional[str]:
+        """Get the sector of a ticker"""
+        rec = self.get(ticker)
+        return rec.get('sector') if rec else None
+
+    def get_exchange(self, ticker: str) -> Optional[str]:
+        """Get the exchange of a ticker (None when no source provides it)"""
+        rec = self.get(ticker)
+        return rec.get('exchange') if rec else None
+
+    @property
+    def sectors(self) -> List[str]:
+        """Sorted list of sectors"""
+        return sorted(self._sector_tickers)
+
+    def tickers_in_sector(self, sector: str) -> List[str]:
+        """
+        Get tickers in a sector
+
+        Args:
+            sector: Sector name
+
+        Returns:
+            Sorted list of tickers
+        """
+        return list(self._sector_tickers.get(sector, []))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the universe as a DataFrame indexed by ticker"""
+        return pd.DataFrame(self.records()).set_index('ticker')
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.upper() in self._records
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+_universes: Dict[Tuple, Tuple[TickerUniverse, float]] = {}
+_universe_lock = threading.Lock()
+
+
+def get_universe(sources: Dict[str, Path] = None,
+                 sidecar: Path = DEFAULT_SIDECAR) -> TickerUniverse:
+    """
+    Get the process-wide ticker universe
+
+    The instance is reused until a source file changes (checked at most every
+    CHECK_INTERVAL seconds).
+
+    Args:
+        sources: Source name -> path overrides
+        sidecar: Sidecar JSON path
+
+    Returns:
+        TickerUniverse
+    """
+    sources = {**DEFAULT_SOURCES, **(sources or {})}
+    key = tuple(sorted((k, str(v)) for k, v in sources.items())) + (str(sidecar),)
+
+    with _universe_lock:
+        cached = _universes.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            universe, checked_at = cached
+            if now - checked_at < CHECK_INTERVAL:
+                return universe
+            if source_signature(sources) == universe.signature:
+                _universes[key] = (universe, now)
+                return universe
+
+        universe = TickerUniverse.load_or_build(sources, sidecar)
+        _universes[key] = (universe, now)
+        return universe
@@ -0,0 +1,132 @@
+"""
+Chart Cache - LRU cache of serialized Plotly figures
+
+Figures are stored as JSON keyed by (chart kind, symbol, date range,
+options, data version), so a rerun with unchanged inputs skips indicator
+calculation and trace building.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.core.memory_cache import MemoryCache
+
+DEFAULT_MAX_MB = 64
+
+
+def frame_version(df: pd.DataFrame) -> str:
+    """
+    Fingerprint a DataFrame's contents for use as a data version
+
+    Args:
+        df: Chart input data
+
+    Returns:
+        Version string (row count and content hash)
+    """
+    if df.empty:
+        return "0:0"
+    digest = int(pd.util.hash_pandas_object(df, index=True).sum()) & 0xFFFFFFFFFFFFFFFF
+    return f"{len(df)}:{digest:016x}"
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn option values (lists, dicts) into hashable tuples"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+
+class FigureCache:
+    """Memoize figure builders by chart inputs and data version"""
+
+    def __init__(self, max_mb: int = DEFAULT_MAX_MB, name: str = "figures"):
+        """
+        Initialize figure cache
+
+        Args:
+            max_mb: Size budget for the serialized figures
+            name: Cache name used in statistics
+        """
+        self._cache = MemoryCache(max_bytes=max_mb * 1024 * 1024, name=name)
+
+    @staticmethod
+    def make_key(kind: str, symbol: Any, date_range: Any,
+                 options: Mapping[str, Any], version: str) -> Tuple:
+        """
+        Build a cache key
+
+        Args:
+            kind: Chart kind (e.g. 'candlestick')
+            symbol: Symbol or symbols shown
+            date_range: Visible range (days, or (start, end))
+            options: Indicator and layout options
+            version: Data version the figure was built from
+
+        Returns:
+            Hashable key
+        """
+        return (kind, _freeze(symbol), _freeze(date_range), _freeze(options), version)
+
+    def get(self, key: Tuple) -> Optional[go.Figure]:
+        """
+        Get a fresh figure for a key
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Figure rebuilt from cached JSON or None
+        """
+        payload = self._cache.get(key)
+        return pio.from_json(payload) if payload is not None else None
+
+    def set(self, key: Tuple, fig: go.Figure) -> bool:
+        """
+        Store a figure
+
+        Args:
+            key: Cache key
+            fig: Figure to serialize
+
+        Returns:
+            True if stored
+        """
+        return self._cache.set(key, fig.to_json())
+
+    def get_or_build(self, key: Tuple, build: Callable[[], Optional[go.Figure]]) -> Optional[go.Figure]:
+        """
+        Get a cached figure or build and cache it
+
+        Empty results (None) are returned without caching.
+
+        Args:
+            key: Cache key
+            build: Figure builder
+
+        Returns:
+            Figure
+        """
+        fig = self.get(key)
+        if fig is None:
+            fig = build()
+            if fig is not None:
+                self.set(key, fig)
+        return fig
+
+    def clear(self):
+        """Remove all cached figures"""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction statistics"""
+        return self._cache.get_stats()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -4,7 +4,6 @@ Streamlit dashboard components
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
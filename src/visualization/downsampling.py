@@ -0,0 +1,242 @@
+"""
+Chart Downsampling - Server-side point reduction for Plotly charts
+
+Line overlays are reduced with LTTB (Largest-Triangle-Three-Buckets), which
+keeps the visual shape of a series with a fixed number of points. OHLC bars
+are aggregated to weekly or monthly candles when the visible range holds too
+many daily bars.
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Defaults (overridable through ChartConfig)
+DEFAULT_MAX_POINTS = 2000
+DEFAULT_MAX_CANDLES = 600
+DEFAULT_WEBGL_THRESHOLD = 5000
+
+# Candle aggregation levels, finest first: (label, pandas period frequency)
+OHLC_LEVELS = (('D', None), ('W', 'W-FRI'), ('M', 'M'))
+
+
+def _as_float(x: Any) -> np.ndarray:
+    """Convert x values (numbers or datetimes) to float64"""
+    values = np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').astype('int64').astype('float64')
+    if values.dtype == object:
+        return pd.to_datetime(values).to_numpy().astype('datetime64[ns]').astype('int64').astype('float64')
+    return values.astype('float64')
+
+
+def lttb_indices(x: Any, y: Any, n_out: int) -> np.ndarray:
+    """
+    Select the indices of points kept by LTTB
+
+    The first and last points are always kept. Points with NaN y values are
+    skipped (indicator warm-up periods).
+
+    Args:
+        x: Monotonic x values (numbers or datetimes)
+        y: Y values
+        n_out: Target number of points
+
+    Returns:
+        Sorted integer indices into x/y
+    """
+    y = np.asarray(y, dtype='float64')
+    finite = np.flatnonzero(np.isfinite(y))
+    n = len(finite)
+    if n <= n_out:
+        return finite
+    if n_out < 3:
+        return finite[np.linspace(0, n - 1, max(n_out, 0)).astype(int)]
+
+    xs = _as_float(x)[finite]
+    ys = y[finite]
+
+    # Buckets over the inner points; the first and last point are fixed
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point)
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], edges[i + 2]
+            avg_x = xs[next_start:next_stop].mean()
+            avg_y = ys[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = xs[-1], ys[-1]
+
+        bucket_x = xs[start:stop]
+        bucket_y = ys[start:stop]
+        area = np.abs((xs[prev] - avg_x) * (bucket_y - ys[prev])
+                      - (xs[prev] - bucket_x) * (avg_y - ys[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return finite[selected]
+
+
+def lttb(x: Any, y: Any, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a line with LTTB
+
+    Args:
+        x: Monotonic x values (numbers or datetimes)
+        y: Y values
+        n_out: Target number of points
+
+    Returns:
+        Tuple of (x, y) arrays of at most n_out points
+    """
+    idx = lttb_indices(x, y, n_out)
+    return np.asarray(x)[idx], np.asarray(y, dtype='float64')[idx]
+
+
+def resample_ohlc(df: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """
+    Aggregate daily bars into weekly/monthly candles
+
+    Each candle is stamped with the date of its last trading session, so
+    weekend rangebreaks keep working.
+
+    Args:
+        df: DataFrame indexed by date with open, high, low, close (and volume)
+        freq: Pandas period frequency (e.g. 'W-FRI', 'M')
+
+    Returns:
+        Aggregated DataFrame indexed by date
+    """
+    if df.empty:
+        return df
+
+    index = pd.DatetimeIndex(df.index)
+    buckets = index.to_period(freq)
+    agg = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last'}
+    if 'volume' in df.columns:
+        agg['volume'] = 'sum'
+
+    grouped = df[list(agg)].groupby(buckets, sort=True)
+    result = grouped.agg(agg)
+    result.index = pd.DatetimeIndex(
+        pd.Series(index, index=buckets).groupby(level=0, sort=True).max().to_numpy(),
+        name=df.index.name
+    )
+    return result
+
+
+class ChartDownsampler:
+    """Pick the candle resolution, line point budget and trace type of a chart"""
+
+    def __init__(self, max_points: int = DEFAULT_MAX_POINTS,
+                 max_candles: int = DEFAULT_MAX_CANDLES,
+                 webgl_threshold: int = DEFAULT_WEBGL_THRESHOLD):
+        """
+        Initialize downsampler
+
+        Args:
+            max_points: Maximum points per line trace (0 disables LTTB)
+            max_candles: Maximum candles before aggregating (0 disables)
+            webgl_threshold: Total points above which Scattergl is used (0 disables)
+        """
+        self.max_points = max_points
+        self.max_candles = max_candles
+        self.webgl_threshold = webgl_threshold
+
+    @classmethod
+    def from_config(cls, config) -> 'ChartDownsampler':
+        """
+        Create from a ChartConfig
+
+        Args:
+            config: ChartConfig (or AppConfig with a charts section)
+
+        Returns:
+            ChartDownsampler
+        """
+        charts = getattr(config, 'charts', config)
+        return cls(charts.max_points, charts.max_candles, charts.webgl_threshold)
+
+    def ohlc_level(self, df: pd.DataFrame) -> Tuple[str, Optional[str]]:
+        """
+        Choose the candle resolution for the visible range
+
+        Args:
+            df: Daily bars indexed by date
+
+        Returns:
+            Tuple of (label 'D'/'W'/'M', pandas frequency or None)
+        """
+        if not self.max_candles or len(df) <= self.max_candles:
+            return OHLC_LEVELS[0]
+
+        span_days = (pd.Timestamp(df.index.max()) - pd.Timestamp(df.index.min())).days
+        for label, freq in OHLC_LEVELS[1:]:
+            bucket_days = 7 if label == 'W' else 30.4
+            if span_days / bucket_days <= self.max_candles:
+                return label, freq
+        return OHLC_LEVELS[-1]
+
+    def prepare_ohlc(self, df: pd.DataFrame,
+                     rollups: Optional[Callable[[str, str, str], Optional[pd.DataFrame]]] = None
+                     ) -> Tuple[pd.DataFrame, str]:
+        """
+        Aggregate bars when the range holds more than max_candles
+
+        Args:
+            df: Daily bars indexed by date
+            rollups: Optional loader of pre-aggregated bars, called with the
+                     label ('W'/'M') and the first/last date (YYYY-MM-DD) of the
+                     periods the range touches; daily bars are resampled when
+                     it returns None or no bars
+
+        Returns:
+            Tuple of (bars to plot, resolution label)
+        """
+        label, freq = self.ohlc_level(df)
+        if freq is None:
+            return df, label
+        if rollups is not None:
+            start = pd.Timestamp(df.index.min()).to_period(freq).start_time.strftime('%Y-%m-%d')
+            end = pd.Timestamp(df.index.max()).to_period(freq).end_time.strftime('%Y-%m-%d')
+            bars = rollups(label, start, end)
+            if bars is not None and not bars.empty:
+                return bars, label
+        return resample_ohlc(df, freq), label
+
+    def line(self, x: Any, y: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample one line trace to the point budget
+
+        Args:
+            x: X values
+            y: Y values
+
+        Returns:
+            Tuple of (x, y) arrays
+        """
+        if not self.max_points or len(y) <= self.max_points:
+            return np.asarray(x), np.asarray(y)
+        return lttb(x, y, self.max_points)
+
+    def scatter_class(self, total_points: int):
+        """
+        Get the scatter trace class for a chart
+
+        Args:
+            total_points: Number of points across all line traces
+
+        Returns:
+            go.Scattergl above the WebGL threshold, otherwise go.Scatter
+        """
+        if self.webgl_threshold and total_points > self.webgl_threshold:
+            return go.Scattergl
+        return go.Scatter
@@ -4,22 +4,34 @@ Creates interactive charts for technical analysis
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from src.core.instrumentation import timed
+
+from .chart_cache import FigureCache, frame_version
+from .downsampling import ChartDownsampler
+
 logger = logging.getLogger(__name__)
 
 
 class TechnicalChartCreator:
     """Creates technical analysis charts using Plotly"""
     
-    def __init__(self):
-        """Initialize technical chart creator"""
-        pass
+    def __init__(self, downsampler: Optional[ChartDownsampler] = None,
+                 figure_cache: Optional[FigureCache] = None):
+        """
+        Initialize technical chart creator
+        
+        Args:
+            downsampler: Point budget for candles and line traces
+            figure_cache: Cache of built figures
+        """
+        self.downsampler = downsampler or ChartDownsampler()
+        self.figure_cache = figure_cache or FigureCache()
     
     def create_candlestick_chart(
         self, 
@@ -28,11 +40,14 @@ class TechnicalChartCreator:
         show_volume: bool = True,
         show_indicators: bool = True,
         ma_periods: List[int] = [20, 50],
-        ema_periods: List[int] = [9, 21]
+        ema_periods: List[int] = [9, 21],
+        data_version: Optional[str] = None
     ) -> go.Figure:
         """
         Create interactive candlestick chart with technical indicators
         
+        Figures are cached by title, date range, options and data version.
+        
         Args:
             data: DataFrame with OHLCV data and indicators
             title: Chart title
@@ -40,6 +55,7 @@ class TechnicalChartCreator:
             show_indicators: Whether to show technical indicators
             ma_periods: MA periods to display
             ema_periods: EMA periods to display
+            data_version: Version of data (hashed from the contents if omitted)
             
         Returns:
             Plotly figure object
@@ -48,6 +64,46 @@ class TechnicalChartCreator:
             logger.warning("Empty data provided for chart creation")
             return go.Figure()
         
+        options = {
+            'show_volume': show_volume, 'show_indicators': show_indicators,
+            'ma_periods': list(ma_periods), 'ema_periods': list(ema_periods),
+            'downsampler': (self.downsampler.max_points, self.downsampler.max_candles,
+                            self.downsampler.webgl_threshold)
+        }
+        date_range = (str(data['date'].iloc[0]), str(data['date'].iloc[-1]))
+        key = self.figure_cache.make_key('candlestick', title, date_range, options,
+                                         data_version or frame_version(data))
+        return self.figure_cache.get_or_build(key, lambda: self._build_candlestick_chart(
+            data, title, show_volume, show_indicators, ma_periods, ema_periods
+        ))
+    
+    @timed('chart.candlestick')
+    def _build_candlestick_chart(
+        self, 
+        data: pd.DataFrame,
+        title: str,
+        show_volume: bool,
+        show_indicators: bool,
+        ma_periods: List[int],
+        ema_periods: List[int]
+    ) -> go.Figure:
+        """
+        Build the candlestick chart
+        
+        Long ranges are aggregated to weekly/monthly candles and indicator
+        lines are LTTB-downsampled to the downsampler's point budget.
+        
+        Args:
+            data: DataFrame with OHLCV data and indicators
+            title: Chart title
+            show_volume: Whether to show volume
+            show_indicators: Whether to show technical indicators
+            ma_periods: MA periods to display
+            ema_periods: EMA periods to display
+            
+        Returns:
+            Plotly figure object
+        """
         # Determine subplot layout
         if show_volume and show_indicators:
             subplot_titles = [title, "Volume", "RSI"]
@@ -75,14 +131,29 @@ class TechnicalChartCreator:
             vertical_spacing=0.05
         )
         
+        # Candles at a resolution that fits the visible range
+        daily = data.set_index('date')
+        ohlc_columns = [c for c in ['open', 'high', 'low', 'close', 'volume'] if c in daily.columns]
+        bars, resolution = self.downsampler.prepare_ohlc(daily[ohlc_columns])
+        if resolution != 'D':
+            title = f"{title} ({resolution})"
+        
+        # Indicator lines (downsampled), trace type chosen by total points
+        line_columns = [f'MA_{p}' for p in ma_periods] + [f'EMA_{p}' for p in ema_periods] + ['RSI']
+        lines = {
+            col: self.downsampler.line(daily.index, daily[col])
+            for col in line_columns if show_indicators and col in daily.columns
+        }
+        scatter = self.downsampler.scatter_class(sum(len(x) for x, _ in lines.values()))
+        
         # Add candlestick chart
         fig.add_trace(
             go.Candlestick(
-                x=data['date'],
-                open=data['open'],
-                high=data['high'],
-                low=data['low'],
-                close=data['close'],
+                x=bars.index,
+                open=bars['open'],
+                high=bars['high'],
+                low=bars['low'],
+                close=bars['close'],
                 name="OHLC",
                 increasing_line_color='#26A69A',
                 decreasing_line_color='#EF5350'
@@ -94,11 +165,12 @@ class TechnicalChartCreator:
         if show_indicators:
             for period in ma_periods:
                 ma_col = f'MA_{period}'
-                if ma_col in data.columns:
+                if ma_col in lines:
+                    x, y = lines[ma_col]
                     fig.add_trace(
-                        go.Scatter(
-                            x=data['date'],
-                            y=data[ma_col],
+                        scatter(
+                            x=x,
+                            y=y,
                             mode='lines',
                             name=f'MA {period}',
                             line=dict(width=1.5, color=f'rgba(255, 165, 0, 0.8)'),
@@ -110,11 +182,12 @@ class TechnicalChartCreator:
             # Add EMAs
             for period in ema_periods:
                 ema_col = f'EMA_{period}'
-                if ema_col in data.columns:
+                if ema_col in lines:
+                    x, y = lines[ema_col]
                     fig.add_trace(
-                        go.Scatter(
-                            x=data['date'],
-                            y=data[ema_col],
+                        scatter(
+                            x=x,
+                            y=y,
                             mode='lines',
                             name=f'EMA {period}',
                             line=dict(width=1.5, color=f'rgba(138, 43, 226, 0.8)'),
@@ -125,13 +198,12 @@ class TechnicalChartCreator:
         
         # Add volume
         if show_volume:
-            colors = ['#26A69A' if close >= open else '#EF5350' 
-                     for close, open in zip(data['close'], data['open'])]
+            colors = np.where(bars['close'] >= bars['open'], '#26A69A', '#EF5350')
             
             fig.add_trace(
                 go.Bar(
-                    x=data['date'],
-                    y=data['volume'],
+                    x=bars.index,
+                    y=bars['volume'],
                     name="Volume",
                     marker_color=colors,
                     opacity=0.7
@@ -140,11 +212,12 @@ class TechnicalChartCreator:
             )
         
         # Add RSI
-        if show_indicators and 'RSI' in data.columns:
+        if 'RSI' in lines:
+            x, y = lines['RSI']
             fig.add_trace(
-                go.Scatter(
-                    x=data['date'],
-                    y=data['RSI'],
+                scatter(
+                    x=x,
+                    y=y,
                     mode='lines',
                     name="RSI",
                     line=dict(width=1.5, color='purple')
@@ -184,6 +257,7 @@ class TechnicalChartCreator:
         
         return fig
     
+    @timed('chart.market_breadth')
     def create_market_breadth_chart(
         self, 
         breadth_stats: Dict[str, any],
@@ -340,6 +414,7 @@ class TechnicalChartCreator:
         
         return fig
     
+    @timed('chart.performance_comparison')
     def create_performance_comparison_chart(
         self, 
         top_performers: pd.DataFrame,
@@ -411,6 +486,7 @@ class TechnicalChartCreator:
         
         return fig
     
+    @timed('chart.technical_summary')
     def create_technical_summary_chart(
         self, 
         data: pd.DataFrame,
@@ -493,8 +569,7 @@ class TechnicalChartCreator:
         
         # Chart 3: Volume Analysis
         if 'volume' in data.columns:
-            colors = ['#26A69A' if close >= open else '#EF5350' 
-                     for close, open in zip(data['close'], data['open'])]
+            colors = np.where(data['close'] >= data['open'], '#26A69A', '#EF5350')
             
             fig.add_trace(
                 go.Bar(
@@ -0,0 +1,100 @@
+"""
+Shared fixtures: synthetic OHLCV panels and bars built on benchmarks/synthetic.py
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+sys.path.insert(0, str(parent_path / "benchmarks"))
+
+from synthetic import make_ohlcv_panel
+
+
+def build_panel(symbols: Optional[Sequence[str]] = None, n_symbols: int = 3, n_days: int = 250,
+                seed: int = 42, end_date: str = '2024-06-28',
+                betas: Optional[Sequence[float]] = None,
+                start_at: Optional[Dict[str, int]] = None,
+                stop_at: Optional[Dict[str, int]] = None,
+                halts: Optional[Dict[str, Tuple[int, int]]] = None,
+                gaps: Optional[Dict[str, float]] = None,
+                categorical: bool = False) -> pd.DataFrame:
+    """
+    Create a long OHLCV panel sorted by symbol and date
+
+    Args:
+        symbols: Symbol names (default: AAA, AAB, ... for n_symbols)
+        n_symbols: Number of symbols when symbols is not given
+        n_days: Sessions in the shared calendar
+        seed: Random seed
+        end_date: Last session of the calendar
+        betas: Loadings on a common market return, one per symbol
+        start_at: Symbol -> first session kept (late listings)
+        stop_at: Symbol -> number of sessions kept (delistings, short histories)
+        halts: Symbol -> (start, stop) sessions dropped (trading halts)
+        gaps: Symbol -> fraction of sessions dropped at random
+        categorical: Store symbol as a category like OHLCVCacheManager.load_panel
+
+    Returns:
+        Long frame with symbol, date, open, high, low, close, volume
+    """
+    n_symbols = len(symbols) if symbols is not None else n_symbols
+    panel = make_ohlcv_panel(n_symbols, seed=seed, end_date=end_date, n_days=n_days, betas=betas)
+    if symbols is not None:
+        names = dict(zip(panel['symbol'].unique(), symbols))
+        panel['symbol'] = panel['symbol'].map(names)
+
+    session = panel.groupby('symbol', sort=False).cumcount().to_numpy()
+    keep = np.ones(len(panel), dtype=bool)
+    rng = np.random.default_rng(seed)
+    for symbol, first in (start_at or {}).items():
+        keep &= ~((panel['symbol'] == symbol).to_numpy() & (session < first))
+    for symbol, count in (stop_at or {}).items():
+        keep &= ~((panel['symbol'] == symbol).to_numpy() & (session >= count))
+    for symbol, (start, stop) in (halts or {}).items():
+        keep &= ~((panel['symbol'] == symbol).to_numpy() & (session >= start) & (session < stop))
+    for symbol, fraction in (gaps or {}).items():
+        keep &= ~((panel['symbol'] == symbol).to_numpy() & (rng.random(len(panel)) < fraction))
+
+    panel = panel[keep].sort_values(['symbol', 'date'], kind='stable').reset_index(drop=True)
+    if categorical:
+        panel['symbol'] = panel['symbol'].astype('category')
+    return panel
+
+
+def build_bars(n_days: int = 250, seed: int = 42, start: Optional[str] = None,
+               end_date: str = '2024-06-28') -> pd.DataFrame:
+    """
+    Create one symbol's daily bars indexed by date, like OHLCVCacheManager.get_ohlcv
+
+    Args:
+        n_days: Number of sessions
+        seed: Random seed
+        start: First session (overrides end_date)
+        end_date: Last session
+
+    Returns:
+        Frame with open, high, low, close, volume indexed by date
+    """
+    if start is not None:
+        end_date = pd.bdate_range(start, periods=n_days)[-1]
+    panel = build_panel(n_symbols=1, n_days=n_days, seed=seed, end_date=end_date)
+    return panel.drop(columns='symbol').set_index('date')
+
+
+@pytest.fixture
+def make_bars():
+    """Factory for one symbol's synthetic daily bars (see build_bars for the options)"""
+    return build_bars
+
+
+@pytest.fixture
+def make_panel():
+    """Factory for synthetic OHLCV panels (see build_panel for the options)"""
+    return build_panel
@@ -0,0 +1,118 @@
+"""
+Tests for the vectorized backtest engine
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.technical.backtest import BacktestEngine, CostModel, fill_price, moving_average, tick_size
+
+
+# Six symbols; S0 stops trading for 20 sessions
+PANEL_OPTIONS = dict(symbols=[f"S{i}" for i in range(6)], n_days=300, halts={'S0': (100, 120)})
+
+
+class TestCosts:
+    """Test VN tick sizes and fills"""
+
+    def test_tick_sizes(self):
+        """Test HOSE price bands and the flat HNX tick"""
+        prices = np.array([9_990, 10_000, 49_950, 50_000, 120_000])
+        np.testing.assert_array_equal(tick_size(prices), [10, 50, 50, 100, 100])
+        np.testing.assert_array_equal(tick_size(prices, 'HNX'), [100] * 5)
+
+        costs = CostModel(slippage_ticks=1)
+        np.testing.assert_array_equal(fill_price(np.array([12_320.0]), 1, costs), [12_400])
+        np.testing.assert_array_equal(fill_price(np.array([12_320.0]), -1, costs), [12_250])
+
+
+class TestBacktestEngine:
+    """Test the simulation against hand-computed trades"""
+
+    def test_single_trade_with_costs(self):
+        """Test fills at the next open, fees, sell tax and T+2"""
+        dates = pd.bdate_range('2024-01-01', periods=6)
+        panel = pd.DataFrame({
+            'symbol': 'AAA', 'date': dates,
+            'open': [10_000.0, 10_020, 10_500, 10_800, 11_000, 11_100],
+            'close': [10_000.0, 10_400, 10_700, 10_900, 11_050, 11_200],
+        })
+        # Long after day 0; exit wanted after day 1, but shares settle on day 3
+        target = pd.DataFrame({'AAA': [True, False, False, False, False, False]}, index=dates)
+        costs = CostModel(commission=0.001, sell_tax=0.001)
+        result = BacktestEngine(panel, costs=costs).run(target)
+
+        buy, sell = 10_050, 10_800   # 10,020 rounded up, 10,800 on the tick grid
+        expected = [1.0, 10_400 / buy * 0.999, 10_700 / buy * 0.999]
+        expected.append(expected[-1] * sell / 10_700 * 0.998)
+        expected += [expected[-1]] * 2
+        np.testing.assert_allclose(result.equity['AAA'], expected)
+
+        trade = result.trades.iloc[0]
+        assert len(result.trades) == 1
+        assert (trade['entry_date'], trade['exit_date']) == (dates[1], dates[3])
+        assert trade['sessions'] == 2
+        assert trade['return_pct'] == pytest.approx((expected[3] - 1) * 100)
+
+    def test_settlement_counts_own_sessions(self):
+        """Test a halt does not shorten T+2 and proceeds settle before the next buy"""
+        dates = pd.bdate_range('2024-01-01', periods=8)
+        close = np.linspace(10_000, 10_700, 8)
+        panel = pd.DataFrame({'symbol': 'BBB', 'date': dates, 'open': close, 'close': close})
+        # AAA does not trade on sessions 2 and 3
+        traded = [0, 1, 4, 5, 6, 7]
+        panel = pd.concat([panel, panel.iloc[traded].assign(symbol='AAA')], ignore_index=True)
+        target = pd.DataFrame({'AAA': [True, False, False, False, False, True, True, True]}, index=dates)
+        result = BacktestEngine(panel, costs=CostModel(commission=0, sell_tax=0)).run(target)
+
+        trades = result.trades
+        assert list(trades['entry_date']) == [dates[1], dates[7]]
+        # Bought on session 1, the shares arrive two AAA sessions later (session 5)
+        assert trades['exit_date'].iloc[0] == dates[5]
+        # The sale proceeds arrive on session 7, not session 6
+        assert pd.isna(trades['exit_date'].iloc[1])
+
+    def test_crossover_universe(self, make_panel):
+        """Test per-symbol runs equal a one-symbol backtest and halts keep equity flat"""
+        panel = make_panel(**PANEL_OPTIONS)
+        engine = BacktestEngine(panel)
+        result = engine.run_crossover(9, 21)
+
+        single = BacktestEngine(panel[panel['symbol'] == 'S3']).run_crossover(9, 21)
+        np.testing.assert_allclose(result.equity['S3'], single.equity['S3'])
+
+        halted = result.equity['S0'].iloc[100:120]
+        assert halted.nunique() == 1
+        assert (result.trades['sessions'] >= 2).all()
+        pd.testing.assert_series_equal(result.portfolio, result.equity.mean(axis=1).rename('portfolio'))
+
+        summary = result.symbol_summary()
+        assert summary.loc['S3', 'trades'] == len(single.trades)
+        assert summary.loc['S3', 'total_return'] == pytest.approx(single.summary()['total_return'])
+
+    def test_ema_matches_per_symbol(self, make_panel):
+        """Test EMAs skip halted sessions like a per-symbol ewm"""
+        panel = make_panel(**PANEL_OPTIONS)
+        close = panel.pivot(index='date', columns='symbol', values='close')
+        s0 = panel[panel['symbol'] == 'S0'].set_index('date')['close']
+        np.testing.assert_allclose(moving_average(close, 21)['S0'].dropna(),
+                                   s0.ewm(span=21, adjust=False).mean())
+        np.testing.assert_allclose(moving_average(close, 20, 'sma')['S0'].dropna(),
+                                   s0.rolling(20).mean().dropna())
+
+    def test_sweep_parallel(self, make_panel):
+        """Test the process pool returns the same results as in-process runs"""
+        engine = BacktestEngine(make_panel(**PANEL_OPTIONS))
+        pairs = [(5, 20), (9, 21), (12, 26), (30, 10)]
+
+        serial = engine.sweep(pairs, max_workers=1)
+        parallel = engine.sweep(pairs, max_workers=2, chunk_size=1)
+        assert len(serial) == 3
+        pd.testing.assert_frame_equal(serial, parallel)
@@ -0,0 +1,83 @@
+"""
+Tests for the batch growth export
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.fundamental.batch_export import GrowthBatchExporter, analyze_chunk, iter_chunks
+from src.analysis.fundamental.growth_analyzer import GrowthAnalyzer
+
+METRICS = ('CIS_10', 'CIS_20', 'CIS_25', 'CIS_26', 'CIS_61', 'CCFI_2')
+
+
+def make_fundamentals(tickers=('AAA', 'BBB', 'CCC', 'DDD', 'EEE')) -> pd.DataFrame:
+    """Create shuffled long-format fundamentals for several tickers"""
+    rng = np.random.default_rng(4)
+    rows = []
+    for ticker in tickers:
+        for year in range(2019, 2024):
+            for quarter in range(0, 5):
+                freq = 'Y' if quarter == 0 else 'Q'
+                report_date = pd.Timestamp(year, 12 if quarter == 0 else quarter * 3, 28)
+                for metric in METRICS:
+                    value = rng.uniform(1e11, 1e12) * (-0.1 if metric in ('CIS_25', 'CIS_26') else 1)
+                    rows.append((ticker, metric, freq, year, quarter, report_date, value))
+    df = pd.DataFrame(rows, columns=['SECURITY_CODE', 'METRIC_CODE', 'FREQ_CODE', 'YEAR',
+                                     'QUARTER', 'REPORT_DATE', 'METRIC_VALUE'])
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+class TestBatchExport:
+    """Test grouped chunking, parity and the Parquet datasets"""
+
+    def test_chunks_hold_whole_tickers(self):
+        """Test every ticker's rows land in exactly one chunk"""
+        data = make_fundamentals()
+        chunks = list(iter_chunks(data, chunk_size=2))
+
+        assert [sorted(c['SECURITY_CODE'].unique()) for c in chunks] == [['AAA', 'BBB'], ['CCC', 'DDD'], ['EEE']]
+        assert sum(len(c) for c in chunks) == len(data)
+
+    def test_matches_serial_analysis(self):
+        """Test chunk results equal per-ticker generate_growth_analysis"""
+        data = make_fundamentals()
+        combined, status = analyze_chunk(data)
+        analyzer = GrowthAnalyzer(data=data)
+
+        assert all(error is None for error in status.values())
+        for ticker in ('AAA', 'DDD'):
+            expected = analyzer.generate_growth_analysis(ticker)
+            for name, df in expected.items():
+                got = combined[name][combined[name]['STOCK'] == ticker].drop(columns='STOCK')
+                pd.testing.assert_frame_equal(got.reset_index(drop=True), df.reset_index(drop=True),
+                                              check_names=False)
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_export_datasets(self, tmp_path, max_workers):
+        """Test one year-partitioned dataset per result type and the report"""
+        data = make_fundamentals()
+        exporter = GrowthBatchExporter(data, tmp_path / "growth", max_workers=max_workers, chunk_size=2)
+        report = exporter.run()
+
+        assert report.succeeded == ['AAA', 'BBB', 'CCC', 'DDD', 'EEE']
+        assert report.tickers_per_second > 0
+        assert set(report.paths) == {'quarterly_data', 'annual_data', 'ttm_growth_data',
+                                     'quarterly_margins', 'annual_margins'}
+
+        quarterly = pd.read_parquet(report.paths['quarterly_margins'])
+        assert len(quarterly) == report.rows['quarterly_margins'] == 5 * 5 * 4
+        assert {'Gross_Margin', 'EBITDA_Margin', 'STOCK'} <= set(quarterly.columns)
+        assert (tmp_path / "growth" / "quarterly_margins" / "YEAR=2023").is_dir()
+        assert (tmp_path / "growth" / "ttm_growth_data" / "Year=2023").is_dir()
+
+        # Re-running replaces the datasets
+        report = exporter.run(['AAA'])
+        assert set(pd.read_parquet(report.paths['annual_data'])['STOCK']) == {'AAA'}
@@ -0,0 +1,64 @@
+"""
+Tests for the vectorized movers engine
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.technical.movers import MoversEngine
+
+
+# Fifty listed symbols and HALT, which stops trading five sessions early
+PANEL_OPTIONS = dict(symbols=[f"S{i:02d}" for i in range(50)] + ['HALT'], n_days=60,
+                     stop_at={'HALT': 55})
+
+
+class TestMoversEngine:
+    """Test MoversEngine metrics and ranking"""
+
+    def test_metrics_match_per_symbol(self, make_panel):
+        """Test returns, gap and volume ratio against per-symbol calculations"""
+        panel = make_panel(**PANEL_OPTIONS)
+        engine = MoversEngine(panel, volume_window=20)
+
+        for symbol in ['S05', 'HALT']:
+            df = panel[panel['symbol'] == symbol]
+            row = engine.table.loc[symbol]
+            close, volume = df['close'].to_numpy(), df['volume'].to_numpy()
+
+            assert row['date'] == df['date'].iloc[-1]
+            assert row['ret_1d'] == pytest.approx((close[-1] / close[-2] - 1) * 100)
+            assert row['ret_5d'] == pytest.approx((close[-1] / close[-6] - 1) * 100)
+            assert row['ret_20d'] == pytest.approx((close[-1] / close[-21] - 1) * 100)
+            assert row['gap_pct'] == pytest.approx((df['open'].iloc[-1] / close[-2] - 1) * 100)
+            assert row['volume_ratio'] == pytest.approx(volume[-1] / volume[-21:-1].mean())
+
+    def test_top_k_matches_full_sort(self, make_panel):
+        """Test argpartition top-k equals a full sort"""
+        engine = MoversEngine(make_panel(**PANEL_OPTIONS))
+        expected = engine.table['ret_5d'].sort_values(ascending=False).index[:7]
+
+        assert list(engine.top('ret_5d', k=7).index) == list(expected)
+        losers = engine.top('ret_5d', k=3, ascending=True)
+        assert list(losers['ret_5d']) == sorted(engine.table['ret_5d'])[:3]
+
+    def test_filters(self, make_panel):
+        """Test sector and trading value filters"""
+        sectors = {f"S{i:02d}": ('Ngân hàng' if i % 2 else 'Bất động sản') for i in range(50)}
+        engine = MoversEngine(make_panel(**PANEL_OPTIONS), sectors=sectors)
+
+        banks = engine.top('ret_1d', k=100, sectors=['Ngân hàng'])
+        assert len(banks) == 25
+        assert set(banks['sector']) == {'Ngân hàng'}
+
+        threshold = engine.table['trading_value'].median()
+        liquid = engine.top('ret_1d', k=100, min_trading_value=threshold)
+        assert (liquid['trading_value'] >= threshold).all()
+
+        with pytest.raises(ValueError):
+            engine.top('unknown')
@@ -0,0 +1,73 @@
+"""
+Tests for the correlated-peer index
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.technical.peers import PeerIndex
+
+
+def make_returns(n_sectors: int = 4, per_sector: int = 8, n_days: int = 150) -> pd.DataFrame:
+    """Create returns where symbols of a sector share a factor; S0_0 misses sessions"""
+    rng = np.random.default_rng(11)
+    columns = {}
+    for sector in range(n_sectors):
+        factor = rng.normal(0, 0.01, n_days)
+        for i in range(per_sector):
+            columns[f"S{sector}_{i}"] = factor + rng.normal(0, 0.006 + 0.001 * i, n_days)
+    returns = pd.DataFrame(columns, index=pd.bdate_range('2024-01-01', periods=n_days))
+    returns.iloc[rng.choice(n_days, 30, replace=False), 0] = np.nan
+    return returns
+
+
+class TestPeerIndex:
+    """Test index construction, lookups and persistence"""
+
+    def test_matches_full_correlation(self):
+        """Test blocked top-k equals a full pairwise correlation matrix"""
+        returns = make_returns()
+        index = PeerIndex.build(returns, k=5, window=120, block_size=7)
+        full = returns.tail(120).corr(min_periods=60)
+
+        for symbol in ['S0_0', 'S2_3', 'S3_7']:
+            expected = full[symbol].drop(symbol).sort_values(ascending=False).head(5)
+            peers = index.peers_of(symbol)
+            assert list(peers['peer']) == list(expected.index)
+            np.testing.assert_allclose(peers['correlation'], expected, rtol=1e-5)
+            # Peers share the sector factor
+            assert all(peer.split('_')[0] == symbol.split('_')[0] for peer in peers['peer'])
+
+    def test_suggest(self):
+        """Test suggestions respect min/max companies and the correlation floor"""
+        index = PeerIndex.build(make_returns(), k=10, window=120)
+
+        assert len(index.suggest('S1_0', min_companies=3, max_companies=5)) == 5
+        assert index.suggest('S1_0', min_companies=3, max_companies=10)[:7] == index.suggest(
+            'S1_0', min_companies=3, max_companies=7)
+        # Nothing clears the floor: the minimum count is still suggested
+        assert len(index.suggest('S1_0', min_companies=3, max_companies=10, min_correlation=0.99)) == 3
+        assert index.suggest('S1_0', candidates=['S1_4', 'S2_0']) == ['S1_4', 'S2_0']
+        assert index.suggest('UNKNOWN') == []
+
+    def test_load_or_build(self, tmp_path):
+        """Test the stored index is reused for the same data version only"""
+        path = tmp_path / "peers.npz"
+        returns = make_returns()
+        built = PeerIndex.load_or_build(returns, "v1", path, k=5)
+        assert path.exists()
+
+        loaded = PeerIndex.load(path)
+        assert loaded.version == "v1" and loaded.k == 5
+        np.testing.assert_array_equal(loaded.peers, built.peers)
+        assert list(loaded.symbols) == list(returns.columns)
+
+        rebuilt = PeerIndex.load_or_build(returns.iloc[:, :10], "v2", path, k=5)
+        assert len(rebuilt) == 10
+        assert PeerIndex.load(path).version == "v2"
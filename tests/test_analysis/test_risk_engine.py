@@ -0,0 +1,82 @@
+"""
+Tests for the vectorized risk engine
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.technical.risk_engine import RiskEngine
+from src.utils.calculations import (
+    calculate_max_drawdown, calculate_returns, calculate_sharpe_ratio, calculate_volatility
+)
+
+
+# Twenty symbols loading 0.5-1.45 on the market; GAP misses sessions, LATE lists late
+BETAS = 0.5 + np.arange(20) / 20
+PANEL_OPTIONS = dict(symbols=[f"S{i:02d}" for i in range(20)] + ['GAP', 'LATE'],
+                     betas=list(BETAS) + [1.0, 1.0], gaps={'GAP': 0.1}, start_at={'LATE': 150})
+
+
+class TestRiskEngine:
+    """Test RiskEngine metrics against the per-symbol calculations"""
+
+    def test_metrics_match_per_symbol(self, make_panel):
+        """Test volatility, Sharpe and drawdown against src/utils/calculations.py"""
+        panel = make_panel(**PANEL_OPTIONS)
+        engine = RiskEngine(panel, window=20)
+
+        for symbol in ['S03', 'GAP', 'LATE']:
+            prices = panel[panel['symbol'] == symbol].set_index('date')['close']
+            returns = calculate_returns(prices)
+            row = engine.table.loc[symbol]
+
+            assert row['bars'] == len(prices)
+            assert row['volatility'] == pytest.approx(returns.std() * np.sqrt(252))
+            assert row['rolling_volatility'] == pytest.approx(calculate_volatility(returns, 20).iloc[-1])
+            assert row['sharpe'] == pytest.approx(calculate_sharpe_ratio(returns))
+            # The engine counts the first bar as a peak; a repeated first price does the same here
+            first_peak = pd.concat([prices.iloc[:1], prices])
+            assert row['max_drawdown'] == pytest.approx(calculate_max_drawdown(first_peak))
+
+    def test_beta_against_benchmark(self, make_panel):
+        """Test beta and correlation use the index when it is in the panel"""
+        panel = make_panel(**PANEL_OPTIONS)
+        index = panel[panel['symbol'] == 'S05'].assign(symbol='VNINDEX')
+        engine = RiskEngine(pd.concat([panel, index], ignore_index=True))
+
+        market = engine.returns['VNINDEX']
+        stock = engine.returns['S12']
+        assert engine.table.loc['S12', 'beta'] == pytest.approx(stock.cov(market) / market.var())
+        assert engine.table.loc['S12', 'market_correlation'] == pytest.approx(stock.corr(market))
+        assert engine.table.loc['VNINDEX', 'beta'] == pytest.approx(1.0)
+
+        # Without the index the value-weighted proxy tracks the common factor
+        proxy = RiskEngine(panel)
+        assert proxy.table['beta'].drop(['GAP', 'LATE']).corr(
+            pd.Series(BETAS, index=[f"S{i:02d}" for i in range(20)])) > 0.8
+
+    def test_correlation_and_covariance(self, make_panel):
+        """Test matrices match pandas pairwise-complete results"""
+        engine = RiskEngine(make_panel(**PANEL_OPTIONS), min_periods=20)
+        returns = engine.returns
+
+        np.testing.assert_allclose(engine.correlation(), returns.corr(min_periods=20), atol=1e-10)
+        np.testing.assert_allclose(engine.covariance(), returns.cov(min_periods=20) * 252, atol=1e-12)
+
+        subset = engine.correlation(['S01', 'LATE', 'GAP'])
+        assert list(subset.index) == ['S01', 'LATE', 'GAP']
+        # LATE only overlaps the last 100 sessions
+        assert subset.loc['S01', 'LATE'] == pytest.approx(returns['S01'].corr(returns['LATE']))
+        assert returns['LATE'].count() == 99
+
+    def test_empty_panel(self):
+        """Test an empty panel yields an empty table"""
+        engine = RiskEngine(pd.DataFrame(columns=['symbol', 'date', 'close', 'volume']))
+        assert engine.table.empty
@@ -0,0 +1,122 @@
+"""
+Tests for the vectorized signal engine and events store
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.technical.signal_engine import SignalEngine, SignalStore, crossings, group_starts
+
+
+SYMBOLS = ['AAA', 'BBB', 'CCC']
+
+
+class TestCrossings:
+    """Test sign-difference crossing detection"""
+
+    def test_touch_is_not_a_cross(self):
+        """Test equal values carry the previous side"""
+        a = np.array([1.0, 2.0, 3.0, 3.0, 4.0, 2.0, 3.0, 1.0])
+        result = crossings(a, 3.0)
+        # 2 -> 3 (touch) -> 4 crosses up once; 4 -> 2 crosses down; 3 touches; 1 stays below
+        assert list(result) == [0, 0, 0, 0, 1, -1, 0, 0]
+
+    def test_equal_start_and_group_boundaries(self):
+        """Test equal seeds and group starts never produce events"""
+        a = np.array([5.0, 6.0, 1.0, 2.0])
+        b = np.array([5.0, 5.0, 3.0, 3.0])
+        starts = group_starts(np.array([0, 0, 1, 1]))
+        assert list(crossings(a, b, starts)) == [0, 0, 0, 0]
+
+
+class TestSignalEngine:
+    """Test panel-wide event detection"""
+
+    def test_ema_cross_matches_per_symbol(self, make_panel):
+        """Test panel EMA crosses equal a per-symbol calculation"""
+        panel = make_panel(SYMBOLS, n_days=300, categorical=True)
+        events = SignalEngine().detect(panel.sample(frac=1, random_state=3))
+        ema_events = events[events['signal'] == 'ema_cross']
+        assert len(ema_events) > 0
+
+        for symbol, bars in panel.groupby('symbol', observed=True):
+            fast = bars['close'].ewm(span=9, adjust=False).mean()
+            slow = bars['close'].ewm(span=21, adjust=False).mean()
+            # Sign flips only; the equal EMA seeds on the first bar are not a cross
+            cross = np.sign(fast - slow).diff().abs().to_numpy()
+            expected = bars['date'].to_numpy()[cross == 2]
+
+            got = ema_events[ema_events['symbol'] == symbol]
+            assert list(got['date']) == list(expected)
+            assert set(got['direction']) <= {1, -1}
+
+    def test_breakout_rsi_and_macd(self):
+        """Test breakout, RSI threshold and MACD events on a crafted series"""
+        dates = pd.bdate_range('2024-01-01', periods=80)
+        # Choppy base (RSI near 50), a slide, then a rally
+        close = np.r_[100 + 0.5 * (-1.0) ** np.arange(30), np.linspace(99, 60, 20), np.linspace(60, 140, 30)]
+        panel = pd.DataFrame({
+            'symbol': 'AAA', 'date': dates, 'open': close,
+            'high': close + 1, 'low': close - 1, 'close': close, 'volume': 1.0
+        })
+        events = SignalEngine().detect(panel)
+        by_signal = {name: group for name, group in events.groupby('signal')}
+
+        assert (by_signal['breakout']['direction'] == -1).any()
+        assert (by_signal['breakout']['direction'] == 1).any()
+        assert (by_signal['rsi_oversold']['direction'] == 1).all()
+        assert (by_signal['rsi_overbought']['direction'] == -1).all()
+        assert set(by_signal['macd_zero']['direction']) == {1, -1}
+
+        # The first breakdown happens on the first falling session
+        first_down = by_signal['breakout'].loc[by_signal['breakout']['direction'] == -1, 'date'].iloc[0]
+        assert first_down == dates[31]
+
+
+class TestSignalStore:
+    """Test the SQLite events table"""
+
+    def test_query_and_todays_signals(self, tmp_path, make_panel):
+        """Test queries by symbol, signal, range and latest session"""
+        panel = make_panel(SYMBOLS, n_days=300, categorical=True)
+        events = SignalEngine().detect(panel)
+        store = SignalStore(tmp_path / "signals.db")
+        store.replace(events, "v1")
+
+        assert store.version == "v1"
+        assert len(store.query()) == len(events)
+
+        aaa = store.query('AAA', ['ema_cross'])
+        expected = events[(events['symbol'] == 'AAA') & (events['signal'] == 'ema_cross')]
+        assert list(aaa['date']) == list(expected['date'])
+        assert list(aaa['direction']) == list(expected['direction'])
+
+        start, end = panel['date'].iloc[50], panel['date'].iloc[100]
+        ranged = store.query(start=start, end=end, direction=1)
+        assert ranged['date'].between(start, end).all()
+        assert (ranged['direction'] == 1).all()
+
+        latest = store.latest_date()
+        assert latest == events['date'].max()
+        today = store.todays_signals()
+        assert (today['date'] == latest).all()
+        assert len(today) == (events['date'] == latest).sum()
+        assert sum(sum(d.values()) for d in store.counts().values()) == len(today)
+        store.close()
+
+    def test_refresh_skips_same_version(self, tmp_path, make_panel):
+        """Test events are recomputed only when the data version changes"""
+        store = SignalStore(tmp_path / "signals.db")
+        panel = make_panel(SYMBOLS, n_days=120, categorical=True)
+
+        assert store.refresh(panel, "v1")
+        assert not store.refresh(panel, "v1")
+        assert store.refresh(make_panel(['AAA'], n_days=120, categorical=True), "v2")
+        assert set(store.query()['symbol']) == {'AAA'}
+        store.close()
@@ -0,0 +1,101 @@
+"""
+Tests for the transposed statement tables
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.analysis.fundamental.statement_tables import (
+    StatementTableStore, SUMMARY_METRICS, add_ebitda, build_statement_table, summarize_statement
+)
+
+
+def make_quarterly(years=range(2016, 2024)) -> pd.DataFrame:
+    """Create shuffled wide quarterly data"""
+    rows = [(y, q) for y in years for q in range(1, 5)]
+    df = pd.DataFrame(rows, columns=['YEAR', 'QUARTER'])
+    n = len(df)
+    df['CIS_10'] = np.arange(n, dtype=float) * 100
+    df['CIS_20'] = np.arange(n, dtype=float) * 30
+    df['CIS_25'] = -5.0
+    df['CIS_26'] = -3.0
+    df['CCFI_2'] = 2.0
+    df['CIS_61'] = np.where(np.arange(n) % 5 == 0, np.nan, np.arange(n, dtype=float))
+    df['REPORT_DATE'] = pd.Timestamp('2024-01-01')
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+class TestStatementTables:
+    """Test table layout, period ordering and summaries"""
+
+    def test_quarterly_table_layout(self):
+        """Test metric rows, chronological period columns and values"""
+        data = add_ebitda(make_quarterly())
+        table = build_statement_table(data, "Income Statement", is_quarterly=True)
+
+        assert table.columns[0] == 'Chỉ tiêu'
+        assert list(table['Chỉ tiêu']) == ['Doanh thu thuần', 'Lợi nhuận gộp', 'Chi phí QLDN',
+                                          'Chi phí bán hàng', 'Lợi nhuận ròng',
+                                          'Lợi nhuận hoạt động', 'EBITDA']
+        periods = list(table.columns[1:])
+        assert periods[:5] == ['1Q2018', '2Q2018', '3Q2018', '4Q2018', '1Q2019']
+        assert periods[-1] == '4Q2023'
+        assert len(periods) == 24
+
+        expected = data.set_index(['YEAR', 'QUARTER']).loc[(2020, 3), 'CIS_10']
+        revenue = table.set_index('Chỉ tiêu').loc['Doanh thu thuần', '3Q2020']
+        assert revenue == expected
+
+    def test_annual_and_duplicates(self):
+        """Test annual labels and that the last duplicate period wins"""
+        data = pd.DataFrame({'YEAR': [2019, 2018, 2019], 'CBS_270': [1.0, 2.0, 3.0]})
+        table = build_statement_table(data, "Balance Sheet", is_quarterly=False)
+        assert list(table.columns) == ['Chỉ tiêu', '2018', '2019']
+        assert table.loc[0, '2019'] == 3.0
+
+    def test_unknown_or_empty(self):
+        """Test empty results when nothing can be shown"""
+        assert build_statement_table(pd.DataFrame(), "Income Statement").empty
+        assert build_statement_table(make_quarterly(), "Unknown").empty
+        assert build_statement_table(make_quarterly(), "Cash Flow").empty is False
+        assert build_statement_table(make_quarterly()[['YEAR', 'QUARTER']], "Margins").empty
+
+    def test_summary_matches_numpy(self):
+        """Test summary statistics skip missing values"""
+        table = build_statement_table(add_ebitda(make_quarterly()), "Income Statement")
+        stats = summarize_statement(table, SUMMARY_METRICS["Income Statement"]).set_index('Chỉ tiêu')
+
+        assert list(stats.index) == ['Doanh thu thuần', 'Lợi nhuận gộp', 'Lợi nhuận ròng', 'EBITDA']
+        values = table.set_index('Chỉ tiêu').loc['Lợi nhuận ròng'].dropna().to_numpy(dtype=float)
+        assert stats.loc['Lợi nhuận ròng', 'Trung bình'] == pytest.approx(np.mean(values))
+        assert stats.loc['Lợi nhuận ròng', 'Độ lệch chuẩn'] == pytest.approx(np.std(values))
+        assert stats.loc['Lợi nhuận ròng', 'Tối đa'] == np.max(values)
+
+    def test_store_builds_each_ticker_once(self):
+        """Test the store caches all tables of a ticker"""
+        calls = []
+
+        def analyze(ticker):
+            calls.append(ticker)
+            quarterly = make_quarterly()
+            annual = quarterly.groupby('YEAR', as_index=False)[['CIS_10', 'CIS_20']].sum()
+            return {'quarterly_data': quarterly, 'annual_data': annual}
+
+        store = StatementTableStore(analyze)
+        annual = store.get('FPT', "Income Statement", is_quarterly=False)
+        assert list(annual.columns[1:]) == [str(y) for y in range(2018, 2024)]
+        assert 'EBITDA' in list(store.get('FPT', "Financial Data")['Chỉ tiêu'])
+        assert store.get('VNM', "Margins").empty
+        assert 'FPT' in store and len(store) == 2
+        assert calls == ['FPT', 'VNM']
+
+        store.invalidate('FPT')
+        store.get('FPT', "Cash Flow")
+        assert calls == ['FPT', 'VNM', 'FPT']
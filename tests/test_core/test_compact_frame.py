@@ -0,0 +1,91 @@
+"""
+Tests for the compact fundamentals frame and ticker slicing
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.compact_frame import estimate_default_memory, frame_memory, read_compact_parquet, ticker_slice
+from src.core.data_manager import DataManager
+
+
+def make_fundamentals(path: Path) -> pd.DataFrame:
+    """Write a small long-format fundamentals parquet in shuffled order"""
+    rng = np.random.default_rng(0)
+    rows = []
+    for ticker, industry in [('VNM', 'Thực phẩm'), ('FPT', 'Công nghệ'), ('HPG', 'Tài nguyên')]:
+        for year in range(2019, 2024):
+            for quarter in range(1, 5):
+                for metric in ['CIS_10', 'CIS_20', 'CBS_270']:
+                    rows.append({
+                        'SECURITY_CODE': ticker,
+                        'METRIC_CODE': metric,
+                        'METRIC_VALUE': float(rng.integers(1, 10_000)),
+                        'FREQ_CODE': 'Q',
+                        'YEAR': year,
+                        'QUARTER': quarter,
+                        'ICB_L2': industry
+                    })
+    df = pd.DataFrame(rows).sample(frac=1, random_state=0).reset_index(drop=True)
+    df.to_parquet(path)
+    return df
+
+
+class TestCompactFrame:
+    """Test compact load mode"""
+
+    def test_dtypes_and_report(self, tmp_path):
+        """Test compact dtypes and a positive memory reduction"""
+        make_fundamentals(tmp_path / "data.parquet")
+        df, report = read_compact_parquet(tmp_path / "data.parquet", float32_values=True)
+
+        assert isinstance(df['SECURITY_CODE'].dtype, pd.CategoricalDtype)
+        assert isinstance(df['METRIC_CODE'].dtype, pd.CategoricalDtype)
+        assert df['YEAR'].dtype == 'int16'
+        assert df['METRIC_VALUE'].dtype == 'float32'
+        assert report['compact_mb'] < report['baseline_mb']
+        assert report['reduction_pct'] > 0
+
+    def test_baseline_matches_default_read(self, tmp_path):
+        """Test the baseline estimate is the size of a plain pd.read_parquet frame"""
+        make_fundamentals(tmp_path / "data.parquet")
+        dictionary_columns = ['SECURITY_CODE', 'METRIC_CODE', 'FREQ_CODE', 'ICB_L2']
+        encoded = pd.read_parquet(tmp_path / "data.parquet", read_dictionary=dictionary_columns)
+
+        plain = pd.read_parquet(tmp_path / "data.parquet")
+        assert estimate_default_memory(encoded) == pytest.approx(frame_memory(plain), rel=0.01)
+
+    def test_ticker_slice(self, tmp_path):
+        """Test binary-search slice matches a boolean mask"""
+        original = make_fundamentals(tmp_path / "data.parquet")
+        df, _ = read_compact_parquet(tmp_path / "data.parquet")
+
+        rows = df.iloc[ticker_slice(df, 'SECURITY_CODE', 'FPT')]
+        assert len(rows) == (original['SECURITY_CODE'] == 'FPT').sum()
+        assert set(rows['SECURITY_CODE']) == {'FPT'}
+        assert ticker_slice(df, 'SECURITY_CODE', 'XXX') == slice(0, 0)
+
+    def test_data_manager_compact_lookup(self, tmp_path):
+        """Test DataManager uses the compact frame for ticker lookups"""
+        original = make_fundamentals(tmp_path / "data.parquet")
+        config = SimpleNamespace(
+            paths=SimpleNamespace(parquet_path=tmp_path / "data.parquet",
+                                  metadata_path=None, cache_dir=tmp_path / "cache"),
+            data=SimpleNamespace(cache_ttl=3600, compact_main_data=True)
+        )
+        manager = DataManager(config)
+
+        data = manager.get_ticker_data('vnm')
+        expected = original[original['SECURITY_CODE'] == 'VNM']
+
+        assert len(data) == len(expected)
+        assert data['METRIC_VALUE'].sum() == pytest.approx(expected['METRIC_VALUE'].sum())
+        assert manager.get_memory_report()['reduction_pct'] > 0
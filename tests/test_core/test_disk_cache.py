@@ -0,0 +1,158 @@
+"""
+Tests for the SQLite disk cache and DataManager integration
+"""
+
+import pandas as pd
+import numpy as np
+import atexit
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.disk_cache import DiskCache, get_disk_cache, serialize
+from src.core.data_manager import DataManager
+
+
+def make_frame(rows: int = 1000) -> pd.DataFrame:
+    """Create a numeric test frame"""
+    return pd.DataFrame({
+        'close': np.arange(rows, dtype='float64'),
+        'volume': np.arange(rows, dtype='int64')
+    })
+
+
+class TestDiskCache:
+    """Test DiskCache behaviour"""
+
+    def test_round_trip_after_flush(self, tmp_path):
+        """Test frames and plain objects survive a reopen"""
+        cache = DiskCache(tmp_path / "cache.db", flush_threshold=100)
+        cache.set('frame', make_frame())
+        cache.set('info', {'ticker': 'VNM', 'count': 3})
+        cache.close()
+
+        reopened = DiskCache(tmp_path / "cache.db")
+        pd.testing.assert_frame_equal(reopened.get('frame'), make_frame())
+        assert reopened.get('info') == {'ticker': 'VNM', 'count': 3}
+        reopened.close()
+
+    def test_write_behind(self, tmp_path):
+        """Test writes are buffered until flush"""
+        cache = DiskCache(tmp_path / "cache.db", flush_threshold=100, flush_interval=3600)
+        cache.set('a', make_frame())
+
+        assert cache.get_stats()['entries'] == 0
+        assert cache.get('a') is not None
+
+        cache.flush()
+        assert cache.get_stats()['entries'] == 1
+        cache.close()
+
+    def test_ttl_longer_than_a_day(self, tmp_path):
+        """Test expiry uses total elapsed time, not the seconds component"""
+        cache = DiskCache(tmp_path / "cache.db", ttl=3600)
+        cache.set('a', make_frame())
+        cache.flush()
+
+        # Backdate expiry by 8 days
+        cache.conn.execute(
+            'UPDATE cache_entries SET expires_at = ?', (time.time() - 8 * 86400,)
+        )
+        cache.conn.commit()
+
+        assert cache.get('a') is None
+        cache.close()
+
+    def test_size_bounded_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over budget"""
+        _, payload = serialize(make_frame())
+        cache = DiskCache(tmp_path / "cache.db", max_bytes=int(len(payload) * 1.5),
+                          flush_threshold=1)
+        cache.set('a', make_frame())
+        cache.set('b', make_frame())
+
+        assert cache.get_stats()['entries'] == 1
+        assert cache.get('a') is None
+        assert cache.get('b') is not None
+        cache.close()
+
+    def test_unchanged_payload_not_rewritten(self, tmp_path):
+        """Test identical writes only refresh expiry"""
+        cache = DiskCache(tmp_path / "cache.db", flush_threshold=1)
+        cache.set('a', make_frame())
+        created = cache.conn.execute('SELECT created_at FROM cache_entries').fetchone()[0]
+
+        time.sleep(0.01)
+        cache.set('a', make_frame())
+        assert cache.conn.execute('SELECT created_at FROM cache_entries').fetchone()[0] == created
+        cache.close()
+
+    def test_shared_per_file(self, tmp_path):
+        """Test one open instance is shared per file and reopened after close"""
+        cache = get_disk_cache(tmp_path / "cache.db", flush_threshold=100)
+        assert get_disk_cache(tmp_path / "." / "cache.db") is cache
+        assert get_disk_cache(tmp_path / "other.db") is not cache
+
+        cache.set('a', make_frame())
+        cache.close()
+        reopened = get_disk_cache(tmp_path / "cache.db")
+        assert reopened is not cache
+        pd.testing.assert_frame_equal(reopened.get('a'), make_frame())
+        reopened.close()
+
+    def test_close_unregisters_exit_hook(self, tmp_path, monkeypatch):
+        """Test closed caches are not held by the exit hook"""
+        registered = []
+        monkeypatch.setattr(atexit, 'register', registered.append)
+        monkeypatch.setattr(atexit, 'unregister', registered.remove)
+
+        cache = DiskCache(tmp_path / "cache.db")
+        assert registered == [cache.close]
+        cache.close()
+        assert registered == []
+
+
+class TestDataManagerCache:
+    """Test DataManager cache wiring"""
+
+    def _make_manager(self, tmp_path):
+        config = SimpleNamespace(
+            paths=SimpleNamespace(parquet_path=None, metadata_path=None, cache_dir=tmp_path),
+            data=SimpleNamespace(cache_ttl=3600, memory_cache_mb=16, disk_cache_mb=16)
+        )
+        return DataManager(config)
+
+    def test_managers_share_disk_cache(self, tmp_path):
+        """Test managers over one cache dir see each other's writes"""
+        first, second = self._make_manager(tmp_path), self._make_manager(tmp_path)
+        assert first._disk_cache is second._disk_cache
+
+        first.cache_data('prices', make_frame())
+        first.memory_cache.clear()
+        pd.testing.assert_frame_equal(second.get_cached_data('prices'), make_frame())
+
+    def test_disk_fallback(self, tmp_path):
+        """Test entries reload from disk after the memory cache is cleared"""
+        manager = self._make_manager(tmp_path)
+        manager.cache_data('prices', make_frame())
+        manager.flush_cache()
+        manager.memory_cache.clear()
+
+        pd.testing.assert_frame_equal(manager.get_cached_data('prices'), make_frame())
+
+    def test_clear_cache_keeps_foreign_files(self, tmp_path):
+        """Test clearing does not delete unrelated files in the cache dir"""
+        foreign = tmp_path / "tcbs_cache.pkl"
+        foreign.write_bytes(b'keep')
+
+        manager = self._make_manager(tmp_path)
+        manager.cache_data('prices', make_frame())
+        manager.clear_cache()
+
+        assert foreign.exists()
+        assert manager.get_cached_data('prices') is None
@@ -0,0 +1,99 @@
+"""
+Tests for Excel Parquet sidecars and the metadata index
+"""
+
+import pandas as pd
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.data_manager import DataManager
+from src.core.excel_cache import ExcelCache
+from src.data.loaders.metadata_loader import MetadataLoader
+
+
+def write_metadata(path: Path, descriptions=('Doanh thu', 'Lợi nhuận', 'Tổng tài sản')) -> Path:
+    """Write a small metadata workbook"""
+    pd.DataFrame({
+        'COLUMN_NAME': ['CIS_10', 'CIS_61', 'CBS_270'],
+        'DATA_TYPE': ['NUMBER', 'NUMBER', 'NUMBER'],
+        'Mô tả': list(descriptions),
+    }).to_excel(path, index=False)
+    return path
+
+
+def count_excel_reads(monkeypatch) -> list:
+    """Record calls to pd.read_excel"""
+    calls = []
+    original = pd.read_excel
+
+    def read_excel(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(pd, 'read_excel', read_excel)
+    return calls
+
+
+class TestExcelCache:
+    """Test sidecar compilation and rebuild rules"""
+
+    def test_compiles_once(self, tmp_path, monkeypatch):
+        """Test the workbook is parsed once and later reads use the sidecar"""
+        workbook = write_metadata(tmp_path / "CSDL.xlsx")
+        calls = count_excel_reads(monkeypatch)
+
+        first = ExcelCache(tmp_path / "cache").read(workbook)
+        second = ExcelCache(tmp_path / "cache").read(workbook)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert list(second['COLUMN_NAME']) == ['CIS_10', 'CIS_61', 'CBS_270']
+
+    def test_rebuild_on_content_change_only(self, tmp_path, monkeypatch):
+        """Test a touched workbook is reused and an edited one is re-parsed"""
+        workbook = write_metadata(tmp_path / "CSDL.xlsx")
+        cache = ExcelCache(tmp_path / "cache")
+        cache.read(workbook)
+        calls = count_excel_reads(monkeypatch)
+
+        stat = workbook.stat()
+        os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache.read(workbook)
+        assert calls == []
+
+        write_metadata(workbook, descriptions=('Doanh thu thuần', 'Lợi nhuận', 'Tổng tài sản'))
+        assert cache.read(workbook)['Mô tả'].iloc[0] == 'Doanh thu thuần'
+        assert len(calls) == 1
+
+    def test_index(self, tmp_path):
+        """Test the key index is stored and rebuilt with the sidecar"""
+        workbook = write_metadata(tmp_path / "CSDL.xlsx")
+        cache = ExcelCache(tmp_path / "cache")
+
+        assert cache.index(workbook, 'COLUMN_NAME') == {'CIS_10': 0, 'CIS_61': 1, 'CBS_270': 2}
+        assert ExcelCache(tmp_path / "cache").index(workbook, 'COLUMN_NAME')['CBS_270'] == 2
+        assert cache.index(workbook, 'missing') == {}
+
+
+class TestMetadataLoader:
+    """Test metric lookups through the metadata index"""
+
+    def test_get_metric_info(self, tmp_path):
+        """Test metric info is found by code"""
+        config = SimpleNamespace(
+            paths=SimpleNamespace(parquet_path=None, metadata_path=write_metadata(tmp_path / "CSDL.xlsx"),
+                                  cache_dir=tmp_path / "cache"),
+            data=SimpleNamespace(cache_ttl=3600)
+        )
+        loader = MetadataLoader(config, DataManager(config))
+
+        info = loader.get_metric_info('CIS_61')
+        assert info['Mô tả'] == 'Lợi nhuận'
+        assert loader.get_metric_info('CIS_99') is None
+        assert (tmp_path / "cache" / "excel").exists()
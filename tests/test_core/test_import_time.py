@@ -0,0 +1,88 @@
+"""
+Import-time budget tests (python -X importtime)
+
+Cold start of the Streamlit pages and cron scripts depends on which
+modules an import pulls in, so these tests check the imported module
+sets and the time spent in the project's own modules.
+"""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+# Self time allowed in src.* modules for one import statement (microseconds)
+OWN_MODULES_BUDGET_US = 50_000
+
+
+def import_profile(statement: str) -> dict:
+    """
+    Run an import in a fresh interpreter with -X importtime
+
+    Args:
+        statement: Python import statement
+
+    Returns:
+        Module name -> self time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=parent_path, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def own_time(modules: dict) -> int:
+    """Total self time of project modules"""
+    return sum(us for name, us in modules.items() if name == 'src' or name.startswith('src.'))
+
+
+class TestImportTime:
+    """Test lazy package imports and import-time budgets"""
+
+    def test_package_imports_are_lazy(self):
+        """Test package __init__ files do not import their submodules"""
+        modules = import_profile('import src.data.connectors, src.core')
+        assert 'pandas' not in modules
+        assert not any(name.startswith('src.data.connectors.') for name in modules)
+
+    def test_config_without_pandas(self):
+        """Test loading configuration does not pull in pandas or DataManager"""
+        modules = import_profile('from src.core.config import get_config')
+        assert 'pandas' not in modules
+        assert 'src.core.data_manager' not in modules
+
+    @pytest.mark.parametrize('statement', [
+        'from src.data.connectors import OHLCVCacheManager',
+        'from src.data.connectors.visualize_ohlcv import OHLCVVisualizer',
+    ])
+    def test_cache_and_charts_skip_network_stack(self, statement):
+        """Test cache and chart imports leave requests, tqdm and TCBS unloaded"""
+        modules = import_profile(statement)
+        for heavy in ('requests', 'tqdm', 'src.data.connectors.tcbs_connector', 'plotly.express'):
+            assert heavy not in modules, f"{statement} imported {heavy}"
+
+        cache_only = 'OHLCVCacheManager' in statement
+        assert ('plotly' in modules) != cache_only
+
+    @pytest.mark.parametrize('statement', [
+        'from src.data.connectors import OHLCVVisualizer',
+        'from src.data.market_context import MarketDataContext',
+        'from src.analysis.fundamental.statement_tables import StatementTableStore',
+    ])
+    def test_own_modules_budget(self, statement):
+        """Test time spent in project modules stays within budget"""
+        modules = import_profile(statement)
+        assert own_time(modules) < OWN_MODULES_BUDGET_US
@@ -0,0 +1,78 @@
+"""
+Tests for DataManager secondary indexes
+"""
+
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.data_manager import DataManager
+from src.core.indexes import FundamentalsIndex
+
+
+def make_manager(tmp_path: Path, compact: bool = True) -> DataManager:
+    """Create a DataManager over a small long-format parquet"""
+    rows = []
+    for ticker, industry in [('VNM', 'Thực phẩm'), ('MSN', 'Thực phẩm'), ('FPT', 'Công nghệ')]:
+        for year in (2022, 2023):
+            rows.append((ticker, 'CIS_10', year * 10.0, 'Y', year, 0, industry))
+            for quarter in range(1, 5):
+                rows.append((ticker, 'CIS_10', year + quarter, 'Q', year, quarter, industry))
+    df = pd.DataFrame(rows, columns=['SECURITY_CODE', 'METRIC_CODE', 'METRIC_VALUE',
+                                     'FREQ_CODE', 'YEAR', 'QUARTER', 'ICB_L2'])
+    df.iloc[::-1].to_parquet(tmp_path / "data.parquet")
+
+    config = SimpleNamespace(
+        paths=SimpleNamespace(parquet_path=tmp_path / "data.parquet",
+                              metadata_path=None, cache_dir=tmp_path / "cache"),
+        data=SimpleNamespace(cache_ttl=3600, compact_main_data=compact, default_frequency='Y')
+    )
+    return DataManager(config)
+
+
+class TestFundamentalsIndex:
+    """Test index-backed lookups"""
+
+    @pytest.mark.parametrize('compact', [True, False])
+    def test_available_tickers_security_code(self, tmp_path, compact):
+        """Test tickers are found for the SECURITY_CODE schema"""
+        manager = make_manager(tmp_path, compact)
+        assert manager.get_available_tickers() == ['FPT', 'MSN', 'VNM']
+
+    def test_metric_value_periods(self, tmp_path):
+        """Test metric lookup by annual, quarterly and default period"""
+        manager = make_manager(tmp_path)
+
+        assert manager.get_metric_value('VNM', 'CIS_10', '2022') == 20220.0
+        assert manager.get_metric_value('VNM', 'CIS_10', '2023Q2') == 2025.0
+        assert manager.get_metric_value('VNM', 'CIS_10') == 20230.0
+        assert manager.get_metric_value('VNM', 'CIS_99') is None
+
+    def test_metric_value_unsorted_frame(self, tmp_path):
+        """Test the default period is the newest one when rows are not period-ordered"""
+        manager = make_manager(tmp_path, compact=False)
+
+        assert manager.get_metric_value('VNM', 'CIS_10') == 20230.0
+        assert manager.get_metric_value('VNM', 'CIS_10', '2023Q2') == 2025.0
+
+    def test_industry_data(self, tmp_path):
+        """Test industry rows come from the industry index"""
+        manager = make_manager(tmp_path)
+
+        data = manager.get_industry_data('Thực phẩm')
+        assert set(data['SECURITY_CODE']) == {'VNM', 'MSN'}
+        assert manager.get_industry_data('Unknown').empty
+
+    def test_unsorted_frame_positions(self):
+        """Test non-contiguous ticker rows are indexed as positions"""
+        df = pd.DataFrame({'SECURITY_CODE': ['A', 'B', 'A'], 'METRIC_VALUE': [1, 2, 3]})
+        index = FundamentalsIndex(df)
+
+        assert list(index.ticker_rows('A')) == [0, 2]
+        assert index.ticker_rows('B') == slice(1, 2)
@@ -0,0 +1,106 @@
+"""
+Tests for hot-path instrumentation
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core import instrumentation
+from src.core.instrumentation import (
+    Histogram, Recorder, count, process_recorder, record_cache, set_recorder, span, timed,
+    use_session_recorder
+)
+from src.core.memory_cache import MemoryCache
+
+
+@pytest.fixture
+def recording():
+    """Enable instrumentation with a fresh session recorder"""
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.enable(True)
+    process_recorder().reset()
+    session = use_session_recorder({})
+    yield session
+    set_recorder(None)
+    process_recorder().reset()
+    instrumentation.enable(was_enabled)
+
+
+class TestHistogram:
+    """Test percentile estimates from log buckets"""
+
+    def test_percentiles(self):
+        """Test p50/p95 are within one bucket of the exact values"""
+        samples = np.random.default_rng(1).lognormal(mean=1.0, sigma=1.0, size=5000)
+        histogram = Histogram()
+        for ms in samples:
+            histogram.add(ms)
+
+        summary = histogram.summary()
+        assert summary['count'] == 5000
+        assert summary['max_ms'] == samples.max()
+        for q, key in ((50, 'p50_ms'), (95, 'p95_ms')):
+            assert summary[key] == pytest.approx(np.percentile(samples, q), rel=0.2)
+
+
+class TestRecording:
+    """Test spans, counters and the disabled fast path"""
+
+    def test_disabled_records_nothing(self, recording):
+        """Test spans and counters are no-ops while disabled"""
+        instrumentation.enable(False)
+
+        @timed('stage.disabled')
+        def work(x):
+            return x * 2
+
+        with span('stage.block'):
+            assert work(21) == 42
+        count('api.tcbs')
+
+        assert recording.stage_stats() == []
+        assert process_recorder().counter_stats() == []
+
+    def test_spans_and_counters(self, recording):
+        """Test events reach the session and process recorders"""
+        @timed('indicators.test')
+        def work():
+            return 'done'
+
+        assert work() == 'done'
+        with span('chart.test'):
+            pass
+        count('api.tcbs', 3)
+
+        for recorder in (recording, process_recorder()):
+            assert {row['stage']: row['count'] for row in recorder.stage_stats()} == {
+                'indicators.test': 1, 'chart.test': 1}
+            assert recorder.counter_stats('api.') == [{'counter': 'api.tcbs', 'total': 3, 'per_minute': 3}]
+
+        # Another session does not see these events
+        other = Recorder()
+        set_recorder(other)
+        count('api.tcbs')
+        assert recording.counter_stats('api.')[0]['total'] == 3
+        assert other.counter_stats('api.')[0]['total'] == 1
+
+    def test_cache_hit_rates(self, recording):
+        """Test MemoryCache lookups are counted per cache"""
+        cache = MemoryCache(name='frames')
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        record_cache('ohlcv', True)
+
+        rates = {row['cache']: row for row in recording.cache_stats()}
+        assert rates['frames']['hits'] == 2
+        assert rates['frames']['misses'] == 1
+        assert rates['frames']['hit_rate'] == pytest.approx(2 / 3)
+        assert rates['ohlcv']['hit_rate'] == 1.0
@@ -0,0 +1,89 @@
+"""
+Tests for the logging policy
+"""
+
+import pytest
+import io
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.log_policy import BatchLog, LoggingConfig, configure_logging, load_logging_config, reset_logging
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+
+@pytest.fixture
+def policy_stream():
+    """Yield a configure function writing to a string buffer; undo afterwards"""
+    stream = io.StringIO()
+
+    def configure(config):
+        configure_logging(config, stream=stream, force=True)
+        return stream
+
+    yield configure
+    reset_logging()
+
+
+class TestLoggingConfig:
+    """Test reading the logging section"""
+
+    def test_repo_config(self):
+        """Test the shipped config.yaml parses with subsystem levels"""
+        config = load_logging_config(parent_path / "config.yaml")
+        assert config.level == "INFO"
+        assert config.subsystems['src.data.connectors'] == "INFO"
+
+    def test_defaults(self, tmp_path):
+        """Test a missing file or section falls back to defaults"""
+        assert load_logging_config(tmp_path / "missing.yaml") == LoggingConfig()
+        assert LoggingConfig.from_dict({'level': 'debug', 'subsystems': {'src.core': 'error'}}) == LoggingConfig(
+            level='DEBUG', subsystems={'src.core': 'ERROR'})
+
+
+class TestConfigureLogging:
+    """Test handlers and subsystem levels"""
+
+    def test_subsystem_levels(self, policy_stream):
+        """Test subsystem levels apply and are reset on reconfigure"""
+        stream = policy_stream(LoggingConfig(level='INFO', subsystems={'test_policy.quiet': 'WARNING'}))
+        logging.getLogger('test_policy.quiet.child').info("hidden")
+        logging.getLogger('test_policy.loud').info("shown")
+        assert "hidden" not in stream.getvalue()
+        assert "test_policy.loud - INFO - shown" in stream.getvalue()
+
+        policy_stream(LoggingConfig(level='INFO'))
+        assert logging.getLogger('test_policy.quiet').level == logging.NOTSET
+
+    def test_hot_path_logs_at_debug(self, policy_stream, tmp_path):
+        """Test per-symbol cache reads do not log at INFO"""
+        stream = policy_stream(LoggingConfig(level='INFO'))
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        for _ in range(5):
+            cache.get_ohlcv('AAA')
+        cache.close()
+        assert "AAA" not in stream.getvalue()
+
+
+class TestBatchLog:
+    """Test per-batch summaries"""
+
+    def test_summary(self, policy_stream):
+        """Test one summary line plus the failed symbols"""
+        stream = policy_stream(LoggingConfig(level='INFO'))
+        logger = logging.getLogger('test_policy.batch')
+        with BatchLog(logger, "Update", max_listed=2) as batch:
+            for symbol in ['AAA', 'BBB', 'CCC']:
+                batch.add(symbol)
+            for symbol in ['DDD', 'EEE', 'FFF']:
+                batch.add(symbol, False, "no data")
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert "Update: 6 symbols in" in lines[0] and "(3 ok, 3 failed)" in lines[0]
+        assert lines[1].endswith("Update failed for: DDD, EEE...")
+        assert batch.total == 6
@@ -0,0 +1,95 @@
+"""
+Tests for the bounded memory cache
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.memory_cache import MemoryCache, estimate_size
+
+
+def make_frame(rows: int = 1000) -> pd.DataFrame:
+    """Create a numeric test frame"""
+    return pd.DataFrame({
+        'close': np.arange(rows, dtype='float64'),
+        'volume': np.arange(rows, dtype='int64')
+    })
+
+
+class TestMemoryCache:
+    """Test MemoryCache behaviour"""
+    
+    def test_hit_and_miss_counters(self):
+        """Test hit/miss accounting"""
+        cache = MemoryCache(max_bytes=1024 * 1024)
+        cache.set('a', make_frame())
+        
+        assert cache.get('a') is not None
+        assert cache.get('missing') is None
+        
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+    
+    def test_lru_eviction_by_size(self):
+        """Test least recently used entries are evicted to fit the budget"""
+        frame = make_frame()
+        size = estimate_size(frame)
+        cache = MemoryCache(max_bytes=size * 2 + size // 2)
+        
+        cache.set('a', frame)
+        cache.set('b', frame)
+        cache.get('a')  # 'b' becomes least recently used
+        cache.set('c', frame)
+        
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats.evictions == 1
+        assert cache.current_bytes <= cache.max_bytes
+    
+    def test_oversized_value_rejected(self):
+        """Test values larger than the whole budget are not stored"""
+        cache = MemoryCache(max_bytes=100)
+        
+        assert cache.set('big', make_frame()) is False
+        assert len(cache) == 0
+    
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL"""
+        cache = MemoryCache(max_bytes=1024 * 1024, ttl=0.01)
+        cache.set('a', 1)
+        time.sleep(0.02)
+        
+        assert cache.get('a') is None
+        assert cache.stats.expirations == 1
+    
+    def test_returned_frame_does_not_modify_cache(self):
+        """Test cached frames are protected from caller mutation"""
+        cache = MemoryCache(max_bytes=1024 * 1024)
+        cache.set('a', make_frame(10))
+        
+        view = cache.get('a')
+        view.loc[0, 'close'] = -1.0
+        view['extra'] = 1
+        
+        cached = cache.get('a')
+        assert cached.loc[0, 'close'] == 0.0
+        assert 'extra' not in cached.columns
+    
+    def test_returned_array_is_read_only(self):
+        """Test cached arrays are returned as read-only views"""
+        cache = MemoryCache(max_bytes=1024 * 1024)
+        cache.set('arr', np.zeros(10))
+        
+        with pytest.raises(ValueError):
+            cache.get('arr')[0] = 1.0
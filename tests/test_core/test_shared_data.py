@@ -0,0 +1,104 @@
+"""
+Tests for the shared Arrow data store
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.shared_data import (
+    SharedDataStore, SharedDataClient, SHARED_DIR_ENV, FUNDAMENTALS_DATASET, OHLCV_DATASET
+)
+from src.core.compact_frame import compact_frame, sort_by_ticker
+from src.core.data_manager import DataManager
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+
+def make_fundamentals(tickers) -> pd.DataFrame:
+    """Create a compact long-format frame"""
+    df = pd.DataFrame({
+        'SECURITY_CODE': np.repeat(tickers, 4),
+        'METRIC_CODE': 'CIS_10',
+        'METRIC_VALUE': np.arange(4 * len(tickers), dtype='float64'),
+        'YEAR': np.tile([2020, 2021, 2022, 2023], len(tickers)),
+    })
+    return sort_by_ticker(compact_frame(df))
+
+
+class TestSharedDataStore:
+    """Test publish/attach and version tracking"""
+
+    def test_attach_is_zero_copy(self, tmp_path):
+        """Test numeric columns are read-only views over the mapped file"""
+        store = SharedDataStore(tmp_path)
+        store.publish(FUNDAMENTALS_DATASET, make_fundamentals(['FPT', 'VNM']))
+
+        df, version = store.attach(FUNDAMENTALS_DATASET)
+        assert version == store.version(FUNDAMENTALS_DATASET)
+        assert isinstance(df['SECURITY_CODE'].dtype, pd.CategoricalDtype)
+        assert not df['METRIC_VALUE'].to_numpy().flags.writeable
+
+    def test_client_picks_up_new_version(self, tmp_path):
+        """Test a client re-attaches only after a new publish"""
+        store = SharedDataStore(tmp_path, keep_versions=1)
+        client = SharedDataClient(store)
+        store.publish(FUNDAMENTALS_DATASET, make_fundamentals(['FPT']))
+
+        first, v1 = client.get(FUNDAMENTALS_DATASET)
+        assert client.get(FUNDAMENTALS_DATASET)[0] is first
+
+        store.publish(FUNDAMENTALS_DATASET, make_fundamentals(['FPT', 'HPG']))
+        assert client.has_new_version(FUNDAMENTALS_DATASET)
+
+        second, v2 = client.get(FUNDAMENTALS_DATASET)
+        assert v2 != v1
+        assert len(second) == 8
+        # Only the latest file is kept
+        assert len(list(tmp_path.glob(f"{FUNDAMENTALS_DATASET}.*.arrow"))) == 1
+
+    def test_data_manager_attaches(self, tmp_path, monkeypatch):
+        """Test DataManager uses the shared frame and rebuilds indexes on new versions"""
+        monkeypatch.setenv(SHARED_DIR_ENV, str(tmp_path / "shm"))
+        store = SharedDataStore()
+        store.publish(FUNDAMENTALS_DATASET, make_fundamentals(['FPT']))
+
+        config = SimpleNamespace(
+            paths=SimpleNamespace(parquet_path=None, metadata_path=None,
+                                  cache_dir=tmp_path / "cache"),
+            data=SimpleNamespace(cache_ttl=3600)
+        )
+        manager = DataManager(config)
+        assert manager.get_available_tickers() == ['FPT']
+
+        store.publish(FUNDAMENTALS_DATASET, make_fundamentals(['FPT', 'VNM']))
+        assert manager.get_available_tickers() == ['FPT', 'VNM']
+        assert len(manager.get_ticker_data('VNM')) == 4
+
+    def test_ohlcv_cache_reads_shared_panel(self, tmp_path, monkeypatch):
+        """Test get_ohlcv slices the shared panel and falls back when SQLite is newer"""
+        dates = pd.date_range('2024-01-01', periods=5, freq='D')
+        bars = pd.DataFrame({'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5,
+                             'volume': 100}, index=pd.Index(dates, name='date'))
+
+        writer = OHLCVCacheManager(cache_dir=str(tmp_path))
+        writer.save_ohlcv('VNM', bars)
+        panel = writer.load_panel()
+
+        monkeypatch.setenv(SHARED_DIR_ENV, str(tmp_path / "shm"))
+        SharedDataStore().publish(OHLCV_DATASET, panel)
+
+        reader = OHLCVCacheManager(cache_dir=str(tmp_path))
+        df = reader.get_ohlcv('VNM', start_date='2024-01-02')
+        assert len(df) == 4
+        assert df['close'].iloc[-1] == 1.5
+
+        newer = bars.copy()
+        newer.index = newer.index + pd.Timedelta(days=5)
+        writer.save_ohlcv('VNM', newer)
+        assert len(reader.get_ohlcv('VNM')) == 10
@@ -0,0 +1,117 @@
+"""
+Tests for the day-partitioned intraday store
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.data.connectors.intraday_store import IntradayPolicy, IntradayStore
+import pyarrow.parquet as pq
+
+
+def make_session(day: str, symbol_seed: int, minutes: int = 5) -> pd.DataFrame:
+    """Create one session of bars (09:15-14:45 local time) indexed by naive dates, like the connector"""
+    rng = np.random.default_rng(symbol_seed)
+    index = pd.date_range(f"{day} 09:15", f"{day} 14:45", freq=f"{minutes}min", name='date')
+    close = np.round(25000 + rng.normal(size=len(index)).cumsum() * 50, -1)
+    return pd.DataFrame({
+        'open': close - 10, 'high': close + 50, 'low': close - 50, 'close': close,
+        'volume': rng.integers(1_000, 100_000, len(index))
+    }, index=index)
+
+
+class TestIntradayStore:
+    """Test appends, windowed reads, compaction and retention"""
+
+    def test_append_and_read_window(self, tmp_path):
+        """Test bars round-trip per symbol and window, with later writes winning"""
+        store = IntradayStore(tmp_path)
+        sessions = {}
+        with store.writer('5', flush_rows=50) as writer:
+            for i, symbol in enumerate(['AAA', 'BBB', 'CCC']):
+                for day in ['2024-03-04', '2024-03-05']:
+                    sessions[(symbol, day)] = make_session(day, 10 * i + int(day[-1]))
+                    writer.add(symbol, sessions[(symbol, day)])
+        # A revised bar arrives later in the session
+        revised = sessions[('BBB', '2024-03-05')].iloc[[12]].assign(close=99_990.0)
+        store.append('BBB', revised, '5')
+
+        assert store.days('5') == [date(2024, 3, 4), date(2024, 3, 5)]
+        bars = store.read(['BBB'], '2024-03-05 10:00', '2024-03-05 11:00', resolution='5')
+        expected = sessions[('BBB', '2024-03-05')].loc['2024-03-05 10:00':'2024-03-05 11:00']
+        assert list(bars['symbol'].unique()) == ['BBB']
+        assert list(bars['date']) == list(expected.index)
+        assert bars.loc[bars['date'] == revised.index[0], 'close'].item() == 99_990.0
+
+        whole = store.read(['AAA', 'CCC'], '2024-03-04', '2024-03-05', resolution='5')
+        assert len(whole) == sum(len(sessions[(symbol, day)]) for symbol in ['AAA', 'CCC']
+                                 for day in ['2024-03-04', '2024-03-05'])
+        np.testing.assert_allclose(
+            whole.loc[whole['symbol'] == 'CCC', 'close'].to_numpy()[:len(sessions[('CCC', '2024-03-04')])],
+            sessions[('CCC', '2024-03-04')]['close'])
+        assert store.read('AAA', '2024-03-06', resolution='5').empty
+
+    def test_naive_times_are_exchange_time(self, tmp_path):
+        """Test naive bars are stored as UTC+7 and read back unchanged"""
+        store = IntradayStore(tmp_path)
+        session = make_session('2024-03-04', 1)
+        store.append('AAA', session, '5')
+
+        table = pq.read_table(next((tmp_path / '5m' / '2024-03-04').glob('part-*.parquet')))
+        assert table.column('ts')[0].as_py() == int(pd.Timestamp('2024-03-04 02:15', tz='UTC').timestamp())
+        assert list(store.read('AAA', '2024-03-04', resolution='5')['date']) == list(session.index)
+
+        # Time-zone aware bars land on the same rows
+        aware = session.tz_localize('Asia/Ho_Chi_Minh').tz_convert('UTC').assign(volume=7)
+        store.append('AAA', aware, '5')
+        bars = store.read('AAA', '2024-03-04 09:00', '2024-03-04 09:30', resolution='5')
+        assert list(bars['date']) == list(session.loc[:'2024-03-04 09:30'].index)
+        assert (bars['volume'] == 7).all()
+
+    def test_compaction(self, tmp_path):
+        """Test compaction merges parts into one sorted file with the same contents"""
+        store = IntradayStore(tmp_path, IntradayPolicy(max_parts=3))
+        for i, symbol in enumerate(['CCC', 'AAA', 'BBB', 'DDD']):
+            store.append(symbol, make_session('2024-03-04', i, minutes=1), '1')
+        store.append('AAA', make_session('2024-03-04', 1, minutes=1).iloc[:10].assign(volume=7), '1')
+        before = store.read(['AAA', 'BBB', 'CCC', 'DDD'], '2024-03-04', resolution='1')
+
+        assert store.compact('1', date(2024, 3, 4))
+        day_dir = tmp_path / '1m' / '2024-03-04'
+        assert [p.name for p in day_dir.iterdir()] == ['bars.parquet']
+        table = pq.read_table(day_dir / 'bars.parquet')
+        assert table.schema.field('close').type == 'float' and table.schema.field('volume').type == 'int32'
+        assert table.column('symbol').to_pylist() == sorted(table.column('symbol').to_pylist())
+        pd.testing.assert_frame_equal(store.read(['AAA', 'BBB', 'CCC', 'DDD'], '2024-03-04', resolution='1'),
+                                      before)
+        assert (before.loc[before['symbol'] == 'AAA', 'volume'].iloc[:10] == 7).all()
+
+        # The writer compacts a day once it collects more than max_parts parts
+        with store.writer('1', flush_rows=1) as writer:
+            for i in range(4):
+                writer.add('EEE', make_session('2024-03-04', 20 + i, minutes=1).iloc[i * 10:(i + 1) * 10])
+        assert len(list(day_dir.glob('part-*.parquet'))) <= 3
+
+    def test_maintain(self, tmp_path):
+        """Test closed days are compacted and expired days deleted"""
+        store = IntradayStore(tmp_path, IntradayPolicy(retention_days={'5': 30}))
+        for day in ['2024-01-02', '2024-03-01', '2024-03-04']:
+            store.append('AAA', make_session(day, 1), '5')
+
+        result = store.maintain(today=date(2024, 3, 4))
+        assert result == {'compacted': 1, 'deleted': 1}
+        assert store.days('5') == [date(2024, 3, 1), date(2024, 3, 4)]
+        assert (tmp_path / '5m' / '2024-03-01' / 'bars.parquet').exists()
+        # Today's session is still being appended to
+        assert not (tmp_path / '5m' / '2024-03-04' / 'bars.parquet').exists()
+
+        with pytest.raises(ValueError):
+            store.read('AAA', '2024-03-04', resolution='2')
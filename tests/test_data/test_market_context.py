@@ -0,0 +1,76 @@
+"""
+Tests for the page-level market data context
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.data.market_context import MarketDataContext
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+
+
+# AAA has a full year, BBB a short history and CCC too few bars for indicators
+PANEL_OPTIONS = dict(symbols=['AAA', 'BBB', 'CCC'], n_days=260, stop_at={'BBB': 60, 'CCC': 10},
+                     categorical=True)
+
+
+def reference_indicators(df: pd.DataFrame) -> dict:
+    """Per-symbol computation used by the original page"""
+    close = df['close']
+    return {
+        'ma20': close.rolling(20).mean().iloc[-1],
+        'ma50': close.rolling(50).mean().iloc[-1] if len(df) >= 50 else np.nan,
+        'ema9': close.ewm(span=9, adjust=False).mean().iloc[-1],
+        'change_pct': (close.iloc[-1] / close.iloc[-2] - 1) * 100,
+        'volume_ratio': df['volume'].iloc[-1] / df['volume'].rolling(20).mean().iloc[-1],
+    }
+
+
+class TestMarketDataContext:
+    """Test vectorized snapshot against per-symbol calculations"""
+
+    def test_snapshot_matches_per_symbol(self, make_panel):
+        """Test snapshot indicators equal the per-ticker loop results"""
+        panel = make_panel(**PANEL_OPTIONS)
+        context = MarketDataContext(panel)
+
+        for symbol in ['AAA', 'BBB']:
+            expected = reference_indicators(panel[panel['symbol'] == symbol])
+            row = context.snapshot.loc[symbol]
+            for key, value in expected.items():
+                if np.isnan(value):
+                    assert np.isnan(row[key])
+                else:
+                    assert row[key] == pytest.approx(value)
+
+        assert np.isnan(context.snapshot.loc['CCC', 'ma20'])
+
+    def test_breadth_and_history(self, make_panel):
+        """Test breadth counts and history slicing"""
+        context = MarketDataContext(make_panel(**PANEL_OPTIONS))
+
+        stats = context.breadth(min_trading_value=0)
+        assert stats['total'] == 2
+        assert set(stats['analyzed']) == {'AAA', 'BBB'}
+
+        assert len(context.history('BBB')) == 60
+        assert context.history('ZZZ').empty
+
+    def test_cache_version_changes_on_save(self, tmp_path, make_panel):
+        """Test the data version changes when bars are saved"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        before = cache.get_data_version()
+
+        bars = make_panel(**PANEL_OPTIONS)
+        bars = bars[bars['symbol'] == 'CCC'].drop(columns='symbol').set_index('date')
+        cache.save_ohlcv('CCC', bars)
+
+        assert cache.get_data_version() != before
+        assert list(cache.get_panel()['symbol'].unique()) == ['CCC']
@@ -0,0 +1,127 @@
+"""
+Tests for the columnar data models
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.core.exceptions import ValidationError
+from src.data.models import Company, CompanyInfo, MetricPanel, PriceSeries
+
+
+def make_fundamentals() -> pd.DataFrame:
+    """Create shuffled long-format fundamentals"""
+    rows = []
+    for ticker in ('VNM', 'FPT'):
+        for year in (2022, 2023):
+            rows.append((ticker, 'CIS_10', year, 0, year * 10.0))
+            for quarter in range(1, 5):
+                rows.append((ticker, 'CIS_10', year, quarter, year + quarter))
+    df = pd.DataFrame(rows, columns=['SECURITY_CODE', 'METRIC_CODE', 'YEAR', 'QUARTER', 'METRIC_VALUE'])
+    return df.sample(frac=1, random_state=2).reset_index(drop=True)
+
+
+class TestPriceSeries:
+    """Test array-backed bars"""
+
+    def test_round_trip_without_copy(self, make_bars):
+        """Test frame conversion shares the float64 arrays"""
+        bars = make_bars(10, start='2024-01-01').astype('float64')
+        series = PriceSeries.from_frame(bars, 'FPT')
+
+        assert len(series) == 10
+        assert np.shares_memory(series.close, bars['close'].to_numpy())
+        frame = series.to_frame()
+        assert np.shares_memory(frame['close'].to_numpy(), series.close)
+        pd.testing.assert_frame_equal(frame, bars, check_freq=False)
+
+    def test_accessors(self, make_bars):
+        """Test latest value, slicing and vectorized returns"""
+        bars = make_bars(10, start='2024-01-01').astype('float64')
+        bars.iloc[-1, bars.columns.get_loc('close')] = np.nan
+        series = PriceSeries.from_frame(bars, 'FPT')
+
+        assert series.latest() == bars['close'].iloc[-2]
+        window = series.slice('2024-01-03', '2024-01-05')
+        assert list(window.to_frame().index) == list(bars.index[2:5])
+        np.testing.assert_allclose(series.returns()[1:-1], bars['close'].pct_change().iloc[1:-1] * 100)
+        np.testing.assert_allclose(series.intraday_range(), bars['high'] - bars['low'])
+
+    def test_batch_validation(self, make_bars):
+        """Test schema violations raise once for the batch"""
+        bars = make_bars(10, start='2024-01-01').astype('float64')
+        with pytest.raises(ValidationError):
+            PriceSeries.from_frame(bars.iloc[::-1], 'FPT')
+        with pytest.raises(ValidationError):
+            PriceSeries.from_frame(bars.drop(columns='low'), 'FPT')
+        with pytest.raises(ValidationError):
+            PriceSeries('FPT', bars.index, bars['open'], bars['high'], bars['low'], bars['close'][:5])
+
+
+class TestMetricPanel:
+    """Test coded fundamentals arrays"""
+
+    def test_lookups(self):
+        """Test series, latest and cross-section lookups"""
+        panel = MetricPanel.from_frame(make_fundamentals())
+
+        years, quarters, values = panel.series('VNM', 'CIS_10', quarterly=True)
+        assert list(zip(years, quarters)) == [(y, q) for y in (2022, 2023) for q in range(1, 5)]
+        assert panel.latest('VNM', 'CIS_10', quarterly=False) == 20230.0
+        assert panel.latest('VNM', 'CIS_99') is None
+        assert panel.cross_section('CIS_10', 2022).to_dict() == {'FPT': 20220.0, 'VNM': 20220.0}
+
+    def test_freq_code_marks_annual_rows(self):
+        """Test FREQ_CODE 'Y' rows are annual whatever their QUARTER holds"""
+        df = make_fundamentals()
+        df['FREQ_CODE'] = np.where(df['QUARTER'] == 0, 'Y', 'Q')
+        # Annual rows reported against the fourth quarter, or without one
+        annual = df['FREQ_CODE'] == 'Y'
+        df['QUARTER'] = df['QUARTER'].astype('float64')
+        df.loc[annual, 'QUARTER'] = np.where(df.loc[annual, 'YEAR'] == 2022, 4, np.nan)
+        panel = MetricPanel.from_frame(df)
+
+        years, quarters, values = panel.series('VNM', 'CIS_10', quarterly=False)
+        assert list(zip(years, quarters, values)) == [(2022, 0, 20220.0), (2023, 0, 20230.0)]
+        years, quarters, _ = panel.series('VNM', 'CIS_10', quarterly=True)
+        assert list(zip(years, quarters)) == [(y, q) for y in (2022, 2023) for q in range(1, 5)]
+        assert panel.latest('VNM', 'CIS_10', quarterly=True) == 2027.0
+
+    def test_categorical_frame(self):
+        """Test compact (categorical) input and frame round trip"""
+        df = make_fundamentals()
+        df['SECURITY_CODE'] = df['SECURITY_CODE'].astype('category')
+        panel = MetricPanel.from_frame(df)
+
+        back = panel.to_frame()
+        assert len(back) == len(df)
+        merged = back.astype({'SECURITY_CODE': str, 'METRIC_CODE': str}).merge(
+            df.astype({'SECURITY_CODE': str}), on=['SECURITY_CODE', 'METRIC_CODE', 'YEAR', 'QUARTER'])
+        assert (merged['METRIC_VALUE_x'] == merged['METRIC_VALUE_y']).all()
+
+
+class TestCompany:
+    """Test company accessors over columnar data"""
+
+    def test_accessors_on_arrays(self, make_bars):
+        """Test list-of-dict bars are converted and accessors use arrays"""
+        records = make_bars(5, start='2024-01-01').reset_index().to_dict('records')
+        company = Company(
+            info=CompanyInfo(ticker='VNM', name='Vinamilk', shares_outstanding=2e9),
+            market_data=records,
+            fundamentals=make_fundamentals()
+        )
+
+        assert isinstance(company.market_data, PriceSeries)
+        assert company.get_latest_price() == records[-1]['close']
+        assert company.get_market_cap() == records[-1]['close'] * 2e9
+        assert company.get_latest_metric('CIS_10', quarterly=True) == 2027.0
+        assert len(company.get_price_history('2024-01-02')) == 4
+        assert Company(info=CompanyInfo(ticker='X', name='X')).get_latest_price() is None
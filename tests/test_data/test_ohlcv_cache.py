@@ -0,0 +1,170 @@
+"""
+Tests for the OHLCV cache rollup tiers and price adjustments
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.data.connectors import update_ohlcv_data
+from src.data.connectors.adjustments import detect_adjustment
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+from src.visualization.downsampling import ChartDownsampler, resample_ohlc
+
+
+class TestRollups:
+    """Test weekly/monthly bars materialized from daily saves"""
+
+    def test_rollups_match_resampled_daily(self, tmp_path, make_bars):
+        """Test 1W/1M bars equal resampled daily bars after incremental saves"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        bars = make_bars(120, seed=3, start='2024-01-01')
+        cache.save_ohlcv('AAA', bars.iloc[:100])
+        # Incremental ingest ending mid-week, then a revised last session
+        cache.save_ohlcv('AAA', bars.iloc[100:118])
+        revised = bars.iloc[117:].copy()
+        revised.loc[revised.index[0], 'high'] = 99_000
+        cache.save_ohlcv('AAA', revised)
+
+        daily = cache.get_ohlcv('AAA')
+        for resolution, freq in [('1W', 'W-FRI'), ('1M', 'M')]:
+            expected = resample_ohlc(daily, freq)
+            stored = cache.get_ohlcv('AAA', resolution=resolution)
+            pd.testing.assert_frame_equal(stored, expected, check_dtype=False, check_freq=False)
+            assert cache.get_cached_symbols(resolution) == ['AAA']
+        assert cache.get_ohlcv('AAA', resolution='1W')['high'].max() == 99_000
+
+    def test_stats_count_daily_bars(self, tmp_path, make_bars):
+        """Test rollup rows stored next to the daily bars are not counted as records"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        cache.save_ohlcv('AAA', make_bars(60, seed=3, start='2024-01-01'))
+
+        assert cache.get_cache_stats()['total_records'] == 60
+
+    def test_rebuild_rollups(self, tmp_path, make_bars):
+        """Test daily bars written without rollups are backfilled"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        cache.save_ohlcv('AAA', make_bars(60, seed=3, start='2024-01-01'))
+        cache.save_ohlcv('BBB', make_bars(30, seed=4, start='2024-03-01'))
+        cache.conn.execute("DELETE FROM ohlcv_data WHERE resolution != '1D'")
+        cache.conn.execute("DELETE FROM cache_metadata WHERE resolution != '1D'")
+
+        assert cache.rebuild_rollups(['BBB']) == 1
+        assert cache.get_ohlcv('AAA', resolution='1M') is None
+        assert cache.rebuild_rollups() == 2
+        expected = resample_ohlc(cache.get_ohlcv('AAA'), 'M')
+        pd.testing.assert_frame_equal(cache.get_ohlcv('AAA', resolution='1M'), expected,
+                                      check_dtype=False, check_freq=False)
+
+    def test_chart_reads_rollups(self, tmp_path, make_bars):
+        """Test long-range candles come from the stored bars of the visible periods"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        cache.save_ohlcv('AAA', make_bars(1500, seed=3, start='2020-01-01'))
+        daily = cache.get_ohlcv('AAA').iloc[-1000:]
+
+        calls = []
+
+        def rollups(label, start, end):
+            calls.append((label, start, end))
+            return cache.get_ohlcv('AAA', start, end, resolution=f'1{label}')
+
+        bars, label = ChartDownsampler(max_candles=300).prepare_ohlc(daily, rollups)
+        assert calls and label == calls[0][0]
+        # The first period is partially visible, so its stored bar covers earlier sessions too
+        expected = resample_ohlc(cache.get_ohlcv('AAA', start_date=calls[0][1]), 'W-FRI' if label == 'W' else 'M')
+        pd.testing.assert_frame_equal(bars, expected, check_dtype=False, check_freq=False)
+
+
+class TestAdjustments:
+    """Test corporate-action detection and read-time factors"""
+
+    def test_detect_adjustment(self, make_bars):
+        """Test only a consistent scale change over the overlap is detected"""
+        cached = make_bars(10, seed=3, start='2024-01-01')['close']
+        assert detect_adjustment(cached, cached * 0.5) == pytest.approx(0.5)
+        # A single revised session or too short an overlap is not an adjustment
+        revised = cached.copy()
+        revised.iloc[-1] *= 0.5
+        assert detect_adjustment(cached, revised) is None
+        assert detect_adjustment(cached, cached.iloc[-2:] * 0.5) is None
+
+    def test_split_applied_at_read_time(self, tmp_path, make_bars):
+        """Test a back-adjusted overlap records a factor instead of rewriting bars"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        raw = make_bars(120, seed=3, start='2024-01-01')
+        cache.save_ohlcv('AAA', raw.iloc[:100])
+        cache.save_ohlcv('BBB', raw.iloc[:100])
+        version = cache.get_data_version()
+
+        # 2:1 split on session 100: the provider now returns history halved
+        adjusted = raw.assign(**{c: raw[c] * 0.5 for c in ['open', 'high', 'low', 'close']},
+                              volume=raw['volume'] * 2)
+        cache.save_ohlcv('AAA', adjusted.iloc[90:110])
+        assert cache.adjustments.symbols() == ['AAA']
+        assert cache.get_data_version() != version
+
+        # Stored rows before the overlap are untouched; reads are on one scale
+        stored = cache.conn.execute(
+            "SELECT close FROM ohlcv_data WHERE symbol = 'AAA' AND resolution = '1D' ORDER BY date"
+        ).fetchone()[0]
+        assert stored == raw['close'].iloc[0]
+        daily = cache.get_ohlcv('AAA')
+        np.testing.assert_allclose(daily[['open', 'high', 'low', 'close']], adjusted.iloc[:110][
+            ['open', 'high', 'low', 'close']])
+        np.testing.assert_array_equal(daily['volume'], adjusted['volume'].iloc[:110])
+        pd.testing.assert_frame_equal(cache.get_ohlcv('AAA', resolution='1W'), resample_ohlc(daily, 'W-FRI'),
+                                      check_dtype=False, check_freq=False)
+
+        panel = cache.load_panel()
+        np.testing.assert_allclose(panel.loc[panel['symbol'] == 'AAA', 'close'], daily['close'])
+        np.testing.assert_allclose(panel.loc[panel['symbol'] == 'BBB', 'close'], raw['close'].iloc[:100])
+
+        # Later fetches on the new scale leave the factor alone
+        cache.save_ohlcv('AAA', adjusted.iloc[105:120])
+        assert len(cache.adjustments.events('AAA')) == 1
+        np.testing.assert_allclose(cache.get_ohlcv('AAA')['close'], adjusted['close'])
+
+        # A second 2:1 split whose overlap covers the first event merges them
+        twice = adjusted.assign(close=adjusted['close'] * 0.5)
+        cache.save_ohlcv('AAA', twice.iloc[85:120])
+        events = cache.adjustments.events('AAA')
+        assert len(events) == 1 and events['factor'].iloc[0] == pytest.approx(0.25)
+        np.testing.assert_allclose(cache.get_ohlcv('AAA')['close'], twice['close'])
+
+        # A full refetch replaces the mixed history and drops the factors
+        cache.save_ohlcv('AAA', twice)
+        assert cache.adjustments.symbols() == []
+        np.testing.assert_allclose(cache.get_ohlcv('AAA')['close'], twice['close'])
+        np.testing.assert_allclose(cache.get_ohlcv('AAA', resolution='1M')['close'],
+                                   resample_ohlc(twice, 'M')['close'])
+
+    def test_refetch_from_first_cached_bar(self, tmp_path, monkeypatch, make_bars):
+        """Test adjusted tickers are re-fetched from their oldest bar, however old"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        raw = make_bars(3200, seed=3, start='2012-01-02')
+        cache.save_ohlcv('AAA', raw.iloc[:3100])
+        adjusted = raw.assign(close=raw['close'] * 0.5)
+        cache.save_ohlcv('AAA', adjusted.iloc[3090:3110])
+        assert cache.adjustments.symbols() == ['AAA']
+
+        requests = []
+
+        class Connector:
+            def get_ohlcv(self, symbol, start_date, end_date, resolution):
+                requests.append(start_date)
+                return adjusted.loc[start_date:]
+
+        monkeypatch.setattr(update_ohlcv_data, 'OHLCVConnector', Connector)
+        monkeypatch.setattr(update_ohlcv_data, 'OHLCVCacheManager', lambda: cache)
+        monkeypatch.setattr(update_ohlcv_data, 'get_universe', lambda paths: None)
+        update_ohlcv_data.OHLCVUpdater().refetch_adjusted()
+
+        assert cache.get_first_date('AAA') == requests[0] == '2012-01-02'
+        assert cache.adjustments.symbols() == []
+        np.testing.assert_allclose(cache.get_ohlcv('AAA')['close'], adjusted['close'])
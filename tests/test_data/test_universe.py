@@ -0,0 +1,81 @@
+"""
+Tests for the ticker universe registry
+"""
+
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.data import universe as universe_module
+from src.data.universe import TickerUniverse, get_universe
+
+
+def make_sources(tmp_path: Path) -> dict:
+    """Write small versions of the universe source files"""
+    pd.DataFrame({
+        'SECURITY_CODE': ['VNM', 'VNM', 'FPT', 'XYZ'],
+        'ICB_L2': ['Thực phẩm', 'Thực phẩm', 'Công nghệ', None],
+        'METRIC_VALUE': [1.0, 2.0, 3.0, 4.0],
+    }).to_parquet(tmp_path / "data.parquet")
+    (tmp_path / "summary.csv").write_text(
+        "ticker,sector,record_count,years,quarters\n"
+        "VNM,Thực phẩm,100,2018-2025,4\nFPT,Công nghệ,90,2018-2025,4\n",
+        encoding='utf-8')
+    (tmp_path / "standard.csv").write_text(
+        "Ticker,Industry_ICB_L2\nVNM,Thực phẩm và đồ uống\nFPT,Công nghệ\n", encoding='utf-8')
+    (tmp_path / "financial.csv").write_text(
+        "Ticker,Industry_ICB_L2\nVCB,Ngân hàng\n", encoding='utf-8')
+    return {
+        'parquet': tmp_path / "data.parquet",
+        'summary': tmp_path / "summary.csv",
+        'standard': tmp_path / "standard.csv",
+        'financial': tmp_path / "financial.csv",
+    }
+
+
+class TestTickerUniverse:
+    """Test universe building and caching"""
+
+    def test_build_merges_sources(self, tmp_path):
+        """Test tickers and sectors come from all sources with CSV precedence"""
+        universe = TickerUniverse.build(make_sources(tmp_path))
+
+        assert universe.tickers == ['FPT', 'VCB', 'VNM', 'XYZ']
+        assert universe.get_sector('vnm') == 'Thực phẩm và đồ uống'
+        assert universe.get('VCB')['financial'] is True
+        assert universe.get('FPT')['record_count'] == 90
+        assert universe.tickers_in_sector('Ngân hàng') == ['VCB']
+        assert universe.get_exchange('FPT') is None
+
+    def test_sidecar_reused_until_source_changes(self, tmp_path, monkeypatch):
+        """Test the sidecar is reused and invalidated by source changes"""
+        sources = make_sources(tmp_path)
+        sidecar = tmp_path / "universe.json"
+        TickerUniverse.load_or_build(sources, sidecar)
+        assert sidecar.exists()
+
+        def fail_build(cls, sources=None):
+            raise AssertionError("rebuilt despite unchanged sources")
+
+        monkeypatch.setattr(TickerUniverse, 'build', classmethod(fail_build))
+        assert len(TickerUniverse.load_or_build(sources, sidecar)) == 4
+
+        monkeypatch.undo()
+        (tmp_path / "financial.csv").write_text(
+            "Ticker,Industry_ICB_L2\nVCB,Ngân hàng\nACB,Ngân hàng\n", encoding='utf-8')
+        assert 'ACB' in TickerUniverse.load_or_build(sources, sidecar)
+
+    def test_singleton(self, tmp_path, monkeypatch):
+        """Test get_universe returns the same instance between checks"""
+        sources = make_sources(tmp_path)
+        sidecar = tmp_path / "universe.json"
+
+        first = get_universe(sources, sidecar)
+        assert get_universe(sources, sidecar) is first
+
+        monkeypatch.setattr(universe_module, 'CHECK_INTERVAL', 0.0)
+        assert get_universe(sources, sidecar) is first
@@ -0,0 +1,76 @@
+"""
+Tests for the synthetic market generator and the benchmark suite
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+sys.path.insert(0, str(parent_path / "benchmarks"))
+
+from run_benchmarks import compare_results, run_suite, save_results
+from synthetic import make_fundamentals, make_ohlcv_panel, make_tickers, write_ohlcv_cache
+from src.analysis.fundamental.growth_analyzer import GrowthAnalyzer
+
+
+class TestSyntheticMarket:
+    """Test the deterministic generators"""
+
+    def test_ohlcv_panel(self, tmp_path):
+        """Test bars are reproducible, consistent and load into the cache"""
+        panel = make_ohlcv_panel(5, n_years=1, seed=3, end_date='2024-06-28')
+        pd.testing.assert_frame_equal(panel, make_ohlcv_panel(5, n_years=1, seed=3, end_date='2024-06-28'))
+
+        assert len(panel) == 5 * 250
+        assert panel['date'].max() == pd.Timestamp('2024-06-28')
+        assert (panel['high'] >= panel[['open', 'close']].max(axis=1)).all()
+        assert (panel['low'] <= panel[['open', 'close']].min(axis=1)).all()
+
+        cache = write_ohlcv_cache(panel, tmp_path)
+        assert cache.get_cached_symbols() == make_tickers(5)
+        bars = cache.get_ohlcv('AAB')
+        np.testing.assert_allclose(bars['close'], panel.loc[panel['symbol'] == 'AAB', 'close'])
+        cache.close()
+
+    def test_fundamentals(self):
+        """Test annual rows sum the quarters and the analysis runs on them"""
+        df = make_fundamentals(3, n_years=3, seed=1)
+        revenue = df[(df['SECURITY_CODE'] == 'AAC') & (df['METRIC_CODE'] == 'CIS_10') & (df['YEAR'] == 2023)]
+
+        quarters = revenue.loc[revenue['FREQ_CODE'] == 'Q', 'METRIC_VALUE'].sum()
+        assert revenue.loc[revenue['FREQ_CODE'] == 'Y', 'METRIC_VALUE'].item() == pytest.approx(quarters)
+        assert (df.loc[df['METRIC_CODE'] == 'CIS_25', 'METRIC_VALUE'] < 0).all()
+
+        results = GrowthAnalyzer(data=df).generate_growth_analysis('AAC')
+        assert len(results['quarterly_margins']) == 12
+        assert results['annual_margins']['Gross_Margin'].notna().all()
+
+
+class TestBenchmarkSuite:
+    """Test a small end-to-end run and the regression comparison"""
+
+    def test_run_and_compare(self, tmp_path):
+        """Test the results document, JSON output and comparison"""
+        document = run_suite(12, n_years=1, sample_size=3, repeat=1,
+                             names=['ohlcv_get', 'growth_analysis', 'breadth_history'])
+
+        assert set(document['results']) == {'ohlcv_get', 'growth_analysis', 'breadth_history'}
+        assert document['results']['ohlcv_get']['operations'] == 3
+        assert document['meta']['tickers'] == 12
+
+        path = save_results(document, tmp_path, 'tiny')
+        baseline = json.loads(path.read_text())
+        baseline['results']['ohlcv_get']['ms_per_op'] /= 2
+
+        rows = {row['benchmark']: row for row in compare_results(document, baseline)}
+        assert rows['ohlcv_get']['status'] == 'REGRESSION'
+        assert rows['growth_analysis']['status'] == 'ok'
+
+        with pytest.raises(ValueError):
+            run_suite(3, names=['missing'])
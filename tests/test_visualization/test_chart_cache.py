@@ -0,0 +1,77 @@
+"""
+Tests for the figure cache
+"""
+
+import pandas as pd
+import numpy as np
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.visualization.chart_cache import FigureCache, frame_version
+from src.visualization.technical_charts import TechnicalChartCreator
+from src.data.connectors.ohlcv_cache import OHLCVCacheManager
+from src.data.connectors.visualize_ohlcv import OHLCVVisualizer
+
+
+class TestFigureCache:
+    """Test figure memoization and invalidation"""
+
+    def test_key_and_version(self, make_bars):
+        """Test option order does not matter and contents change the version"""
+        key_a = FigureCache.make_key('c', 'FPT', 90, {'a': [1, 2], 'b': True}, 'v1')
+        key_b = FigureCache.make_key('c', 'FPT', 90, {'b': True, 'a': [1, 2]}, 'v1')
+        assert key_a == key_b
+        hash(key_a)
+
+        bars = make_bars(300, seed=9, start='2023-01-02')
+        changed = bars.copy()
+        changed.iloc[10, 3] += 1
+        assert frame_version(bars) == frame_version(bars.copy())
+        assert frame_version(bars) != frame_version(changed)
+
+    def test_technical_chart_reuses_figure(self, make_bars):
+        """Test repeated calls are served from the cache as fresh figures"""
+        data = make_bars(300, seed=9, start='2023-01-02').reset_index()
+        data['MA_20'] = data['close'].rolling(20).mean()
+        creator = TechnicalChartCreator(figure_cache=FigureCache(max_mb=8))
+
+        first = creator.create_candlestick_chart(data, title="FPT", ma_periods=[20], ema_periods=[])
+        second = creator.create_candlestick_chart(data, title="FPT", ma_periods=[20], ema_periods=[])
+        assert creator.figure_cache.get_stats()['hits'] == 1
+        assert second is not first
+        assert json.loads(second.to_json()) == json.loads(first.to_json())
+
+        second.update_layout(title="changed")
+        third = creator.create_candlestick_chart(data, title="FPT", ma_periods=[20], ema_periods=[])
+        assert third.layout.title.text == "FPT"
+
+        creator.create_candlestick_chart(data, title="FPT", ma_periods=[20], ema_periods=[], show_volume=False)
+        assert len(creator.figure_cache) == 2
+
+        # Volume colors follow close vs open
+        volume = next(t for t in first.data if t.name == "Volume")
+        up = (data['close'] >= data['open']).to_numpy()
+        assert list(volume.marker.color) == list(np.where(up, '#26A69A', '#EF5350'))
+
+    def test_visualizer_invalidates_on_new_bars(self, tmp_path, make_bars):
+        """Test OHLCVVisualizer rebuilds after the symbol's cached bars change"""
+        cache = OHLCVCacheManager(cache_dir=str(tmp_path))
+        cache.save_ohlcv('FPT', make_bars(300, seed=9, start='2023-01-02'))
+        updater = SimpleNamespace(cache=cache, get_ticker_data=lambda s: cache.get_ohlcv(s))
+        viz = OHLCVVisualizer(updater=updater, figure_cache=FigureCache(max_mb=8))
+
+        viz.create_candlestick_chart('FPT', days=90)
+        viz.create_candlestick_chart('FPT', days=90)
+        assert viz.figure_cache.get_stats()['hits'] == 1
+
+        newer = make_bars(310, seed=9, start='2023-01-02').iloc[300:]
+        cache.save_ohlcv('FPT', newer)
+        fig = viz.create_candlestick_chart('FPT', days=90)
+        assert viz.figure_cache.get_stats()['hits'] == 1
+        assert pd.Timestamp(fig.data[0].x[-1]) == newer.index[-1]
@@ -0,0 +1,94 @@
+"""
+Tests for chart downsampling
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+parent_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.visualization.downsampling import ChartDownsampler, lttb, lttb_indices, resample_ohlc
+from src.visualization.technical_charts import TechnicalChartCreator
+
+
+class TestLTTB:
+    """Test the LTTB line reduction"""
+
+    def test_keeps_endpoints_and_extremes(self):
+        """Test first/last points and the global peak survive"""
+        x = np.arange(10_000, dtype=float)
+        y = np.sin(x / 300)
+        y[4321] = 5.0
+
+        idx = lttb_indices(x, y, 300)
+        assert len(idx) == 300
+        assert idx[0] == 0 and idx[-1] == len(x) - 1
+        assert 4321 in idx
+        assert np.all(np.diff(idx) > 0)
+
+    def test_datetimes_and_nans(self, make_bars):
+        """Test datetime x values and skipped NaN warm-up points"""
+        bars = make_bars(3000, seed=5, start='2012-01-02')
+        sma = bars['close'].rolling(200).mean()
+        x, y = lttb(bars.index, sma, 500)
+
+        assert len(x) == 500
+        assert x[0] == bars.index[199]
+        assert not np.isnan(y).any()
+
+    def test_short_series_untouched(self):
+        """Test series under the budget are returned as-is"""
+        assert list(lttb_indices(np.arange(10), np.arange(10.0), 50)) == list(range(10))
+
+
+class TestChartDownsampler:
+    """Test candle aggregation and trace selection"""
+
+    def test_resample_ohlc(self, make_bars):
+        """Test weekly candles aggregate OHLCV and keep the last session date"""
+        bars = make_bars(10, seed=5, start='2012-01-02')
+        weekly = resample_ohlc(bars, 'W-FRI')
+
+        assert len(weekly) == 2
+        first_week = bars.iloc[:5]
+        assert weekly.index[0] == first_week.index[-1]
+        assert weekly['open'].iloc[0] == first_week['open'].iloc[0]
+        assert weekly['high'].iloc[0] == first_week['high'].max()
+        assert weekly['close'].iloc[0] == first_week['close'].iloc[-1]
+        assert weekly['volume'].iloc[0] == first_week['volume'].sum()
+
+    def test_level_follows_range(self, make_bars):
+        """Test daily, weekly and monthly candles by visible range"""
+        bars = make_bars(3000, seed=5, start='2012-01-02')
+        downsampler = ChartDownsampler(max_candles=600)
+
+        assert downsampler.prepare_ohlc(bars.tail(500))[1] == 'D'
+        weekly, label = downsampler.prepare_ohlc(bars.tail(2000))
+        assert label == 'W' and len(weekly) <= 600
+        monthly, label = downsampler.prepare_ohlc(make_bars(5000, seed=5, start='2012-01-02'))
+        assert label == 'M' and len(monthly) <= 600
+
+    def test_webgl_threshold(self):
+        """Test Scattergl above the threshold and disabled at 0"""
+        assert ChartDownsampler(webgl_threshold=100).scatter_class(101) is go.Scattergl
+        assert ChartDownsampler(webgl_threshold=100).scatter_class(100) is go.Scatter
+        assert ChartDownsampler(webgl_threshold=0).scatter_class(10**6) is go.Scatter
+
+    def test_candlestick_chart_payload(self, make_bars):
+        """Test the technical chart stays within the point budget"""
+        bars = make_bars(3000, seed=5, start='2012-01-02').reset_index()
+        bars['MA_20'] = bars['close'].rolling(20).mean()
+        bars['RSI'] = 50.0
+
+        creator = TechnicalChartCreator(ChartDownsampler(max_points=400, max_candles=300))
+        fig = creator.create_candlestick_chart(bars, ma_periods=[20], ema_periods=[])
+
+        sizes = {trace.name: len(trace.x) for trace in fig.data}
+        assert sizes['OHLC'] <= 300
+        assert sizes['Volume'] == sizes['OHLC']
+        assert sizes['MA 20'] == 400
+        assert sizes['RSI'] == 400
@@ -33,7 +33,7 @@ class DailyOHLCVUpdater:
         conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
         cursor = conn.cursor()
         cursor.execute(
-            'SELECT MAX(date) FROM ohlcv_data WHERE symbol = ?',
+            "SELECT MAX(date) FROM ohlcv_data WHERE symbol = ? AND resolution = '1D'",
             (ticker,)
         )
         result = cursor.fetchone()
@@ -68,18 +68,18 @@ class DailyOHLCVUpdater:
         try:
             df = self.vnstock.get_ohlcv(ticker, start_date, end_date)
             if not df.empty:
-                # Filter only new data
-                if last_date:
-                    df = df[df.index > last_date]
+                # Ensure timezone naive
+                if hasattr(df.index, 'tz') and df.index.tz is not None:
+                    df.index = df.index.tz_localize(None)
                 
-                if not df.empty:
-                    # Ensure timezone naive
-                    if hasattr(df.index, 'tz') and df.index.tz is not None:
-                        df.index = df.index.tz_localize(None)
-                    
-                    # Save to cache (will merge with existing data)
+                # Count only new data
+                new_rows = int((df.index > last_date).sum()) if last_date else len(df)
+                
+                if new_rows:
+                    # Save with the overlap (will merge with existing data; the
+                    # cache compares the overlap to detect price adjustments)
                     self.cache.save_ohlcv(ticker, df)
-                    return len(df), "VnStock"
+                    return new_rows, "VnStock"
                 else:
                     return 0, "No new data"
         except Exception as e:
@@ -88,15 +88,13 @@ class DailyOHLCVUpdater:
                 try:
                     df = self.tcbs.get_ohlcv(ticker, start_date, end_date)
                     if not df.empty:
-                        if last_date:
-                            df = df[df.index > last_date]
+                        if hasattr(df.index, 'tz') and df.index.tz is not None:
+                            df.index = df.index.tz_localize(None)
+                        new_rows = int((df.index > last_date).sum()) if last_date else len(df)
                         
-                        if not df.empty:
-                            if hasattr(df.index, 'tz') and df.index.tz is not None:
-                                df.index = df.index.tz_localize(None)
-                            
+                        if new_rows:
                             self.cache.save_ohlcv(ticker, df)
-                            return len(df), "TCBS"
+                            return new_rows, "TCBS"
                 except:
                     pass
         
@@ -106,7 +104,7 @@ class DailyOHLCVUpdater:
         """Get list of all tickers in cache"""
         conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
         cursor = conn.cursor()
-        cursor.execute('SELECT DISTINCT symbol FROM ohlcv_data ORDER BY symbol')
+        cursor.execute("SELECT DISTINCT symbol FROM ohlcv_data WHERE resolution = '1D' ORDER BY symbol")
         tickers = [row[0] for row in cursor.fetchall()]
         conn.close()
         return tickers
@@ -197,6 +195,7 @@ def main():
             COUNT(*) as total_records,
             MAX(date) as latest_date
         FROM ohlcv_data
+        WHERE resolution = '1D'
     ''')
     cache_stats = cursor.fetchone()
     conn.close()
@@ -96,7 +96,7 @@ def get_missing_tickers():
     # Get tickers already in cache
     conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
     cursor = conn.cursor()
-    cursor.execute('SELECT DISTINCT symbol FROM ohlcv_data')
+    cursor.execute("SELECT DISTINCT symbol FROM ohlcv_data WHERE resolution = '1D'")
     cached_tickers = [row[0] for row in cursor.fetchall()]
     conn.close()
     
@@ -262,7 +262,7 @@ def main():
     
     conn = sqlite3.connect('Database/cache/ohlcv_cache.db')
     cursor = conn.cursor()
-    cursor.execute('SELECT COUNT(DISTINCT symbol), COUNT(*) FROM ohlcv_data')
+    cursor.execute("SELECT COUNT(DISTINCT symbol), COUNT(*) FROM ohlcv_data WHERE resolution = '1D'")
     cached_symbols, total_records = cursor.fetchone()
     conn.close()
     